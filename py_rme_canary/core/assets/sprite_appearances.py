@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 import lzma
 import os
@@ -118,101 +119,7 @@ class SpriteAppearances:
         return None
 
     def _load_sheet(self, sheet: SpriteSheet) -> None:
-        if sheet.loaded:
-            return
-
-        p = Path(sheet.path)
-        if not p.exists():
-            raise SpriteAppearancesError(f"Sprite sheet not found: {p}")
-
-        if p.suffix.lower() in (".png", ".bmp"):
-            sheet_width, sheet_height, pixel_data = _load_image_sheet(p)
-            sheet.data = pixel_data
-            sheet.sheet_width = int(sheet_width)
-            sheet.sheet_height = int(sheet_height)
-            sheet.loaded = True
-            return
-
-        blob = p.read_bytes()
-        if not blob:
-            raise SpriteAppearancesError(f"Sprite sheet empty: {p}")
-
-        # Port of legacy header parsing from `SpriteAppearances::loadSpriteSheet`.
-        pos = 0
-        # Skip variable pad of NULs.
-        while pos < len(blob) and blob[pos] == 0x00:
-            pos += 1
-        if pos >= len(blob):
-            raise SpriteAppearancesError("Invalid sprite sheet header (all zeros)")
-
-        # Skip full constant marker [0x70 0x0A 0xFA 0x80 0x24].
-        # We are currently positioned at 0x70.
-        pos += 5
-
-        # Skip 7-bit int encoded LZMA file size.
-        while pos < len(blob) and (blob[pos] & 0x80) == 0x80:
-            pos += 1
-        pos += 1  # consume final size byte
-
-        if pos + 1 + 4 + 8 >= len(blob):
-            raise SpriteAppearancesError("Invalid sprite sheet header (truncated)")
-
-        lclppb = blob[pos]
-        pos += 1
-
-        lc = int(lclppb % 9)
-        remainder = int(lclppb // 9)
-        lp = int(remainder % 5)
-        pb = int(remainder // 5)
-
-        dict_size = 0
-        for i in range(4):
-            dict_size |= int(blob[pos + i]) << (i * 8)
-        pos += 4
-
-        # Skip cip compressed size (8 bytes)
-        pos += 8
-
-        try:
-            decompressed = lzma.decompress(
-                blob[pos:],
-                format=lzma.FORMAT_RAW,
-                filters=[
-                    {
-                        "id": lzma.FILTER_LZMA1,
-                        "dict_size": int(dict_size),
-                        "lc": int(lc),
-                        "lp": int(lp),
-                        "pb": int(pb),
-                    }
-                ],
-            )
-        except Exception as e:
-            raise SpriteAppearancesError(f"Failed to LZMA-decompress sprite sheet: {e}") from e
-
-        if len(decompressed) < 54:
-            raise SpriteAppearancesError("Decompressed sprite sheet too small")
-
-        pixel_offset = struct.unpack_from("<I", decompressed, 10)[0]
-        if pixel_offset <= 0 or pixel_offset + BYTES_IN_SPRITE_SHEET > len(decompressed):
-            raise SpriteAppearancesError("Invalid BMP pixel offset in decompressed sprite sheet")
-
-        pixel_buf = bytearray(decompressed[pixel_offset : pixel_offset + BYTES_IN_SPRITE_SHEET])
-
-        # Flip vertically (legacy does this in-place).
-        row_bytes = SPRITE_SHEET_WIDTH_BYTES
-        for y in range(SPRITE_SHEET_HEIGHT // 2):
-            y2 = SPRITE_SHEET_HEIGHT - y - 1
-            a0 = y * row_bytes
-            b0 = y2 * row_bytes
-            tmp = pixel_buf[a0 : a0 + row_bytes]
-            pixel_buf[a0 : a0 + row_bytes] = pixel_buf[b0 : b0 + row_bytes]
-            pixel_buf[b0 : b0 + row_bytes] = tmp
-
-        sheet.data = bytes(pixel_buf)
-        sheet.sheet_width = SPRITE_SHEET_WIDTH
-        sheet.sheet_height = SPRITE_SHEET_HEIGHT
-        sheet.loaded = True
+        decode_sprite_sheet(sheet)
 
     def get_sprite_rgba(self, sprite_id: int) -> tuple[int, int, bytes]:
         """Return (w, h, BGRA bytes) for `sprite_id` (cached)."""
@@ -233,32 +140,9 @@ class SpriteAppearances:
             raise SpriteAppearancesError("Sheet loaded but pixel data missing")
 
         sprite_w, sprite_h = sheet.sprite_size()
+        out = extract_sheet_sprite(sheet, sid)
 
-        sprite_offset = sid - int(sheet.first_id)
-        if sprite_offset < 0 or sid > int(sheet.last_id):
-            raise SpriteAppearancesError("Sprite id out of sheet bounds")
-
-        sheet_width_bytes = int(sheet.sheet_width) * BYTES_PER_PIXEL
-        all_columns = int(sheet.sheet_width // sprite_w) if int(sprite_w) > 0 else 0
-        if all_columns <= 0:
-            raise SpriteAppearancesError("Invalid sheet dimensions for sprite extraction")
-        sprite_row = int(sprite_offset // all_columns)
-        sprite_col = int(sprite_offset % all_columns)
-
-        try:
-            out = bytearray(sprite_w * sprite_h * BYTES_PER_PIXEL)
-        except MemoryError as e:
-            raise SpriteAppearancesError(f"Out of memory creating sprite buffer ({sprite_w}x{sprite_h})") from e
-        src = sheet.data
-        sprite_w_bytes = int(sprite_w) * BYTES_PER_PIXEL
-
-        for y in range(int(sprite_h)):
-            src_row = sprite_row * int(sprite_h) + y
-            src_start = src_row * sheet_width_bytes + (sprite_col * sprite_w_bytes)
-            dst_start = y * sprite_w_bytes
-            out[dst_start : dst_start + sprite_w_bytes] = src[src_start : src_start + sprite_w_bytes]
-
-        result = (int(sprite_w), int(sprite_h), bytes(out))
+        result = (int(sprite_w), int(sprite_h), out)
         try:
             self._sprite_cache[sid] = result
             self._sprite_cache.move_to_end(sid)
@@ -285,6 +169,140 @@ class SpriteAppearances:
         return result
 
 
+def decode_sprite_sheet(sheet: SpriteSheet, blob: bytes | None = None) -> None:
+    """Decode `sheet` into `sheet.data` (BGRA), reading its file unless `blob` is given."""
+    if sheet.loaded:
+        return
+
+    p = Path(sheet.path)
+    if blob is None:
+        if not p.exists():
+            raise SpriteAppearancesError(f"Sprite sheet not found: {p}")
+        blob = p.read_bytes()
+
+    if p.suffix.lower() in (".png", ".bmp"):
+        sheet_width, sheet_height, pixel_data = _load_image_sheet(io.BytesIO(blob))
+        sheet.data = pixel_data
+        sheet.sheet_width = int(sheet_width)
+        sheet.sheet_height = int(sheet_height)
+        sheet.loaded = True
+        return
+
+    if not blob:
+        raise SpriteAppearancesError(f"Sprite sheet empty: {p}")
+
+    # Port of legacy header parsing from `SpriteAppearances::loadSpriteSheet`.
+    pos = 0
+    # Skip variable pad of NULs.
+    while pos < len(blob) and blob[pos] == 0x00:
+        pos += 1
+    if pos >= len(blob):
+        raise SpriteAppearancesError("Invalid sprite sheet header (all zeros)")
+
+    # Skip full constant marker [0x70 0x0A 0xFA 0x80 0x24].
+    # We are currently positioned at 0x70.
+    pos += 5
+
+    # Skip 7-bit int encoded LZMA file size.
+    while pos < len(blob) and (blob[pos] & 0x80) == 0x80:
+        pos += 1
+    pos += 1  # consume final size byte
+
+    if pos + 1 + 4 + 8 >= len(blob):
+        raise SpriteAppearancesError("Invalid sprite sheet header (truncated)")
+
+    lclppb = blob[pos]
+    pos += 1
+
+    lc = int(lclppb % 9)
+    remainder = int(lclppb // 9)
+    lp = int(remainder % 5)
+    pb = int(remainder // 5)
+
+    dict_size = 0
+    for i in range(4):
+        dict_size |= int(blob[pos + i]) << (i * 8)
+    pos += 4
+
+    # Skip cip compressed size (8 bytes)
+    pos += 8
+
+    try:
+        decompressed = lzma.decompress(
+            blob[pos:],
+            format=lzma.FORMAT_RAW,
+            filters=[
+                {
+                    "id": lzma.FILTER_LZMA1,
+                    "dict_size": int(dict_size),
+                    "lc": int(lc),
+                    "lp": int(lp),
+                    "pb": int(pb),
+                }
+            ],
+        )
+    except Exception as e:
+        raise SpriteAppearancesError(f"Failed to LZMA-decompress sprite sheet: {e}") from e
+
+    if len(decompressed) < 54:
+        raise SpriteAppearancesError("Decompressed sprite sheet too small")
+
+    pixel_offset = struct.unpack_from("<I", decompressed, 10)[0]
+    if pixel_offset <= 0 or pixel_offset + BYTES_IN_SPRITE_SHEET > len(decompressed):
+        raise SpriteAppearancesError("Invalid BMP pixel offset in decompressed sprite sheet")
+
+    pixel_buf = bytearray(decompressed[pixel_offset : pixel_offset + BYTES_IN_SPRITE_SHEET])
+
+    # Flip vertically (legacy does this in-place).
+    row_bytes = SPRITE_SHEET_WIDTH_BYTES
+    for y in range(SPRITE_SHEET_HEIGHT // 2):
+        y2 = SPRITE_SHEET_HEIGHT - y - 1
+        a0 = y * row_bytes
+        b0 = y2 * row_bytes
+        tmp = pixel_buf[a0 : a0 + row_bytes]
+        pixel_buf[a0 : a0 + row_bytes] = pixel_buf[b0 : b0 + row_bytes]
+        pixel_buf[b0 : b0 + row_bytes] = tmp
+
+    sheet.data = bytes(pixel_buf)
+    sheet.sheet_width = SPRITE_SHEET_WIDTH
+    sheet.sheet_height = SPRITE_SHEET_HEIGHT
+    sheet.loaded = True
+
+
+def extract_sheet_sprite(sheet: SpriteSheet, sprite_id: int) -> bytes:
+    """Cut the BGRA pixels of `sprite_id` out of a decoded `sheet`."""
+    if sheet.data is None:
+        raise SpriteAppearancesError("Sheet loaded but pixel data missing")
+
+    sid = int(sprite_id)
+    sprite_w, sprite_h = sheet.sprite_size()
+
+    sprite_offset = sid - int(sheet.first_id)
+    if sprite_offset < 0 or sid > int(sheet.last_id):
+        raise SpriteAppearancesError("Sprite id out of sheet bounds")
+
+    sheet_width_bytes = int(sheet.sheet_width) * BYTES_PER_PIXEL
+    all_columns = int(sheet.sheet_width // sprite_w) if int(sprite_w) > 0 else 0
+    if all_columns <= 0:
+        raise SpriteAppearancesError("Invalid sheet dimensions for sprite extraction")
+    sprite_row = int(sprite_offset // all_columns)
+    sprite_col = int(sprite_offset % all_columns)
+
+    try:
+        out = bytearray(sprite_w * sprite_h * BYTES_PER_PIXEL)
+    except MemoryError as e:
+        raise SpriteAppearancesError(f"Out of memory creating sprite buffer ({sprite_w}x{sprite_h})") from e
+    src = sheet.data
+    sprite_w_bytes = int(sprite_w) * BYTES_PER_PIXEL
+
+    for y in range(int(sprite_h)):
+        src_row = sprite_row * int(sprite_h) + y
+        src_start = src_row * sheet_width_bytes + (sprite_col * sprite_w_bytes)
+        dst_start = y * sprite_w_bytes
+        out[dst_start : dst_start + sprite_w_bytes] = src[src_start : src_start + sprite_w_bytes]
+    return bytes(out)
+
+
 def resolve_assets_dir(path: str | os.PathLike[str]) -> str:
     """Accepts either client root or assets folder; returns assets folder."""
 
@@ -306,7 +324,7 @@ def resolve_assets_dir(path: str | os.PathLike[str]) -> str:
     )
 
 
-def _load_image_sheet(path: Path) -> tuple[int, int, bytes]:
+def _load_image_sheet(path: Path | io.BytesIO) -> tuple[int, int, bytes]:
     try:
         from PIL import Image  # type: ignore[import-not-found]
     except Exception as e:
@@ -1,14 +1,17 @@
 # gamemap.py
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 from .houses import House
 from .item import Position
+from .spawn_index import SpawnAreaIndex
 from .spawns import MonsterSpawnArea, NpcSpawnArea
 from .tile import Tile
+from .tile_table import TileTable, TileTableView
 from .towns import Town
 from .zones import Zone
 
@@ -67,11 +70,12 @@ class GameMap:
     Besides tiles and header metadata, this may also include persisted
     map-level structures that are part of the OTBM format (e.g. waypoints).
 
-    Tiles are stored sparsely by (x, y, z).
+    Tiles are stored sparsely by (x, y, z) in a :class:`TileTable`, which is
+    what makes :meth:`snapshot` O(1).
     """
 
     header: MapHeader
-    tiles: dict[TileKey, Tile] = field(default_factory=dict)
+    tiles: dict[TileKey, Tile] = field(default_factory=TileTable)
     # Persisted map-level structures (OTBM child nodes).
     waypoints: dict[str, Position] = field(default_factory=dict)
     towns: dict[int, Town] = field(default_factory=dict)
@@ -82,6 +86,48 @@ class GameMap:
     zones: dict[int, Zone] = field(default_factory=dict)
     # Metadata injected by loaders; kept here so it works with `slots=True`.
     load_report: LoadReport = field(default_factory=_default_load_report)
+    # Derived spatial indexes over the spawn lists; never persisted or compared.
+    _monster_spawn_index: SpawnAreaIndex[MonsterSpawnArea] = field(
+        default_factory=SpawnAreaIndex, init=False, repr=False, compare=False
+    )
+    _npc_spawn_index: SpawnAreaIndex[NpcSpawnArea] = field(
+        default_factory=SpawnAreaIndex, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tiles, TileTable):
+            self.tiles = TileTable(self.tiles)
+
+    def snapshot(self) -> MapSnapshot:
+        """Capture a consistent point-in-time view of the map.
+
+        Costs O(1) in the number of tiles: the tile table journals the old
+        tile of each key first written while the snapshot is open, and the
+        map-level structures are shallow-copied (their values are frozen).
+        Take it between edits on the editing thread; the snapshot can then be
+        read or serialized from any thread. Close it when done.
+        """
+        tiles = self.tiles
+        if not isinstance(tiles, TileTable):
+            tiles = self.tiles = TileTable(tiles)
+        return MapSnapshot(
+            header=self.header,
+            tiles=tiles.view(),
+            waypoints=MappingProxyType(dict(self.waypoints)),
+            towns=MappingProxyType(dict(self.towns)),
+            monster_spawns=tuple(self.monster_spawns),
+            npc_spawns=tuple(self.npc_spawns),
+            houses=MappingProxyType(dict(self.houses)),
+            zones=MappingProxyType(dict(self.zones)),
+        )
+
+    def monster_spawn_index(self) -> SpawnAreaIndex[MonsterSpawnArea]:
+        """Grid index over `monster_spawns`, synced with the current list."""
+        return self._monster_spawn_index.sync(self.monster_spawns)
+
+    def npc_spawn_index(self) -> SpawnAreaIndex[NpcSpawnArea]:
+        """Grid index over `npc_spawns`, synced with the current list."""
+        return self._npc_spawn_index.sync(self.npc_spawns)
 
     def get_tile(self, x: int, y: int, z: int) -> Tile | None:
         return self.tiles.get((int(x), int(y), int(z)))
@@ -113,3 +159,44 @@ class GameMap:
 
     def clear(self) -> None:
         self.tiles.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class MapSnapshot:
+    """Frozen view of a :class:`GameMap` returned by :meth:`GameMap.snapshot`."""
+
+    header: MapHeader
+    tiles: TileTableView
+    waypoints: Mapping[str, Position]
+    towns: Mapping[int, Town]
+    monster_spawns: tuple[MonsterSpawnArea, ...]
+    npc_spawns: tuple[NpcSpawnArea, ...]
+    houses: Mapping[int, House]
+    zones: Mapping[int, Zone]
+
+    def __enter__(self) -> MapSnapshot:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @property
+    def version(self) -> int:
+        """Tile table version at capture time."""
+        return self.tiles.version
+
+    def close(self) -> None:
+        self.tiles.close()
+
+    def to_game_map(self) -> GameMap:
+        """Build a detached :class:`GameMap` for serializers; O(tiles)."""
+        return GameMap(
+            header=self.header,
+            tiles=self.tiles.materialize(),
+            waypoints=dict(self.waypoints),
+            towns=dict(self.towns),
+            monster_spawns=list(self.monster_spawns),
+            npc_spawns=list(self.npc_spawns),
+            houses=dict(self.houses),
+            zones=dict(self.zones),
+        )
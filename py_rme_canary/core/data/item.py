@@ -34,7 +34,11 @@ class Position:
     z: int
 
 
-@dataclass(slots=True)
+# Shared attribute-free items, keyed by (id, client_id, subtype, count).
+_PLAIN_ITEMS: dict[tuple[int, int | None, int | None, int | None], Item] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class Item:
     """Minimal item model required for strict OTBM I/O.
 
@@ -54,6 +58,10 @@ class Item:
     Visual vs logical IDs:
     - The editor may draw using ClientID but must save using ServerID.
     - `client_id` is optional metadata and is never written to OTBM.
+
+    Items are immutable; edit them with `dataclasses.replace`. Most map items
+    are attribute-free copies of the same id (grounds, walls, borders), so the
+    loader and brushes share one instance per value via `Item.plain`.
     """
 
     id: int
@@ -92,6 +100,47 @@ class Item:
 
         return int(self.id)
 
+    @classmethod
+    def plain(
+        cls,
+        item_id: int,
+        *,
+        client_id: int | None = None,
+        subtype: int | None = None,
+        count: int | None = None,
+    ) -> Item:
+        """Return the shared attribute-free item for these values."""
+
+        key = (int(item_id), client_id, subtype, count)
+        item = _PLAIN_ITEMS.get(key)
+        if item is None:
+            item = _PLAIN_ITEMS.setdefault(key, cls(id=key[0], client_id=client_id, subtype=subtype, count=count))
+        return item
+
+    @property
+    def is_plain(self) -> bool:
+        """True when nothing but id, client id, subtype and count is set."""
+
+        return (
+            self.raw_unknown_id is None
+            and self.text is None
+            and self.description is None
+            and self.action_id is None
+            and self.unique_id is None
+            and self.destination is None
+            and not self.items
+            and not self.attribute_map
+            and self.depot_id is None
+            and self.house_door_id is None
+        )
+
+    def interned(self) -> Item:
+        """Return the shared instance for a plain item, or `self` otherwise."""
+
+        if not self.is_plain:
+            return self
+        return Item.plain(self.id, client_id=self.client_id, subtype=self.subtype, count=self.count)
+
     def with_container_items(self, children: tuple[Item, ...]) -> Item:
         return Item(
             id=self.id,
@@ -0,0 +1,190 @@
+"""Spatial index over spawn areas.
+
+Spawn areas live in plain lists on :class:`GameMap` (``monster_spawns`` /
+``npc_spawns``) because that is what the XML/OTMM IO and undo actions work
+with. Hover lookups, spawn brushes and the spawn context menu however need
+"which areas cover this tile" answered per mouse move, which a linear scan
+over a few thousand areas cannot do cheaply.
+
+:class:`SpawnAreaIndex` keeps a per-floor uniform grid of the square
+footprint (centre +- radius) of every area. It follows the list it was built
+from: replacing the list (undo/redo assigns a fresh copy) or growing and
+shrinking it in place (brushes, importers) is diffed by object identity, so
+only the areas that actually changed are re-bucketed.
+"""
+
+from __future__ import annotations
+
+from .spawns import MonsterSpawnArea, NpcSpawnArea
+
+CELL_SHIFT = 4  # 16x16 tiles per grid cell
+
+CellKey = tuple[int, int, int]  # (z, cell_x, cell_y)
+
+
+def _area_bounds(area: MonsterSpawnArea | NpcSpawnArea) -> tuple[int, int, int, int, int]:
+    c = area.center
+    r = max(0, int(area.radius))
+    return int(c.x) - r, int(c.y) - r, int(c.x) + r, int(c.y) + r, int(c.z)
+
+
+class SpawnAreaIndex[AreaT: (MonsterSpawnArea, NpcSpawnArea)]:
+    """Uniform grid of spawn areas keyed by ``(z, x >> CELL_SHIFT, y >> CELL_SHIFT)``.
+
+    Queries return ``(list_index, area)`` pairs ordered by list index, so
+    callers that relied on "first match wins" over the source list keep
+    their semantics.
+
+    The index is synchronised lazily by :meth:`sync`; it notices list
+    replacement and length changes on its own. Callers that overwrite a
+    slot in place (``spawns[i] = area``) must call :meth:`invalidate`.
+    """
+
+    __slots__ = ("_cells", "_members", "_positions", "_source", "_source_len")
+
+    def __init__(self) -> None:
+        self._cells: dict[CellKey, list[AreaT]] = {}
+        self._members: dict[int, AreaT] = {}
+        self._positions: dict[int, int] | None = None
+        self._source: list[AreaT] | None = None
+        self._source_len = -1
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self, spawns: list[AreaT]) -> SpawnAreaIndex[AreaT]:
+        """Bring the grid in line with ``spawns`` and return ``self``."""
+        if spawns is self._source and len(spawns) == self._source_len:
+            return self
+
+        current = {id(area): area for area in spawns}
+        members = self._members
+        for key in members.keys() - current.keys():
+            self._unlink(members.pop(key))
+        for key in current.keys() - members.keys():
+            area = current[key]
+            members[key] = area
+            self._link(area)
+
+        self._source = spawns
+        self._source_len = len(spawns)
+        self._positions = None
+        return self
+
+    def invalidate(self) -> None:
+        """Force the next :meth:`sync` to diff against the source list."""
+        self._source = None
+        self._source_len = -1
+        self._positions = None
+
+    def _cell_keys(self, area: AreaT) -> list[CellKey]:
+        x0, y0, x1, y1, z = _area_bounds(area)
+        return [
+            (z, cx, cy)
+            for cx in range(x0 >> CELL_SHIFT, (x1 >> CELL_SHIFT) + 1)
+            for cy in range(y0 >> CELL_SHIFT, (y1 >> CELL_SHIFT) + 1)
+        ]
+
+    def _link(self, area: AreaT) -> None:
+        cells = self._cells
+        for key in self._cell_keys(area):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [area]
+            else:
+                bucket.append(area)
+
+    def _unlink(self, area: AreaT) -> None:
+        cells = self._cells
+        for key in self._cell_keys(area):
+            bucket = cells.get(key)
+            if bucket is None:
+                continue
+            for i, candidate in enumerate(bucket):
+                if candidate is area:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del cells[key]
+
+    def _position_of(self, area: AreaT) -> int:
+        positions = self._positions
+        if positions is None:
+            source = self._source or []
+            positions = {}
+            for idx, candidate in enumerate(source):
+                positions.setdefault(id(candidate), idx)
+            self._positions = positions
+        return positions.get(id(area), -1)
+
+    def _ordered(self, found: dict[int, AreaT]) -> list[tuple[int, AreaT]]:
+        pairs = [(self._position_of(area), area) for area in found.values()]
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def covering(self, x: int, y: int, z: int) -> list[tuple[int, AreaT]]:
+        """Return areas whose footprint contains ``(x, y, z)``."""
+        tx, ty, tz = int(x), int(y), int(z)
+        bucket = self._cells.get((tz, tx >> CELL_SHIFT, ty >> CELL_SHIFT))
+        if not bucket:
+            return []
+        found: dict[int, AreaT] = {}
+        for area in bucket:
+            c = area.center
+            if max(abs(tx - int(c.x)), abs(ty - int(c.y))) <= int(area.radius):
+                found[id(area)] = area
+        return self._ordered(found)
+
+    def in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> list[tuple[int, AreaT]]:
+        """Return areas whose footprint intersects the inclusive rectangle."""
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        x0, y0, x1, y1, tz = int(x0), int(y0), int(x1), int(y1), int(z)
+        cells = self._cells
+        found: dict[int, AreaT] = {}
+        for cx in range(x0 >> CELL_SHIFT, (x1 >> CELL_SHIFT) + 1):
+            for cy in range(y0 >> CELL_SHIFT, (y1 >> CELL_SHIFT) + 1):
+                bucket = cells.get((tz, cx, cy))
+                if not bucket:
+                    continue
+                for area in bucket:
+                    ax0, ay0, ax1, ay1, _ = _area_bounds(area)
+                    if ax0 <= x1 and ax1 >= x0 and ay0 <= y1 and ay1 >= y0:
+                        found[id(area)] = area
+        return self._ordered(found)
+
+    def centered_at(self, x: int, y: int, z: int) -> AreaT | None:
+        """Return the first area whose centre is exactly ``(x, y, z)``."""
+        tx, ty, tz = int(x), int(y), int(z)
+        for _idx, area in self.covering(tx, ty, tz):
+            c = area.center
+            if int(c.x) == tx and int(c.y) == ty:
+                return area
+        return None
+
+    def nearest_covering(self, x: int, y: int, z: int) -> tuple[int, AreaT, int, int] | None:
+        """Return ``(index, area, dx, dy)`` for the covering area closest to its centre.
+
+        Ties go to the lowest list index, matching a linear scan.
+        """
+        best: tuple[int, int, AreaT, int, int] | None = None
+        for idx, area in self.covering(x, y, z):
+            dx = int(x) - int(area.center.x)
+            dy = int(y) - int(area.center.y)
+            score = abs(dx) + abs(dy)
+            if best is None or score < best[0]:
+                best = (score, idx, area, dx, dy)
+        if best is None:
+            return None
+        _, idx, area, dx, dy = best
+        return idx, area, dx, dy
@@ -0,0 +1,276 @@
+"""Tile storage with cheap point-in-time views.
+
+:class:`GameMap` keeps its tiles in a :class:`TileTable`. It is a plain
+``dict`` for every read (lookups and iteration stay at C speed), but it
+routes writes through a hook so that :meth:`TileTable.view` can hand out a
+consistent snapshot in O(1): while a view is open, the first write to a key
+records the key's previous tile in the view's journal. A view therefore
+reads "journal first, live table otherwise" and never needs a copy of the
+table up front.
+
+Views are meant for background readers (autosave, exporters). They are safe
+to read from another thread while the owning thread keeps editing, because
+every journal entry is written before the live slot it protects and is never
+changed afterwards. Tiles are frozen; code that mutates a tile's item list
+in place bypasses the journal, exactly as it bypasses undo history.
+
+Incremental indexes that only need to know *which* keys changed (not their
+old tiles) use :meth:`TileTable.track_changes` instead of a view.
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tile import Tile
+
+TileKey = tuple[int, int, int]
+
+_ABSENT: Any = object()  # journal marker: the key had no tile when the view opened
+
+
+class TileTable(dict[TileKey, "Tile"]):
+    """``dict`` of tiles keyed by ``(x, y, z)`` that supports :meth:`view`."""
+
+    __slots__ = ("_journals", "_trackers", "_version")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Replaced, never mutated, so a reader on another thread can iterate them.
+        self._journals: tuple[dict[TileKey, Any], ...] = ()
+        self._trackers: tuple[set[TileKey], ...] = ()
+        self._version = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle/copy the tiles only; open views belong to the original table.
+        return (type(self), (dict(self),))
+
+    @property
+    def version(self) -> int:
+        """Bumped by every write; equal versions mean identical contents."""
+        return self._version
+
+    @property
+    def open_views(self) -> int:
+        return len(self._journals)
+
+    def view(self) -> TileTableView:
+        """Open a point-in-time view of the current tiles in O(1)."""
+        return TileTableView(self)
+
+    def track_changes(self) -> TileChangeTracker:
+        """Start recording the keys written from now on (see :class:`TileChangeTracker`)."""
+        return TileChangeTracker(self)
+
+    # --- journaling --------------------------------------------------------
+
+    def _remember(self, key: TileKey) -> None:
+        for journal in self._journals:
+            if key not in journal:
+                journal[key] = dict.get(self, key, _ABSENT)
+
+    def _open(self, journal: dict[TileKey, Any]) -> None:
+        self._journals = (*self._journals, journal)
+
+    def _close(self, journal: dict[TileKey, Any]) -> None:
+        self._journals = tuple(j for j in self._journals if j is not journal)
+
+    def _touched(self, key: TileKey) -> None:
+        # Called after the live slot changed, so a tracker drained in between
+        # sees the key again on its next drain rather than losing it.
+        for keys in self._trackers:
+            keys.add(key)
+
+    def _track(self, keys: set[TileKey]) -> None:
+        self._trackers = (*self._trackers, keys)
+
+    def _untrack(self, keys: set[TileKey]) -> None:
+        self._trackers = tuple(k for k in self._trackers if k is not keys)
+
+    # --- writes --------------------------------------------------------------
+
+    def __setitem__(self, key: TileKey, tile: Tile) -> None:
+        if self._journals:
+            self._remember(key)
+        dict.__setitem__(self, key, tile)
+        self._version += 1
+        if self._trackers:
+            self._touched(key)
+
+    def __delitem__(self, key: TileKey) -> None:
+        if self._journals:
+            self._remember(key)
+        dict.__delitem__(self, key)
+        self._version += 1
+        if self._trackers:
+            self._touched(key)
+
+    def pop(self, key: TileKey, *default: Any) -> Any:
+        if self._journals and key in self:
+            self._remember(key)
+        self._version += 1
+        value = dict.pop(self, key, *default)
+        if self._trackers:
+            self._touched(key)
+        return value
+
+    def popitem(self) -> tuple[TileKey, Tile]:
+        if self._journals and self:
+            self._remember(next(reversed(self)))
+        self._version += 1
+        item = dict.popitem(self)
+        if self._trackers:
+            self._touched(item[0])
+        return item
+
+    def setdefault(self, key: TileKey, default: Tile) -> Tile:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        items: Iterable[tuple[TileKey, Tile]]
+        if isinstance(other, Mapping):
+            items = other.items()
+        elif hasattr(other, "keys"):
+            keys = other.keys()
+            items = ((key, other[key]) for key in keys)
+        else:
+            items = other
+        for key, tile in items:
+            self[key] = tile
+        for key, tile in kwargs.items():
+            self[key] = tile  # type: ignore[index]
+
+    def __ior__(self, other: Any) -> TileTable:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        if self._journals:
+            for key in list(self):
+                self._remember(key)
+        keys = list(self) if self._trackers else ()
+        dict.clear(self)
+        self._version += 1
+        for key in keys:
+            self._touched(key)
+
+
+class TileChangeTracker:
+    """Keys of a :class:`TileTable` written since the last :meth:`drain`.
+
+    Cheaper than a view: it keeps keys only, never old tiles. Writes may
+    happen on another thread while the owner drains; a key written during a
+    drain is reported by that drain or the next one, never lost.
+    """
+
+    __slots__ = ("__weakref__", "_finalizer", "_keys")
+
+    def __init__(self, table: TileTable) -> None:
+        keys: set[TileKey] = set()
+        self._keys = keys
+        table._track(keys)
+        self._finalizer = weakref.finalize(self, table._untrack, keys)
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    @property
+    def pending(self) -> int:
+        return len(self._keys)
+
+    def drain(self) -> set[TileKey]:
+        """Return and forget the keys written since the previous drain."""
+        # copy() and difference_update() are single C calls; a key re-added
+        # by a concurrent write in between is removed here but that write's
+        # tile is already live, so the caller reads it.
+        keys = self._keys.copy()
+        self._keys.difference_update(keys)
+        return keys
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class TileTableView:
+    """Read-only tiles of a :class:`TileTable` as they were when the view opened.
+
+    Close the view (or use it as a context manager) when done; until then
+    every first write to a key costs the owning table one journal entry.
+    A view that is garbage collected closes itself.
+    """
+
+    __slots__ = ("__weakref__", "_finalizer", "_journal", "_table", "version")
+
+    def __init__(self, table: TileTable) -> None:
+        journal: dict[TileKey, Any] = {}
+        self._table = table
+        self._journal = journal
+        self.version = table.version
+        table._open(journal)
+        self._finalizer = weakref.finalize(self, table._close, journal)
+
+    def __enter__(self) -> TileTableView:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    @property
+    def journal_size(self) -> int:
+        """Tiles written since the view opened (its retention cost)."""
+        return len(self._journal)
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def get(self, key: TileKey, default: Tile | None = None) -> Tile | None:
+        self._check_open()
+        # Live slot first: a concurrent first write journals the old tile
+        # before replacing it, so checking the journal second cannot miss it.
+        tile = dict.get(self._table, key, _ABSENT)
+        old = self._journal.get(key, tile)
+        return default if old is _ABSENT else old
+
+    def __getitem__(self, key: TileKey) -> Tile:
+        tile = self.get(key)
+        if tile is None:
+            raise KeyError(key)
+        return tile
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def written_keys(self) -> set[TileKey]:
+        """Keys written on the live table since the view opened."""
+        self._check_open()
+        return set(self._journal.copy())
+
+    def materialize(self) -> TileTable:
+        """Copy the viewed tiles into a new, independent :class:`TileTable`."""
+        self._check_open()
+        # Copy the live table before the journal: anything written in between
+        # is journaled by the time the journal is copied.
+        tiles = TileTable(dict.copy(self._table))
+        for key, old in self._journal.copy().items():
+            if old is _ABSENT:
+                dict.pop(tiles, key, None)
+            else:
+                dict.__setitem__(tiles, key, old)
+        return tiles
+
+    def items(self) -> Iterator[tuple[TileKey, Tile]]:
+        return iter(self.materialize().items())
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("tile view is closed")
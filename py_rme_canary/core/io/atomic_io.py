@@ -1,6 +1,7 @@
 # atomic_io.py
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
 
@@ -30,3 +31,49 @@ def save_bytes_atomic(path: str, data: bytes) -> None:
                 tmp.unlink()
         except OSError:
             pass
+
+
+# Digest of the bytes last written (or verified) at each path, keyed by the
+# file's (size, mtime) so a file changed behind our back is re-read.
+_DIGEST_CACHE: dict[str, tuple[int, int, bytes]] = {}
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _file_digest(path: Path, size: int, mtime_ns: int) -> bytes:
+    key = str(path.resolve())
+    cached = _DIGEST_CACHE.get(key)
+    if cached is not None and cached[:2] == (size, mtime_ns):
+        return cached[2]
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.digest()
+    _DIGEST_CACHE[key] = (size, mtime_ns, digest)
+    return digest
+
+
+def save_bytes_atomic_if_changed(path: str | Path, data: bytes) -> bool:
+    """Like :func:`save_bytes_atomic`, but skip the write when `path` already holds `data`.
+
+    The existing file is only hashed when its size matches, and its digest is
+    remembered, so re-saving an unchanged file costs a `stat` after the first
+    time. Returns True if the file was written.
+    """
+
+    dst = Path(path)
+    digest = _digest(data)
+    try:
+        st = dst.stat()
+    except OSError:
+        st = None
+    if st is not None and st.st_size == len(data) and _file_digest(dst, st.st_size, st.st_mtime_ns) == digest:
+        return False
+
+    save_bytes_atomic(str(dst), data)
+    st = dst.stat()
+    _DIGEST_CACHE[str(dst.resolve())] = (st.st_size, st.st_mtime_ns, digest)
+    return True
@@ -1,24 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from py_rme_canary.core.data.houses import House
 from py_rme_canary.core.data.item import Position
 from py_rme_canary.core.exceptions.io import HousesXmlError
+from py_rme_canary.core.io.atomic_io import save_bytes_atomic_if_changed
 from py_rme_canary.core.io.xml.base import as_bool, as_int
 from py_rme_canary.core.io.xml.safe import Element
-from py_rme_canary.core.io.xml.safe import safe_etree as ET
+from py_rme_canary.core.io.xml.streaming import XML_DECLARATION, iter_records, iter_text_records, start_tag
 
 
 def parse_houses_xml(xml_text: str) -> dict[int, House]:
-    root = ET.fromstring(xml_text)
-    if (root.tag or "").strip().lower() != "houses":
-        raise HousesXmlError("Invalid root tag: expected <houses>")
+    return _read_houses(iter_text_records(xml_text, "houses", error=HousesXmlError))
 
+
+def _read_houses(records: Iterator[Element]) -> dict[int, House]:
     out: dict[int, House] = {}
 
-    for node in list(root):
+    for node in records:
         if (node.tag or "").strip().lower() != "house":
             continue
 
@@ -67,49 +68,42 @@ def parse_houses_xml(xml_text: str) -> dict[int, House]:
     return out
 
 
-def _indent(elem: Element, level: int = 0) -> None:
-    i = "\n" + level * "\t"
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "\t"
-        for child in elem:
-            _indent(child, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    elif level and (not elem.tail or not elem.tail.strip()):
-        elem.tail = i
-
-
-def build_houses_xml(houses: Iterable[House]) -> str:
-    root = ET.Element("houses")
-
+def iter_houses_xml(houses: Iterable[House]) -> Iterator[str]:
+    """Yield the houses document line by line, ordered by house id."""
+    yield XML_DECLARATION
+    empty = True
     for house in sorted(houses, key=lambda h: int(h.id)):
-        node = ET.SubElement(root, "house")
-        node.set("name", str(house.name))
-        node.set("houseid", str(int(house.id)))
-
+        if empty:
+            yield "<houses>"
+            empty = False
         entry = house.entry or Position(0, 0, 0)
-        node.set("entryx", str(int(entry.x)))
-        node.set("entryy", str(int(entry.y)))
-        node.set("entryz", str(int(entry.z)))
-
-        node.set("rent", str(int(house.rent)))
+        attrs: dict[str, object] = {
+            "name": house.name,
+            "houseid": int(house.id),
+            "entryx": int(entry.x),
+            "entryy": int(entry.y),
+            "entryz": int(entry.z),
+            "rent": int(house.rent),
+        }
         if house.guildhall:
-            node.set("guildhall", "true")
+            attrs["guildhall"] = "true"
+        attrs["townid"] = int(house.townid)
+        attrs["size"] = int(house.size)
+        attrs["clientid"] = int(house.clientid)
+        attrs["beds"] = int(house.beds)
+        yield f"\n\t{start_tag('house', attrs, empty=True)}"
+    yield "<houses />" if empty else "\n</houses>\n"
 
-        node.set("townid", str(int(house.townid)))
-        node.set("size", str(int(house.size)))
-        node.set("clientid", str(int(house.clientid)))
-        node.set("beds", str(int(house.beds)))
 
-    _indent(root)
-    return str(ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"))
+def build_houses_xml(houses: Iterable[House]) -> str:
+    return "".join(iter_houses_xml(houses))
 
 
 def load_houses(path: str | Path) -> dict[int, House]:
-    xml_text = Path(path).read_text(encoding="utf-8", errors="replace")
-    return parse_houses_xml(xml_text)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return _read_houses(iter_records(f, "houses", error=HousesXmlError))
 
 
-def save_houses(path: str | Path, houses: Iterable[House]) -> None:
-    Path(path).write_text(build_houses_xml(houses), encoding="utf-8")
+def save_houses(path: str | Path, houses: Iterable[House]) -> bool:
+    """Write the houses file unless it already has this content; True if written."""
+    return save_bytes_atomic_if_changed(path, build_houses_xml(houses).encode("utf-8"))
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from py_rme_canary.core.data.gamemap import GameMap, TileKey
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader, TileKey
 from py_rme_canary.core.data.item import Position
 
 ValidationSeverity = Literal["error", "warning"]
@@ -40,6 +40,23 @@ class MapValidationResult:
         return any(i.severity == "error" for i in self.issues)
 
 
+@dataclass(slots=True)
+class TileReferences:
+    """What the tile pass of :class:`MapValidator` needs to know about the tiles.
+
+    ``houses`` and ``zones`` map each referenced id to the positions using it;
+    the positions are only iterated for ids that are not defined on the map.
+    """
+
+    houses: Mapping[int, Iterable[TileKey]] = field(default_factory=dict)
+    zones: Mapping[int, Iterable[TileKey]] = field(default_factory=dict)
+    out_of_bounds: Sequence[TileKey] = ()
+
+
+def in_map_bounds(header: MapHeader, x: int, y: int, z: int, *, max_z: int = 15) -> bool:
+    return 0 <= int(x) < int(header.width) and 0 <= int(y) < int(header.height) and 0 <= int(z) <= int(max_z)
+
+
 class MapValidator:
     """Validate structural consistency of a GameMap."""
 
@@ -48,9 +65,14 @@ class MapValidator:
         self._max_z: int = int(max_z)
         self._result = MapValidationResult()
 
-    def validate(self) -> MapValidationResult:
+    def validate(self, *, tile_refs: TileReferences | None = None) -> MapValidationResult:
+        """Run every check.
+
+        ``tile_refs`` lets a caller that already walked the tiles (the
+        incremental map audit) skip the tile pass.
+        """
         self._validate_header()
-        self._validate_tiles()
+        self._validate_tiles(tile_refs if tile_refs is not None else self._collect_tile_references())
         self._validate_waypoints()
         self._validate_towns()
         self._validate_houses()
@@ -69,8 +91,7 @@ class MapValidator:
         )
 
     def _in_bounds(self, x: int, y: int, z: int) -> bool:
-        h = self._map.header
-        return 0 <= int(x) < int(h.width) and 0 <= int(y) < int(h.height) and 0 <= int(z) <= self._max_z
+        return in_map_bounds(self._map.header, x, y, z, max_z=self._max_z)
 
     def _validate_header(self) -> None:
         h = self._map.header
@@ -83,9 +104,9 @@ class MapValidator:
                 height=h.height,
             )
 
-    def _validate_tiles(self) -> None:
-        used_house_ids: set[int] = set()
-        used_zone_ids: set[int] = set()
+    def _collect_tile_references(self) -> TileReferences:
+        houses: dict[int, list[TileKey]] = {}
+        zones: dict[int, list[TileKey]] = {}
         invalid_positions: list[TileKey] = []
 
         for tile in self._map.iter_tiles():
@@ -93,40 +114,50 @@ class MapValidator:
             if not self._in_bounds(x, y, z):
                 invalid_positions.append((x, y, z))
                 continue
-
             if tile.house_id is not None:
-                used_house_ids.add(int(tile.house_id))
-                if int(tile.house_id) not in self._map.houses:
-                    self._add(
-                        "error",
-                        "HOUSE_ID_MISSING",
-                        "Tile references a house id that is not defined.",
-                        house_id=int(tile.house_id),
-                        position=(x, y, z),
-                    )
-
+                houses.setdefault(int(tile.house_id), []).append((x, y, z))
             for zid in tile.zones:
-                used_zone_ids.add(int(zid))
-                if int(zid) not in self._map.zones:
-                    self._add(
-                        "warning",
-                        "ZONE_ID_MISSING",
-                        "Tile references a zone id that is not defined.",
-                        zone_id=int(zid),
-                        position=(x, y, z),
-                    )
+                zones.setdefault(int(zid), []).append((x, y, z))
+
+        return TileReferences(houses=houses, zones=zones, out_of_bounds=invalid_positions)
+
+    def _validate_tiles(self, refs: TileReferences) -> None:
+        for house_id, positions in refs.houses.items():
+            if int(house_id) in self._map.houses:
+                continue
+            for position in positions:
+                self._add(
+                    "error",
+                    "HOUSE_ID_MISSING",
+                    "Tile references a house id that is not defined.",
+                    house_id=int(house_id),
+                    position=position,
+                )
+
+        for zid, positions in refs.zones.items():
+            if int(zid) in self._map.zones:
+                continue
+            for position in positions:
+                self._add(
+                    "warning",
+                    "ZONE_ID_MISSING",
+                    "Tile references a zone id that is not defined.",
+                    zone_id=int(zid),
+                    position=position,
+                )
 
+        invalid_positions = refs.out_of_bounds
         if invalid_positions:
             self._add(
                 "error",
                 "TILE_OUT_OF_BOUNDS",
                 "One or more tiles are outside map bounds.",
                 count=len(invalid_positions),
-                sample=invalid_positions[:5],
+                sample=list(invalid_positions[:5]),
             )
 
-        self._used_house_ids = used_house_ids
-        self._used_zone_ids = used_zone_ids
+        self._used_house_ids = {int(hid) for hid in refs.houses}
+        self._used_zone_ids = {int(zid) for zid in refs.zones}
 
     def _validate_waypoints(self) -> None:
         for name, pos in self._map.waypoints.items():
@@ -25,6 +25,8 @@ from .loader import (
 
 # High-level API - Saving
 from .saver import (
+    build_tile_node,
+    is_compact_ground_item,
     save_game_map_atomic,
     save_game_map_atomic_with_items_db,
     save_game_map_bundle_atomic,
@@ -60,6 +62,8 @@ __all__ = [
     "load_game_map_with_items_db",
     # Saver
     "serialize",
+    "build_tile_node",
+    "is_compact_ground_item",
     "save_game_map_atomic",
     "save_game_map_atomic_with_items_db",
     "save_game_map_bundle_atomic",
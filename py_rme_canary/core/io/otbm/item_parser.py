@@ -253,10 +253,12 @@ class ItemParser:
         tile_pos: tuple[int, int, int] | None = None,
     ) -> Item:
         item_id, client_id, raw_unknown_id = self._resolve_raw_item_id(raw_item_id, tile_pos=tile_pos)
+        if raw_unknown_id is None:
+            return Item.plain(int(item_id), client_id=int(client_id) if client_id is not None else None)
         return Item(
             id=int(item_id),
             client_id=int(client_id) if client_id is not None else None,
-            raw_unknown_id=int(raw_unknown_id) if raw_unknown_id is not None else None,
+            raw_unknown_id=int(raw_unknown_id),
         )
 
     def parse_item_payload(
@@ -389,6 +391,25 @@ class ItemParser:
                 if count is None and subtype is not None:
                     count = int(subtype)
 
+        if (
+            raw_unknown_id is None
+            and text is None
+            and description is None
+            and action_id is None
+            and unique_id is None
+            and destination is None
+            and depot_id is None
+            and house_door_id is None
+            and not attribute_map
+        ):
+            # Attribute-free items share one instance per value.
+            return Item.plain(
+                int(item_id),
+                client_id=int(client_id) if client_id is not None else None,
+                subtype=subtype,
+                count=count,
+            )
+
         return Item(
             id=int(item_id),
             client_id=int(client_id) if client_id is not None else None,
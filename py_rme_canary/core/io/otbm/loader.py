@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import os
 import struct
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import BinaryIO
 
@@ -67,6 +68,10 @@ class LoadWarning:
     action: str | None = None
 
 
+class _StreamStoppedError(Exception):
+    """Raised internally when a streaming consumer asks to stop."""
+
+
 class OTBMLoader:
     """High-level OTBM map loader.
 
@@ -96,6 +101,12 @@ class OTBMLoader:
         self._tile_parser: TileParser | None = None
         self._header: RootHeader | None = None
 
+        # Streaming state (see `stream`).
+        self._on_tile_area: Callable[[list[Tile]], bool | None] | None = None
+        self._on_progress: Callable[[int, int], None] | None = None
+        self._file_size: int = 0
+        self.stream_stopped: bool = False
+
     @staticmethod
     def _validate_policy(policy: str) -> str:
         """Validate unknown item policy."""
@@ -106,6 +117,37 @@ class OTBMLoader:
 
     def load(self, path: str) -> GameMap:
         """Load a complete GameMap from an OTBM file."""
+        return self._load(path)
+
+    def stream(
+        self,
+        path: str,
+        *,
+        on_tile_area: Callable[[list[Tile]], bool | None],
+        on_header: Callable[[MapHeader], None] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> GameMap:
+        """Parse an OTBM file handing tiles over one tile area at a time.
+
+        Tiles are never accumulated, so peak memory stays proportional to the
+        largest OTBM tile area. The returned GameMap carries the header, towns,
+        waypoints, spawns and load report, but no tiles.
+
+        `on_header` fires once the MAP_DATA attributes are known and before the
+        first tile is parsed. `on_progress` receives (bytes_read, file_size)
+        after each area. Returning False from `on_tile_area` stops parsing;
+        `stream_stopped` is then True.
+        """
+        self._on_tile_area = on_tile_area
+        self._on_progress = on_progress
+        self.stream_stopped = False
+        try:
+            return self._load(path, on_header=on_header)
+        finally:
+            self._on_tile_area = None
+            self._on_progress = None
+
+    def _load(self, path: str, *, on_header: Callable[[MapHeader], None] | None = None) -> GameMap:
         self.warnings.clear()
 
         # Pre-load guardrail (file size). This is deterministic and cheap.
@@ -125,6 +167,7 @@ class OTBMLoader:
         zonefile = ""
 
         with open(path, "rb") as f:
+            self._file_size = os.fstat(f.fileno()).st_size
             # Read root header
             self._header = read_root_header(f, allow_unsupported_versions=self.allow_unsupported_versions)
 
@@ -196,9 +239,27 @@ class OTBMLoader:
                     if child_payload.delimiter is None:
                         raise OTBMParseError("MAP_DATA missing delimiter")
 
+                    if on_header is not None:
+                        on_header(
+                            MapHeader(
+                                otbm_version=self._header.otbm_version,
+                                width=self._header.width,
+                                height=self._header.height,
+                                description=description,
+                                spawnmonsterfile=spawnmonsterfile,
+                                spawnnpcfile=spawnnpcfile,
+                                housefile=housefile,
+                                zonefile=zonefile,
+                            )
+                        )
+
                     if child_payload.delimiter == NODE_START:
                         # Parse MAP_DATA children (tile areas, towns, waypoints)
-                        self._parse_map_data_children(f, tiles, waypoints, towns)
+                        try:
+                            self._parse_map_data_children(f, tiles, waypoints, towns)
+                        except _StreamStoppedError:
+                            self.stream_stopped = True
+                            break
                 else:
                     d = child_payload.drain_to_delimiter()
                     if d == NODE_START:
@@ -312,7 +373,16 @@ class OTBMLoader:
             map_child_type, map_child_payload = begin_node(stream)
 
             if map_child_type == OTBM_TILE_AREA:
-                self._parse_tile_area(stream, map_child_payload, tiles)
+                if self._on_tile_area is None:
+                    self._parse_tile_area(stream, map_child_payload, tiles)
+                else:
+                    area_tiles: dict[tuple[int, int, int], Tile] = {}
+                    self._parse_tile_area(stream, map_child_payload, area_tiles)
+                    keep_going = self._on_tile_area(list(area_tiles.values()))
+                    if self._on_progress is not None:
+                        self._on_progress(stream.tell(), self._file_size)
+                    if keep_going is False:
+                        raise _StreamStoppedError
             elif map_child_type == OTBM_TOWNS:
                 self._parse_towns(stream, map_child_payload, towns)
             elif map_child_type == OTBM_WAYPOINTS:
@@ -132,7 +132,7 @@ def _string_payload(text: str) -> bytes:
     return struct.pack("<H", _u16(len(raw))) + raw
 
 
-def _is_compact_ground_item(item: Item) -> bool:
+def is_compact_ground_item(item: Item) -> bool:
     """Check if item can be written as compact tile attribute.
 
     RME only writes a compact item in the tile payload for simple ground.
@@ -388,7 +388,7 @@ def _build_item_node(
 # =============================================================================
 
 
-def _build_tile_node(
+def build_tile_node(
     *,
     base_x: int,
     base_y: int,
@@ -414,7 +414,7 @@ def _build_tile_node(
     # RME behavior: ground is often stored as a compact item (OTBM_ATTR_ITEM)
     children_items: list[Item] = []
     if tile.ground is not None:
-        if int(otbm_version) >= 2 and _is_compact_ground_item(tile.ground):
+        if int(otbm_version) >= 2 and is_compact_ground_item(tile.ground):
             resolved_id = _resolve_item_id_for_save(
                 int(tile.ground.id),
                 id_mapper=id_mapper,
@@ -464,7 +464,7 @@ def _build_tile_node_with_items_db(
 
     children_items: list[Item] = []
     if tile.ground is not None:
-        if int(otbm_version) >= 2 and _is_compact_ground_item(tile.ground):
+        if int(otbm_version) >= 2 and is_compact_ground_item(tile.ground):
             resolved_id = _resolve_item_id_for_save(
                 int(tile.ground.id),
                 id_mapper=id_mapper,
@@ -569,7 +569,7 @@ def serialize(
         payload = struct.pack("<HHB", _u16(key.base_x), _u16(key.base_y), _u8(key.z))
         if items_db is None:
             children = tuple(
-                _build_tile_node(
+                build_tile_node(
                     base_x=key.base_x,
                     base_y=key.base_y,
                     tile=t,
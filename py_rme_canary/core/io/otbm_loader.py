@@ -18,7 +18,8 @@ from py_rme_canary.core.config.project import (
     load_project_json,
     resolve_map_file,
 )
-from py_rme_canary.core.data.gamemap import GameMap
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.tile import Tile
 from py_rme_canary.core.database.id_mapper import IdMapper
 from py_rme_canary.core.database.items_otb import ItemsOTB, ItemsOTBError
 from py_rme_canary.core.database.items_xml import ItemsXML
@@ -140,6 +141,62 @@ class OTBMLoader:
         - Project wrapper JSON (sidecar or explicit)
         - Fallback sniff (repo defaults)
         """
+        cfg, map_path, warnings = self._prepare_detection(path, workspace_root=workspace_root)
+        gm = self.load(str(map_path))
+        self._finish_detection_report(gm, cfg, warnings)
+        return gm
+
+    def stream_with_detection(
+        self,
+        path: str,
+        *,
+        on_tile_area: Callable[[list[Tile]], bool | None],
+        on_header: Callable[[GameMap], None] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        workspace_root: str | Path | None = None,
+    ) -> GameMap:
+        """Stream a map's tiles area by area with project/definition resolution.
+
+        Unlike `load_with_detection`, tiles are handed to `on_tile_area` and
+        never collected. `on_header` receives a tile-less GameMap with the
+        header and the external houses/spawns/zones files already loaded, before
+        the first tile area is parsed; the same object is returned at the end
+        with towns, waypoints and the load report filled in.
+        """
+        cfg, map_path, warnings = self._prepare_detection(path, workspace_root=workspace_root)
+        shell: GameMap | None = None
+
+        def header_ready(header: MapHeader) -> None:
+            nonlocal shell
+            shell = GameMap(header=header)
+            ext = _load_external_files_into_gamemap(shell, otbm_path=map_path)
+            if ext:
+                self._inner.warnings.extend(ext)
+            if on_header is not None:
+                on_header(shell)
+
+        gm = self._inner.stream(
+            str(map_path),
+            on_tile_area=on_tile_area,
+            on_header=header_ready,
+            on_progress=on_progress,
+        )
+        if shell is not None:
+            shell.towns = gm.towns
+            shell.waypoints = gm.waypoints
+            shell.load_report = gm.load_report
+            shell.load_report["warnings"] = list(self._inner.warnings)
+            gm = shell
+        self._finish_detection_report(gm, cfg, warnings)
+        return gm
+
+    @property
+    def stream_stopped(self) -> bool:
+        return self._inner.stream_stopped
+
+    def _prepare_detection(
+        self, path: str, *, workspace_root: str | Path | None
+    ) -> tuple[ConfigurationManager, Path, list[LoadWarning]]:
         p = Path(path)
         project_path = p if p.suffix.lower() == ".json" else find_project_for_otbm(p)
 
@@ -170,8 +227,9 @@ class OTBMLoader:
             allow_unsupported_versions=self._allow_unsupported_versions,
             memory_guard=self._memory_guard,
         )
+        return cfg, map_path, warnings
 
-        gm = self.load(str(map_path))
+    def _finish_detection_report(self, gm: GameMap, cfg: ConfigurationManager, warnings: list[LoadWarning]) -> None:
         try:
             md_engine = str(cfg.metadata.engine or "unknown")
             md_cv = int(cfg.metadata.client_version or 0)
@@ -197,7 +255,6 @@ class OTBMLoader:
             if hasattr(gm, "load_report") and isinstance(gm.load_report, dict):
                 gm.load_report.setdefault("warnings", [])
                 gm.load_report["warnings"].extend(warnings)
-        return gm
 
 
 def _load_items_definitions(
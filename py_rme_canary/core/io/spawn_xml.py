@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from py_rme_canary.core.data.item import Position
@@ -11,23 +11,20 @@ from py_rme_canary.core.data.spawns import (
     NpcSpawnEntry,
 )
 from py_rme_canary.core.exceptions.io import SpawnXmlError
+from py_rme_canary.core.io.atomic_io import save_bytes_atomic_if_changed
 from py_rme_canary.core.io.xml.base import as_int
-from py_rme_canary.core.io.xml.safe import Element, ElementTree
-from py_rme_canary.core.io.xml.safe import safe_etree as ET
-
-
-def _require_tag(root: Element, expected_lower: str) -> None:
-    if (root.tag or "").strip().lower() != expected_lower:
-        raise SpawnXmlError(f"Invalid root tag: expected <{expected_lower}>")
+from py_rme_canary.core.io.xml.safe import Element
+from py_rme_canary.core.io.xml.streaming import XML_DECLARATION, iter_records, iter_text_records, start_tag
 
 
 def parse_monster_spawns_xml(xml_text: str) -> tuple[MonsterSpawnArea, ...]:
-    root = ET.fromstring(xml_text)
-    _require_tag(root, "monsters")
+    return _read_monster_spawns(iter_text_records(xml_text, "monsters", error=SpawnXmlError))
+
 
+def _read_monster_spawns(records: Iterator[Element]) -> tuple[MonsterSpawnArea, ...]:
     areas: list[MonsterSpawnArea] = []
 
-    for spawn_node in list(root):
+    for spawn_node in records:
         if (spawn_node.tag or "").strip().lower() != "monster":
             continue
 
@@ -102,12 +99,13 @@ def parse_monster_spawns_xml(xml_text: str) -> tuple[MonsterSpawnArea, ...]:
 
 
 def parse_npc_spawns_xml(xml_text: str) -> tuple[NpcSpawnArea, ...]:
-    root = ET.fromstring(xml_text)
-    _require_tag(root, "npcs")
+    return _read_npc_spawns(iter_text_records(xml_text, "npcs", error=SpawnXmlError))
 
+
+def _read_npc_spawns(records: Iterator[Element]) -> tuple[NpcSpawnArea, ...]:
     areas: list[NpcSpawnArea] = []
 
-    for spawn_node in list(root):
+    for spawn_node in records:
         if (spawn_node.tag or "").strip().lower() != "npc":
             continue
 
@@ -172,91 +170,96 @@ def parse_npc_spawns_xml(xml_text: str) -> tuple[NpcSpawnArea, ...]:
     return tuple(areas)
 
 
-def _xml_bytes(doc: ElementTree) -> bytes:
-    # Matches legacy in spirit: UTF-8 + XML declaration.
-    root = doc.getroot()
-    if root is None:
-        return b""
-    return bytes(ET.tostring(root, encoding="utf-8", xml_declaration=True))
-
-
-def _indent(elem: Element, level: int = 0) -> None:
-    # Pretty-print (ElementTree has no default pretty printer).
-    i = "\n" + level * "\t"
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "\t"
-        for child in elem:
-            _indent(child, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    elif level and (not elem.tail or not elem.tail.strip()):
-        elem.tail = i
-
-
-def build_monster_spawns_xml(areas: Iterable[MonsterSpawnArea]) -> str:
-    root = ET.Element("monsters")
-
+def iter_monster_spawns_xml(areas: Iterable[MonsterSpawnArea]) -> Iterator[str]:
+    """Yield the monster spawn document line by line."""
+    yield XML_DECLARATION
+    empty = True
     for area in areas:
-        spawn = ET.SubElement(root, "monster")
-        spawn.set("centerx", str(int(area.center.x)))
-        spawn.set("centery", str(int(area.center.y)))
-        spawn.set("centerz", str(int(area.center.z)))
-        spawn.set("radius", str(int(area.radius)))
-
+        if empty:
+            yield "<monsters>"
+            empty = False
+        spawn = _spawn_attrs(area)
+        if not area.monsters:
+            yield f"\n\t{start_tag('monster', spawn, empty=True)}"
+            continue
+        yield f"\n\t{start_tag('monster', spawn)}"
         for entry in area.monsters:
-            m = ET.SubElement(spawn, "monster")
-            m.set("name", str(entry.name))
-            m.set("x", str(int(entry.dx)))
-            m.set("y", str(int(entry.dy)))
-            m.set("z", str(int(area.center.z)))
-            m.set("spawntime", str(int(entry.spawntime)))
+            attrs: dict[str, object] = {
+                "name": entry.name,
+                "x": int(entry.dx),
+                "y": int(entry.dy),
+                "z": int(area.center.z),
+                "spawntime": int(entry.spawntime),
+            }
             if entry.direction is not None and int(entry.direction) != 0:
-                m.set("direction", str(int(entry.direction)))
+                attrs["direction"] = int(entry.direction)
             if entry.weight is not None:
-                m.set("weight", str(int(entry.weight)))
+                attrs["weight"] = int(entry.weight)
+            yield f"\n\t\t{start_tag('monster', attrs, empty=True)}"
+        yield "\n\t</monster>"
+    yield "<monsters />" if empty else "\n</monsters>\n"
 
-    _indent(root)
-    return str(ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"))
-
-
-def build_npc_spawns_xml(areas: Iterable[NpcSpawnArea]) -> str:
-    root = ET.Element("npcs")
 
+def iter_npc_spawns_xml(areas: Iterable[NpcSpawnArea]) -> Iterator[str]:
+    """Yield the NPC spawn document line by line."""
+    yield XML_DECLARATION
+    empty = True
     for area in areas:
-        spawn = ET.SubElement(root, "npc")
-        spawn.set("centerx", str(int(area.center.x)))
-        spawn.set("centery", str(int(area.center.y)))
-        spawn.set("centerz", str(int(area.center.z)))
-        spawn.set("radius", str(int(area.radius)))
-
+        if empty:
+            yield "<npcs>"
+            empty = False
+        spawn = _spawn_attrs(area)
+        if not area.npcs:
+            yield f"\n\t{start_tag('npc', spawn, empty=True)}"
+            continue
+        yield f"\n\t{start_tag('npc', spawn)}"
         for entry in area.npcs:
-            n = ET.SubElement(spawn, "npc")
-            n.set("name", str(entry.name))
-            n.set("x", str(int(entry.dx)))
-            n.set("y", str(int(entry.dy)))
-            n.set("z", str(int(area.center.z)))
-            n.set("spawntime", str(int(entry.spawntime)))
+            attrs: dict[str, object] = {
+                "name": entry.name,
+                "x": int(entry.dx),
+                "y": int(entry.dy),
+                "z": int(area.center.z),
+                "spawntime": int(entry.spawntime),
+            }
             if entry.direction is not None and int(entry.direction) != 0:
-                n.set("direction", str(int(entry.direction)))
+                attrs["direction"] = int(entry.direction)
+            yield f"\n\t\t{start_tag('npc', attrs, empty=True)}"
+        yield "\n\t</npc>"
+    yield "<npcs />" if empty else "\n</npcs>\n"
+
 
-    _indent(root)
-    return str(ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"))
+def _spawn_attrs(area: MonsterSpawnArea | NpcSpawnArea) -> dict[str, object]:
+    return {
+        "centerx": int(area.center.x),
+        "centery": int(area.center.y),
+        "centerz": int(area.center.z),
+        "radius": int(area.radius),
+    }
+
+
+def build_monster_spawns_xml(areas: Iterable[MonsterSpawnArea]) -> str:
+    return "".join(iter_monster_spawns_xml(areas))
+
+
+def build_npc_spawns_xml(areas: Iterable[NpcSpawnArea]) -> str:
+    return "".join(iter_npc_spawns_xml(areas))
 
 
 def load_monster_spawns(path: str | Path) -> tuple[MonsterSpawnArea, ...]:
-    xml_text = Path(path).read_text(encoding="utf-8", errors="replace")
-    return parse_monster_spawns_xml(xml_text)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return _read_monster_spawns(iter_records(f, "monsters", error=SpawnXmlError))
 
 
 def load_npc_spawns(path: str | Path) -> tuple[NpcSpawnArea, ...]:
-    xml_text = Path(path).read_text(encoding="utf-8", errors="replace")
-    return parse_npc_spawns_xml(xml_text)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return _read_npc_spawns(iter_records(f, "npcs", error=SpawnXmlError))
 
 
-def save_monster_spawns(path: str | Path, areas: Iterable[MonsterSpawnArea]) -> None:
-    Path(path).write_text(build_monster_spawns_xml(areas), encoding="utf-8")
+def save_monster_spawns(path: str | Path, areas: Iterable[MonsterSpawnArea]) -> bool:
+    """Write the monster spawn file unless it already has this content; True if written."""
+    return save_bytes_atomic_if_changed(path, build_monster_spawns_xml(areas).encode("utf-8"))
 
 
-def save_npc_spawns(path: str | Path, areas: Iterable[NpcSpawnArea]) -> None:
-    Path(path).write_text(build_npc_spawns_xml(areas), encoding="utf-8")
+def save_npc_spawns(path: str | Path, areas: Iterable[NpcSpawnArea]) -> bool:
+    """Write the NPC spawn file unless it already has this content; True if written."""
+    return save_bytes_atomic_if_changed(path, build_npc_spawns_xml(areas).encode("utf-8"))
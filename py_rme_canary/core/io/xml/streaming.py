@@ -0,0 +1,83 @@
+"""Streaming helpers for the map sidecar XML files (spawns, houses, zones).
+
+Sidecars are flat: a root element holding many records, each with at most one
+level of children. Reading them through :func:`iter_records` keeps only the
+record being processed in memory instead of the whole tree, and writers emit
+text line by line with :func:`start_tag` instead of building a DOM first.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import IO
+
+from .safe import Element, safe_etree
+
+XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+
+_ATTR_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("\r", "&#13;"),
+    ("\n", "&#10;"),
+    ("\t", "&#09;"),
+)
+
+
+def escape_attr(value: str) -> str:
+    # Same escaping as ElementTree, so output matches what it would serialize.
+    for char, entity in _ATTR_ESCAPES:
+        if char in value:
+            value = value.replace(char, entity)
+    return value
+
+
+def start_tag(tag: str, attrs: Mapping[str, object], *, empty: bool = False) -> str:
+    """Render ``<tag a="1">`` (or ``<tag a="1" />`` when ``empty``)."""
+    parts = [tag]
+    parts.extend(f'{name}="{escape_attr(str(value))}"' for name, value in attrs.items())
+    return f"<{' '.join(parts)}{' />' if empty else '>'}"
+
+
+def iter_records(
+    source: str | Path | IO[str] | IO[bytes],
+    root_tag: str,
+    *,
+    error: type[Exception] = ValueError,
+) -> Iterator[Element]:
+    """Yield each direct child of the document root once it is fully parsed.
+
+    ``source`` is a path or an open file. Parsing goes through the safe
+    (defusedxml) ``iterparse``, so DTD entity tricks are rejected exactly as
+    with ``fromstring``. A yielded record (and its children) is only valid
+    until the next one is requested; it is then dropped from the tree.
+
+    Raises ``error`` if the root element is not ``root_tag`` (compared
+    case-insensitively).
+    """
+    root: Element | None = None
+    depth = 0
+    for event, elem in safe_etree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                if (elem.tag or "").strip().lower() != root_tag:
+                    raise error(f"Invalid root tag: expected <{root_tag}>")
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and root is not None:
+            yield elem
+            root.clear()
+
+
+def iter_text_records(xml_text: str, root_tag: str, *, error: type[Exception] = ValueError) -> Iterator[Element]:
+    """:func:`iter_records` over an in-memory document."""
+    return iter_records(io.StringIO(xml_text), root_tag, error=error)
+
+
+__all__ = ["XML_DECLARATION", "escape_attr", "iter_records", "iter_text_records", "start_tag"]
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from py_rme_canary.core.data.zones import Zone
 from py_rme_canary.core.exceptions.io import ZonesXmlError
+from py_rme_canary.core.io.atomic_io import save_bytes_atomic_if_changed
 from py_rme_canary.core.io.xml.base import as_int
 from py_rme_canary.core.io.xml.safe import Element
-from py_rme_canary.core.io.xml.safe import safe_etree as ET
+from py_rme_canary.core.io.xml.streaming import XML_DECLARATION, iter_records, iter_text_records, start_tag
 
 
 def parse_zones_xml(xml_text: str) -> dict[int, Zone]:
-    root = ET.fromstring(xml_text)
-    if (root.tag or "").strip().lower() != "zones":
-        raise ZonesXmlError("Invalid root tag: expected <zones>")
+    return _read_zones(iter_text_records(xml_text, "zones", error=ZonesXmlError))
 
+
+def _read_zones(records: Iterator[Element]) -> dict[int, Zone]:
     out: dict[int, Zone] = {}
 
-    for node in list(root):
+    for node in records:
         if (node.tag or "").strip().lower() != "zone":
             continue
 
@@ -31,37 +32,29 @@ def parse_zones_xml(xml_text: str) -> dict[int, Zone]:
     return out
 
 
-def _indent(elem: Element, level: int = 0) -> None:
-    i = "\n" + level * "\t"
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "\t"
-        for child in elem:
-            _indent(child, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    elif level and (not elem.tail or not elem.tail.strip()):
-        elem.tail = i
-
-
-def build_zones_xml(zones: Iterable[Zone]) -> str:
-    root = ET.Element("zones")
-
+def iter_zones_xml(zones: Iterable[Zone]) -> Iterator[str]:
+    """Yield the zones document line by line, ordered by zone id."""
+    yield XML_DECLARATION
+    empty = True
     for zone in sorted(zones, key=lambda z: int(z.id)):
         if int(zone.id) <= 0:
             continue
-        node = ET.SubElement(root, "zone")
-        node.set("name", str(zone.name))
-        node.set("zoneid", str(int(zone.id)))
+        if empty:
+            yield "<zones>"
+            empty = False
+        yield f"\n\t{start_tag('zone', {'name': zone.name, 'zoneid': int(zone.id)}, empty=True)}"
+    yield "<zones />" if empty else "\n</zones>\n"
+
 
-    _indent(root)
-    return str(ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"))
+def build_zones_xml(zones: Iterable[Zone]) -> str:
+    return "".join(iter_zones_xml(zones))
 
 
 def load_zones(path: str | Path) -> dict[int, Zone]:
-    xml_text = Path(path).read_text(encoding="utf-8", errors="replace")
-    return parse_zones_xml(xml_text)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return _read_zones(iter_records(f, "zones", error=ZonesXmlError))
 
 
-def save_zones(path: str | Path, zones: Iterable[Zone]) -> None:
-    Path(path).write_text(build_zones_xml(zones), encoding="utf-8")
+def save_zones(path: str | Path, zones: Iterable[Zone]) -> bool:
+    """Write the zones file unless it already has this content; True if written."""
+    return save_bytes_atomic_if_changed(path, build_zones_xml(zones).encode("utf-8"))
@@ -1,8 +1,10 @@
 """Memory management module.
 
-Provides object pooling and memory optimization utilities.
+Provides object pooling, reusable frame buffers and allocation measurement.
 """
 
+from .alloc_probe import AllocationProbe, AllocationReport
+from .frame_arena import ArenaStats, FrameArena
 from .object_pool import (
     ItemPool,
     ObjectPool,
@@ -14,6 +16,10 @@ from .object_pool import (
 )
 
 __all__ = [
+    "AllocationProbe",
+    "AllocationReport",
+    "ArenaStats",
+    "FrameArena",
     "ItemPool",
     "ObjectPool",
     "PoolManager",
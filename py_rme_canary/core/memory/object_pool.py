@@ -344,20 +344,11 @@ class ItemPool(ObjectPool["Item"]):
 
             return Item(id=0)
 
-        def reset_fn(item: Item) -> None:
-            item.id = 0
-            item.count = 1
-            item.action_id = None
-            item.unique_id = None
-            item.text = None
-            item.destination = None
-            # Items attribute is a tuple (immutable default), so we can't clear it.
-            # If mutable list was intended, Item definition needs update.
-            # For now, we assume we can't easily reuse container items without replacement.
-
+        # Item is immutable (plain items are shared flyweights), so there is
+        # nothing to reset; the pool only keeps the interface.
         super().__init__(
             factory=factory,
-            reset_fn=reset_fn,
+            reset_fn=None,
             max_size=max_size,
             name="ItemPool",
         )
@@ -370,12 +361,11 @@ class ItemPool(ObjectPool["Item"]):
             count: Stack count.
 
         Returns:
-            Item configured with ID and count.
+            The shared plain Item for (item_id, count).
         """
-        item = self.acquire()
-        item.id = int(item_id)
-        item.count = max(1, int(count))
-        return item
+        from py_rme_canary.core.data.item import Item
+
+        return Item.plain(int(item_id), count=max(1, int(count)))
 
 
 @dataclass
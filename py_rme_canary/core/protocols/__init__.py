@@ -3,10 +3,12 @@
 from .live_client import LiveClient, ReconnectConfig
 from .live_packets import ConnectionState, NetworkHeader, PacketType
 from .live_server import LiveServer
+from .live_sync import LiveChangeJournal
 from .tile_recorder import TileChangeRecorder
 
 __all__ = [
     "ConnectionState",
+    "LiveChangeJournal",
     "LiveClient",
     "LiveServer",
     "NetworkHeader",
@@ -17,6 +17,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+from .live_inbox import LiveTileInbox
 from .live_packets import ConnectionState, PacketType, encode_cursor
 from .live_socket import LiveSocket
 
@@ -97,6 +98,16 @@ class LiveClient(LiveSocket):
         self._map_chunks: dict[int, dict[str, Any]] = {}
         self._expected_chunks: int = 0
 
+        # Resync position: the server journal epoch and the last sequence
+        # applied. Kept across reconnects so only missed changes are fetched.
+        self.sync_epoch: int = 0
+        self.sync_seq: int = 0
+        self.sync_pending: bool = False
+
+        # Received tiles, decoded on the receive thread and applied by the
+        # session on the UI thread (see LiveTileInbox).
+        self.inbox = LiveTileInbox()
+
     def set_cursor_callback(self, callback: Callable[[int, int, int, int], None] | None) -> None:
         """Set callback for cursor updates: (client_id, x, y, z)."""
         self._on_cursor_update = callback
@@ -322,6 +333,36 @@ class LiveClient(LiveSocket):
         self._expected_chunks = 0
         return self.send_packet(PacketType.MAP_REQUEST, payload)
 
+    def request_sync(self) -> bool:
+        """Ask the server for the tiles changed since the last applied sequence.
+
+        The server answers with SYNC_CHUNK packets: only the missed changes
+        if its journal still covers ``sync_seq``, else a full snapshot.
+        """
+        from .live_sync import encode_sync_request
+
+        self.sync_pending = True
+        return self.send_packet(PacketType.SYNC_REQUEST, encode_sync_request(self.sync_epoch, self.sync_seq))
+
+    def begin_sync_reset(self) -> None:
+        """A full snapshot started: the old position no longer describes the map."""
+        self.sync_epoch = 0
+        self.sync_seq = 0
+
+    def finish_sync(self, epoch: int, seq: int) -> None:
+        """The last SYNC_CHUNK of an answer was applied."""
+        self.sync_epoch = int(epoch)
+        self.sync_seq = int(seq)
+        self.sync_pending = False
+
+    def advance_sync(self, epoch: int, seq: int) -> None:
+        """Apply a SYNC_MARK sent after a relayed tile update."""
+        # While an answer is in flight, marks may be ahead of what has been
+        # applied; finish_sync sets the position instead.
+        if self.sync_pending or int(epoch) != self.sync_epoch:
+            return
+        self.sync_seq = max(self.sync_seq, int(seq))
+
     def _receive_loop(self) -> None:
         """Background loop to handle incoming data."""
         if not self.socket:
@@ -344,11 +385,46 @@ class LiveClient(LiveSocket):
             self._do_disconnect("Connection lost")
 
     def _handle_packet(self, packet_type: int, payload: bytes) -> None:
-        """Queue received packet for polling on the main thread."""
+        """Queue received packet for polling on the main thread.
+
+        Tile data and sync bookkeeping are handled here on the receive
+        thread instead: tiles go to :attr:`inbox`, already decoded.
+        """
+        if self._route_tiles(int(packet_type), payload):
+            return
         with self._queue_lock:
             self._incoming_queue.append((int(packet_type), payload))
         log.debug("Queued packet %s with %s bytes", int(packet_type), len(payload))
 
+    def _route_tiles(self, packet_type: int, payload: bytes) -> bool:
+        from .live_sync import SYNC_DONE, SYNC_RESET, decode_sync_chunk, decode_sync_mark
+        from .tile_serializer import decode_map_chunk, decode_tile_update
+
+        if packet_type == PacketType.TILE_UPDATE:
+            tiles, ok = decode_tile_update(payload)
+            if not (ok and tiles):
+                return False  # legacy position list: the session repaints those
+            self.inbox.put(tiles)
+            return True
+        if packet_type == PacketType.MAP_CHUNK:
+            self.inbox.put(decode_map_chunk(payload)["tiles"])
+            return True
+        if packet_type == PacketType.SYNC_CHUNK:
+            chunk = decode_sync_chunk(payload)
+            if chunk["flags"] & SYNC_RESET:
+                self.begin_sync_reset()
+                self.inbox.reset()
+            self.inbox.put(chunk["tiles"])
+            # Pending tiles outlive a reconnect, so the position can move on
+            # before the UI thread has applied them.
+            if chunk["flags"] & SYNC_DONE:
+                self.finish_sync(chunk["epoch"], chunk["seq"])
+            return True
+        if packet_type == PacketType.SYNC_MARK:
+            self.advance_sync(*decode_sync_mark(payload))
+            return True
+        return False
+
     def _handle_client_list(self, payload: bytes) -> None:
         """Parse and dispatch client list update."""
         if len(payload) < 2:
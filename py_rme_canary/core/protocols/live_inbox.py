@@ -0,0 +1,195 @@
+"""Coalescing inbox for tiles received from live peers.
+
+The network thread decodes TILE_UPDATE / MAP_CHUNK / SYNC_CHUNK payloads and
+:meth:`LiveTileInbox.put` s the tiles, keyed by position: a tile that arrives
+again before it was applied replaces the pending copy in place (keeping its
+queue position and age), so a burst of updates to the same area costs one
+apply per tile. The UI thread then :meth:`LiveTileInbox.drain` s the inbox
+within a time budget and gets back the set of changed positions, for a
+single change notification.
+
+Layer: core (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+TileKey = tuple[int, int, int]
+
+DEFAULT_APPLY_BUDGET_MS = 8.0
+_DRAIN_BATCH = 64  # tiles applied between budget checks
+
+
+@dataclass(slots=True)
+class LiveInboxStats:
+    """Counters for a :class:`LiveTileInbox`.
+
+    Attributes:
+        queue_depth: Tiles waiting to be applied.
+        peak_queue_depth: Largest queue depth observed.
+        tiles_received: Tiles put into the inbox.
+        tiles_coalesced: Tiles replaced (or reset) before being applied.
+        tiles_applied: Tiles handed to the apply callback.
+        drains: Drains that applied at least one tile.
+        last_drain_ms: Wall time of the last such drain.
+        last_latency_ms: Oldest receive-to-apply delay in the last drain.
+        max_latency_ms: Largest receive-to-apply delay observed.
+        total_latency_ms: Sum of receive-to-apply delays, for the mean.
+    """
+
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    tiles_received: int = 0
+    tiles_coalesced: int = 0
+    tiles_applied: int = 0
+    drains: int = 0
+    last_drain_ms: float = 0.0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        """Mean receive-to-apply delay per applied tile."""
+        if self.tiles_applied == 0:
+            return 0.0
+        return self.total_latency_ms / self.tiles_applied
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/debugging."""
+        return {
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "tiles_received": self.tiles_received,
+            "tiles_coalesced": self.tiles_coalesced,
+            "tiles_applied": self.tiles_applied,
+            "drains": self.drains,
+            "last_drain_ms": round(self.last_drain_ms, 2),
+            "last_latency_ms": round(self.last_latency_ms, 2),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "mean_latency_ms": round(self.mean_latency_ms, 2),
+        }
+
+
+class LiveTileInbox:
+    """Latest pending state per tile position, filled by the network thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[TileKey, tuple[dict[str, Any], float]] = OrderedDict()
+        self._reset = False
+        self._stats = LiveInboxStats()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def stats(self) -> LiveInboxStats:
+        """Copy of the current counters."""
+        with self._lock:
+            stats = self._stats
+            return LiveInboxStats(
+                queue_depth=len(self._pending),
+                peak_queue_depth=stats.peak_queue_depth,
+                tiles_received=stats.tiles_received,
+                tiles_coalesced=stats.tiles_coalesced,
+                tiles_applied=stats.tiles_applied,
+                drains=stats.drains,
+                last_drain_ms=stats.last_drain_ms,
+                last_latency_ms=stats.last_latency_ms,
+                max_latency_ms=stats.max_latency_ms,
+                total_latency_ms=stats.total_latency_ms,
+            )
+
+    def put(self, tiles: Iterable[dict[str, Any]]) -> None:
+        """Queue decoded tiles (dicts as from ``tile_serializer.decode_tile``)."""
+        now = time.perf_counter()
+        with self._lock:
+            pending = self._pending
+            stats = self._stats
+            for tile in tiles:
+                if not tile:
+                    continue
+                key = (int(tile["x"]), int(tile["y"]), int(tile["z"]))
+                previous = pending.get(key)
+                if previous is None:
+                    pending[key] = (tile, now)
+                else:
+                    pending[key] = (tile, previous[1])
+                    stats.tiles_coalesced += 1
+                stats.tiles_received += 1
+            stats.peak_queue_depth = max(stats.peak_queue_depth, len(pending))
+
+    def reset(self) -> None:
+        """Drop pending tiles; the next drain clears the map before applying more."""
+        with self._lock:
+            self._stats.tiles_coalesced += len(self._pending)
+            self._pending.clear()
+            self._reset = True
+
+    def drain(
+        self,
+        apply: Callable[[list[dict[str, Any]]], set[TileKey]],
+        *,
+        on_reset: Callable[[], set[TileKey]],
+        budget_ms: float | None = DEFAULT_APPLY_BUDGET_MS,
+    ) -> set[TileKey]:
+        """Apply pending tiles, oldest first, until the inbox is empty or the budget is spent.
+
+        ``apply`` receives batches of tile dicts and returns the positions
+        it changed; ``on_reset`` clears the map after a :meth:`reset`. The
+        budget is checked between batches, so a drain always makes progress
+        and overruns by at most one batch. ``None`` drains everything.
+
+        Returns the union of changed positions.
+        """
+        started = time.perf_counter()
+        deadline = None if budget_ms is None else started + max(0.0, float(budget_ms)) / 1000.0
+        changed: set[TileKey] = set()
+        applied = 0
+        oldest = 0.0
+        latency_sum = 0.0
+
+        with self._lock:
+            reset, self._reset = self._reset, False
+        if reset:
+            changed |= on_reset()
+
+        while True:
+            with self._lock:
+                # A reset that arrives mid-drain must run before any tile queued after it.
+                if self._reset:
+                    break
+                pending = self._pending
+                batch = [pending.popitem(last=False)[1] for _ in range(min(_DRAIN_BATCH, len(pending)))]
+            if not batch:
+                break
+            changed |= apply([tile for tile, _queued in batch])
+            now = time.perf_counter()
+            for _tile, queued in batch:
+                latency_sum += now - queued
+            oldest = max(oldest, now - batch[0][1])
+            applied += len(batch)
+            if deadline is not None and now >= deadline:
+                break
+
+        if applied:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                stats = self._stats
+                stats.tiles_applied += applied
+                stats.drains += 1
+                stats.last_drain_ms = elapsed_ms
+                stats.last_latency_ms = oldest * 1000.0
+                stats.max_latency_ms = max(stats.max_latency_ms, oldest * 1000.0)
+                stats.total_latency_ms += latency_sum * 1000.0
+        return changed
+
+
+__all__ = ["DEFAULT_APPLY_BUDGET_MS", "LiveInboxStats", "LiveTileInbox"]
@@ -23,6 +23,9 @@ class PacketType(IntEnum):
     TILE_UPDATE = 13
     MAP_REQUEST = 14
     MAP_CHUNK = 15
+    SYNC_REQUEST = 16
+    SYNC_CHUNK = 17
+    SYNC_MARK = 18
 
     # Chat / Interaction
     MESSAGE = 20
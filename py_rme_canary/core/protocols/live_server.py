@@ -12,10 +12,15 @@ import threading
 import time
 from collections.abc import Callable
 from contextlib import suppress
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .live_inbox import LiveTileInbox
 from .live_packets import PacketType, decode_cursor, encode_chat
 from .live_peer import LivePeer
+from .live_sync import LiveChangeJournal, decode_sync_request, encode_sync_mark, iter_sync_chunks
+
+if TYPE_CHECKING:
+    from py_rme_canary.core.data.gamemap import MapSnapshot
 
 log = logging.getLogger(__name__)
 
@@ -75,6 +80,15 @@ class LiveServer:
         # Callback for map data requests: (x_min, y_min, x_max, y_max, z) -> list[tiles]
         self._map_provider: Callable[[int, int, int, int, int], Any] | None = None
 
+        # Relayed tile changes, for delta resyncs. The lock keeps journal
+        # order and broadcast order identical; sync answers only hold it to
+        # copy from the journal and to send the short tail that ends them.
+        self.journal = LiveChangeJournal()
+        self._sync_lock = threading.Lock()
+
+        # Tiles from clients, decoded here and applied by the host session.
+        self.inbox = LiveTileInbox()
+
     def set_map_provider(self, callback: Callable[[int, int, int, int, int], Any] | None) -> None:
         """Set callback to provide map data for sync requests."""
         self._map_provider = callback
@@ -126,6 +140,81 @@ class LiveServer:
             if not peer.send_packet(packet_type, payload):
                 self._disconnect_client(sock)
 
+    def broadcast_tiles(self, payload: bytes, exclude: socket.socket | None = None) -> int:
+        """Journal and broadcast a TILE_UPDATE payload; return its sequence number.
+
+        Every client, including ``exclude`` (the sender), then gets a
+        SYNC_MARK so it knows which sequence it is up to date with.
+        """
+        with self._sync_lock:
+            seq = self.journal.record(payload)
+            self.broadcast(PacketType.TILE_UPDATE, payload, exclude=exclude)
+            self.broadcast(PacketType.SYNC_MARK, encode_sync_mark(self.journal.epoch, seq))
+        return seq
+
+    def serve_sync(self, request: bytes, snapshot: "MapSnapshot | None" = None) -> bool:
+        """Answer a queued SYNC_REQUEST on a background thread.
+
+        ``request`` is the payload popped from :meth:`pop_packet`. The host
+        passes a snapshot of its map taken on the editing thread; it is only
+        read if the client needs a full sync, and is closed either way.
+        Returns False if the requesting client is gone.
+        """
+        client_id = int.from_bytes(request[:4], "little", signed=False)
+        epoch, since = decode_sync_request(request[4:])
+        peer = next((p for p in list(self.clients.values()) if int(p.client_id) == client_id), None)
+        if peer is None:
+            if snapshot is not None:
+                snapshot.close()
+            return False
+        threading.Thread(target=self._send_sync, args=(peer, epoch, since, snapshot), daemon=True).start()
+        return True
+
+    def _send_sync(self, peer: LivePeer, epoch: int, since: int, snapshot: "MapSnapshot | None") -> None:
+        from .tile_serializer import encode_tile
+
+        journal = self.journal
+        try:
+            with self._sync_lock:
+                delta = journal.changes_since(epoch, since)
+            if delta is None:
+                # Full sync: the snapshot first, then every journaled tile on
+                # top, since the snapshot's position in the journal is unknown.
+                tiles_view = snapshot.tiles.items() if snapshot is not None else ()
+                snapshot_tiles = (encode_tile(tile) for _key, tile in tiles_view)
+                log.info(f"Full sync for {peer.name}")
+                if not self._send_sync_chunks(peer, journal.epoch, 0, snapshot_tiles, reset=True, done=False):
+                    return
+                with self._sync_lock:
+                    delta = journal.entries()
+            else:
+                log.info(f"Delta sync for {peer.name}: {len(delta[1])} tiles since {since}")
+
+            # Send the copied tiles without holding the lock, so editing and
+            # relaying carry on meanwhile. Updates relayed to this client in
+            # the meantime may arrive before older copied tiles of the same
+            # positions; the journal tail since the copy, sent under the lock
+            # so nothing is relayed in between, puts them back.
+            seq, tiles = delta
+            if not self._send_sync_chunks(peer, journal.epoch, seq, tiles, done=False):
+                return
+            with self._sync_lock:
+                tail = journal.changes_since(journal.epoch, seq)
+                tail_seq, tail_tiles = tail if tail is not None else journal.entries()
+                self._send_sync_chunks(peer, journal.epoch, tail_seq, tail_tiles)
+        except Exception as e:
+            log.error(f"Sync to {peer.name} failed: {e}")
+        finally:
+            if snapshot is not None:
+                snapshot.close()
+
+    @staticmethod
+    def _send_sync_chunks(peer: LivePeer, epoch: int, seq: int, tiles: Any, **flags: bool) -> bool:
+        for chunk in iter_sync_chunks(epoch, seq, tiles, **flags):
+            if not peer.send_packet(PacketType.SYNC_CHUNK, chunk):
+                return False
+        return True
+
     def pop_packet(self) -> tuple[int, bytes] | None:
         with self._queue_lock:
             if self._incoming_queue:
@@ -264,8 +353,20 @@ class LiveServer:
             return
 
         if packet_type == PacketType.TILE_UPDATE:
-            self.broadcast(PacketType.TILE_UPDATE, payload, exclude=client)
-            self._enqueue_packet(int(packet_type), payload)
+            from .tile_serializer import decode_tile_update
+
+            self.broadcast_tiles(payload, exclude=client)
+            tiles, ok = decode_tile_update(payload)
+            if ok and tiles:
+                self.inbox.put(tiles)
+            else:
+                self._enqueue_packet(int(packet_type), payload)
+            return
+
+        if packet_type == PacketType.SYNC_REQUEST:
+            # The host answers from the editing thread, where it can take a
+            # consistent snapshot of its map (see serve_sync).
+            self._enqueue_packet(int(packet_type), int(peer.client_id).to_bytes(4, "little") + payload)
             return
 
         if packet_type == PacketType.MESSAGE:
@@ -0,0 +1,198 @@
+"""Change journal and packets for live client resynchronisation.
+
+The server numbers every TILE_UPDATE it relays with a sequence number and
+keeps the latest encoded bytes of each changed tile in a bounded journal.
+Clients track the last sequence they applied (announced after each relayed
+update by a SYNC_MARK) and, after a reconnect, send it in a SYNC_REQUEST.
+If the journal still reaches back that far the server answers with only the
+tiles changed since; otherwise (new server epoch, never synced, journal
+truncated) it streams a full snapshot.
+
+Packet formats (little endian):
+
+    SYNC_REQUEST  <epoch:u64><since:u64>
+    SYNC_CHUNK    <epoch:u64><seq:u64><flags:u8><tile_count:u16>[tile_data...]
+    SYNC_MARK     <epoch:u64><seq:u64>
+
+``tile_data`` uses :func:`tile_serializer.encode_tile`. A sync answer is one
+or more chunks: the first of a full snapshot has ``SYNC_RESET`` (drop the
+local map first), the last has ``SYNC_DONE`` and carries the sequence the
+client is at once it has applied everything.
+
+Layer: core (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+import secrets
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .tile_serializer import decode_tile, split_tile_update
+
+SYNC_RESET = 1
+SYNC_DONE = 2
+
+DEFAULT_JOURNAL_ENTRIES = 100_000  # distinct tiles remembered for delta syncs
+SYNC_CHUNK_BYTES = 64 * 1024
+
+_REQUEST = struct.Struct("<QQ")
+_CHUNK_HEADER = struct.Struct("<QQBH")
+
+
+class LiveChangeJournal:
+    """Latest encoded state of recently changed tiles, ordered by sequence.
+
+    Each :meth:`record` call takes the next sequence number; a tile changed
+    again moves to the end with the new number, so the journal holds one
+    entry per position and stays sorted. When it grows past ``max_entries``
+    the oldest entries are dropped and :attr:`floor` rises: clients whose
+    last sequence is below it can no longer be served a delta.
+
+    ``epoch`` identifies this journal; sequence numbers from another server
+    run (or a client that never synced, epoch 0) are never comparable.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_JOURNAL_ENTRIES, *, epoch: int | None = None) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.epoch = int(epoch) if epoch else secrets.randbits(63) | 1
+        self._seq = 0
+        self._floor = 0
+        self._entries: OrderedDict[tuple[int, int, int], tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def floor(self) -> int:
+        return self._floor
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, payload: bytes) -> int:
+        """Journal the tiles of a TILE_UPDATE payload; return the current sequence.
+
+        Payloads without tile data (legacy position lists) leave the
+        sequence unchanged.
+        """
+        pieces = split_tile_update(payload)
+        with self._lock:
+            if not pieces:
+                return self._seq
+            self._seq += 1
+            seq = self._seq
+            entries = self._entries
+            for key, data in pieces:
+                entries[key] = (seq, data)
+                entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                _key, (dropped, _data) = entries.popitem(last=False)
+                self._floor = max(self._floor, dropped)
+            return seq
+
+    def changes_since(self, epoch: int, since: int) -> tuple[int, list[bytes]] | None:
+        """Return ``(seq, tiles)`` changed after ``since``, or None if a full sync is needed."""
+        with self._lock:
+            if int(epoch) != self.epoch or not self._floor <= int(since) <= self._seq:
+                return None
+            tiles: list[bytes] = []
+            for entry_seq, data in reversed(self._entries.values()):
+                if entry_seq <= since:
+                    break
+                tiles.append(data)
+            tiles.reverse()
+            return self._seq, tiles
+
+    def entries(self) -> tuple[int, list[bytes]]:
+        """Return ``(seq, tiles)`` for every journaled tile."""
+        with self._lock:
+            return self._seq, [data for _seq, data in self._entries.values()]
+
+
+def encode_sync_request(epoch: int, since: int) -> bytes:
+    return _REQUEST.pack(int(epoch), int(since))
+
+
+def decode_sync_request(payload: bytes) -> tuple[int, int]:
+    """Return ``(epoch, since)``; ``(0, 0)`` (full sync) if malformed."""
+    if len(payload) < _REQUEST.size:
+        return 0, 0
+    epoch, since = _REQUEST.unpack_from(payload)
+    return int(epoch), int(since)
+
+
+encode_sync_mark = encode_sync_request
+decode_sync_mark = decode_sync_request
+
+
+def encode_sync_chunk(epoch: int, seq: int, flags: int, tiles: list[bytes]) -> bytes:
+    return _CHUNK_HEADER.pack(int(epoch), int(seq), int(flags), len(tiles)) + b"".join(tiles)
+
+
+def decode_sync_chunk(payload: bytes) -> dict[str, Any]:
+    """Decode a SYNC_CHUNK packet.
+
+    Returns:
+        dict with epoch, seq, flags and tiles (as from ``decode_tile``)
+    """
+    if len(payload) < _CHUNK_HEADER.size:
+        return {"epoch": 0, "seq": 0, "flags": 0, "tiles": []}
+    epoch, seq, flags, count = _CHUNK_HEADER.unpack_from(payload)
+    tiles: list[dict[str, Any]] = []
+    offset = _CHUNK_HEADER.size
+    for _ in range(count):
+        tile, offset = decode_tile(payload, offset)
+        if not tile:
+            break
+        tiles.append(tile)
+    return {"epoch": int(epoch), "seq": int(seq), "flags": int(flags), "tiles": tiles}
+
+
+def iter_sync_chunks(
+    epoch: int,
+    seq: int,
+    tiles: Iterable[bytes],
+    *,
+    reset: bool = False,
+    done: bool = True,
+    budget: int = SYNC_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Pack encoded tiles into SYNC_CHUNK payloads of about ``budget`` bytes.
+
+    Always yields at least one chunk. ``SYNC_RESET`` goes on the first chunk
+    when ``reset``, ``SYNC_DONE`` on the last one when ``done``.
+    """
+    first_flags = SYNC_RESET if reset else 0
+    batch: list[bytes] = []
+    size = 0
+    for data in tiles:
+        if batch and (size + len(data) > budget or len(batch) == 0xFFFF):
+            yield encode_sync_chunk(epoch, seq, first_flags, batch)
+            first_flags = 0
+            batch = []
+            size = 0
+        batch.append(data)
+        size += len(data)
+    yield encode_sync_chunk(epoch, seq, first_flags | (SYNC_DONE if done else 0), batch)
+
+
+__all__ = [
+    "DEFAULT_JOURNAL_ENTRIES",
+    "SYNC_CHUNK_BYTES",
+    "SYNC_DONE",
+    "SYNC_RESET",
+    "LiveChangeJournal",
+    "decode_sync_chunk",
+    "decode_sync_mark",
+    "decode_sync_request",
+    "encode_sync_chunk",
+    "encode_sync_mark",
+    "encode_sync_request",
+    "iter_sync_chunks",
+]
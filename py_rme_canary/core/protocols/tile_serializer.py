@@ -111,8 +111,8 @@ def decode_tile(payload: bytes, offset: int = 0) -> tuple[dict[str, Any], int]:
         tile["ground_id"] = int(struct.unpack("<H", payload[offset : offset + 2])[0])
         offset += 2
 
-    # House ID (read if available, independent of flags for compatibility)
-    if len(payload) >= offset + 4:
+    # House ID: only present when flagged, otherwise it is the next tile's header
+    if flags & 2 and len(payload) >= offset + 4:
         tile["house_id"] = int(struct.unpack("<I", payload[offset : offset + 4])[0])
         offset += 4
 
@@ -154,6 +154,27 @@ def decode_tile_update(payload: bytes) -> tuple[list[dict[str, Any]], bool]:
     return tiles, True
 
 
+def split_tile_update(payload: bytes) -> list[tuple[tuple[int, int, int], bytes]]:
+    """Split a TILE_UPDATE payload into ``((x, y, z), encoded_tile)`` pairs.
+
+    The encoded bytes are sliced from ``payload`` unchanged, so they can be
+    concatenated again behind a tile count without re-encoding.
+    """
+    if len(payload) < 6 or payload[:4] != TILE_UPDATE_MAGIC:
+        return []
+
+    count = int(struct.unpack("<H", payload[4:6])[0])
+    offset = 6
+    pieces: list[tuple[tuple[int, int, int], bytes]] = []
+    for _ in range(count):
+        tile, end = decode_tile(payload, offset)
+        if not tile:
+            break
+        pieces.append(((tile["x"], tile["y"], tile["z"]), payload[offset:end]))
+        offset = end
+    return pieces
+
+
 def encode_map_chunk(
     chunk_id: int,
     total_chunks: int,
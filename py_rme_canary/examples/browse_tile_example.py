@@ -17,23 +17,13 @@ def test_browse_tile_dialog():
     app = QApplication(sys.argv)
 
     # Create a sample tile with multiple items
-    tile = Tile(x=1024, y=1024, z=7)
-
-    # Add ground
-    tile.ground = Item(id=102)  # Grass
-
-    # Add items
     tree = Item(id=2700)  # Tree
     stone = Item(id=1285)  # Stone
+    torch = Item(id=2050, action_id=1001)  # Torch
+    container = Item(id=1987, unique_id=5000, text="Magic Chest")  # Container
 
-    torch = Item(id=2050)  # Torch
-    torch.action_id = 1001
-
-    container = Item(id=1987)  # Container
-    container.unique_id = 5000
-    container.text = "Magic Chest"
-
-    tile.items = [tree, stone, torch, container]
+    # Grass ground plus items
+    tile = Tile(x=1024, y=1024, z=7, ground=Item(id=102), items=[tree, stone, torch, container])
 
     # Show dialog
     dialog = BrowseTileDialog(
@@ -8,7 +8,7 @@ import sys
 
 from PyQt6.QtWidgets import QApplication
 
-from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.item import Item, Position
 from py_rme_canary.core.data.tile import Tile
 from py_rme_canary.logic_layer.context_menu_handlers import ContextMenuActionHandlers
 from py_rme_canary.vis_layer.ui.menus.context_menus import ItemContextMenu
@@ -19,12 +19,8 @@ def example_item_context_menu():
     app = QApplication(sys.argv)
 
     # Create sample tile with door item
-    tile = Tile(x=1024, y=1024, z=7)
-    tile.ground = Item(id=102)  # Grass
-
-    door = Item(id=1209)  # Closed wooden door
-    door.action_id = 1001
-    tile.items = [door]
+    door = Item(id=1209, action_id=1001)  # Closed wooden door
+    tile = Tile(x=1024, y=1024, z=7, ground=Item(id=102), items=[door])  # Grass ground
 
     # Create action handlers
     handlers = ContextMenuActionHandlers(
@@ -98,9 +94,8 @@ def example_teleport_navigation():
     """Example: Navigate to teleport destination."""
     app = QApplication(sys.argv)
 
-    teleport = Item(id=1387)
     # In a real scenario, destination would be loaded from map
-    teleport.destination = (2000, 2000, 10)
+    teleport = Item(id=1387, destination=Position(x=2000, y=2000, z=10))
 
     handlers = ContextMenuActionHandlers()
 
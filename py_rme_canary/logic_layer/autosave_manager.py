@@ -8,6 +8,8 @@ Architecture:
     - AutoSaveManager: Main class handling scheduling and execution
     - AutoSaveConfig: Settings dataclass
     - Uses QTimer integration for PyQt6 compatibility
+    - Snapshot saves: serialize a GameMap.snapshot() off-thread while
+      editing continues (see AutoSaveManager.set_snapshot_save)
 
 Layer: logic_layer (signals are Qt-free, use callbacks)
 """
@@ -24,7 +26,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    pass
+    from py_rme_canary.core.data.gamemap import MapSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +141,8 @@ class AutoSaveManager:
 
         # Callbacks
         self._save_callback: Callable[[Path], bool] | None = None
+        self._take_snapshot: Callable[[], MapSnapshot] | None = None
+        self._write_snapshot: Callable[[MapSnapshot, Path], bool] | None = None
         self._on_save_start: Callable[[], None] | None = None
         self._on_save_complete: Callable[[Path, float], None] | None = None
         self._on_save_error: Callable[[str], None] | None = None
@@ -179,6 +183,26 @@ class AutoSaveManager:
         """
         self._save_callback = callback
 
+    def set_snapshot_save(
+        self,
+        take_snapshot: Callable[[], MapSnapshot],
+        write_snapshot: Callable[[MapSnapshot, Path], bool],
+    ) -> None:
+        """Save a point-in-time snapshot instead of the live map.
+
+        ``take_snapshot`` is called on the autosave thread and must capture
+        the map between edits, so it has to hand ``GameMap.snapshot()`` (O(1))
+        over to the editing thread and wait for the result. ``write_snapshot``
+        then runs on the autosave thread while editing continues. The snapshot is closed
+        after the write. Takes precedence over :meth:`set_save_callback`.
+
+        Args:
+            take_snapshot: Returns a fresh snapshot of the current map.
+            write_snapshot: Serializes the snapshot to path, True on success.
+        """
+        self._take_snapshot = take_snapshot
+        self._write_snapshot = write_snapshot
+
     def set_map_info(self, path: Path | None, name: str = "untitled") -> None:
         """Set current map information.
 
@@ -280,7 +304,7 @@ class AutoSaveManager:
         Returns:
             True if successful.
         """
-        if self._save_callback is None:
+        if self._save_callback is None and self._take_snapshot is None:
             logger.warning("AutoSave: No save callback configured")
             return False
 
@@ -309,7 +333,7 @@ class AutoSaveManager:
 
             # Perform save
             logger.info("AutoSave: Saving to %s", backup_path)
-            success = self._save_callback(backup_path)
+            success = self._save(backup_path)
 
             if success:
                 elapsed = time.perf_counter() - start_time
@@ -348,6 +372,18 @@ class AutoSaveManager:
 
         return success
 
+    def _save(self, path: Path) -> bool:
+        take, write = self._take_snapshot, self._write_snapshot
+        if take is None or write is None:
+            assert self._save_callback is not None
+            return self._save_callback(path)
+
+        snapshot = take()
+        try:
+            return write(snapshot, path)
+        finally:
+            snapshot.close()
+
     def _generate_backup_path(self) -> Path:
         """Generate a timestamped backup file path.
 
@@ -248,10 +248,10 @@ class AutoBorderProcessor:
 
         if str(brush_def.brush_type).lower() == "carpet":
             # Place below other items (so other items render above the carpet).
-            kept.insert(0, Item(id=int(new_server_id)))
+            kept.insert(0, Item.plain(int(new_server_id)))
         else:
             # Default wall-like: place on top.
-            kept.append(Item(id=int(new_server_id)))
+            kept.append(Item.plain(int(new_server_id)))
 
         if kept == list(tile.items):
             return tile
@@ -487,7 +487,7 @@ class AutoBorderProcessor:
 
         border_ids = {int(v) for v in brush_def.borders.values()}
         new_items = [it for it in tile.items if int(it.id) not in border_ids]
-        new_items.insert(0, Item(id=int(new_id)))
+        new_items.insert(0, Item.plain(int(new_id)))
         if new_items == tile.items:
             return
 
@@ -540,7 +540,7 @@ class AutoBorderProcessor:
         if border_groups is not None and brush_def.border_group is not None:
             border_ids.update(border_groups.items_for_group(int(brush_def.border_group)))
         new_items = [it for it in tile.items if int(it.id) not in border_ids]
-        new_items.insert(0, Item(id=int(selected_id)))
+        new_items.insert(0, Item.plain(int(selected_id)))
         if new_items == tile.items:
             return
         self._set_tile(replace(tile, items=new_items))
@@ -664,7 +664,7 @@ def apply_brush_definition_around_positions(
         if placement == "ground":
             if int(tile.ground.id) == int(selected_id):
                 continue
-            new_tile = replace(tile, ground=Item(id=int(selected_id)), modified=True)
+            new_tile = replace(tile, ground=Item.plain(int(selected_id)), modified=True)
             game_map.set_tile(new_tile)
             modified.append((int(x), int(y), int(z)))
             continue
@@ -673,7 +673,7 @@ def apply_brush_definition_around_positions(
         if clean_existing and border_ids:
             new_items = [it for it in new_items if int(it.id) not in border_ids]
         if int(selected_id) != 0:
-            new_items.insert(0, Item(id=int(selected_id)))
+            new_items.insert(0, Item.plain(int(selected_id)))
         if new_items == tile.items:
             continue
         new_tile = replace(tile, items=new_items)
@@ -79,14 +79,14 @@ def replace_top_item(tile: Tile, *, new_server_id: int, brush_type: str) -> Tile
         return replace(tile, ground=None)
 
     if brush_type in ("ground", "terrain"):
-        return replace(tile, ground=Item(id=new_server_id))
+        return replace(tile, ground=Item.plain(new_server_id))
 
     # Default to "item" placement (walls/carpets/etc.)
     new_items = list(tile.items)
     if new_items:
-        new_items[-1] = Item(id=new_server_id)
+        new_items[-1] = Item.plain(new_server_id)
     else:
-        new_items.append(Item(id=new_server_id))
+        new_items.append(Item.plain(new_server_id))
     return replace(tile, items=new_items)
 
 
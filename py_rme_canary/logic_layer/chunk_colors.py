@@ -0,0 +1,154 @@
+"""Minimap colours of map tiles, cached per chunk.
+
+Zoomed far out, a tile covers a handful of pixels and its sprites are not
+legible, yet drawing them still costs one call per item. At that level the
+canvas draws each 32x32 chunk (the selection bitmap layout) as one small
+RGBA texture holding the minimap colour of every tile instead.
+``ChunkColorCache`` builds those textures from the tiles and keeps them until
+a tile of the chunk changes.
+
+Layer: logic_layer (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SHIFT, CHUNK_SIZE, ChunkKey, TileKey
+
+Color = tuple[int, int, int, int]
+
+EMPTY_COLOR: Color = (43, 43, 43, 255)
+_EMPTY_PIXEL = bytes(EMPTY_COLOR)
+
+
+def id_color(item_id: int) -> Color:
+    """Return the hash-based display colour of an item id (matches ``qcolor_from_id``)."""
+    v = int(item_id) & 0xFFFFFFFF
+    r = (v * 2654435761) & 0xFF
+    g = (v * 2246822519) & 0xFF
+    b = (v * 3266489917) & 0xFF
+    return (48 + r % 160, 48 + g % 160, 48 + b % 160, 255)
+
+
+def tile_minimap_color(tile: Any) -> Color:
+    """Return the colour of the topmost item of a tile (ground when it has no items)."""
+    if tile.items:
+        return id_color(tile.items[-1].id)
+    if tile.ground is not None:
+        return id_color(tile.ground.id)
+    return EMPTY_COLOR
+
+
+def tile_ground_color(tile: Any) -> Color:
+    """Return the colour of the ground of a tile (topmost item when it has no ground)."""
+    if tile.ground is not None:
+        return id_color(tile.ground.id)
+    if tile.items:
+        return id_color(tile.items[-1].id)
+    return EMPTY_COLOR
+
+
+def tiles_version(game_map: Any) -> int | None:
+    """Return the tile table version of a map, or None when its tiles are not versioned."""
+    version = getattr(getattr(game_map, "tiles", None), "version", None)
+    return None if version is None else int(version)
+
+
+class ChunkColorCache:
+    """RGBA minimap textures of map chunks (``CHUNK_SIZE`` x ``CHUNK_SIZE`` pixels, row-major).
+
+    Missing tiles, and unmodified tiles when ``only_modified`` is set, use
+    :data:`EMPTY_COLOR`. The cache follows one map and one filter at a time;
+    :meth:`sync` drops everything when either changes, or when the tile
+    table version moved without the edit being reported through
+    :meth:`invalidate`.
+
+    Args:
+        max_chunks: Textures kept before the oldest are dropped.
+    """
+
+    __slots__ = ("_chunks", "_colors", "_map_ref", "_max_chunks", "_only_modified", "_version", "builds")
+
+    def __init__(self, max_chunks: int = 4096) -> None:
+        self._chunks: dict[ChunkKey, bytes] = {}
+        self._colors: dict[int, bytes] = {}
+        self._max_chunks = max(1, int(max_chunks))
+        self._map_ref: object = None
+        self._only_modified = False
+        self._version: int | None = None
+        self.builds = 0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def clear(self) -> None:
+        """Forget every cached texture."""
+        self._chunks.clear()
+
+    def sync(self, game_map: Any, *, only_modified: bool = False) -> None:
+        """Follow ``game_map`` and the filter, dropping textures that may be stale."""
+        version = tiles_version(game_map)
+        only_modified = bool(only_modified)
+        if (
+            game_map is not self._map_ref
+            or only_modified != self._only_modified
+            or version is None
+            or version != self._version
+        ):
+            self._chunks.clear()
+        self._map_ref = game_map
+        self._only_modified = only_modified
+        self._version = version
+
+    def invalidate(self, keys: Iterable[TileKey], *, version: int | None) -> None:
+        """Drop the textures holding any of the changed tiles; ``version`` is the table version after the edit."""
+        chunks = self._chunks
+        for ck in {(int(z), int(x) >> CHUNK_SHIFT, int(y) >> CHUNK_SHIFT) for x, y, z in keys}:
+            chunks.pop(ck, None)
+        self._version = version
+
+    def chunk_rgba(self, game_map: Any, ck: ChunkKey) -> bytes:
+        """Return the texture of chunk ``(z, cx, cy)``, building it on first use."""
+        rgba = self._chunks.get(ck)
+        if rgba is None:
+            chunks = self._chunks
+            if len(chunks) >= self._max_chunks:
+                del chunks[next(iter(chunks))]
+            rgba = chunks[ck] = self._build(game_map, ck)
+        return rgba
+
+    def _build(self, game_map: Any, ck: ChunkKey) -> bytes:
+        z, cx, cy = ck
+        x0 = cx << CHUNK_SHIFT
+        y0 = cy << CHUNK_SHIFT
+        only_modified = self._only_modified
+        colors = self._colors
+        get_tile = game_map.get_tile
+        buf = bytearray(_EMPTY_PIXEL * (CHUNK_SIZE * CHUNK_SIZE))
+        offset = 0
+        for y in range(y0, y0 + CHUNK_SIZE):
+            for x in range(x0, x0 + CHUNK_SIZE):
+                tile = get_tile(x, y, z)
+                if tile is not None and not (only_modified and not getattr(tile, "modified", False)):
+                    top = tile.items[-1] if tile.items else tile.ground
+                    if top is not None:
+                        top_id = int(top.id)
+                        pixel = colors.get(top_id)
+                        if pixel is None:
+                            pixel = colors[top_id] = bytes(id_color(top_id))
+                        buf[offset : offset + 4] = pixel
+                offset += 4
+        self.builds += 1
+        return bytes(buf)
+
+
+__all__ = [
+    "EMPTY_COLOR",
+    "ChunkColorCache",
+    "id_color",
+    "tile_ground_color",
+    "tile_minimap_color",
+    "tiles_version",
+]
@@ -5,6 +5,9 @@ Provides copy/cut/paste functionality with:
 - Multiple format support (tiles, items, selection)
 - Clipboard history
 - Paste preview overlay
+
+Tile selections travel between editor instances in the compact binary format
+from ``clipboard_binary``; the JSON format is still read for older payloads.
 """
 
 from __future__ import annotations
@@ -12,6 +15,7 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
     from py_rme_canary.core.data.item import Item
     from py_rme_canary.core.data.spawns import MonsterSpawnArea, NpcSpawnArea
     from py_rme_canary.core.data.tile import Tile
+    from py_rme_canary.logic_layer.clipboard_binary import BinaryClipboardHeader
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +44,10 @@ class ClipboardEntry:
     origin_x: int = 0
     origin_y: int = 0
     origin_z: int = 0
+    # Binary clipboard payload (see clipboard_binary); tiles are decoded lazily.
+    binary: bytes | None = None
+    header: BinaryClipboardHeader | None = None
+    id_remap: dict[int, int] | None = None
 
     def __post_init__(self) -> None:
         if self.source_position is not None:
@@ -77,6 +86,8 @@ class ClipboardEntry:
 
     def tile_count(self) -> int:
         """Get number of tiles in this entry."""
+        if self.header is not None:
+            return int(self.header.tile_count)
         if self.tiles is not None:
             return len(self.tiles)
         if isinstance(self.data, dict | list):
@@ -457,6 +468,100 @@ class ClipboardManager:
             origin_z = int(getattr(tiles[0], "z", 0)) if tiles else 0
         return self.copy_tiles(tiles, (int(origin_x), int(origin_y), int(origin_z)))
 
+    def copy_tiles_binary(
+        self,
+        tiles: list[Tile],
+        origin: tuple[int, int, int] | None = None,
+        *,
+        client_version: str | None = None,
+        name_lookup: Callable[[int], str | None] | None = None,
+        sprite_hash_lookup: Callable[[int], int | None] | None = None,
+    ) -> bool:
+        """Copy tiles straight into the binary clipboard format.
+
+        Unlike ``copy_tiles`` this never builds per-tile ``TileData`` dicts;
+        the entry holds the encoded bytes and tiles are decoded on paste.
+        """
+        if not tiles:
+            return False
+        entry = self.encode_binary_entry(
+            tiles,
+            origin,
+            client_version=client_version,
+            name_lookup=name_lookup,
+            sprite_hash_lookup=sprite_hash_lookup,
+        )
+        self._set_current(entry)
+        logger.debug(f"Copied {entry.tile_count()} tiles to clipboard (binary, {len(entry.binary or b'')} bytes)")
+        return True
+
+    def copy_tiles_binary_async(
+        self,
+        tiles: list[Tile],
+        origin: tuple[int, int, int] | None = None,
+        *,
+        client_version: str | None = None,
+        name_lookup: Callable[[int], str | None] | None = None,
+        sprite_hash_lookup: Callable[[int], int | None] | None = None,
+    ) -> Future[ClipboardEntry]:
+        """Encode tiles on the clipboard worker thread.
+
+        The returned future yields the finished entry; pass it to
+        ``set_current`` (and ``to_system_clipboard``) from the GUI thread.
+        """
+        from py_rme_canary.logic_layer.clipboard_binary import run_in_background
+
+        return run_in_background(
+            self.encode_binary_entry,
+            list(tiles),
+            origin,
+            client_version=client_version,
+            name_lookup=name_lookup,
+            sprite_hash_lookup=sprite_hash_lookup,
+        )
+
+    @staticmethod
+    def encode_binary_entry(
+        tiles: list[Tile],
+        origin: tuple[int, int, int] | None = None,
+        *,
+        client_version: str | None = None,
+        name_lookup: Callable[[int], str | None] | None = None,
+        sprite_hash_lookup: Callable[[int], int | None] | None = None,
+    ) -> ClipboardEntry:
+        """Build a binary clipboard entry for ``tiles`` (safe to call off the GUI thread)."""
+        import time
+
+        from py_rme_canary.logic_layer.clipboard_binary import encode_tiles, read_header
+
+        if origin is None:
+            origin = (
+                min(int(t.x) for t in tiles),
+                min(int(t.y) for t in tiles),
+                min(int(t.z) for t in tiles),
+            )
+        payload = encode_tiles(
+            tiles,
+            origin,
+            client_version=client_version,
+            name_lookup=name_lookup,
+            sprite_hash_lookup=sprite_hash_lookup,
+        )
+        header = read_header(payload)
+        return ClipboardEntry(
+            entry_type=header.entry_type,
+            width=header.width,
+            height=header.height,
+            timestamp=time.time(),
+            source_position=header.origin,
+            binary=payload,
+            header=header,
+        )
+
+    def set_current(self, entry: ClipboardEntry) -> None:
+        """Install a prepared entry (e.g. the result of a background copy)."""
+        self._set_current(entry)
+
     def copy_items(
         self,
         items: list[Item],
@@ -551,6 +656,14 @@ class ClipboardManager:
 
         positions = []
 
+        if self._current.header is not None:
+            # Binary entries: the footprint in the header is enough, no tile
+            # records are decoded for the preview.
+            for rel_x, rel_y, rel_z in self._current.header.footprint:
+                x, y = self._apply_transform(rel_x, rel_y, self._current.width, self._current.height)
+                positions.append((x + target[0], y + target[1], target[2] + rel_z))
+            return positions
+
         if self._current.entry_type in ("tiles", "cut_tiles"):
             for tile_data in self._current.data:
                 x = target[0] + tile_data.rel_x
@@ -675,6 +788,20 @@ class ClipboardManager:
             from PyQt6.QtCore import QMimeData
             from PyQt6.QtWidgets import QApplication
 
+            if self._current.binary is not None:
+                from py_rme_canary.logic_layer.clipboard_binary import BINARY_MIME_TYPE
+
+                clipboard = QApplication.clipboard()
+                if not clipboard:
+                    return False
+                mime = QMimeData()
+                mime.setData(BINARY_MIME_TYPE, self._current.binary)
+                version = self._current.header.client_version if self._current.header is not None else None
+                version_str = f" [v{version or client_version}]" if (version or client_version) else ""
+                mime.setText(f"[py_rme{version_str}] {self._current.tile_count()} tiles")
+                clipboard.setMimeData(mime)
+                return True
+
             # Serialize to JSON
             serialized_tiles = []
             if self._current.entry_type.endswith("tiles"):
@@ -767,6 +894,16 @@ class ClipboardManager:
             if not mime:
                 return False
 
+            from py_rme_canary.logic_layer.clipboard_binary import BINARY_MIME_TYPE
+
+            if mime.hasFormat(BINARY_MIME_TYPE):
+                return self.load_binary(
+                    mime.data(BINARY_MIME_TYPE).data(),
+                    target_version=target_version,
+                    name_resolver=name_resolver,
+                    hash_resolver=hash_resolver,
+                )
+
             MIME_TYPE = "application/x-pyrme-clipboard"
             # Check for our format
             if mime.hasFormat(MIME_TYPE):
@@ -839,6 +976,55 @@ class ClipboardManager:
 
         return False
 
+    def load_binary(
+        self,
+        payload: bytes,
+        *,
+        target_version: str | None = None,
+        name_resolver: Any | None = None,
+        hash_resolver: Any | None = None,
+    ) -> bool:
+        """Install a binary clipboard payload, reading only its header.
+
+        Version translation is resolved once per distinct item id from the
+        header table; tiles are decoded later by ``tiles_from_entry``.
+        """
+        import time
+
+        from py_rme_canary.logic_layer.clipboard_binary import (
+            ClipboardFormatError,
+            build_id_remap,
+            read_header,
+        )
+
+        try:
+            header = read_header(payload)
+        except (ClipboardFormatError, ValueError) as e:
+            logger.debug(f"Binary clipboard payload rejected: {e}")
+            return False
+
+        id_remap: dict[int, int] | None = None
+        source_version = header.client_version
+        if source_version and target_version and source_version != target_version:
+            logger.warning(f"Clipboard version mismatch: Source {source_version} -> Target {target_version}")
+            if not name_resolver and not hash_resolver:
+                logger.warning("No name resolver provided for version conversion.")
+            else:
+                id_remap = build_id_remap(header, name_resolver=name_resolver, hash_resolver=hash_resolver)
+
+        entry = ClipboardEntry(
+            entry_type=header.entry_type,
+            width=header.width,
+            height=header.height,
+            timestamp=time.time(),
+            source_position=header.origin,
+            binary=bytes(payload),
+            header=header,
+            id_remap=id_remap,
+        )
+        self._set_current(entry)
+        return True
+
     def _convert_data(
         self,
         data: dict[str, Any],
@@ -926,6 +1112,13 @@ def tiles_from_entry(entry: ClipboardEntry) -> tuple[list[Tile], tuple[int, int,
     if entry is None or not entry.entry_type.endswith("tiles"):
         return None
 
+    if entry.binary is not None:
+        from py_rme_canary.logic_layer.clipboard_binary import iter_tiles
+
+        origin = entry.source_position or (0, 0, 0)
+        decoded = list(iter_tiles(entry.binary, header=entry.header, origin=origin, id_remap=entry.id_remap))
+        return decoded, (int(origin[0]), int(origin[1]), int(origin[2]))
+
     from py_rme_canary.core.data.item import Item
     from py_rme_canary.core.data.tile import Tile
 
@@ -977,3 +1170,10 @@ def tiles_from_entry(entry: ClipboardEntry) -> tuple[list[Tile], tuple[int, int,
         )
 
     return tiles, (int(origin[0]), int(origin[1]), int(origin[2]))
+
+
+def tiles_from_entry_async(entry: ClipboardEntry) -> Future[tuple[list[Tile], tuple[int, int, int]] | None]:
+    """Run ``tiles_from_entry`` on the clipboard worker thread."""
+    from py_rme_canary.logic_layer.clipboard_binary import run_in_background
+
+    return run_in_background(tiles_from_entry, entry)
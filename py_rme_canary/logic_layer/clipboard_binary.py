@@ -0,0 +1,552 @@
+"""Compact binary clipboard format.
+
+Layout (all integers little endian)::
+
+    b"PRMC" | u8 format | u8 flags | u16 reserved
+    u32 header_len    | header (UTF-8 JSON: type, client version, origin,
+                        size, bbox, tile count, id -> name/sprite-hash table)
+    u32 footprint_len | footprint (relative chunk bitsets, see selection_bitmap)
+    body              | tile records, zlib-compressed when FLAG_ZLIB is set
+
+Each tile record is ``<iibBI`` (rel_x, rel_y, rel_z, record flags, node
+length) followed by the tile encoded exactly like an OTBM tile node, and an
+optional length-prefixed JSON blob for creatures and spawns (which OTBM keeps
+in sidecar XML files).
+
+Everything a paste preview needs (counts, bounding box, footprint and the
+version-translation table) lives before the body, so ``read_header`` never
+touches tile data. Encoding and decoding are incremental; ``run_in_background``
+moves them onto the shared clipboard worker thread.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import struct
+import threading
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SIZE, ChunkedSelection
+
+if TYPE_CHECKING:
+    from py_rme_canary.core.data.item import Item
+    from py_rme_canary.core.data.tile import Tile
+
+logger = logging.getLogger(__name__)
+
+BINARY_MIME_TYPE = "application/x-pyrme-clipboard-bin"
+
+MAGIC = b"PRMC"
+FORMAT_VERSION = 1
+FLAG_ZLIB = 0x01
+
+_PREAMBLE = struct.Struct("<4sBBH")
+_U32 = struct.Struct("<I")
+_RECORD = struct.Struct("<iibBI")
+_FOOTPRINT_CHUNK = struct.Struct("<iii")
+_CHUNK_BYTES = CHUNK_SIZE * CHUNK_SIZE // 8
+
+# Record flags.
+_REC_GROUND_NODE = 0x01  # ground was written as the first child item node
+_REC_EXTRAS = 0x02  # a JSON blob with creatures/spawns follows the node
+
+_READ_BLOCK = 1 << 16
+
+_pool_lock = threading.Lock()
+_pool: ThreadPoolExecutor | None = None
+
+
+class ClipboardFormatError(ValueError):
+    """Raised when clipboard bytes are not a valid binary payload."""
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryClipboardHeader:
+    """Everything known about a binary clipboard payload without its tiles."""
+
+    entry_type: str
+    client_version: str | None
+    origin: tuple[int, int, int]
+    width: int
+    height: int
+    tile_count: int
+    bbox: tuple[tuple[int, int, int], tuple[int, int, int]] | None
+    # server id -> (name, sprite hash), used for cross-version translation.
+    id_table: dict[int, tuple[str | None, int | None]] = field(default_factory=dict)
+    footprint: ChunkedSelection = field(default_factory=ChunkedSelection)
+    compressed: bool = True
+    body_offset: int = 0
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clipboard")
+        return _pool
+
+
+def _collect_ids(item: Item, out: set[int]) -> None:
+    out.add(int(item.id))
+    for child in item.items:
+        _collect_ids(child, out)
+
+
+def collect_item_ids(tiles: Iterable[Tile]) -> set[int]:
+    """Server ids used by ``tiles`` (grounds, stacks and container contents)."""
+    ids: set[int] = set()
+    for tile in tiles:
+        if tile.ground is not None:
+            _collect_ids(tile.ground, ids)
+        for item in tile.items:
+            _collect_ids(item, ids)
+    ids.discard(0)
+    return ids
+
+
+def prefetch_lookup[T](ids: Iterable[int], lookup: Callable[[int], T | None]) -> dict[int, T | None]:
+    """Resolve ``lookup`` for every id now, so a worker thread only reads a dict.
+
+    Lookups backed by editor state (sprite caches, lazily loaded item
+    databases) are not thread safe; call this on the GUI thread and pass
+    ``result.get`` to the encoder instead of the original callable.
+    """
+    resolved: dict[int, T | None] = {}
+    for sid in ids:
+        try:
+            resolved[int(sid)] = lookup(int(sid))
+        except Exception:
+            resolved[int(sid)] = None
+    return resolved
+
+
+def _strip_unknown(item: Item) -> Item | None:
+    if int(item.id) == 0:
+        return None
+    if not item.items:
+        return item
+    children = tuple(ch for ch in (_strip_unknown(c) for c in item.items) if ch is not None)
+    return item.with_container_items(children)
+
+
+def _tile_node(tile: Tile) -> tuple[bytes, bool]:
+    """Encode ``tile`` as an OTBM tile node positioned at offset (0, 0)."""
+    from py_rme_canary.core.io.otbm.saver import build_tile_node, is_compact_ground_item
+
+    try:
+        node = build_tile_node(base_x=int(tile.x), base_y=int(tile.y), tile=tile, otbm_version=2, id_mapper=None)
+    except ValueError:
+        # Unknown-id placeholders (id 0) cannot be written; drop them.
+        ground = _strip_unknown(tile.ground) if tile.ground is not None else None
+        items = [it for it in (_strip_unknown(i) for i in tile.items) if it is not None]
+        tile = replace(tile, ground=ground, items=items)
+        node = build_tile_node(base_x=int(tile.x), base_y=int(tile.y), tile=tile, otbm_version=2, id_mapper=None)
+    ground_node = tile.ground is not None and not is_compact_ground_item(tile.ground)
+    return node, ground_node
+
+
+def _tile_extras(tile: Tile, origin: tuple[int, int, int]) -> dict[str, Any] | None:
+    from py_rme_canary.logic_layer.clipboard import (
+        _serialize_creature,
+        _serialize_spawn_monster,
+        _serialize_spawn_npc,
+    )
+
+    extras: dict[str, Any] = {}
+    monsters = [p for p in (_serialize_creature(c) for c in getattr(tile, "monsters", []) or []) if p is not None]
+    if monsters:
+        extras["monsters"] = monsters
+    npc = _serialize_creature(getattr(tile, "npc", None))
+    if npc is not None:
+        extras["npc"] = npc
+    spawn_monster = _serialize_spawn_monster(getattr(tile, "spawn_monster", None), origin)
+    if spawn_monster is not None:
+        extras["spawn_monster"] = spawn_monster
+    spawn_npc = _serialize_spawn_npc(getattr(tile, "spawn_npc", None), origin)
+    if spawn_npc is not None:
+        extras["spawn_npc"] = spawn_npc
+    return extras or None
+
+
+def _pack_footprint(footprint: ChunkedSelection) -> bytes:
+    out = bytearray()
+    for (z, cx, cy), mask in footprint._chunks.items():
+        out += _FOOTPRINT_CHUNK.pack(z, cx, cy)
+        out += mask.to_bytes(_CHUNK_BYTES, "little")
+    return zlib.compress(bytes(out), 6)
+
+
+def _unpack_footprint(raw: bytes) -> ChunkedSelection:
+    data = zlib.decompress(raw) if raw else b""
+    step = _FOOTPRINT_CHUNK.size + _CHUNK_BYTES
+    if len(data) % step:
+        raise ClipboardFormatError("Corrupt clipboard footprint")
+    chunks: dict[tuple[int, int, int], int] = {}
+    for pos in range(0, len(data), step):
+        key = _FOOTPRINT_CHUNK.unpack_from(data, pos)
+        start = pos + _FOOTPRINT_CHUNK.size
+        chunks[key] = int.from_bytes(data[start : start + _CHUNK_BYTES], "little")
+    return ChunkedSelection._from_chunks(chunks)
+
+
+class BinaryClipboardEncoder:
+    """Incrementally encodes tiles into the binary clipboard format.
+
+    Usage::
+
+        encoder = BinaryClipboardEncoder(origin, client_version="13.10")
+        for tile in tiles:
+            encoder.add_tile(tile)
+        payload = encoder.finish()
+    """
+
+    def __init__(
+        self,
+        origin: tuple[int, int, int],
+        *,
+        client_version: str | None = None,
+        entry_type: str = "tiles",
+        name_lookup: Callable[[int], str | None] | None = None,
+        sprite_hash_lookup: Callable[[int], int | None] | None = None,
+        compress: bool = True,
+    ) -> None:
+        self._origin = (int(origin[0]), int(origin[1]), int(origin[2]))
+        self._client_version = client_version
+        self._entry_type = str(entry_type)
+        self._name_lookup = name_lookup
+        self._sprite_hash_lookup = sprite_hash_lookup
+        self._compressor = zlib.compressobj(6) if compress else None
+        self._body: list[bytes] = []
+        self._ids: set[int] = set()
+        self._footprint = ChunkedSelection()
+        self._count = 0
+        self._min: list[int] | None = None
+        self._max: list[int] | None = None
+
+    @property
+    def tile_count(self) -> int:
+        return self._count
+
+    def _write(self, data: bytes) -> None:
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+            if not data:
+                return
+        self._body.append(data)
+
+    def add_tile(self, tile: Tile) -> None:
+        rel = (int(tile.x) - self._origin[0], int(tile.y) - self._origin[1], int(tile.z) - self._origin[2])
+        node, ground_node = _tile_node(tile)
+        extras = _tile_extras(tile, self._origin)
+        flags = (_REC_GROUND_NODE if ground_node else 0) | (_REC_EXTRAS if extras else 0)
+
+        self._write(_RECORD.pack(rel[0], rel[1], rel[2], flags, len(node)) + node)
+        if extras:
+            blob = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+            self._write(_U32.pack(len(blob)) + blob)
+
+        if tile.ground is not None:
+            _collect_ids(tile.ground, self._ids)
+        for item in tile.items:
+            _collect_ids(item, self._ids)
+        self._footprint.add(rel)
+        if self._min is None or self._max is None:
+            self._min = list(rel)
+            self._max = list(rel)
+        else:
+            for axis in range(3):
+                self._min[axis] = min(self._min[axis], rel[axis])
+                self._max[axis] = max(self._max[axis], rel[axis])
+        self._count += 1
+
+    def add_tiles(self, tiles: Iterable[Tile]) -> None:
+        for tile in tiles:
+            self.add_tile(tile)
+
+    def _id_table(self) -> list[list[Any]]:
+        table: list[list[Any]] = []
+        for sid in sorted(self._ids):
+            if sid == 0:
+                continue
+            name = None
+            sprite_hash = None
+            if self._name_lookup is not None:
+                try:
+                    name = self._name_lookup(sid)
+                except Exception:
+                    name = None
+            if self._sprite_hash_lookup is not None:
+                try:
+                    sprite_hash = self._sprite_hash_lookup(sid)
+                except Exception:
+                    sprite_hash = None
+            table.append([sid, str(name) if name else None, int(sprite_hash) if sprite_hash is not None else None])
+        return table
+
+    def finish(self) -> bytes:
+        if self._compressor is not None:
+            tail = self._compressor.flush()
+            if tail:
+                self._body.append(tail)
+            self._compressor = None
+            flags = FLAG_ZLIB
+        else:
+            flags = 0
+
+        bbox = None
+        width = height = 0
+        if self._min is not None and self._max is not None:
+            bbox = [list(self._min), list(self._max)]
+            width = self._max[0] - self._min[0] + 1
+            height = self._max[1] - self._min[1] + 1
+        header = json.dumps(
+            {
+                "type": self._entry_type,
+                "version": self._client_version,
+                "origin": list(self._origin),
+                "width": width,
+                "height": height,
+                "tile_count": self._count,
+                "bbox": bbox,
+                "ids": self._id_table(),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        footprint = _pack_footprint(self._footprint)
+
+        out = bytearray(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, flags, 0))
+        out += _U32.pack(len(header)) + header
+        out += _U32.pack(len(footprint)) + footprint
+        for part in self._body:
+            out += part
+        self._body.clear()
+        return bytes(out)
+
+
+def encode_tiles(
+    tiles: Iterable[Tile],
+    origin: tuple[int, int, int],
+    *,
+    client_version: str | None = None,
+    entry_type: str = "tiles",
+    name_lookup: Callable[[int], str | None] | None = None,
+    sprite_hash_lookup: Callable[[int], int | None] | None = None,
+    compress: bool = True,
+) -> bytes:
+    """Encode ``tiles`` (relative to ``origin``) into a binary clipboard payload."""
+    encoder = BinaryClipboardEncoder(
+        origin,
+        client_version=client_version,
+        entry_type=entry_type,
+        name_lookup=name_lookup,
+        sprite_hash_lookup=sprite_hash_lookup,
+        compress=compress,
+    )
+    encoder.add_tiles(tiles)
+    return encoder.finish()
+
+
+def is_binary_payload(data: bytes) -> bool:
+    return len(data) >= _PREAMBLE.size and bytes(data[:4]) == MAGIC
+
+
+def read_header(data: bytes) -> BinaryClipboardHeader:
+    """Parse the header and footprint only; tile records are not touched."""
+    view = memoryview(data)
+    if len(view) < _PREAMBLE.size + _U32.size:
+        raise ClipboardFormatError("Clipboard payload too short")
+    magic, fmt, flags, _reserved = _PREAMBLE.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ClipboardFormatError("Not a py_rme binary clipboard payload")
+    if fmt > FORMAT_VERSION:
+        raise ClipboardFormatError(f"Unsupported clipboard format {fmt}")
+
+    pos = _PREAMBLE.size
+    (header_len,) = _U32.unpack_from(view, pos)
+    pos += _U32.size
+    try:
+        meta = json.loads(bytes(view[pos : pos + header_len]).decode("utf-8"))
+    except ValueError as exc:
+        raise ClipboardFormatError("Corrupt clipboard header") from exc
+    pos += header_len
+    (footprint_len,) = _U32.unpack_from(view, pos)
+    pos += _U32.size
+    footprint = _unpack_footprint(bytes(view[pos : pos + footprint_len]))
+    pos += footprint_len
+
+    raw_bbox = meta.get("bbox")
+    bbox = None
+    if raw_bbox:
+        lo, hi = raw_bbox
+        bbox = ((int(lo[0]), int(lo[1]), int(lo[2])), (int(hi[0]), int(hi[1]), int(hi[2])))
+    origin = meta.get("origin") or [0, 0, 0]
+    id_table: dict[int, tuple[str | None, int | None]] = {}
+    for sid, name, sprite_hash in meta.get("ids") or []:
+        id_table[int(sid)] = (name, int(sprite_hash) if sprite_hash is not None else None)
+
+    return BinaryClipboardHeader(
+        entry_type=str(meta.get("type") or "tiles"),
+        client_version=meta.get("version"),
+        origin=(int(origin[0]), int(origin[1]), int(origin[2])),
+        width=int(meta.get("width", 0) or 0),
+        height=int(meta.get("height", 0) or 0),
+        tile_count=int(meta.get("tile_count", 0) or 0),
+        bbox=bbox,
+        id_table=id_table,
+        footprint=footprint,
+        compressed=bool(flags & FLAG_ZLIB),
+        body_offset=pos,
+    )
+
+
+def build_id_remap(
+    header: BinaryClipboardHeader,
+    *,
+    name_resolver: Callable[[str], int | None] | None = None,
+    hash_resolver: Callable[[int, int | None, str | None], int | None] | None = None,
+) -> dict[int, int]:
+    """Translate source server ids once per distinct id (sprite hash first, then name)."""
+    remap: dict[int, int] = {}
+    for sid, (name, sprite_hash) in header.id_table.items():
+        resolved: int | None = None
+        if hash_resolver is not None and sprite_hash is not None:
+            try:
+                resolved = hash_resolver(int(sprite_hash), int(sid), name)
+            except Exception:
+                resolved = None
+        if resolved is None and name_resolver is not None and name:
+            try:
+                resolved = name_resolver(str(name))
+            except Exception:
+                resolved = None
+        if resolved is not None and int(resolved) != int(sid):
+            remap[int(sid)] = int(resolved)
+    return remap
+
+
+def _remap_item(item: Item, remap: dict[int, int]) -> Item:
+    new_id = remap.get(int(item.id))
+    children = item.items
+    if children:
+        mapped = tuple(_remap_item(ch, remap) for ch in children)
+        if any(a is not b for a, b in zip(mapped, children, strict=True)):
+            item = item.with_container_items(mapped)
+    if new_id is not None:
+        item = replace(item, id=int(new_id))
+    return item
+
+
+class _BodyReader:
+    """File-like reader over the (optionally compressed) record stream."""
+
+    __slots__ = ("_buf", "_decompressor", "_pos", "_src", "_src_pos")
+
+    def __init__(self, data: bytes, offset: int, compressed: bool) -> None:
+        self._src = memoryview(data)
+        self._src_pos = int(offset)
+        self._decompressor = zlib.decompressobj() if compressed else None
+        self._buf = bytearray()
+        self._pos = 0
+
+    def _fill(self, need: int) -> None:
+        while len(self._buf) - self._pos < need and self._src_pos < len(self._src):
+            block = bytes(self._src[self._src_pos : self._src_pos + _READ_BLOCK])
+            self._src_pos += len(block)
+            if self._decompressor is not None:
+                block = self._decompressor.decompress(block)
+            if self._pos:
+                del self._buf[: self._pos]
+                self._pos = 0
+            self._buf += block
+        if self._decompressor is not None and self._src_pos >= len(self._src) and len(self._buf) - self._pos < need:
+            self._buf += self._decompressor.flush()
+
+    def read(self, n: int) -> bytes:
+        self._fill(n)
+        end = min(self._pos + n, len(self._buf))
+        out = bytes(self._buf[self._pos : end])
+        self._pos = end
+        return out
+
+
+def iter_tiles(
+    data: bytes,
+    *,
+    header: BinaryClipboardHeader | None = None,
+    origin: tuple[int, int, int] | None = None,
+    id_remap: dict[int, int] | None = None,
+) -> Iterator[Tile]:
+    """Stream ``Tile`` objects out of a binary payload, placed at ``origin``."""
+    from py_rme_canary.core.constants import NODE_START
+    from py_rme_canary.core.io.otbm.item_parser import ItemParser
+    from py_rme_canary.core.io.otbm.streaming import begin_node
+    from py_rme_canary.core.io.otbm.tile_parser import TileParser
+    from py_rme_canary.logic_layer.clipboard import (
+        _deserialize_monster,
+        _deserialize_npc,
+        _deserialize_spawn_monster,
+        _deserialize_spawn_npc,
+    )
+
+    if header is None:
+        header = read_header(data)
+    base = header.origin if origin is None else (int(origin[0]), int(origin[1]), int(origin[2]))
+    parser = TileParser(item_parser=ItemParser(otbm_version=2), otbm_version=2)
+    reader = _BodyReader(data, header.body_offset, header.compressed)
+
+    for _ in range(int(header.tile_count)):
+        raw = reader.read(_RECORD.size)
+        if len(raw) != _RECORD.size:
+            raise ClipboardFormatError("Truncated clipboard body")
+        rel_x, rel_y, rel_z, flags, node_len = _RECORD.unpack(raw)
+        node = reader.read(node_len)
+        if len(node) != node_len or not node or node[0] != NODE_START:
+            raise ClipboardFormatError("Corrupt clipboard tile record")
+
+        x, y, z = base[0] + rel_x, base[1] + rel_y, base[2] + rel_z
+        stream = io.BytesIO(node)
+        stream.read(1)
+        node_type, payload = begin_node(stream)
+        tile = parser.parse_tile_node(stream, node_type, payload, area_base_x=x, area_base_y=y, area_z=z)
+        if tile is None:
+            continue
+
+        changes: dict[str, Any] = {}
+        ground = tile.ground
+        items = tile.items
+        if flags & _REC_GROUND_NODE and ground is None and items:
+            ground, items = items[0], items[1:]
+            changes.update(ground=ground, items=items)
+        if id_remap:
+            changes["ground"] = _remap_item(ground, id_remap) if ground is not None else None
+            changes["items"] = [_remap_item(it, id_remap) for it in items]
+        if flags & _REC_EXTRAS:
+            (blob_len,) = _U32.unpack(reader.read(_U32.size))
+            extras = json.loads(reader.read(blob_len).decode("utf-8"))
+            changes["monsters"] = [
+                m for m in (_deserialize_monster(p) for p in extras.get("monsters") or []) if m is not None
+            ]
+            changes["npc"] = _deserialize_npc(extras.get("npc"))
+            changes["spawn_monster"] = _deserialize_spawn_monster(extras.get("spawn_monster"), base)
+            changes["spawn_npc"] = _deserialize_spawn_npc(extras.get("spawn_npc"), base)
+        yield replace(tile, **changes) if changes else tile
+
+
+def decode_tiles(
+    data: bytes,
+    *,
+    origin: tuple[int, int, int] | None = None,
+    id_remap: dict[int, int] | None = None,
+) -> list[Tile]:
+    return list(iter_tiles(data, origin=origin, id_remap=id_remap))
+
+
+def run_in_background(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+    """Submit arbitrary clipboard work to the shared worker thread."""
+    return _executor().submit(fn, *args, **kwargs)
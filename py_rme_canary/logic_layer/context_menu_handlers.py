@@ -288,6 +288,28 @@ class ContextMenuActionHandlers:
                 return ("items", int(index))
         return None
 
+    def _replace_item_unrecorded(self, tile: Tile | None, item: Item, new_item: Item) -> bool:
+        """Swap `item` for `new_item` without history (no session to record it).
+
+        The tile is rebuilt and written back to the editor's map; the shared
+        tile object is never changed in place.
+        """
+        if tile is None:
+            return False
+        slot = self._find_item_slot(tile, item)
+        if slot is None or slot[0] != "items":
+            return False
+        session = self._resolve_session()
+        if session is None:
+            return False
+        items = list(tile.items)
+        items[slot[1]] = new_item
+        updated = replace(tile, items=items, modified=True)
+        session.game_map.set_tile(updated)
+        with suppress(Exception):
+            session._emit_tiles_changed({(int(tile.x), int(tile.y), int(tile.z))})  # noqa: SLF001
+        return True
+
     def _commit_tile_change(
         self,
         *,
@@ -791,8 +813,11 @@ class ContextMenuActionHandlers:
             return
 
         # Final fallback when no session context is available.
-        item.id = int(toggle_id)
-        is_open = ItemTypeDetector.is_door_open(item)
+        toggled = replace(item, id=int(toggle_id))
+        if not self._replace_item_unrecorded(tile, item, toggled):
+            self._show_status("[Toggle Door] No editable map for this door")
+            return
+        is_open = ItemTypeDetector.is_door_open(toggled)
         self._show_status(f"[Toggle Door] Door {old_id} → {int(toggle_id)} ({'opened' if is_open else 'closed'})")
 
     # ========================
@@ -827,25 +852,34 @@ class ContextMenuActionHandlers:
                 self._show_status(f"[Rotate Item] Item {old_id} → {int(next_id)}")
                 return
 
-        item.id = int(next_id)
-        self._show_status(f"[Rotate Item] Item {old_id} → {int(item.id)}")
+        if not self._replace_item_unrecorded(tile, item, replace(item, id=int(next_id))):
+            self._show_status("[Rotate Item] No editable map for this item")
+            return
+        self._show_status(f"[Rotate Item] Item {old_id} → {int(next_id)}")
 
     # ========================
     # Teleport Navigation
     # ========================
 
-    def goto_teleport_destination(self, item: Item) -> None:
+    def goto_teleport_destination(self, item: Item, position: tuple[int, int, int] | None = None) -> None:
         """Navigate canvas to teleport destination.
 
+        With a session and the item's position, the destination comes from
+        the session's teleport link index, and the status bar notes one-way
+        or broken links.
+
         Args:
             item: Teleport item
+            position: Tile holding the teleport, when known
         """
         from py_rme_canary.logic_layer.item_type_detector import ItemTypeDetector
 
         if not ItemTypeDetector.is_teleport(item):
             return
 
-        dest = ItemTypeDetector.get_teleport_destination(item)
+        dest, note = self._indexed_teleport_destination(item, position)
+        if dest is None:
+            dest = ItemTypeDetector.get_teleport_destination(item)
         if not dest:
             print("[Go To Teleport] No destination set")
             return
@@ -866,10 +900,32 @@ class ContextMenuActionHandlers:
                 canvas = getattr(editor, "canvas", None)
                 if canvas is not None and hasattr(canvas, "update"):
                     canvas.update()
-                self._show_status(f"[Go To Teleport] Jumped to {x}, {y}, {z}")
+                self._show_status(f"[Go To Teleport] Jumped to {x}, {y}, {z}{note}")
                 return
 
-        self._show_status(f"[Go To Teleport] Destination: {dest}")
+        self._show_status(f"[Go To Teleport] Destination: {dest}{note}")
+
+    def _indexed_teleport_destination(
+        self, item: Item, position: tuple[int, int, int] | None
+    ) -> tuple[tuple[int, int, int] | None, str]:
+        """Destination and status note for the teleport at ``position`` from the session index."""
+        from py_rme_canary.logic_layer.teleport_manager import LinkStatus
+
+        session = self._resolve_session()
+        teleport_links = getattr(session, "teleport_links", None)
+        if position is None or teleport_links is None:
+            return None, ""
+        links = teleport_links()
+        key = (int(position[0]), int(position[1]), int(position[2]))
+        link = links.get_link_at(key)
+        if link is None or int(link.item_id) != int(item.id) or link.destination == link.source:
+            return None, ""
+        links.validate_all()  # only re-checks links touched since the last call
+        note = {
+            LinkStatus.BROKEN: " (destination has no tile)",
+            LinkStatus.NO_RETURN: " (one-way)",
+        }.get(link.status, "")
+        return link.destination, note
 
     # ========================
     # Copy Data Actions
@@ -1084,11 +1140,8 @@ class ContextMenuActionHandlers:
             editor = self._resolve_editor()
             parent = editor if isinstance(editor, QWidget) else None
 
-            draft_item = replace(item)
-            accepted = bool(_edit_item_basic_properties(parent, draft_item))
-            if not accepted:
-                return
-            if draft_item == item:
+            draft_item = _edit_item_basic_properties(parent, item)
+            if draft_item is None or draft_item == item:
                 return
 
             committed = self._apply_item_change(
@@ -1108,9 +1161,9 @@ class ContextMenuActionHandlers:
                 return
 
             # No session/history available fallback.
-            item.action_id = draft_item.action_id
-            item.unique_id = draft_item.unique_id
-            item.text = draft_item.text
+            if not self._replace_item_unrecorded(tile, item, draft_item):
+                self._show_status("[Properties] No editable map for this item")
+                return
             self._show_status(f"[Properties] Updated item #{int(item.id)}")
             return
         self._show_status(f"[Properties] Item #{int(item.id)}")
@@ -1203,7 +1256,9 @@ class ContextMenuActionHandlers:
             return
 
         # No session/history available fallback.
-        item.text = updated_text
+        if not self._replace_item_unrecorded(tile, item, replace(item, text=updated_text)):
+            self._show_status("[Edit Text] No editable map for this item")
+            return
         self._show_status(f"[Edit Text] Updated text for item {int(item.id)}")
 
     def open_tile_properties(self, tile: Tile | None = None, position: tuple[int, int, int] | None = None) -> None:
@@ -1312,7 +1367,7 @@ class ContextMenuActionHandlers:
             # Item interactions
             "toggle_door": lambda: self.toggle_door(item, tile, position) if tile and position else None,
             "rotate_item": lambda: self.rotate_item(item, tile, position) if tile and position else None,
-            "goto_teleport": lambda: self.goto_teleport_destination(item),
+            "goto_teleport": lambda: self.goto_teleport_destination(item, position),
             # Copy data
             "copy_server_id": lambda: self.copy_server_id(item),
             "copy_client_id": lambda: self.copy_client_id(item),
@@ -4,6 +4,7 @@ This module enables seamless copying of map areas between RME instances running
 different Tibia client versions (e.g., 7.4, 10.x, 13.x). Features include:
 
 - Sprite hash matching (FNV-1a) to find equivalent sprites across versions
+- Bulk sprite hash index built in a worker pool and cached on disk
 - Automatic ID translation during paste operations
 - Auto-correction of wrong IDs using sprite matching
 - Support for multiple simultaneous RME instances
@@ -28,12 +29,18 @@ from py_rme_canary.logic_layer.cross_version.sprite_hash import (
     calculate_sprite_hash,
     fnv1a_64,
 )
+from py_rme_canary.logic_layer.cross_version.sprite_hash_index import (
+    build_sprite_hash_index,
+    load_or_build_sprite_hash_index,
+)
 
 __all__ = [
     # Sprite hashing
     "fnv1a_64",
     "calculate_sprite_hash",
     "SpriteHashMatcher",
+    "build_sprite_hash_index",
+    "load_or_build_sprite_hash_index",
     # Clipboard
     "CrossVersionClipboard",
     "ClipboardData",
@@ -15,6 +15,7 @@ References:
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 from py_rme_canary.logic_layer.rust_accel import fnv1a_64 as fnv1a_64  # noqa: PLC0414
@@ -129,6 +130,35 @@ class SpriteHashMatcher:
         # Reverse mapping: id → hash (one-to-one)
         self._id_to_hash[sprite_id] = hash_value
 
+    @classmethod
+    def from_hashes(cls, pairs: Iterable[tuple[int, int]]) -> SpriteHashMatcher:
+        """Build a matcher from precomputed ``(sprite_id, hash)`` pairs.
+
+        Used by the bulk index builder and the on-disk cache (see
+        :mod:`.sprite_hash_index`). For distinct IDs this gives the same tables
+        as calling :meth:`add_sprite` in order, without the per-call duplicate
+        scan that makes large groups of identical sprites (e.g. blank ones)
+        quadratic.
+
+        Args:
+            pairs: ``(sprite_id, hash)`` pairs; a later pair for the same ID wins
+
+        Returns:
+            New matcher holding the given sprites
+        """
+        matcher = cls()
+        id_to_hash = matcher._id_to_hash
+        for sprite_id, hash_value in pairs:
+            id_to_hash[sprite_id] = hash_value
+        hash_to_ids = matcher._hash_to_ids
+        for sprite_id, hash_value in id_to_hash.items():
+            ids = hash_to_ids.get(hash_value)
+            if ids is None:
+                hash_to_ids[hash_value] = [sprite_id]
+            else:
+                ids.append(sprite_id)
+        return matcher
+
     def find_by_hash(self, hash_value: int) -> list[int]:
         """Find all sprite IDs matching a hash value.
 
@@ -168,6 +198,14 @@ class SpriteHashMatcher:
         """
         return self._id_to_hash.get(sprite_id)
 
+    def items(self) -> Iterator[tuple[int, int]]:
+        """Iterate ``(sprite_id, hash)`` pairs in registration order."""
+        return iter(self._id_to_hash.items())
+
+    def __len__(self) -> int:
+        """Number of registered sprite IDs."""
+        return len(self._id_to_hash)
+
     def clear(self) -> None:
         """Remove all sprites from the hash table.
 
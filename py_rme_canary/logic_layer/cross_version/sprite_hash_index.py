@@ -0,0 +1,334 @@
+"""Bulk-built, disk-cached sprite hash index for cross-version copy/paste.
+
+Filling a :class:`SpriteHashMatcher` through ``add_sprite`` decodes and hashes
+every sprite of a client one call at a time, so the first cross-version paste
+pays for decoding all sprite sheets of both clients. This module instead:
+
+- hashes whole sheets in a process pool; each task decodes one sheet (or, for
+  legacy ``.spr`` archives, one run of sprite ids) and returns the hashes of
+  all its sprites, so only compact hash arrays cross process boundaries;
+- stores the resulting tables in a versioned cache file together with the
+  size, mtime and digest of every asset file they were built from. A later
+  session whose assets are unchanged loads the cache instead of rebuilding.
+
+Typical use::
+
+    matcher = load_or_build_sprite_hash_index(loaded_assets.sprite_assets)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from py_rme_canary.core.assets.legacy_dat_spr import LegacySpriteArchive
+from py_rme_canary.core.assets.sprite_appearances import (
+    SpriteAppearances,
+    SpriteSheet,
+    decode_sprite_sheet,
+    extract_sheet_sprite,
+)
+from py_rme_canary.core.io.atomic_io import save_bytes_atomic
+from py_rme_canary.logic_layer.cross_version.sprite_hash import SpriteHashMatcher, calculate_sprite_hash
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+"""Bumped whenever the file layout or the hashed pixel format changes."""
+
+_MAGIC = b"RMESPRHX"
+_HEADER = struct.Struct("<II")  # version, metadata length
+_COUNT = struct.Struct("<I")
+_LEGACY_CHUNK = 4096  # sprite ids per legacy task
+
+
+@dataclass(frozen=True, slots=True)
+class AssetFingerprint:
+    """Identity of one asset file an index was built from."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str  # blake2b-128, hex
+
+
+def fingerprint_file(path: str | Path) -> AssetFingerprint:
+    """Stat and hash ``path``."""
+    st = os.stat(path)
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return AssetFingerprint(str(path), int(st.st_size), int(st.st_mtime_ns), h.hexdigest())
+
+
+def asset_files(sprites: SpriteAppearances | LegacySpriteArchive) -> list[Path]:
+    """Files whose contents determine the sprite hashes of ``sprites``."""
+    if isinstance(sprites, SpriteAppearances):
+        catalog = Path(sprites.assets_dir) / "catalog-content.json"
+        return [catalog, *(Path(sheet.path) for sheet in sprites.sheets)]
+    if isinstance(sprites, LegacySpriteArchive):
+        # The .dat decides how sprites are read from the .spr (e.g. extended ids).
+        dat = Path(sprites.dat_path)
+        return [Path(sprites.spr_path), dat] if dat.exists() else [Path(sprites.spr_path)]
+    raise TypeError(f"Unsupported sprite provider: {type(sprites).__name__}")
+
+
+# --- building ----------------------------------------------------------------
+
+
+def _hash_sheet(path: str, sprite_type: int, first_id: int, last_id: int) -> tuple[AssetFingerprint, array[int]]:
+    # Runs in a worker process: decode one sheet, hash every sprite on it.
+    st = os.stat(path)
+    blob = Path(path).read_bytes()
+    fingerprint = AssetFingerprint(
+        path, int(st.st_size), int(st.st_mtime_ns), hashlib.blake2b(blob, digest_size=16).hexdigest()
+    )
+    sheet = SpriteSheet(first_id=first_id, last_id=last_id, sprite_type=sprite_type, path=path)
+    decode_sprite_sheet(sheet, blob)
+    width, height = sheet.sprite_size()
+    hashes = array("Q")
+    for sprite_id in range(first_id, last_id + 1):
+        hashes.append(calculate_sprite_hash(extract_sheet_sprite(sheet, sprite_id), width, height))
+    return fingerprint, hashes
+
+
+@lru_cache(maxsize=2)
+def _legacy_archive(dat_path: str, spr_path: str) -> LegacySpriteArchive:
+    return LegacySpriteArchive(dat_path=dat_path, spr_path=spr_path)
+
+
+def _hash_legacy_run(dat_path: str, spr_path: str, first_id: int, last_id: int) -> array[int]:
+    # Runs in a worker process; the archive's offset table is read once per process.
+    archive = _legacy_archive(dat_path, spr_path)
+    hashes = array("Q")
+    for sprite_id in range(first_id, last_id + 1):
+        width, height, pixels = archive.get_sprite_rgba(sprite_id)
+        hashes.append(calculate_sprite_hash(pixels, width, height))
+    return hashes
+
+
+def _run(fn: Callable[..., Any], tasks: list[tuple[Any, ...]], max_workers: int | None) -> list[Any]:
+    workers = max_workers if max_workers is not None else min(8, os.cpu_count() or 1)
+    if workers <= 1 or len(tasks) <= 1:
+        return [fn(*task) for task in tasks]
+    # Spawned, not forked: the editor process runs Qt and other threads.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        return list(pool.map(fn, *zip(*tasks, strict=True), chunksize=chunksize))
+
+
+def build_sprite_hash_index(
+    sprites: SpriteAppearances | LegacySpriteArchive,
+    *,
+    max_workers: int | None = None,
+) -> tuple[SpriteHashMatcher, list[AssetFingerprint]]:
+    """Hash every sprite of ``sprites`` sheet by sheet in a worker pool.
+
+    The result matches calling ``add_sprite(sid, *sprites.get_sprite_rgba(sid))``
+    for every sprite id in ascending order. ``max_workers`` defaults to the CPU
+    count (capped at 8); ``1`` hashes in the calling process.
+
+    Returns:
+        The filled matcher and the fingerprints of the files it was built from,
+        ready for :func:`save_sprite_hash_index`.
+    """
+    pairs: list[tuple[int, int]] = []
+    if isinstance(sprites, SpriteAppearances):
+        sheets = sorted(sprites.sheets, key=lambda sheet: int(sheet.first_id))
+        catalog = fingerprint_file(asset_files(sprites)[0])
+        sheet_tasks = [
+            (sheet.path, int(sheet.sprite_type), int(sheet.first_id), int(sheet.last_id)) for sheet in sheets
+        ]
+        results = _run(_hash_sheet, sheet_tasks, max_workers)
+        fingerprints = [catalog]
+        for sheet, (fingerprint, hashes) in zip(sheets, results, strict=True):
+            fingerprints.append(fingerprint)
+            pairs.extend(zip(range(int(sheet.first_id), int(sheet.last_id) + 1), hashes, strict=True))
+        # Keep the fingerprints in asset_files() order for validation.
+        by_path = {fp.path: fp for fp in fingerprints}
+        fingerprints = [by_path[str(path)] for path in asset_files(sprites)]
+    elif isinstance(sprites, LegacySpriteArchive):
+        fingerprints = [fingerprint_file(path) for path in asset_files(sprites)]
+        count = sprites.sprite_count
+        legacy_tasks = [
+            (str(sprites.dat_path), str(sprites.spr_path), first, min(first + _LEGACY_CHUNK - 1, count))
+            for first in range(1, count + 1, _LEGACY_CHUNK)
+        ]
+        results = _run(_hash_legacy_run, legacy_tasks, max_workers)
+        for (_dat, _spr, first, last), hashes in zip(legacy_tasks, results, strict=True):
+            pairs.extend(zip(range(first, last + 1), hashes, strict=True))
+    else:
+        raise TypeError(f"Unsupported sprite provider: {type(sprites).__name__}")
+    return SpriteHashMatcher.from_hashes(pairs), fingerprints
+
+
+# --- persistence -------------------------------------------------------------
+
+
+def save_sprite_hash_index(
+    path: str | Path, matcher: SpriteHashMatcher, fingerprints: Sequence[AssetFingerprint]
+) -> None:
+    """Write ``matcher``'s tables and the asset fingerprints to ``path`` atomically."""
+    meta = json.dumps(
+        {"files": [[fp.path, fp.size, fp.mtime_ns, fp.digest] for fp in fingerprints]},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    ids = array("I")
+    hashes = array("Q")
+    for sprite_id, hash_value in matcher.items():
+        ids.append(sprite_id)
+        hashes.append(hash_value)
+    if sys.byteorder != "little":
+        ids.byteswap()
+        hashes.byteswap()
+    save_bytes_atomic(
+        str(path),
+        b"".join(
+            (
+                _MAGIC,
+                _HEADER.pack(INDEX_VERSION, len(meta)),
+                meta,
+                _COUNT.pack(len(ids)),
+                ids.tobytes(),
+                hashes.tobytes(),
+            )
+        ),
+    )
+
+
+def _read_index(path: Path) -> tuple[list[AssetFingerprint], array[int], array[int]] | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        if not data.startswith(_MAGIC):
+            return None
+        pos = len(_MAGIC)
+        version, meta_len = _HEADER.unpack_from(data, pos)
+        if version != INDEX_VERSION:
+            return None
+        pos += _HEADER.size
+        meta = json.loads(data[pos : pos + meta_len].decode("utf-8"))
+        pos += meta_len
+        (count,) = _COUNT.unpack_from(data, pos)
+        pos += _COUNT.size
+        ids = array("I", data[pos : pos + count * 4])
+        pos += count * 4
+        hashes = array("Q", data[pos : pos + count * 8])
+        if len(ids) != count or len(hashes) != count or pos + count * 8 != len(data):
+            return None
+        fingerprints = [AssetFingerprint(str(p), int(s), int(m), str(d)) for p, s, m, d in meta["files"]]
+    except (struct.error, ValueError, KeyError, TypeError):
+        return None
+    if sys.byteorder != "little":
+        ids.byteswap()
+        hashes.byteswap()
+    return fingerprints, ids, hashes
+
+
+def _revalidate(recorded: list[AssetFingerprint], files: Sequence[Path]) -> list[AssetFingerprint] | None:
+    """Current fingerprints if ``files`` still match ``recorded``, else None.
+
+    Size and mtime are enough when both match; a file whose mtime moved (a
+    copy or a touch) is re-hashed and still accepted if its digest is equal.
+    """
+    if [fp.path for fp in recorded] != [str(path) for path in files]:
+        return None
+    current: list[AssetFingerprint] = []
+    for fp in recorded:
+        try:
+            st = os.stat(fp.path)
+        except OSError:
+            return None
+        if st.st_size != fp.size:
+            return None
+        if st.st_mtime_ns != fp.mtime_ns:
+            fresh = fingerprint_file(fp.path)
+            if fresh.digest != fp.digest:
+                return None
+            fp = fresh
+        current.append(fp)
+    return current
+
+
+def load_sprite_hash_index(path: str | Path, files: Sequence[Path]) -> SpriteHashMatcher | None:
+    """Load the index at ``path`` if it was built from the current ``files``.
+
+    Returns None when the cache is missing, corrupt, from another format
+    version, or any asset file changed since it was written.
+    """
+    read = _read_index(Path(path))
+    if read is None:
+        return None
+    recorded, ids, hashes = read
+    if _revalidate(recorded, files) is None:
+        return None
+    return SpriteHashMatcher.from_hashes(zip(ids, hashes, strict=True))
+
+
+def default_cache_path(sprites: SpriteAppearances | LegacySpriteArchive) -> Path:
+    """Per-client cache file under the user's ``~/.py_rme_canary`` folder."""
+    location = str(Path(asset_files(sprites)[0]).resolve())
+    key = hashlib.blake2b(location.encode("utf-8"), digest_size=8).hexdigest()
+    return Path.home() / ".py_rme_canary" / "sprite_hashes" / f"{key}.bin"
+
+
+def load_or_build_sprite_hash_index(
+    sprites: SpriteAppearances | LegacySpriteArchive,
+    *,
+    cache_path: str | Path | None = None,
+    max_workers: int | None = None,
+) -> SpriteHashMatcher:
+    """Load the cached index for ``sprites``, rebuilding and saving it if stale."""
+    path = Path(cache_path) if cache_path is not None else default_cache_path(sprites)
+    files = asset_files(sprites)
+
+    read = _read_index(path)
+    if read is not None:
+        recorded, ids, hashes = read
+        current = _revalidate(recorded, files)
+        if current is not None:
+            matcher = SpriteHashMatcher.from_hashes(zip(ids, hashes, strict=True))
+            if current != recorded:
+                # Same contents under new mtimes: refresh so the next load skips hashing.
+                _save_quietly(path, matcher, current)
+            return matcher
+
+    matcher, fingerprints = build_sprite_hash_index(sprites, max_workers=max_workers)
+    _save_quietly(path, matcher, fingerprints)
+    return matcher
+
+
+def _save_quietly(path: Path, matcher: SpriteHashMatcher, fingerprints: Sequence[AssetFingerprint]) -> None:
+    # The cache is an optimization; an unwritable location must not break pasting.
+    try:
+        save_sprite_hash_index(path, matcher, fingerprints)
+    except OSError:
+        logger.warning("Could not write sprite hash cache %s", path, exc_info=True)
+
+
+__all__ = [
+    "INDEX_VERSION",
+    "AssetFingerprint",
+    "asset_files",
+    "build_sprite_hash_index",
+    "default_cache_path",
+    "fingerprint_file",
+    "load_or_build_sprite_hash_index",
+    "load_sprite_hash_index",
+    "save_sprite_hash_index",
+]
@@ -213,7 +213,7 @@ class DoorBrush:
             new_items = []
             for item in tile.items:
                 if self._is_wall_item(item):
-                    new_items.append(Item(id=door_item_id))
+                    new_items.append(Item.plain(door_item_id))
                 else:
                     new_items.append(item)
             new_tile = replace(tile, items=new_items, modified=True)
@@ -14,7 +14,7 @@ Architecture Notes:
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 
 from py_rme_canary.logic_layer.settings import LIGHT_PRESETS, LightSettings
@@ -290,6 +290,10 @@ class DrawingOptions:
         """
         return self.show_tooltips and not self.is_only_colors()
 
+    def render_key(self) -> tuple[object, ...]:
+        """Return a hashable snapshot of every option; equal keys render the same map layer."""
+        return tuple(getattr(self, f.name) for f in fields(self) if f.compare)
+
     def _notify_change(self) -> None:
         """Notify listeners that options have changed."""
         if self._on_change is not None:
@@ -9,7 +9,7 @@ Reference:
 
 Features:
     - FloodFillConfig: Fill settings (mode, tolerance, limits)
-    - FloodFillEngine: Core fill algorithm (BFS-based)
+    - FloodFillEngine: Core fill algorithm (BFS or scanline spans)
     - FillMode: Different fill strategies
     - FillResult: Statistics about filled area
 
@@ -20,11 +20,13 @@ from __future__ import annotations
 
 import logging
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
+from py_rme_canary.logic_layer.transactional_brush import LabeledPaintAction
+
 if TYPE_CHECKING:
     from py_rme_canary.core.data.gamemap import GameMap
     from py_rme_canary.core.data.tile import Tile
@@ -39,6 +41,7 @@ class FillMode(Enum):
     SAME_TYPE = auto()  # Fill all matching tiles in area (not connected)
     REPLACE_ALL = auto()  # Fill entire selection regardless of type
     BORDER_ONLY = auto()  # Fill only the border of the area
+    SCANLINE = auto()  # Same region as CONTIGUOUS, filled span by span
 
 
 class FillDirection(Enum):
@@ -83,6 +86,8 @@ class FillResult:
         stopped_by_limit: Whether fill was stopped by max_tiles limit.
         bounds: Bounding box of filled area (min_x, min_y, max_x, max_y).
         error: Error message if operation failed.
+        action: Undoable record of every tile the brush changed, or None
+            when nothing was applied.
     """
 
     tiles_filled: int = 0
@@ -90,6 +95,7 @@ class FillResult:
     stopped_by_limit: bool = False
     bounds: tuple[int, int, int, int] | None = None
     error: str | None = None
+    action: LabeledPaintAction | None = None
 
     @property
     def success(self) -> bool:
@@ -99,11 +105,101 @@ class FillResult:
 # Type alias for position
 Position = tuple[int, int, int]  # (x, y, z)
 
+# Item-id signatures are cached per Tile object; the cache is dropped past this size.
+_SIGNATURE_CACHE_LIMIT = 1 << 18
+_NO_ITEMS: frozenset[int] = frozenset()
+
+_CHUNK_SHIFT = 6
+_CHUNK_SIZE = 1 << _CHUNK_SHIFT
+_CHUNK_MASK = _CHUNK_SIZE - 1
+
+
+class _TileBitmap:
+    """Set of positions stored as one byte per tile in 64x64 chunks.
+
+    Memory grows with the number of touched chunks (4 KiB each) rather than
+    with one tuple plus set slot per tile, and a row span is marked with a
+    single slice assignment.
+    """
+
+    __slots__ = ("_chunks", "_count")
+
+    def __init__(self) -> None:
+        self._chunks: dict[Position, bytearray] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __contains__(self, pos: Position) -> bool:
+        x, y, z = pos
+        chunk = self._chunks.get((z, x >> _CHUNK_SHIFT, y >> _CHUNK_SHIFT))
+        return chunk is not None and chunk[((y & _CHUNK_MASK) << _CHUNK_SHIFT) | (x & _CHUNK_MASK)] == 1
+
+    def __iter__(self) -> Iterator[Position]:
+        for (z, cx, cy), chunk in self._chunks.items():
+            base_x = cx << _CHUNK_SHIFT
+            base_y = cy << _CHUNK_SHIFT
+            index = chunk.find(1)
+            while index != -1:
+                yield (base_x + (index & _CHUNK_MASK), base_y + (index >> _CHUNK_SHIFT), z)
+                index = chunk.find(1, index + 1)
+
+    def _chunk(self, x: int, y: int, z: int) -> bytearray:
+        key = (z, x >> _CHUNK_SHIFT, y >> _CHUNK_SHIFT)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._chunks[key] = bytearray(_CHUNK_SIZE * _CHUNK_SIZE)
+        return chunk
+
+    def add(self, pos: Position) -> None:
+        x, y, z = pos
+        chunk = self._chunk(x, y, z)
+        index = ((y & _CHUNK_MASK) << _CHUNK_SHIFT) | (x & _CHUNK_MASK)
+        if not chunk[index]:
+            chunk[index] = 1
+            self._count += 1
+
+    def add_span(self, x0: int, x1: int, y: int, z: int) -> None:
+        """Add the inclusive row span ``x0..x1`` at ``(y, z)``."""
+        row = (y & _CHUNK_MASK) << _CHUNK_SHIFT
+        while x0 <= x1:
+            end = min(x1, x0 | _CHUNK_MASK)
+            chunk = self._chunk(x0, y, z)
+            start, stop = row + (x0 & _CHUNK_MASK), row + (end & _CHUNK_MASK) + 1
+            self._count += (stop - start) - chunk.count(1, start, stop)
+            chunk[start:stop] = b"\x01" * (stop - start)
+            x0 = end + 1
+
+    def row(self, x0: int, x1: int, y: int, z: int) -> bytes:
+        """Return one byte per position ``x0..x1`` of row ``(y, z)``; 1 marks a member."""
+        parts: list[bytes] = []
+        row = (y & _CHUNK_MASK) << _CHUNK_SHIFT
+        while x0 <= x1:
+            end = min(x1, x0 | _CHUNK_MASK)
+            chunk = self._chunks.get((z, x0 >> _CHUNK_SHIFT, y >> _CHUNK_SHIFT))
+            start = row + (x0 & _CHUNK_MASK)
+            stop = row + (end & _CHUNK_MASK) + 1
+            parts.append(bytes(stop - start) if chunk is None else bytes(chunk[start:stop]))
+            x0 = end + 1
+        return b"".join(parts)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._count = 0
+
 
 class FloodFillEngine:
     """Engine for performing flood fill operations.
 
-    Uses breadth-first search (BFS) for efficient contiguous fill.
+    Uses breadth-first search (BFS) for contiguous fill, or whole row spans
+    for ``FillMode.SCANLINE``. Visited and filled positions are kept in
+    per-chunk bitmaps, and tiles are compared through a match signature that
+    is cached per (immutable) ``Tile`` object, so repeated previews under the
+    cursor only pay for tiles they have not seen yet.
 
     Example:
         engine = FloodFillEngine(game_map)
@@ -133,8 +229,14 @@ class FloodFillEngine:
 
         # Tracking
         self._visited: set[Position] = set()
-        self._to_fill: set[Position] = set()
+        self._to_fill: set[Position] | _TileBitmap = set()
         self._reference_tile: Tile | None = None
+        self._reference_signature: tuple[int, frozenset[int] | None] | None = None
+        # Item-id signatures keyed by id(tile); _signed keeps those tiles alive
+        # so an id cannot be reused by a different tile while it is cached.
+        self._signatures: dict[int, frozenset[int]] = {}
+        self._signed: list[Tile] = []
+        self._matches: Callable[[int, int, int], bool] = lambda _x, _y, _z: False
 
     def fill(
         self,
@@ -154,8 +256,21 @@ class FloodFillEngine:
         """
         self._brush = brush
         self._config = config or FillConfig()
+
+        result = self._collect(start)
+        if result.error is not None:
+            return result
+
+        # Apply brush to collected tiles
+        if self._to_fill:
+            result.action = self._apply_brush_to_tiles()
+
+        return result
+
+    def _collect(self, start: Position) -> FillResult:
+        """Gather the positions to fill into ``self._to_fill`` without touching the map."""
         self._visited.clear()
-        self._to_fill.clear()
+        self._to_fill = _TileBitmap() if self._config.mode == FillMode.SCANLINE else set()
 
         x, y, z = start
 
@@ -165,25 +280,21 @@ class FloodFillEngine:
 
         # Get reference tile for matching
         self._reference_tile = self._map.get_tile(x, y, z)
+        self._prepare_matcher()
 
         # Perform fill based on mode
         if self._config.mode == FillMode.CONTIGUOUS:
-            result = self._contiguous_fill(start)
-        elif self._config.mode == FillMode.SAME_TYPE:
-            result = self._same_type_fill(start)
-        elif self._config.mode == FillMode.REPLACE_ALL:
-            result = self._replace_all_fill(start)
-        elif self._config.mode == FillMode.BORDER_ONLY:
-            result = self._border_fill(start)
-        else:
-            # Should be unreachable given FillMode enum, but safe fallback
-            return FillResult(error=f"Unknown fill mode: {self._config.mode}")  # type: ignore[unreachable]
-
-        # Apply brush to collected tiles
-        if self._to_fill:
-            self._apply_brush_to_tiles()
-
-        return result
+            return self._contiguous_fill(start)
+        if self._config.mode == FillMode.SCANLINE:
+            return self._scanline_fill(start)
+        if self._config.mode == FillMode.SAME_TYPE:
+            return self._same_type_fill(start)
+        if self._config.mode == FillMode.REPLACE_ALL:
+            return self._replace_all_fill(start)
+        if self._config.mode == FillMode.BORDER_ONLY:
+            return self._border_fill(start)
+        # Should be unreachable given FillMode enum, but safe fallback
+        return FillResult(error=f"Unknown fill mode: {self._config.mode}")  # type: ignore[unreachable]
 
     def _contiguous_fill(self, start: Position) -> FillResult:
         """BFS-based contiguous flood fill.
@@ -195,6 +306,7 @@ class FloodFillEngine:
         self._visited.add(start)
 
         directions = self._get_directions()
+        matches = self._matches
 
         min_x = max_x = start[0]
         min_y = max_y = start[1]
@@ -213,7 +325,7 @@ class FloodFillEngine:
             checked += 1
 
             # Check if tile matches
-            if self._matches_reference(x, y, z):
+            if matches(x, y, z):
                 self._to_fill.add((x, y, z))
 
                 # Update bounds
@@ -238,6 +350,90 @@ class FloodFillEngine:
             bounds=(min_x, min_y, max_x, max_y) if self._to_fill else None,
         )
 
+    def _scanline_fill(self, start: Position) -> FillResult:
+        """Span-based contiguous fill.
+
+        Each stack entry is a seed that is already known to match; it is
+        grown left and right into a full row span, the span is written to
+        the bitmap in one operation, and the rows above and below are scanned
+        once for the first position of every matching run. Only matching
+        tiles are ever marked, so ``_to_fill`` doubles as the visited set.
+        """
+        x, y, z = start
+        filled = _TileBitmap()
+        self._to_fill = filled
+        matches = self._matches
+        width = int(self._map.header.width)
+        height = int(self._map.header.height)
+        reach = 1 if self._config.direction == FillDirection.EIGHT_WAY else 0
+        remaining = int(self._config.max_tiles)
+
+        checked = 1
+        if remaining <= 0 or not matches(x, y, z):
+            return FillResult(tiles_checked=checked)
+
+        min_x = max_x = x
+        min_y = max_y = y
+        stopped = False
+        stack: list[tuple[int, int]] = [(x, y)]
+
+        while stack:
+            sx, sy = stack.pop()
+            if (sx, sy, z) in filled:
+                continue
+            if remaining <= 0:
+                stopped = True
+                break
+
+            lx = sx
+            while lx > 0 and (lx - 1, sy, z) not in filled:
+                checked += 1
+                if not matches(lx - 1, sy, z):
+                    break
+                lx -= 1
+            rx = sx
+            while rx < width - 1 and (rx + 1, sy, z) not in filled:
+                checked += 1
+                if not matches(rx + 1, sy, z):
+                    break
+                rx += 1
+
+            if rx - lx + 1 > remaining:
+                rx = lx + remaining - 1
+                stopped = True
+            filled.add_span(lx, rx, sy, z)
+            remaining -= rx - lx + 1
+            min_x = min(min_x, lx)
+            max_x = max(max_x, rx)
+            min_y = min(min_y, sy)
+            max_y = max(max_y, sy)
+            if stopped:
+                break
+
+            for ny in (sy - 1, sy + 1):
+                if not 0 <= ny < height:
+                    continue
+                in_run = False
+                scan_x0 = max(0, lx - reach)
+                for nx, seen in enumerate(filled.row(scan_x0, min(width - 1, rx + reach), ny, z), scan_x0):
+                    if seen:
+                        in_run = False
+                        continue
+                    checked += 1
+                    if matches(nx, ny, z):
+                        if not in_run:
+                            stack.append((nx, ny))
+                            in_run = True
+                    else:
+                        in_run = False
+
+        return FillResult(
+            tiles_filled=int(self._config.max_tiles) - remaining,
+            tiles_checked=checked,
+            stopped_by_limit=stopped,
+            bounds=(min_x, min_y, max_x, max_y),
+        )
+
     def _same_type_fill(self, start: Position) -> FillResult:
         """Fill all tiles of the same type in a bounded area.
 
@@ -353,67 +549,101 @@ class FloodFillEngine:
             0 <= x < self._map.header.width and 0 <= y < self._map.header.height and 0 <= z < 16  # Standard Z range
         )
 
-    def _matches_reference(self, x: int, y: int, z: int) -> bool:
-        """Check if tile at position matches the reference tile."""
-        tile = self._map.get_tile(x, y, z)
-
-        # Handle empty tiles
-        if tile is None:
-            if self._reference_tile is None:
-                return self._config.fill_empty
-            return False
-
-        if self._reference_tile is None:
-            return self._config.fill_empty
+    def _prepare_matcher(self) -> None:
+        """Sign the reference tile once and build the per-position match predicate.
 
-        # Check ground match
-        if self._config.match_ground:
-            ref_ground = self._reference_tile.ground
-            tile_ground = tile.ground
-
-            ref_id = ref_ground.id if ref_ground else 0
-            tile_id = tile_ground.id if tile_ground else 0
-
-            if ref_id != tile_id:
-                return False
-
-        # Check items match (if enabled)
-        if self._config.match_items:
-            ref_items = frozenset(item.id for item in self._reference_tile.items)
-            tile_items = frozenset(item.id for item in tile.items)
+        Checks run cheapest first (border flag, ground id) so item-id
+        signatures are only built, and cached, for tiles that got that far.
+        """
+        config = self._config
+        if len(self._signatures) > _SIGNATURE_CACHE_LIMIT:
+            self._signatures.clear()
+            self._signed.clear()
+        ref_tile = self._reference_tile
+        tiles = self._map.tiles
+        fill_empty = bool(config.fill_empty)
+        if ref_tile is None:
+            # An empty reference matches empty and non-empty tiles alike.
+            self._reference_signature = None
+            self._matches = lambda _x, _y, _z: fill_empty
+            return
 
-            if ref_items != tile_items:
+        match_ground = bool(config.match_ground)
+        match_items = bool(config.match_items)
+        respect_borders = bool(config.respect_borders)
+        ref_ground = ref_tile.ground.id if ref_tile.ground else 0
+        ref_items = self._item_signature(ref_tile) if match_items else None
+        self._reference_signature = (ref_ground, ref_items)
+        cache = self._signatures
+        item_signature = self._item_signature
+
+        def matches(x: int, y: int, z: int) -> bool:
+            tile = tiles.get((x, y, z))
+            if tile is None:
                 return False
-
-        # Check borders (if respect_borders enabled)
-        if self._config.respect_borders:
-            # Check if tile has auto-border items (usually have specific flags)
-            for item in tile.items:
-                if hasattr(item, "is_border") and item.is_border:
+            # Check borders (if respect_borders enabled)
+            if respect_borders:
+                for item in tile.items:
+                    if getattr(item, "is_border", False):
+                        return False
+            # Check ground match
+            if match_ground:
+                ground = tile.ground
+                if (ground.id if ground else 0) != ref_ground:
                     return False
+            # Check items match (if enabled)
+            if not match_items:
+                return True
+            signature = cache.get(id(tile))
+            return (signature if signature is not None else item_signature(tile)) == ref_items
+
+        self._matches = matches
+
+    def _item_signature(self, tile: Tile) -> frozenset[int]:
+        """Return the set of item ids on ``tile``, cached per tile object."""
+        items = tile.items
+        if not items:
+            return _NO_ITEMS
+        signature = frozenset([item.id for item in items])
+        self._signatures[id(tile)] = signature
+        self._signed.append(tile)
+        return signature
 
-        return True
+    def _matches_reference(self, x: int, y: int, z: int) -> bool:
+        """Check if tile at position matches the reference tile."""
+        return self._matches(x, y, z)
 
-    def _apply_brush_to_tiles(self) -> None:
-        """Apply the brush to all collected tiles."""
-        if self._brush is None:
-            return
+    def _apply_brush_to_tiles(self) -> LabeledPaintAction | None:
+        """Apply the brush to all collected tiles as one undoable action.
 
-        for x, y, z in self._to_fill:
+        Every position's before/after tile is recorded into a single
+        ``LabeledPaintAction`` so the caller can commit the whole fill to
+        history at once instead of one entry per tile.
+        """
+        if self._brush is None:
+            return None
+
+        # Apply brush (implementation depends on brush type)
+        apply = getattr(self._brush, "apply", None) or getattr(self._brush, "draw", None)
+        if apply is None:
+            return None
+
+        game_map = self._map
+        tiles = game_map.tiles
+        action = LabeledPaintAction(brush_id=0, label="Fill")
+        for key in self._to_fill:
+            before = tiles.get(key)
             try:
                 # Get or create tile
-                tile = self._map.get_tile(x, y, z)
-                if tile is None:
-                    tile = self._map.ensure_tile(x, y, z)
-
-                # Apply brush (implementation depends on brush type)
-                if hasattr(self._brush, "apply"):
-                    self._brush.apply(tile, self._map)
-                elif hasattr(self._brush, "draw"):
-                    self._brush.draw(tile, self._map)
-
+                tile = before if before is not None else game_map.ensure_tile(*key)
+                apply(tile, game_map)
             except Exception as e:
-                logger.warning("Failed to apply brush at (%d, %d, %d): %s", x, y, z, e)
+                logger.warning("Failed to apply brush at (%d, %d, %d): %s", *key, e)
+            after = tiles.get(key)
+            if after is not before:
+                action.record_tile_change(key, before, after)
+
+        return action if action.has_changes() else None
 
     def preview_fill(
         self,
@@ -423,7 +653,10 @@ class FloodFillEngine:
     ) -> Iterator[Position]:
         """Generate preview of fill without applying changes.
 
-        Yields positions that would be filled, for overlay rendering.
+        Yields positions that would be filled, for overlay rendering. Runs
+        the same collection as :meth:`fill` for the configured mode; with
+        ``FillMode.SCANLINE`` and a warm signature cache it is cheap enough
+        to call on every cursor move.
 
         Args:
             start: Starting position.
@@ -435,22 +668,11 @@ class FloodFillEngine:
         """
         self._brush = brush
         self._config = config or FillConfig()
-        self._visited.clear()
-        self._to_fill.clear()
-
-        # Run fill logic without applying
-        original_brush = self._brush
-        self._brush = None  # Prevent application
 
-        x, y, z = start
-        if not self._is_valid_position(x, y, z):
+        result = self._collect(start)
+        if result.error is not None:
             return
 
-        self._reference_tile = self._map.get_tile(x, y, z)
-        self._contiguous_fill(start)
-
-        self._brush = original_brush
-
         yield from self._to_fill
 
 
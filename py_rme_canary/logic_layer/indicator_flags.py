@@ -0,0 +1,143 @@
+"""Cached per-tile indicator flags for the map overlay.
+
+The hook / pickupable / moveable / avoidable indicators only depend on the
+item ids stacked on a tile, so the overlay does not need to walk every
+visible stack on every repaint. ``IndicatorFlagCache`` folds a stack into a
+bitmask once, memoising the mask of each item id, and keeps the flagged
+tiles of a 32x32 chunk (the selection bitmap layout) until a tile of that
+chunk changes. Each chunk carries a version number that is bumped on
+invalidation, so renderers can key their own retained layers on it.
+
+Layer: logic_layer (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SHIFT, CHUNK_SIZE, ChunkKey, TileKey
+
+HOOK = 1
+PICKUPABLE = 2
+MOVEABLE = 4
+AVOIDABLE = 8
+INDICATOR_MASK = HOOK | PICKUPABLE | MOVEABLE | AVOIDABLE
+MODIFIED = 16  # not an indicator; lets "only show modified" filter cached entries
+
+ChunkFlags = tuple[tuple[int, int, int], ...]  # (x, y, mask) of the flagged tiles
+
+
+def item_indicator_mask(props: Any) -> int:
+    """Return the indicator bits of one ``ItemProps``-like record."""
+    if props is None:
+        return 0
+    mask = 0
+    if getattr(props, "hook", False):
+        mask |= HOOK
+    if getattr(props, "pickupable", False):
+        mask |= PICKUPABLE
+    if getattr(props, "moveable", False):
+        mask |= MOVEABLE
+    if getattr(props, "avoidable", False):
+        mask |= AVOIDABLE
+    return mask
+
+
+class IndicatorFlagCache:
+    """Indicator bitmasks of map tiles, cached per chunk.
+
+    The cache follows one map and one item-properties table at a time;
+    passing a different object to :meth:`chunk_flags` drops everything.
+    Tile edits must be reported through :meth:`invalidate`.
+    """
+
+    __slots__ = ("_chunks", "_item_masks", "_map_ref", "_props_ref", "_versions")
+
+    def __init__(self) -> None:
+        self._chunks: dict[ChunkKey, ChunkFlags] = {}
+        self._versions: dict[ChunkKey, int] = {}
+        self._item_masks: dict[int, int] = {}
+        self._map_ref: object = None
+        self._props_ref: object = None
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def clear(self) -> None:
+        """Forget every cached chunk (versions still move forward)."""
+        for key in self._chunks:
+            self._versions[key] = self._versions.get(key, 0) + 1
+        self._chunks.clear()
+        self._item_masks.clear()
+
+    def invalidate(self, keys: Iterable[TileKey]) -> None:
+        """Drop the chunks holding any of the changed tile positions."""
+        chunks = self._chunks
+        versions = self._versions
+        for ck in {(int(z), int(x) >> CHUNK_SHIFT, int(y) >> CHUNK_SHIFT) for x, y, z in keys}:
+            versions[ck] = versions.get(ck, 0) + 1
+            chunks.pop(ck, None)
+
+    def version(self, ck: ChunkKey) -> int:
+        """Return the version of a chunk; it changes whenever the chunk is invalidated."""
+        return self._versions.get(ck, 0)
+
+    def tile_mask(self, tile: Any, props: Mapping[int, Any]) -> int:
+        """Return the OR of the indicator bits of every item on ``tile`` (plus ``MODIFIED``)."""
+        item_masks = self._item_masks
+        mask = 0
+        ground = getattr(tile, "ground", None)
+        items = list(getattr(tile, "items", None) or ())
+        if ground is not None:
+            items.append(ground)
+        for item in items:
+            sid = int(item.id)
+            bits = item_masks.get(sid)
+            if bits is None:
+                bits = item_indicator_mask(props.get(sid))
+                item_masks[sid] = bits
+            mask |= bits
+        if mask and getattr(tile, "modified", False):
+            mask |= MODIFIED
+        return mask
+
+    def chunk_flags(self, game_map: Any, ck: ChunkKey, props: Mapping[int, Any]) -> ChunkFlags:
+        """Return ``(x, y, mask)`` for every tile of chunk ``ck`` with any indicator bit."""
+        if game_map is not self._map_ref or props is not self._props_ref:
+            self.clear()
+            self._map_ref = game_map
+            self._props_ref = props
+        cached = self._chunks.get(ck)
+        if cached is not None:
+            return cached
+
+        z, cx, cy = ck
+        bx = cx << CHUNK_SHIFT
+        by = cy << CHUNK_SHIFT
+        get_tile = game_map.get_tile
+        flags: list[tuple[int, int, int]] = []
+        for y in range(by, by + CHUNK_SIZE):
+            for x in range(bx, bx + CHUNK_SIZE):
+                tile = get_tile(x, y, z)
+                if tile is None:
+                    continue
+                mask = self.tile_mask(tile, props)
+                if mask:
+                    flags.append((x, y, mask))
+        result = tuple(flags)
+        self._chunks[ck] = result
+        return result
+
+
+__all__ = [
+    "AVOIDABLE",
+    "HOOK",
+    "INDICATOR_MASK",
+    "MODIFIED",
+    "MOVEABLE",
+    "PICKUPABLE",
+    "ChunkFlags",
+    "IndicatorFlagCache",
+    "item_indicator_mask",
+]
@@ -0,0 +1,171 @@
+"""Frame-rate coalescing of canvas pointer input.
+
+High-polling-rate mice deliver several move events per rendered frame.
+Handling each one (status bar, hover stack, brush preview, and during a
+stroke a whole brush footprint) makes strokes lag behind the cursor with
+large brushes. ``PointerCoalescer`` only records the events: the stroke
+path is extended tile by tile with Bresenham lines, so fast drags do not
+skip tiles, and the latest pointer position replaces the previous one. The
+canvas takes both once per frame and applies the merged footprint from
+:func:`stroke_footprint` in one pass.
+
+Layer: logic_layer (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+TilePos = tuple[int, int]
+Offsets = Sequence[tuple[int, int]]
+
+
+def bresenham_line(x0: int, y0: int, x1: int, y1: int) -> Iterator[TilePos]:
+    """Yield the tiles of the 8-connected line from ``(x0, y0)`` to ``(x1, y1)``, both included."""
+    x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        yield (x0, y0)
+        if x0 == x1 and y0 == y1:
+            return
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+
+def stroke_footprint(
+    path: Iterable[TilePos],
+    offsets: Offsets,
+    *,
+    width: int,
+    height: int,
+) -> list[TilePos]:
+    """Return the in-bounds tiles covered by ``offsets`` around each path tile.
+
+    Tiles come out once each, in the order the stroke first reaches them.
+    """
+    seen: dict[TilePos, None] = {}
+    for x, y in path:
+        for dx, dy in offsets:
+            tx = x + dx
+            ty = y + dy
+            if 0 <= tx < width and 0 <= ty < height:
+                seen[(tx, ty)] = None
+    return list(seen)
+
+
+@dataclass(slots=True)
+class CoalescerStats:
+    """Counters for a :class:`PointerCoalescer`.
+
+    Attributes:
+        events: Pointer events recorded.
+        frames: Flushes that had something to hand out.
+        stroke_tiles: Path tiles handed out for painting.
+    """
+
+    events: int = 0
+    frames: int = 0
+    stroke_tiles: int = 0
+
+    @property
+    def events_per_frame(self) -> float:
+        if self.frames == 0:
+            return 0.0
+        return self.events / self.frames
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/debugging."""
+        return {
+            "events": self.events,
+            "frames": self.frames,
+            "stroke_tiles": self.stroke_tiles,
+            "events_per_frame": round(self.events_per_frame, 2),
+        }
+
+
+class PointerCoalescer:
+    """Pointer events gathered between two frames."""
+
+    __slots__ = ("_alt", "_last_tile", "_path", "_pointer", "stats")
+
+    def __init__(self) -> None:
+        self._pointer: TilePos | None = None
+        self._last_tile: TilePos | None = None
+        self._path: dict[TilePos, None] = {}
+        self._alt = False
+        self.stats = CoalescerStats()
+
+    @property
+    def pending(self) -> bool:
+        return self._pointer is not None or bool(self._path)
+
+    @property
+    def stroke_active(self) -> bool:
+        return self._last_tile is not None
+
+    def move(self, px: int, py: int) -> None:
+        """Record the latest pointer position (widget pixels)."""
+        self._pointer = (int(px), int(py))
+        self.stats.events += 1
+
+    def begin_stroke(self, x: int, y: int) -> None:
+        """Start a stroke at a tile the caller has already painted."""
+        self._last_tile = (int(x), int(y))
+        self._path.clear()
+
+    def extend_stroke(self, x: int, y: int, *, alt: bool = False) -> None:
+        """Continue the stroke to tile ``(x, y)``, filling the gap from the previous tile."""
+        last = self._last_tile
+        tile = (int(x), int(y))
+        if last is None or tile == last:
+            return
+        path = self._path
+        line = bresenham_line(last[0], last[1], tile[0], tile[1])
+        next(line)  # the previous tile is already painted or queued
+        for pos in line:
+            path[pos] = None
+        self._last_tile = tile
+        self._alt = bool(alt)
+
+    def end_stroke(self) -> None:
+        self._last_tile = None
+
+    def take_pointer(self) -> TilePos | None:
+        """Return and clear the latest pointer position."""
+        pointer, self._pointer = self._pointer, None
+        return pointer
+
+    def take_stroke(self) -> tuple[list[TilePos], bool]:
+        """Return and clear the stroke tiles queued since the last frame, with the Alt state."""
+        path = list(self._path)
+        self._path.clear()
+        self.stats.stroke_tiles += len(path)
+        return path, self._alt
+
+    def mark_frame(self) -> None:
+        self.stats.frames += 1
+
+    def clear(self) -> None:
+        """Drop everything pending and end the stroke."""
+        self._pointer = None
+        self._path.clear()
+        self._last_tile = None
+
+
+__all__ = [
+    "CoalescerStats",
+    "PointerCoalescer",
+    "bresenham_line",
+    "stroke_footprint",
+]
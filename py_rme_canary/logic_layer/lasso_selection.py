@@ -8,11 +8,99 @@ Layer: logic_layer (no PyQt6 imports)
 from __future__ import annotations
 
 import logging
+import math
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from py_rme_canary.logic_layer.session.selection_bitmap import Span, TileOccupancyIndex
 
 log = logging.getLogger(__name__)
 
 
+class WindingRule(Enum):
+    """Which tiles of a self-intersecting outline count as inside."""
+
+    EVEN_ODD = "even_odd"  # Inside where an odd number of edges lie to the left
+    NON_ZERO = "non_zero"  # Inside wherever the outline winds around the tile
+
+
+def polygon_spans(points: Sequence[tuple[int, int]], rule: WindingRule = WindingRule.EVEN_ODD) -> Iterator[Span]:
+    """Scan-convert a closed outline into row spans ``(y, x0, x1)``.
+
+    Edges are bucketed by their first row and kept in an active edge list
+    while the scan moves down, so each row only intersects the edges that
+    cross it. A tile ``(x, y)`` is inside when the crossings strictly left
+    of ``x`` satisfy ``rule``; with ``EVEN_ODD`` this selects exactly the
+    tiles :meth:`LassoSelection.point_in_polygon` accepts.
+    """
+    n = len(points)
+    if n < 3:
+        return
+
+    # (last_row, p1x, p1y, dx, dy, winding) bucketed by first row; an edge
+    # crosses rows min(y)+1 .. max(y), matching the ray cast's half-open test.
+    starts: dict[int, list[tuple[int, int, int, int, int, int]]] = {}
+    for i in range(n):
+        p1x, p1y = points[i]
+        p2x, p2y = points[(i + 1) % n]
+        if p1y == p2y:
+            continue
+        edge = (max(p1y, p2y), p1x, p1y, p2x - p1x, p2y - p1y, 1 if p2y > p1y else -1)
+        starts.setdefault(min(p1y, p2y) + 1, []).append(edge)
+    if not starts:
+        return
+
+    first_row = min(starts)
+    last_row = max(edge[0] for bucket in starts.values() for edge in bucket)
+    active: list[tuple[int, int, int, int, int, int]] = []
+    for y in range(first_row, last_row + 1):
+        bucket = starts.get(y)
+        if bucket:
+            active.extend(bucket)
+        active = [edge for edge in active if edge[0] >= y]
+        if not active:
+            continue
+
+        crossings = sorted(((y - p1y) * dx / dy + p1x, winding) for _, p1x, p1y, dx, dy, winding in active)
+        run: tuple[int, int] | None = None
+        for x0, x1 in _inside_intervals(crossings, rule):
+            if run is not None and x0 <= run[1] + 1:
+                run = (run[0], max(run[1], x1))
+                continue
+            if run is not None:
+                yield (y, run[0], run[1])
+            run = (x0, x1)
+        if run is not None:
+            yield (y, run[0], run[1])
+
+
+def _inside_intervals(crossings: list[tuple[float, int]], rule: WindingRule) -> Iterator[tuple[int, int]]:
+    """Yield integer ``[x0, x1]`` runs between sorted crossings that ``rule`` marks as inside."""
+    if rule is WindingRule.EVEN_ODD:
+        for i in range(0, len(crossings) - 1, 2):
+            x0 = math.floor(crossings[i][0]) + 1
+            x1 = math.floor(crossings[i + 1][0])
+            if x0 <= x1:
+                yield x0, x1
+        return
+
+    winding = 0
+    enter = 0.0
+    for cx, direction in crossings:
+        previous = winding
+        winding += direction
+        if previous == 0 and winding != 0:
+            enter = cx
+        elif previous != 0 and winding == 0:
+            x0 = math.floor(enter) + 1
+            x1 = math.floor(cx)
+            if x0 <= x1:
+                yield x0, x1
+
+
 @dataclass
 class LassoSelection:
     """Manages freehand/polygon selection state.
@@ -29,6 +117,7 @@ class LassoSelection:
     points: list[tuple[int, int]] = field(default_factory=list)
     is_active: bool = False
     z_level: int = 7
+    rule: WindingRule = WindingRule.EVEN_ODD
 
     def start(self, x: int, y: int, z: int = 7) -> None:
         """Start a new lasso selection."""
@@ -91,11 +180,22 @@ class LassoSelection:
 
         return inside
 
-    def get_selected_tiles(self, z: int | None = None) -> list[tuple[int, int, int]]:
+    def iter_spans(self) -> Iterator[Span]:
+        """Yield the polygon's inside tiles as row spans ``(y, x0, x1)``."""
+        return polygon_spans(self.points, self.rule)
+
+    def get_selected_tiles(
+        self,
+        z: int | None = None,
+        *,
+        occupancy: TileOccupancyIndex | None = None,
+    ) -> list[tuple[int, int, int]]:
         """Get all tile positions inside the polygon.
 
         Args:
             z: Z-level to use (defaults to selection z_level)
+            occupancy: When given, only tiles that exist and are non-empty
+                on the map are returned.
 
         Returns:
             List of (x, y, z) tuples for selected tiles
@@ -103,18 +203,11 @@ class LassoSelection:
         if len(self.points) < 3:
             return []
 
-        bbox = self.get_bounding_box()
-        if not bbox:
-            return []
-
-        min_x, min_y, max_x, max_y = bbox
         z_val = z if z is not None else self.z_level
-        tiles: list[tuple[int, int, int]] = []
-
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                if self.point_in_polygon(x, y):
-                    tiles.append((x, y, z_val))
+        if occupancy is not None:
+            tiles = list(occupancy.select_spans(self.iter_spans(), z_val))
+        else:
+            tiles = [(x, y, z_val) for y, x0, x1 in self.iter_spans() for x in range(x0, x1 + 1)]
 
         log.debug("Lasso selected %d tiles", len(tiles))
         return tiles
@@ -171,6 +264,14 @@ class LassoTool:
         self._selection.close()
         return self._selection.get_selected_tiles()
 
+    def finish_spans(self) -> list[Span]:
+        """Complete the selection and return its row spans ``(y, x0, x1)``."""
+        if not self.is_active:
+            return []
+
+        self._selection.close()
+        return list(self._selection.iter_spans())
+
     def cancel(self) -> None:
         """Cancel current selection."""
         self._selection.cancel()
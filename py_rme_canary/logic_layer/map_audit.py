@@ -0,0 +1,352 @@
+"""Incremental map audit: statistics, UID conflicts and validation in one pass.
+
+`compute_map_statistics`, `UIDValidator.scan` and `MapValidator.validate`
+each walk every tile and item. The audit engine walks the tiles once,
+keeps a summary per chunk and, after edits, rescans only the chunks whose
+tiles changed. Map-level checks (header, towns, houses, spawns, ...) are
+cheap and are re-run on every refresh against the cached tile summaries.
+
+Layer: logic_layer (no PyQt6 imports)
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from py_rme_canary.core.data.gamemap import GameMap, TileKey
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.io.map_validator import MapValidationResult, MapValidator, TileReferences
+
+from .map_statistics import MapStatistics
+from .uid_validator import UIDConflict, UIDValidationResult
+
+AUDIT_CHUNK_SHIFT = 5  # 32x32 tiles per chunk
+
+ChunkKey = tuple[int, int, int]  # (cx, cy, z)
+_UIDLocation = tuple[int, int, int, int]  # (x, y, z, item_id)
+
+
+@dataclass(slots=True)
+class _ChunkAudit:
+    """Everything the audit needs from the tiles of one chunk."""
+
+    tiles: int = 0
+    items: int = 0
+    action_ids: int = 0
+    unique_ids: int = 0
+    teleports: int = 0
+    containers: int = 0
+    depots: int = 0
+    doors: int = 0
+    uid_items_scanned: int = 0
+    item_ids: Counter[int] = field(default_factory=Counter)
+    uids: dict[int, list[_UIDLocation]] = field(default_factory=dict)
+    houses: dict[int, list[TileKey]] = field(default_factory=dict)
+    zones: dict[int, list[TileKey]] = field(default_factory=dict)
+    out_of_bounds: list[TileKey] = field(default_factory=list)
+
+
+def _index_add[T](index: dict[int, dict[ChunkKey, list[T]]], chunk_key: ChunkKey, part: dict[int, list[T]]) -> None:
+    for ident, entries in part.items():
+        index.setdefault(ident, {})[chunk_key] = entries
+
+
+def _index_remove[T](index: dict[int, dict[ChunkKey, list[T]]], chunk_key: ChunkKey, part: dict[int, list[T]]) -> None:
+    for ident in part:
+        per_chunk = index.get(ident)
+        if per_chunk is None:
+            continue
+        per_chunk.pop(chunk_key, None)
+        if not per_chunk:
+            del index[ident]
+
+
+def _uid_footprint(item: Item) -> tuple[int, bool]:
+    """Items UIDValidator visits for ``item`` (container contents included) and whether any has a UID."""
+    scanned, has_uid = 1, bool(item.unique_id and item.unique_id > 0)
+    for sub in item.items:
+        sub_scanned, sub_has_uid = _uid_footprint(sub)
+        scanned += sub_scanned
+        has_uid = has_uid or sub_has_uid
+    return scanned, has_uid
+
+
+def _collect_uids(item: Item, position: TileKey, uids: dict[int, list[_UIDLocation]]) -> None:
+    uid = item.unique_id
+    if uid and uid > 0:
+        uids.setdefault(uid, []).append((*position, item.id))
+    for sub in item.items:
+        _collect_uids(sub, position, uids)
+
+
+@dataclass(frozen=True, slots=True)
+class MapAudit:
+    """One refresh of the audit; ``revision`` changes whenever the content may have."""
+
+    revision: int
+    statistics: MapStatistics
+    uids: UIDValidationResult
+    validation: MapValidationResult
+
+
+class MapAuditEngine:
+    """Keep map statistics, UID conflicts and validation issues up to date.
+
+    Feed every changed tile position to :meth:`mark_dirty` (the editor
+    session does this for all edits, undo/redo included) and call
+    :meth:`refresh` when a panel needs the numbers. Only chunks touched
+    since the previous refresh are rescanned. Map-level data (waypoints,
+    houses, towns, spawns) is not tracked per chunk, so the statistics and
+    validation are recomputed from the chunk summaries on every refresh.
+
+    Usage:
+        engine = MapAuditEngine(game_map)
+        audit = engine.refresh()
+        print(audit.statistics.total_items, audit.uids.duplicate_count)
+    """
+
+    def __init__(self, game_map: GameMap, *, max_z: int = 15) -> None:
+        self._map = game_map
+        self._max_z = int(max_z)
+        self._chunks: dict[ChunkKey, _ChunkAudit] = {}
+        self._dirty: set[ChunkKey] = set()
+        self._built_for: tuple[int, int] | None = None
+        self._revision = 0
+        self._last: MapAudit | None = None
+
+        # Map-wide indexes, updated chunk by chunk.
+        self._item_ids: Counter[int] = Counter()
+        self._uids: dict[int, dict[ChunkKey, list[_UIDLocation]]] = {}
+        self._houses: dict[int, dict[ChunkKey, list[TileKey]]] = {}
+        self._zones: dict[int, dict[ChunkKey, list[TileKey]]] = {}
+
+    @property
+    def game_map(self) -> GameMap:
+        return self._map
+
+    @property
+    def dirty_chunk_count(self) -> int:
+        return len(self._dirty)
+
+    def mark_dirty(self, positions: Iterable[TileKey]) -> None:
+        """Queue the chunks holding ``positions`` for rescanning."""
+        dirty = self._dirty
+        for x, y, z in positions:
+            dirty.add((int(x) >> AUDIT_CHUNK_SHIFT, int(y) >> AUDIT_CHUNK_SHIFT, int(z)))
+
+    def invalidate(self) -> None:
+        """Forget every cached chunk; the next refresh walks the whole map."""
+        self._built_for = None
+
+    def refresh(self) -> MapAudit:
+        """Bring the audit up to date and return it."""
+        header = self._map.header
+        dims = (int(header.width), int(header.height))
+        last = self._last
+        if self._built_for != dims:
+            self._rebuild()
+            self._built_for = dims
+            last = None
+        elif self._dirty:
+            for key in self._dirty:
+                self._rescan_chunk(key)
+            last = None
+        self._dirty.clear()
+
+        # UID conflicts depend on the tiles only; keep them when no chunk changed.
+        self._revision += 1
+        self._last = MapAudit(
+            revision=self._revision,
+            statistics=self._statistics(),
+            uids=last.uids if last is not None else self._uid_result(),
+            validation=self._validation(),
+        )
+        return self._last
+
+    # --- chunk maintenance -------------------------------------------------
+
+    def _rebuild(self) -> None:
+        self._chunks.clear()
+        self._item_ids.clear()
+        self._uids.clear()
+        self._houses.clear()
+        self._zones.clear()
+
+        # Bucket the existing keys rather than (key, tile) pairs: allocating a
+        # tuple per tile keeps the cyclic GC busy on large maps.
+        shift = AUDIT_CHUNK_SHIFT
+        buckets: defaultdict[ChunkKey, list[TileKey]] = defaultdict(list)
+        for key in self._map.tiles:
+            buckets[key[0] >> shift, key[1] >> shift, key[2]].append(key)
+
+        for chunk_key, bucket in buckets.items():
+            chunk = self._scan(bucket)
+            self._chunks[chunk_key] = chunk
+            self._absorb(chunk_key, chunk)
+
+    def _rescan_chunk(self, chunk_key: ChunkKey) -> None:
+        old = self._chunks.pop(chunk_key, None)
+        if old is not None:
+            self._retire(chunk_key, old)
+
+        cx, cy, z = chunk_key
+        chunk = self._scan(self._chunk_tiles(cx, cy, z))
+        if chunk.tiles:
+            self._chunks[chunk_key] = chunk
+            self._absorb(chunk_key, chunk)
+
+    def _chunk_tiles(self, cx: int, cy: int, z: int) -> Iterator[TileKey]:
+        tiles = self._map.tiles
+        size = 1 << AUDIT_CHUNK_SHIFT
+        x0, y0 = cx << AUDIT_CHUNK_SHIFT, cy << AUDIT_CHUNK_SHIFT
+        for x in range(x0, x0 + size):
+            for y in range(y0, y0 + size):
+                key = (x, y, z)
+                if key in tiles:
+                    yield key
+
+    def _scan(self, keys: Iterable[TileKey]) -> _ChunkAudit:
+        chunk = _ChunkAudit()
+        tiles = self._map.tiles
+        header = self._map.header
+        width, height, max_z = int(header.width), int(header.height), self._max_z
+
+        # Gather the items first and evaluate each distinct object once:
+        # attribute-free items are shared (Item.plain), so a chunk usually
+        # holds a handful of objects repeated many times.
+        keys = list(keys)
+        grounds: list[Item] = []
+        stack: list[Item] = []
+        for key in keys:
+            tile = tiles[key]
+            x, y, z = key
+            ground = tile.ground
+            if ground is not None:
+                grounds.append(ground)
+            stack.extend(tile.items)
+
+            if not (0 <= x < width and 0 <= y < height and 0 <= z <= max_z):
+                chunk.out_of_bounds.append((x, y, z))
+                continue
+            if tile.house_id is not None:
+                chunk.houses.setdefault(int(tile.house_id), []).append((x, y, z))
+            for zid in tile.zones:
+                chunk.zones.setdefault(int(zid), []).append((x, y, z))
+        chunk.tiles = len(keys)
+
+        item_ids = chunk.item_ids
+        with_uids: set[int] = set()
+        for items, on_stack in ((grounds, False), (stack, True)):
+            objects = dict(zip(map(id, items), items, strict=True))
+            for oid, n in Counter(map(id, items)).items():
+                it = objects[oid]
+                chunk.items += n
+                item_ids[it.id] += n
+                if it.action_id is not None and int(it.action_id) > 0:
+                    chunk.action_ids += n
+                if it.unique_id is not None and int(it.unique_id) > 0:
+                    chunk.unique_ids += n
+                scanned, has_uid = _uid_footprint(it)
+                chunk.uid_items_scanned += n * scanned
+                if has_uid:
+                    with_uids.add(oid)
+                if not on_stack:
+                    continue
+                if it.destination is not None:
+                    chunk.teleports += n
+                if it.items:
+                    chunk.containers += n
+                if it.depot_id is not None and int(it.depot_id) > 0:
+                    chunk.depots += n
+                if it.house_door_id is not None and int(it.house_door_id) > 0:
+                    chunk.doors += n
+
+        if with_uids:
+            uids = chunk.uids
+            for key in keys:
+                tile = tiles[key]
+                ground = tile.ground
+                for it in (ground, *tile.items) if ground is not None else tile.items:
+                    if id(it) in with_uids:
+                        _collect_uids(it, key, uids)
+
+        return chunk
+
+    def _absorb(self, chunk_key: ChunkKey, chunk: _ChunkAudit) -> None:
+        self._item_ids.update(chunk.item_ids)
+        _index_add(self._uids, chunk_key, chunk.uids)
+        _index_add(self._houses, chunk_key, chunk.houses)
+        _index_add(self._zones, chunk_key, chunk.zones)
+
+    def _retire(self, chunk_key: ChunkKey, chunk: _ChunkAudit) -> None:
+        self._item_ids.subtract(chunk.item_ids)
+        for item_id in chunk.item_ids:
+            if self._item_ids[item_id] <= 0:
+                del self._item_ids[item_id]
+        _index_remove(self._uids, chunk_key, chunk.uids)
+        _index_remove(self._houses, chunk_key, chunk.houses)
+        _index_remove(self._zones, chunk_key, chunk.zones)
+
+    # --- results -----------------------------------------------------------
+
+    def _statistics(self) -> MapStatistics:
+        game_map = self._map
+        chunks = self._chunks.values()
+
+        tiles_per_floor = [0] * 16
+        for (_cx, _cy, z), chunk in self._chunks.items():
+            if 0 <= int(z) < 16:
+                tiles_per_floor[int(z)] += chunk.tiles
+
+        monster_names = {str(m.name) for area in game_map.monster_spawns for m in area.monsters}
+        npc_names = {str(n.name) for area in game_map.npc_spawns for n in area.npcs}
+
+        return MapStatistics(
+            total_tiles=sum(c.tiles for c in chunks),
+            total_items=sum(c.items for c in chunks),
+            unique_items=len(self._item_ids),
+            total_monsters=sum(len(area.monsters) for area in game_map.monster_spawns),
+            unique_monsters=len(monster_names),
+            total_npcs=sum(len(area.npcs) for area in game_map.npc_spawns),
+            unique_npcs=len(npc_names),
+            total_spawns=int(len(game_map.monster_spawns) + len(game_map.npc_spawns)),
+            total_houses=len(game_map.houses),
+            items_with_action_id=sum(c.action_ids for c in chunks),
+            items_with_unique_id=sum(c.unique_ids for c in chunks),
+            teleport_count=sum(c.teleports for c in chunks),
+            container_count=sum(c.containers for c in chunks),
+            depot_count=sum(c.depots for c in chunks),
+            door_count=sum(c.doors for c in chunks),
+            waypoint_count=len(game_map.waypoints),
+            tiles_per_floor=tuple(tiles_per_floor),
+        )
+
+    def _uid_result(self) -> UIDValidationResult:
+        result = UIDValidationResult(
+            total_items_scanned=sum(c.uid_items_scanned for c in self._chunks.values()),
+            total_uids_found=len(self._uids),
+        )
+        for uid, per_chunk in self._uids.items():
+            if len(per_chunk) == 1 and len(next(iter(per_chunk.values()))) == 1:
+                continue
+            locs = sorted(itertools.chain.from_iterable(per_chunk.values()))
+            result.duplicate_count += 1
+            result.conflicts.append(
+                UIDConflict(
+                    unique_id=uid,
+                    positions=[(x, y, z) for x, y, z, _ in locs],
+                    item_ids=[item_id for _, _, _, item_id in locs],
+                )
+            )
+        return result
+
+    def _validation(self) -> MapValidationResult:
+        def positions(index: dict[int, dict[ChunkKey, list[TileKey]]]) -> dict[int, Iterable[TileKey]]:
+            return {ident: itertools.chain.from_iterable(per_chunk.values()) for ident, per_chunk in index.items()}
+
+        out_of_bounds = [pos for chunk in self._chunks.values() for pos in chunk.out_of_bounds]
+        refs = TileReferences(houses=positions(self._houses), zones=positions(self._zones), out_of_bounds=out_of_bounds)
+        return MapValidator(self._map, max_z=self._max_z).validate(tile_refs=refs)
@@ -11,6 +11,8 @@ Features:
     - MapDiff: Compare two GameMap instances
     - TileDiff: Detailed tile-level differences
     - DiffReport: Summary and detailed change report
+    - ChunkHashIndex: Per-floor Merkle tree of chunk content hashes
+    - StreamingDiffReport: Report filled incrementally by a worker pool
     - Patch generation for applying changes
 
 Layer: logic_layer (no PyQt6 dependencies)
@@ -18,12 +20,20 @@ Layer: logic_layer (no PyQt6 dependencies)
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from collections.abc import Sequence
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
+from py_rme_canary.core.data.tile_table import TileTable, TileTableView
+
 if TYPE_CHECKING:
     from py_rme_canary.core.data.gamemap import GameMap
     from py_rme_canary.core.data.item import Item
@@ -35,6 +45,15 @@ logger = logging.getLogger(__name__)
 # Position type alias
 Position = tuple[int, int, int]  # (x, y, z)
 
+# Chunk key (z, chunk_x, chunk_y) and region key (z, region_x, region_y)
+ChunkKey = tuple[int, int, int]
+
+DEFAULT_CHUNK_SIZE = 32
+# Chunks per region side; regions are the middle level of the per-floor tree.
+REGION_SPAN = 8
+# Chunk indexes an engine keeps alive between compare_sparse calls.
+INDEX_CACHE_SIZE = 4
+
 
 class ChangeType(Enum):
     """Type of change detected."""
@@ -213,6 +232,316 @@ class DiffReport:
         return "\n".join(lines)
 
 
+@dataclass
+class StreamingDiffReport(DiffReport):
+    """DiffReport filled incrementally while chunk comparisons run.
+
+    Consumers may read ``tile_diffs`` (or use ``iter_diffs``) before the
+    comparison finishes; ``done`` becomes True once every chunk was processed
+    and ``tile_diffs`` was replaced by a copy in (z, y, x) order. The list
+    ``iter_diffs`` streams from is never reordered.
+
+    Attributes:
+        chunks_total: Chunks that needed a tile-level comparison.
+        chunks_done: Chunks processed so far.
+        chunks_skipped: Chunks skipped because their content hashes matched.
+    """
+
+    chunks_total: int = 0
+    chunks_done: int = 0
+    chunks_skipped: int = 0
+    error: BaseException | None = None
+    _cond: threading.Condition = field(default_factory=threading.Condition, repr=False, compare=False)
+    _done: bool = field(default=False, repr=False, compare=False)
+    _cancelled: bool = field(default=False, repr=False, compare=False)
+    _arrivals: list[TileDiff] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._arrivals = self.tile_diffs
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def progress(self) -> float:
+        if self.chunks_total <= 0:
+            return 1.0 if self._done else 0.0
+        return self.chunks_done / self.chunks_total
+
+    def cancel(self) -> None:
+        """Stop scheduling further chunk comparisons."""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the comparison finished; returns ``done``."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._done, timeout=timeout)
+            return self._done
+
+    def iter_diffs(self, timeout: float | None = None) -> Iterator[TileDiff]:
+        """Yield diffs as they are produced, until the comparison finishes.
+
+        Diffs are yielded in arrival order (not sorted). ``timeout`` bounds
+        each wait for new results.
+        """
+        index = 0
+        while True:
+            with self._cond:
+                seen = index
+
+                def ready(seen: int = seen) -> bool:
+                    return self._done or len(self._arrivals) > seen
+
+                self._cond.wait_for(ready, timeout=timeout)
+                batch = self._arrivals[index:]
+                finished = self._done
+            yield from batch
+            index += len(batch)
+            if finished and index >= len(self._arrivals):
+                return
+            if not batch and not finished:
+                return  # timed out
+
+    def _add_chunk(
+        self,
+        diffs: list[TileDiff],
+        compared: int,
+        unchanged: int,
+        on_diff: Callable[[TileDiff], None] | None,
+    ) -> None:
+        with self._cond:
+            stats = self.statistics
+            stats.tiles_compared += compared
+            stats.tiles_unchanged += unchanged
+            for diff in diffs:
+                z = diff.position[2]
+                floor_counts = self.floor_stats.setdefault(z, {"added": 0, "removed": 0, "modified": 0})
+                MapDiffEngine._count_diff(stats, floor_counts, diff)
+            self._arrivals.extend(diffs)
+            self.chunks_done += 1
+            self._cond.notify_all()
+        if on_diff is not None:
+            for diff in diffs:
+                on_diff(diff)
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        with self._cond:
+            self.tile_diffs = sorted(self._arrivals, key=lambda d: (d.position[2], d.position[1], d.position[0]))
+            self.error = error
+            self._done = True
+            self._cond.notify_all()
+
+
+class ChunkHashIndex:
+    """Per-floor Merkle tree of chunk content hashes for one map.
+
+    Levels: floor root -> regions (``REGION_SPAN`` x ``REGION_SPAN`` chunks)
+    -> chunks (``chunk_size`` x ``chunk_size`` tiles). Only tiles that exist
+    are visited, so cost is proportional to the tile count, not the header.
+
+    ``fingerprint`` maps a tile to a hashable value; two tiles with equal
+    fingerprints must compare as unchanged at the engine's diff level.
+
+    When the map stores its tiles in a :class:`TileTable` the index tracks
+    the keys written after it was built, and :meth:`refresh` rehashes only
+    the chunks holding them (plus their region and floor roots).
+
+    Given a ``view`` (the tiles of a :meth:`GameMap.snapshot`), the index is
+    built from the view instead of the live table, so it can run on another
+    thread while the map is edited. ``version`` is the table version the
+    hashes describe; keys written after the view opened stay pending until
+    the next :meth:`refresh`.
+    """
+
+    def __init__(
+        self,
+        game_map: GameMap,
+        fingerprint: Callable[[Tile], Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        floors: Sequence[int] | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        view: TileTableView | None = None,
+    ) -> None:
+        self.chunk_size = max(1, int(chunk_size))
+        self.tiles = game_map.tiles
+        self.chunk_keys: dict[ChunkKey, list[Position]] = {}
+        self.chunk_hashes: dict[ChunkKey, bytes] = {}
+        self.region_hashes: dict[ChunkKey, bytes] = {}
+        self.floor_hashes: dict[int, bytes] = {}
+        self.region_chunks: dict[ChunkKey, list[ChunkKey]] = {}
+        self.floor_regions: dict[int, list[ChunkKey]] = {}
+        self.chunks_hashed = 0
+        self._fingerprint = fingerprint
+        self._floor_filter = None if floors is None else frozenset(int(z) for z in floors)
+        self._region = region
+        # Opened before the first read so no write can slip between build and tracking.
+        self._tracker = self.tiles.track_changes() if isinstance(self.tiles, TileTable) else None
+        self._pending: set[Position] = set()
+        source: Mapping[Position, Tile]
+        if view is None:
+            self.version = getattr(self.tiles, "version", 0)
+            source = self.tiles
+        else:
+            self.version = view.version
+            source = view.materialize()
+            if self._tracker is not None:
+                # Written between the view and the tracker opening: not in the hashes, not tracked.
+                self._pending = view.written_keys()
+
+        cs = self.chunk_size
+        for key in source:
+            if not self._accepts(key):
+                continue
+            x, y, z = key
+            chunk_key = (z, x // cs, y // cs)
+            positions = self.chunk_keys.get(chunk_key)
+            if positions is None:
+                self.chunk_keys[chunk_key] = [key]
+            else:
+                positions.append(key)
+
+        for chunk_key, positions in self.chunk_keys.items():
+            positions.sort(key=_row_major)
+            self._hash_chunk(chunk_key, source)
+            z, cx, cy = chunk_key
+            self.region_chunks.setdefault((z, cx // REGION_SPAN, cy // REGION_SPAN), []).append(chunk_key)
+        for region_key, children in self.region_chunks.items():
+            children.sort()
+            self._hash_region(region_key)
+            self.floor_regions.setdefault(region_key[0], []).append(region_key)
+        for z, region_keys in self.floor_regions.items():
+            region_keys.sort()
+            self._hash_floor(z)
+
+    @property
+    def tracking(self) -> bool:
+        """True when :meth:`refresh` can follow edits incrementally."""
+        return self._tracker is not None
+
+    def tile_count(self, chunk_key: ChunkKey) -> int:
+        return len(self.chunk_keys.get(chunk_key, ()))
+
+    def refresh(self, view: TileTableView | None = None) -> int:
+        """Rehash the chunks written since the last build/refresh; returns how many.
+
+        Reads the live table, or ``view`` when given. The view must not be
+        older than ``version``.
+        """
+        if self._tracker is None:
+            return 0
+        source: Mapping[Position, Tile] | TileTableView
+        written = self._tracker.drain() | self._pending
+        if view is None:
+            self.version = getattr(self.tiles, "version", 0)
+            source = self.tiles
+            self._pending = set()
+        else:
+            if view.version < self.version:
+                raise ValueError("tile view is older than the index")
+            self.version = view.version
+            source = view
+            # Read after the drain: a key written since is journaled by now.
+            self._pending = view.written_keys()
+        cs = self.chunk_size
+        touched: dict[ChunkKey, list[Position]] = {}
+        for key in written:
+            if self._accepts(key):
+                x, y, z = key
+                touched.setdefault((z, x // cs, y // cs), []).append(key)
+        if not touched:
+            return 0
+
+        regions: set[ChunkKey] = set()
+        for chunk_key, keys in touched.items():
+            positions = set(self.chunk_keys.get(chunk_key, ()))
+            for key in keys:
+                if key in source:
+                    positions.add(key)
+                else:
+                    positions.discard(key)
+            z, cx, cy = chunk_key
+            region_key = (z, cx // REGION_SPAN, cy // REGION_SPAN)
+            regions.add(region_key)
+            children = self.region_chunks.setdefault(region_key, [])
+            if positions:
+                if chunk_key not in self.chunk_keys:
+                    children.append(chunk_key)
+                    children.sort()
+                self.chunk_keys[chunk_key] = sorted(positions, key=_row_major)
+                self._hash_chunk(chunk_key, source)
+            elif chunk_key in self.chunk_keys:
+                del self.chunk_keys[chunk_key]
+                del self.chunk_hashes[chunk_key]
+                children.remove(chunk_key)
+
+        floors: set[int] = set()
+        for region_key in regions:
+            z = region_key[0]
+            floors.add(z)
+            siblings = self.floor_regions.setdefault(z, [])
+            if self.region_chunks[region_key]:
+                if region_key not in self.region_hashes:
+                    siblings.append(region_key)
+                    siblings.sort()
+                self._hash_region(region_key)
+            else:
+                del self.region_chunks[region_key]
+                if self.region_hashes.pop(region_key, None) is not None:
+                    siblings.remove(region_key)
+        for z in floors:
+            if self.floor_regions[z]:
+                self._hash_floor(z)
+            else:
+                del self.floor_regions[z]
+                self.floor_hashes.pop(z, None)
+        return len(touched)
+
+    def close(self) -> None:
+        """Stop tracking edits; the index keeps its last hashes."""
+        if self._tracker is not None:
+            self._tracker.close()
+            self._tracker = None
+
+    def _accepts(self, key: Position) -> bool:
+        x, y, z = key
+        if self._floor_filter is not None and z not in self._floor_filter:
+            return False
+        region = self._region
+        return region is None or (region[0] <= x < region[2] and region[1] <= y < region[3])
+
+    def _hash_chunk(self, chunk_key: ChunkKey, tiles: Mapping[Position, Tile] | TileTableView) -> None:
+        fingerprint = self._fingerprint
+        payload = repr([(p[0], p[1], fingerprint(tiles[p])) for p in self.chunk_keys[chunk_key]]).encode()
+        self.chunk_hashes[chunk_key] = hashlib.blake2b(payload, digest_size=16).digest()
+        self.chunks_hashed += 1
+
+    def _hash_region(self, region_key: ChunkKey) -> None:
+        h = hashlib.blake2b(digest_size=16)
+        for child in self.region_chunks[region_key]:
+            h.update(repr(child).encode())
+            h.update(self.chunk_hashes[child])
+        self.region_hashes[region_key] = h.digest()
+
+    def _hash_floor(self, z: int) -> None:
+        h = hashlib.blake2b(digest_size=16)
+        for region_key in self.floor_regions[z]:
+            h.update(repr(region_key).encode())
+            h.update(self.region_hashes[region_key])
+        self.floor_hashes[z] = h.digest()
+
+
+def _row_major(pos: Position) -> tuple[int, int]:
+    return pos[1], pos[0]
+
+
 class MapDiffEngine:
     """Engine for comparing two maps.
 
@@ -239,10 +568,14 @@ class MapDiffEngine:
         self._level = level
         self._ignore_empty_tiles = True
         self._ignore_flags: set[str] = set()
+        # (id(tiles), chunk_size, floors, region) -> index following that map's edits.
+        self._indexes: OrderedDict[tuple[Any, ...], ChunkHashIndex] = OrderedDict()
+        self._index_lock = threading.Lock()
 
     def set_level(self, level: DiffLevel) -> None:
         """Set comparison detail level."""
         self._level = level
+        self.clear_index_cache()
 
     def set_ignore_empty(self, ignore: bool) -> None:
         """Set whether to ignore empty tiles."""
@@ -251,6 +584,14 @@ class MapDiffEngine:
     def add_ignore_flag(self, flag_name: str) -> None:
         """Add a flag to ignore during comparison."""
         self._ignore_flags.add(flag_name)
+        self.clear_index_cache()
+
+    def clear_index_cache(self) -> None:
+        """Drop the cached chunk indexes (they hash with the old fingerprint)."""
+        with self._index_lock:
+            for index in self._indexes.values():
+                index.close()
+            self._indexes.clear()
 
     def compare(
         self,
@@ -307,55 +648,303 @@ class MapDiffEngine:
                             stats.tiles_unchanged += 1
                         continue
 
-                    # Tile added
-                    if old_tile is None and new_tile is not None:
-                        diff = TileDiff(
-                            position=(x, y, z),
-                            change_type=ChangeType.ADDED,
-                        )
-                        diff.item_changes = self._items_to_changes(new_tile, ChangeType.ADDED)
-                        report.tile_diffs.append(diff)
-                        stats.tiles_added += 1
-                        stats.items_added += len(diff.item_changes)
-                        floor_stats[z]["added"] += 1
+                    diff = self._diff_tile_pair(old_tile, new_tile, (x, y, z))
+                    if diff is None:
+                        stats.tiles_unchanged += 1
                         continue
+                    report.tile_diffs.append(diff)
+                    self._count_diff(stats, floor_stats[z], diff)
 
-                    # Tile removed
-                    if old_tile is not None and new_tile is None:
-                        diff = TileDiff(
-                            position=(x, y, z),
-                            change_type=ChangeType.REMOVED,
-                        )
-                        diff.item_changes = self._items_to_changes(old_tile, ChangeType.REMOVED)
-                        report.tile_diffs.append(diff)
-                        stats.tiles_removed += 1
-                        stats.items_removed += len(diff.item_changes)
-                        floor_stats[z]["removed"] += 1
-                        continue
+        report.floor_stats = floor_stats
+        return report
 
-                    # Both tiles exist - compare them
-                    # old_tile and new_tile are not None here because of previous checks
-                    diff = self._compare_tiles(old_tile, new_tile, (x, y, z))  # type: ignore[arg-type]
-
-                    if diff.has_changes:
-                        report.tile_diffs.append(diff)
-                        stats.tiles_modified += 1
-                        floor_stats[z]["modified"] += 1
-
-                        # Count item changes
-                        for ic in diff.item_changes:
-                            if ic.change_type == ChangeType.ADDED:
-                                stats.items_added += 1
-                            elif ic.change_type == ChangeType.REMOVED:
-                                stats.items_removed += 1
-                            elif ic.change_type == ChangeType.MODIFIED:
-                                stats.items_modified += 1
-                    else:
-                        stats.tiles_unchanged += 1
+    def tile_fingerprint(self, tile: Tile) -> Any:
+        """Hashable summary of everything the current level compares."""
+        ground = tile.ground
+        deep = self._level in (DiffLevel.ITEMS_DEEP, DiffLevel.FULL)
+        if deep:
+            ground_fp: Any = self._item_fingerprint(ground) if ground is not None else None
+            items_fp: Any = tuple(self._item_fingerprint(item) for item in tile.items)
+        else:
+            ground_fp = int(ground.id) if ground is not None else 0
+            items_fp = tuple(int(item.id) for item in tile.items)
+        if self._level == DiffLevel.FULL:
+            flags = tuple(
+                getattr(tile, attr, None)
+                for attr in ("flags", "pz", "no_logout", "pvp_zone", "no_pvp")
+                if attr not in self._ignore_flags
+            )
+            return (ground_fp, items_fp, flags, tile.house_id or 0)
+        return (ground_fp, items_fp)
+
+    @staticmethod
+    def _item_fingerprint(item: Item) -> tuple[Any, ...]:
+        return (
+            int(item.id),
+            getattr(item, "count", None),
+            getattr(item, "action_id", None),
+            getattr(item, "unique_id", None),
+            getattr(item, "destination", None),
+            getattr(item, "text", None),
+            getattr(item, "charges", None),
+        )
+
+    def build_chunk_index(
+        self,
+        game_map: GameMap,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        floors: Sequence[int] | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        view: TileTableView | None = None,
+    ) -> ChunkHashIndex:
+        """Build the chunk hash tree of a map at this engine's diff level.
+
+        The index can be kept and passed back to ``compare_sparse``; it is
+        refreshed from the map's tile writes before every use. Indexes built
+        here are not cached by the engine. Pass ``view`` to hash a snapshot
+        of the map's tiles instead of the live table.
+        """
+        return ChunkHashIndex(
+            game_map,
+            self.tile_fingerprint,
+            chunk_size=chunk_size,
+            floors=floors,
+            region=region,
+            view=view,
+        )
+
+    def compare_sparse(
+        self,
+        old_map: GameMap,
+        new_map: GameMap,
+        region: tuple[int, int, int, int] | None = None,
+        floors: Sequence[int] | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int | None = None,
+        old_index: ChunkHashIndex | None = None,
+        new_index: ChunkHashIndex | None = None,
+        on_diff: Callable[[TileDiff], None] | None = None,
+        background: bool = False,
+    ) -> StreamingDiffReport:
+        """Compare only tiles that exist in either map, skipping identical chunks.
+
+        Both maps are summarised as per-floor Merkle trees of chunk hashes;
+        floors, regions and chunks whose hashes match are skipped without
+        touching their tiles. The engine keeps the trees between calls and
+        rehashes only chunks written since, so repeated diffs of an edited
+        map cost time proportional to the edits. Remaining chunks are
+        compared and their diffs are appended to the returned report as they
+        finish.
+
+        Both maps are snapshotted when the call is made, so edits made while
+        a background diff runs are not observed by it.
+
+        ``tiles_compared`` counts positions holding a tile in either map
+        (empty positions are never visited).
 
-        report.floor_stats = floor_stats
+        Args:
+            old_map: Original map.
+            new_map: New/modified map.
+            region: Optional (min_x, min_y, max_x, max_y) to compare.
+            floors: Optional list of floors to compare.
+            chunk_size: Chunk side in tiles (ignored when indexes are given).
+            max_workers: Worker threads for chunk comparisons. Defaults to one
+                (inline) unless the interpreter runs without the GIL, since
+                the comparison is pure Python and CPU-bound.
+            old_index: Prebuilt index of ``old_map`` (same level/filters).
+            new_index: Prebuilt index of ``new_map`` (same level/filters).
+            on_diff: Called (from a worker thread) for every diff found.
+            background: Return immediately and finish asynchronously.
+
+        Returns:
+            StreamingDiffReport; call ``wait()`` when ``background`` is True.
+        """
+        if old_index is not None and new_index is not None and old_index.chunk_size != new_index.chunk_size:
+            raise ValueError("old_index and new_index must use the same chunk size")
+        if old_index is not None:
+            chunk_size = old_index.chunk_size
+        elif new_index is not None:
+            chunk_size = new_index.chunk_size
+
+        report = StreamingDiffReport()
+        report.old_map_info = self._extract_map_info(old_map, "old")
+        report.new_map_info = self._extract_map_info(new_map, "new")
+        for z in floors if floors is not None else range(16):
+            report.floor_stats[int(z)] = {"added": 0, "removed": 0, "modified": 0}
+
+        # Taken here, on the editing thread, so the worker never reads the live tables.
+        old_tiles = old_map.snapshot().tiles
+        new_tiles = new_map.snapshot().tiles
+
+        def run() -> None:
+            error: BaseException | None = None
+            try:
+                # Cached indexes are refreshed in place, so one sparse diff at a time.
+                with self._index_lock:
+                    old = self._resolve_index(old_map, old_tiles, old_index, chunk_size, floors, region)
+                    new = self._resolve_index(new_map, new_tiles, new_index, chunk_size, floors, region)
+                    self._run_sparse(report, old, new, old_tiles, new_tiles, max_workers=max_workers, on_diff=on_diff)
+            except BaseException as exc:  # surfaced through report.error
+                logger.exception("Sparse map diff failed")
+                error = exc
+            finally:
+                old_tiles.close()
+                new_tiles.close()
+            report._finish(error)
+
+        if background:
+            threading.Thread(target=run, name="map-diff", daemon=True).start()
+        else:
+            run()
         return report
 
+    def _resolve_index(
+        self,
+        game_map: GameMap,
+        view: TileTableView,
+        given: ChunkHashIndex | None,
+        chunk_size: int,
+        floors: Sequence[int] | None,
+        region: tuple[int, int, int, int] | None,
+    ) -> ChunkHashIndex:
+        """Return an index of ``game_map`` as seen by ``view``, reusing the cache when possible."""
+        tiles = game_map.tiles
+        key = (id(tiles), int(chunk_size), None if floors is None else tuple(sorted({int(z) for z in floors})), region)
+        kept = given if given is not None else self._indexes.get(key)
+        if kept is not None and (given is not None or kept.tiles is tiles):
+            if kept.version <= view.version:
+                if given is None:
+                    self._indexes.move_to_end(key)
+                kept.refresh(view)
+                return kept
+            # The kept index already follows edits made after the snapshot; hash the snapshot once.
+            index = self.build_chunk_index(game_map, chunk_size=chunk_size, floors=floors, region=region, view=view)
+            index.close()
+            return index
+        index = self.build_chunk_index(game_map, chunk_size=chunk_size, floors=floors, region=region, view=view)
+        if index.tracking:
+            # The index holds the table, so its id cannot be reused while cached.
+            self._indexes[key] = index
+            while len(self._indexes) > INDEX_CACHE_SIZE:
+                self._indexes.popitem(last=False)[1].close()
+        return index
+
+    def _run_sparse(
+        self,
+        report: StreamingDiffReport,
+        old_index: ChunkHashIndex,
+        new_index: ChunkHashIndex,
+        old_tiles: TileTableView,
+        new_tiles: TileTableView,
+        *,
+        max_workers: int | None,
+        on_diff: Callable[[TileDiff], None] | None,
+    ) -> None:
+        dirty: list[ChunkKey] = []
+        skipped_tiles = 0
+
+        for z in sorted(set(old_index.floor_regions) | set(new_index.floor_regions)):
+            if old_index.floor_hashes.get(z) == new_index.floor_hashes.get(z):
+                for region_key in old_index.floor_regions.get(z, ()):
+                    for chunk_key in old_index.region_chunks[region_key]:
+                        skipped_tiles += old_index.tile_count(chunk_key)
+                        report.chunks_skipped += 1
+                continue
+            region_keys = set(old_index.floor_regions.get(z, ())) | set(new_index.floor_regions.get(z, ()))
+            for region_key in sorted(region_keys):
+                old_chunks = old_index.region_chunks.get(region_key, [])
+                if old_index.region_hashes.get(region_key) == new_index.region_hashes.get(region_key):
+                    for chunk_key in old_chunks:
+                        skipped_tiles += old_index.tile_count(chunk_key)
+                        report.chunks_skipped += 1
+                    continue
+                chunk_keys = set(old_chunks) | set(new_index.region_chunks.get(region_key, ()))
+                for chunk_key in sorted(chunk_keys):
+                    if old_index.chunk_hashes.get(chunk_key) == new_index.chunk_hashes.get(chunk_key):
+                        skipped_tiles += old_index.tile_count(chunk_key)
+                        report.chunks_skipped += 1
+                    else:
+                        dirty.append(chunk_key)
+
+        with report._cond:
+            report.statistics.tiles_compared += skipped_tiles
+            report.statistics.tiles_unchanged += skipped_tiles
+            report.chunks_total = len(dirty)
+
+        def compare_chunk(chunk_key: ChunkKey) -> None:
+            if report.cancelled:
+                return
+            positions = set(old_index.chunk_keys.get(chunk_key, ()))
+            positions.update(new_index.chunk_keys.get(chunk_key, ()))
+            diffs: list[TileDiff] = []
+            unchanged = 0
+            for pos in sorted(positions, key=lambda p: (p[1], p[0])):
+                diff = self._diff_tile_pair(old_tiles.get(pos), new_tiles.get(pos), pos)
+                if diff is None:
+                    unchanged += 1
+                else:
+                    diffs.append(diff)
+            report._add_chunk(diffs, len(positions), unchanged, on_diff)
+
+        if not dirty:
+            return
+        if max_workers is not None:
+            workers = max_workers
+        elif getattr(sys, "_is_gil_enabled", lambda: True)():
+            workers = 1
+        else:
+            workers = min(8, os.cpu_count() or 1)
+        if workers <= 1 or len(dirty) == 1:
+            for chunk_key in dirty:
+                compare_chunk(chunk_key)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="map-diff") as pool:
+            for future in [pool.submit(compare_chunk, chunk_key) for chunk_key in dirty]:
+                future.result()
+
+    def _diff_tile_pair(self, old_tile: Tile | None, new_tile: Tile | None, pos: Position) -> TileDiff | None:
+        """Diff one position where at least one tile exists; None when unchanged."""
+        if old_tile is None and new_tile is None:
+            return None
+
+        if old_tile is None:
+            diff = TileDiff(position=pos, change_type=ChangeType.ADDED)
+            diff.item_changes = self._items_to_changes(new_tile, ChangeType.ADDED)  # type: ignore[arg-type]
+            return diff
+
+        if new_tile is None:
+            diff = TileDiff(position=pos, change_type=ChangeType.REMOVED)
+            diff.item_changes = self._items_to_changes(old_tile, ChangeType.REMOVED)
+            return diff
+
+        diff = self._compare_tiles(old_tile, new_tile, pos)
+        return diff if diff.has_changes else None
+
+    @staticmethod
+    def _count_diff(stats: DiffStatistics, floor_counts: dict[str, int], diff: TileDiff) -> None:
+        if diff.change_type == ChangeType.ADDED:
+            stats.tiles_added += 1
+            stats.items_added += len(diff.item_changes)
+            floor_counts["added"] += 1
+            return
+        if diff.change_type == ChangeType.REMOVED:
+            stats.tiles_removed += 1
+            stats.items_removed += len(diff.item_changes)
+            floor_counts["removed"] += 1
+            return
+
+        stats.tiles_modified += 1
+        floor_counts["modified"] += 1
+        for ic in diff.item_changes:
+            if ic.change_type == ChangeType.ADDED:
+                stats.items_added += 1
+            elif ic.change_type == ChangeType.REMOVED:
+                stats.items_removed += 1
+            elif ic.change_type == ChangeType.MODIFIED:
+                stats.items_modified += 1
+
     def _extract_map_info(self, game_map: GameMap, label: str) -> dict[str, Any]:
         """Extract basic info from a map."""
         return {
@@ -228,10 +228,12 @@ class MonsterSpawnsAction:
 
     def undo(self, game_map: GameMap) -> None:
         game_map.monster_spawns = list(self.before)
+        game_map.monster_spawn_index()
         game_map.header = self.header_before
 
     def redo(self, game_map: GameMap) -> None:
         game_map.monster_spawns = list(self.after)
+        game_map.monster_spawn_index()
         game_map.header = self.header_after
 
     def describe(self) -> str:
@@ -253,10 +255,12 @@ class NpcSpawnsAction:
 
     def undo(self, game_map: GameMap) -> None:
         game_map.npc_spawns = list(self.before)
+        game_map.npc_spawn_index()
         game_map.header = self.header_before
 
     def redo(self, game_map: GameMap) -> None:
         game_map.npc_spawns = list(self.after)
+        game_map.npc_spawn_index()
         game_map.header = self.header_after
 
     def describe(self) -> str:
@@ -190,12 +190,4 @@ class MonsterBrush:
 
     def _is_in_spawn_area(self, game_map: GameMap, pos: Position) -> bool:
         """Check if position is within any monster spawn area."""
-        for spawn in game_map.monster_spawns:
-            cx, cy, cz = spawn.center.x, spawn.center.y, spawn.center.z
-            if cz != pos.z:
-                continue
-            dx = abs(pos.x - cx)
-            dy = abs(pos.y - cy)
-            if dx <= spawn.radius and dy <= spawn.radius:
-                return True
-        return False
+        return bool(game_map.monster_spawn_index().covering(pos.x, pos.y, pos.z))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, replace
 from pathlib import Path
 
@@ -22,6 +23,7 @@ class ImportMapReport:
     house_id_mapping: dict[int, int] | None = None
     zone_id_mapping: dict[int, int] | None = None
     warnings: list[str] | None = None
+    cancelled: bool = False
 
     def __post_init__(self) -> None:
         if self.house_id_mapping is None:
@@ -42,9 +44,21 @@ def import_map_with_offset(
     import_spawns: bool = True,
     import_zones: bool = False,
     merge_mode: int = 0,
+    progress_callback: Callable[[float, str], None] | None = None,
+    cancel_check: Callable[[], bool] | None = None,
 ) -> ImportMapReport:
+    """Merge the map at `source_path` into `target_map`.
+
+    The source is streamed one OTBM tile area at a time, so it is never held
+    as a second GameMap. Houses, zones and spawns come from the source's
+    external files and are imported before the first tile so that house and
+    zone ids can be remapped on the fly.
+
+    `progress_callback(fraction, message)` is called after every tile area;
+    when `cancel_check()` returns True the import stops after the current
+    area and `report.cancelled` is set. Tiles merged so far are kept.
+    """
     loader = OTBMLoader()
-    source_map = loader.load_with_detection(str(source_path))
 
     report = ImportMapReport()
     offset_x, offset_y, offset_z = offset
@@ -52,23 +66,27 @@ def import_map_with_offset(
     house_id_mapping: dict[int, int] = {}
     zone_id_mapping: dict[int, int] = {}
 
-    if import_houses:
-        house_id_mapping = _build_house_id_mapping(target_map, source_map)
-        report.house_id_mapping = dict(house_id_mapping)
-        _import_houses(target_map, source_map, offset_x, offset_y, offset_z, house_id_mapping, report)
+    def on_header(source_map: GameMap) -> None:
+        nonlocal house_id_mapping, zone_id_mapping
+        if import_houses:
+            house_id_mapping = _build_house_id_mapping(target_map, source_map)
+            report.house_id_mapping = dict(house_id_mapping)
+            _import_houses(target_map, source_map, offset_x, offset_y, offset_z, house_id_mapping, report)
 
-    if import_zones:
-        zone_id_mapping = _build_zone_id_mapping(target_map, source_map)
-        report.zone_id_mapping = dict(zone_id_mapping)
-        _import_zones(target_map, source_map, zone_id_mapping, report)
+        if import_zones:
+            zone_id_mapping = _build_zone_id_mapping(target_map, source_map)
+            report.zone_id_mapping = dict(zone_id_mapping)
+            _import_zones(target_map, source_map, zone_id_mapping, report)
 
-    if import_spawns:
-        _import_spawns(target_map, source_map, offset_x, offset_y, offset_z, report)
+        if import_spawns:
+            _import_spawns(target_map, source_map, offset_x, offset_y, offset_z, report)
 
-    if import_tiles:
+    def on_tile_area(tiles: list[Tile]) -> bool:
+        if not import_tiles:
+            return False
         _import_tiles(
             target_map,
-            source_map,
+            tiles,
             offset_x,
             offset_y,
             offset_z,
@@ -78,7 +96,21 @@ def import_map_with_offset(
             import_spawns,
             report,
         )
-
+        if cancel_check is not None and cancel_check():
+            report.cancelled = True
+            return False
+        return True
+
+    def on_progress(done: int, total: int) -> None:
+        if progress_callback is not None and total > 0:
+            progress_callback(min(1.0, done / total), f"Imported {report.tiles_imported} tiles")
+
+    loader.stream_with_detection(
+        str(source_path),
+        on_tile_area=on_tile_area,
+        on_header=on_header,
+        on_progress=on_progress,
+    )
     return report
 
 
@@ -191,7 +223,7 @@ def _import_spawns(
 
 def _import_tiles(
     target_map: GameMap,
-    source_map: GameMap,
+    source_tiles: Iterable[Tile],
     offset_x: int,
     offset_y: int,
     offset_z: int,
@@ -204,8 +236,8 @@ def _import_tiles(
     max_x = int(target_map.header.width)
     max_y = int(target_map.header.height)
 
-    for key, tile in source_map.tiles.items():
-        sx, sy, sz = key
+    for tile in source_tiles:
+        sx, sy, sz = tile.x, tile.y, tile.z
         tx = int(sx) + int(offset_x)
         ty = int(sy) + int(offset_y)
         tz = int(sz) + int(offset_z)
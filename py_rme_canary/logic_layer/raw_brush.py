@@ -297,7 +297,7 @@ class RawBrush:
         try:
             from py_rme_canary.core.data.item import Item
 
-            return Item(id=self.item_id)
+            return Item.plain(self.item_id)
         except Exception:
             # Fallback: return a simple item-like object
             return _SimpleItem(self.item_id)
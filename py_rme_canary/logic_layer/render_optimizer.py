@@ -5,14 +5,16 @@ Performance optimization for map rendering:
 - Dirty rectangle tracking
 - Batch rendering
 - Level of detail (LOD)
+- Frame planning for retained map layers (skip / partial / full redraw)
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
@@ -248,6 +250,8 @@ class LevelOfDetail:
     show_creatures: bool
     show_grid: bool
     show_names: bool
+    show_sprites: bool = True  # False: one flat ground colour per tile
+    chunk_textures: bool = False  # Draw whole chunks from cached minimap colour textures
 
 
 class LODManager:
@@ -272,6 +276,14 @@ class LODManager:
         LevelOfDetail(0.1, False, False, False, False),  # <25% - hide items
     ]
 
+    # Map canvas zoom is tile_px / 32; the editor zooms between 6 and 64 px per tile.
+    CANVAS_LEVELS = [
+        LevelOfDetail(0.5, True, True, True, True),  # 16px+ - show everything
+        LevelOfDetail(0.375, True, False, False, False),  # 12-15px - hide creatures, grid, names
+        LevelOfDetail(0.25, False, False, False, False, show_sprites=False),  # 8-11px - ground colours
+        LevelOfDetail(0.0, False, False, False, False, show_sprites=False, chunk_textures=True),  # <8px - minimap
+    ]
+
     def __init__(self, levels: list[LevelOfDetail] | None = None) -> None:
         self._levels = levels or self.DEFAULT_LEVELS
         # Sort by threshold descending
@@ -420,3 +432,174 @@ class RenderOptimizer:
     def end_frame(self) -> tuple[list[tuple[int, int, int]], list[tuple[int, int, int]], list[tuple[int, int, int]]]:
         """End frame and get render batches."""
         return self.batch.flush()
+
+
+class FrameMode(Enum):
+    """How much of a retained map layer a frame redraws."""
+
+    SKIP = auto()  # Nothing changed: reuse the layer as is
+    PARTIAL = auto()  # Redraw the dirty rectangles only
+    FULL = auto()  # Redraw the whole layer
+
+
+@dataclass(slots=True)
+class FramePlan:
+    """Result of :meth:`FramePlanner.plan`.
+
+    Attributes:
+        mode: What the frame has to redraw.
+        rects: Tile rectangles to redraw on partial frames (``x2``/``y2`` exclusive).
+    """
+
+    mode: FrameMode = FrameMode.FULL
+    rects: list[BoundingBox] = field(default_factory=list)
+
+    @property
+    def tile_count(self) -> int:
+        """Tiles covered by the dirty rectangles."""
+        return sum(r.width * r.height for r in self.rects)
+
+
+@dataclass(slots=True)
+class FramePlanStats:
+    """Counters for a :class:`FramePlanner`.
+
+    Attributes:
+        frames: Frames planned.
+        skipped: Frames that reused the retained layer.
+        partial: Frames that redrew dirty rectangles only.
+        full: Frames that redrew the whole layer.
+        partial_tiles: Tiles redrawn by partial frames.
+    """
+
+    frames: int = 0
+    skipped: int = 0
+    partial: int = 0
+    full: int = 0
+    partial_tiles: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/debugging."""
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "partial": self.partial,
+            "full": self.full,
+            "partial_tiles": self.partial_tiles,
+        }
+
+
+class FramePlanner:
+    """Decides whether a retained map layer can be reused, patched or must be redrawn.
+
+    The canvas describes everything its map layer depends on apart from the
+    tiles (viewport, zoom, drawing options, assets...) as a hashable ``key``
+    and passes the tile table version along. Tile edits are reported with
+    :meth:`mark_tiles` in map tile coordinates; edits outside the viewport
+    are culled, the rest are merged into dirty rectangles. Each report also
+    records the table version it brings the layer up to, so a version the
+    planner was never told about (an edit nobody reported) forces a full
+    redraw instead of leaving stale tiles on screen.
+
+    Usage:
+        planner = FramePlanner()
+
+        planner.mark_tiles(changed, version=tiles.version)  # on edits
+        plan = planner.plan(key, tiles.version, bounds=(x0, y0, x1, y1))
+        if plan.mode is FrameMode.FULL:
+            redraw_layer()
+        elif plan.mode is FrameMode.PARTIAL:
+            for rect in plan.rects:
+                redraw_layer(clip=rect)
+
+    Args:
+        max_rects: Dirty rectangles to track before falling back to a full redraw.
+        max_dirty_fraction: Share of the viewport above which a full redraw is cheaper.
+        merge_distance: Tiles between two dirty areas that still merge them.
+    """
+
+    def __init__(self, *, max_rects: int = 16, max_dirty_fraction: float = 0.5, merge_distance: int = 2) -> None:
+        self.culler = ViewportCuller()
+        self.dirty_tracker = DirtyRectTracker(merge_threshold=merge_distance)
+        self.stats = FramePlanStats()
+        self._max_rects = max(1, int(max_rects))
+        self._max_dirty_fraction = float(max_dirty_fraction)
+        self._key: Hashable | None = None
+        self._version: int | None = None  # Tile version the layer shows
+        self._marked_version: int | None = None  # Tile version the reported edits lead to
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame."""
+        self.dirty_tracker.mark_full_redraw()
+
+    def mark_tiles(self, keys: Iterable[tuple[int, ...]], *, version: int | None) -> None:
+        """Report edited tiles (``(x, y, z)`` keys) and the tile version after the edit."""
+        self._marked_version = None if version is None else int(version)
+        tracker = self.dirty_tracker
+        if tracker.is_full_redraw():
+            return
+        culler = self.culler
+        for x, y in {(int(key[0]), int(key[1])) for key in keys}:
+            if not culler.is_visible(x, y):
+                continue
+            tracker.mark_dirty_tile(x, y, tile_size=1)
+            if tracker.dirty_count > self._max_rects:
+                tracker.mark_full_redraw()
+                return
+
+    def plan(
+        self,
+        key: Hashable,
+        version: int | None,
+        *,
+        bounds: tuple[int, int, int, int],
+        partial_ok: bool = True,
+    ) -> FramePlan:
+        """Plan the next frame and reset the dirty state.
+
+        Args:
+            key: Everything besides the tiles that the layer depends on.
+            version: Current tile table version, or None when the map has none.
+            bounds: Visible tiles as ``(x0, y0, x1, y1)``, ends exclusive.
+            partial_ok: False when the layer cannot be patched (e.g. lighting
+                spreads past the edited tiles).
+        """
+        x0, y0, x1, y1 = (int(v) for v in bounds)
+        tracker = self.dirty_tracker
+        plan = FramePlan()
+        if key != self._key or version is None or tracker.is_full_redraw():
+            plan.mode = FrameMode.FULL
+        elif version == self._version and not tracker.dirty_count:
+            plan.mode = FrameMode.SKIP
+        elif version != self._marked_version:
+            plan.mode = FrameMode.FULL
+        else:
+            for rect in tracker.get_dirty_rects():
+                clipped = BoundingBox(max(rect.x1, x0), max(rect.y1, y0), min(rect.x2, x1), min(rect.y2, y1))
+                if clipped.width > 0 and clipped.height > 0:
+                    plan.rects.append(clipped)
+            if not plan.rects:
+                plan.mode = FrameMode.SKIP
+            elif not partial_ok or plan.tile_count > self._max_dirty_fraction * max(1, (x1 - x0) * (y1 - y0)):
+                plan.mode = FrameMode.FULL
+                plan.rects = []
+            else:
+                plan.mode = FrameMode.PARTIAL
+
+        self._key = key
+        self._version = version
+        self._marked_version = version
+        tracker.clear()
+        self.culler.set_viewport(x0, y0, max(0, x1 - x0), max(0, y1 - y0), tile_size=1)
+
+        stats = self.stats
+        stats.frames += 1
+        if plan.mode is FrameMode.SKIP:
+            stats.skipped += 1
+        elif plan.mode is FrameMode.PARTIAL:
+            stats.partial += 1
+            stats.partial_tiles += plan.tile_count
+        else:
+            stats.full += 1
+        return plan
@@ -9,7 +9,9 @@ Reference:
 
 Features:
     - ScriptEngine: Execute Python scripts in sandboxed environment
-    - MapAPI: Safe API for scripts to interact with maps
+    - MapAPI: Safe API for scripts to interact with maps. Iteration and item
+      queries are served from sparse indexes, and every edit of a run is
+      collected into one undoable action (see ``MapAPI.batch``)
     - ScriptResult: Execution results and logging
     - Built-in utility functions for common operations
 
@@ -22,17 +24,20 @@ import ast
 import logging
 import time
 import traceback
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from io import StringIO
 from typing import TYPE_CHECKING, Any
 
 from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.session.selection_bitmap import ChunkedSelection
+from py_rme_canary.logic_layer.transactional_brush import LabeledPaintAction
 
 if TYPE_CHECKING:
     from py_rme_canary.core.data.gamemap import GameMap
-    from py_rme_canary.core.data.tile import Tile
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +46,24 @@ logger = logging.getLogger(__name__)
 Position = tuple[int, int, int]  # (x, y, z)
 
 
+def _item_ids(tile: Tile | None) -> set[int]:
+    """IDs a tile answers to in ``find_items`` (ground and stacked items)."""
+    if tile is None:
+        return set()
+    ids = {int(item.id) for item in tile.items}
+    if tile.ground is not None:
+        ids.add(int(tile.ground.id))
+    return ids
+
+
+def _row_major(key: Position) -> tuple[int, int]:
+    return key[1], key[0]
+
+
+def _floor_row_major(key: Position) -> tuple[int, int, int]:
+    return key[2], key[1], key[0]
+
+
 class ScriptStatus(Enum):
     """Status of script execution."""
 
@@ -132,23 +155,44 @@ class MapAPI:
         for tile in map.iter_region(100, 100, 110, 110, 7):
             if tile.has_item(2120):
                 map.remove_item(tile.x, tile.y, tile.z, 2120)
+
+        # Bulk edits
+        map.fill_region(100, 100, 199, 199, 7, 4526)
+        map.replace_in_region(0, 0, 2047, 2047, 7, 2120, 2121)
+
+    Iteration and ``find_items`` only visit tiles that exist: the API keeps a
+    chunked index of tile positions and an item-ID index, both built on first
+    use and updated by its own edits. Edits are recorded into one
+    :class:`LabeledPaintAction` per outermost :meth:`batch`, which is handed
+    to ``on_commit`` when the batch closes.
     """
 
-    def __init__(self, game_map: GameMap, config: ScriptConfig) -> None:
+    def __init__(
+        self,
+        game_map: GameMap,
+        config: ScriptConfig,
+        *,
+        on_commit: Callable[[LabeledPaintAction], None] | None = None,
+    ) -> None:
         """Initialize the Map API.
 
         Args:
             game_map: The map to operate on.
             config: Script configuration.
+            on_commit: Receives the action of each closed batch with changes.
         """
         self._map = game_map
         self._config = config
+        self._on_commit = on_commit
         self._stats = {
             "tiles_modified": 0,
             "items_added": 0,
             "items_removed": 0,
         }
         self._pending_changes: list[dict[str, Any]] = []
+        self._batch: LabeledPaintAction | None = None
+        self._positions: ChunkedSelection | None = None
+        self._by_item: dict[int, set[Position]] | None = None
 
     @property
     def width(self) -> int:
@@ -165,6 +209,91 @@ class MapAPI:
         """Get current operation statistics."""
         return self._stats.copy()
 
+    @contextmanager
+    def batch(self, label: str = "Script") -> Iterator[None]:
+        """Collect every edit made inside the block into one undoable action.
+
+        Batches nest; inner blocks join the outermost one. When the outermost
+        block exits (also on error, so the history matches the map) the
+        action is passed to ``on_commit`` if anything changed.
+
+        Example in script:
+            with map.batch("Pave road"):
+                for x in range(100, 200):
+                    map.set_ground(x, 100, 7, 4526)
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = LabeledPaintAction(brush_id=0, label=str(label))
+        try:
+            yield
+        finally:
+            action, self._batch = self._batch, None
+            if action.has_changes() and self._on_commit is not None:
+                self._on_commit(action)
+
+    # --- indexes and writes ------------------------------------------------
+
+    def _tile_positions(self) -> ChunkedSelection:
+        if self._positions is None:
+            self._positions = ChunkedSelection(self._map.tiles.keys())
+        return self._positions
+
+    def _item_positions(self) -> dict[int, set[Position]]:
+        if self._by_item is None:
+            by_item: dict[int, set[Position]] = {}
+            for key, tile in self._map.tiles.items():
+                if tile.ground is not None:
+                    by_item.setdefault(int(tile.ground.id), set()).add(key)
+                for item in tile.items:
+                    by_item.setdefault(int(item.id), set()).add(key)
+            self._by_item = by_item
+        return self._by_item
+
+    def _make_item(self, item_id: int) -> Item:
+        if hasattr(self._map, "item_factory"):
+            return self._map.item_factory.create(item_id)
+        return Item.plain(int(item_id))
+
+    def _write(self, key: Position, after: Tile | None) -> None:
+        """Replace the tile at ``key``, keeping the indexes and batch in step."""
+        if self._batch is None:
+            with self.batch():
+                self._write(key, after)
+            return
+
+        before = self._map.get_tile(*key)
+        if after is before:
+            return
+
+        if self._positions is not None:
+            if after is None:
+                self._positions.discard(key)
+            else:
+                self._positions.add(key)
+        if self._by_item is not None:
+            old_ids = _item_ids(before)
+            new_ids = _item_ids(after)
+            for item_id in old_ids - new_ids:
+                bucket = self._by_item.get(item_id)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._by_item[item_id]
+            for item_id in new_ids - old_ids:
+                self._by_item.setdefault(item_id, set()).add(key)
+
+        if after is None:
+            self._map.delete_tile(*key)
+        else:
+            self._map.set_tile(after)
+        self._batch.record_tile_change(key, before, after)
+
+    def _get_or_new_tile(self, x: int, y: int, z: int) -> Tile:
+        tile = self._map.get_tile(x, y, z)
+        return tile if tile is not None else Tile(x=int(x), y=int(y), z=int(z))
+
     def get_tile(self, x: int, y: int, z: int) -> TileProxy | None:
         """Get a tile at position.
 
@@ -194,7 +323,8 @@ class MapAPI:
         """
         tile = self._map.get_tile(x, y, z)
         if tile is None:
-            tile = self._map.ensure_tile(x, y, z)
+            tile = Tile(x=int(x), y=int(y), z=int(z))
+            self._write((tile.x, tile.y, tile.z), tile)
         return TileProxy(tile, x, y, z)
 
     def tile_exists(self, x: int, y: int, z: int) -> bool:
@@ -222,19 +352,8 @@ class MapAPI:
                 }
             )
         else:
-            tile = self._map.get_tile(x, y, z)
-            if tile is None:
-                tile = self._map.ensure_tile(x, y, z)
-
-            # Create item and set as ground
-            if hasattr(self._map, "item_factory"):
-                item = self._map.item_factory.create(item_id)
-            else:
-                # Basic fallback
-                item = Item(id=item_id)
-
-            new_tile = tile.with_ground(item)
-            self._map.set_tile(new_tile)
+            tile = self._get_or_new_tile(x, y, z)
+            self._write((tile.x, tile.y, tile.z), tile.with_ground(self._make_item(item_id)))
 
         self._stats["tiles_modified"] += 1
         return True
@@ -262,20 +381,11 @@ class MapAPI:
                 }
             )
         else:
-            tile = self._map.get_tile(x, y, z)
-            if tile is None:
-                tile = self._map.ensure_tile(x, y, z)
-
-            if hasattr(self._map, "item_factory"):
-                item = self._map.item_factory.create(item_id)
-            else:
-                item = Item(id=item_id)
-
-            if hasattr(item, "count"):
-                item.count = count
-
-            new_tile = tile.add_item(item)
-            self._map.set_tile(new_tile)
+            tile = self._get_or_new_tile(x, y, z)
+            item = self._make_item(item_id)
+            if hasattr(item, "count") and item.count != count:
+                item = replace(item, count=count)
+            self._write((tile.x, tile.y, tile.z), tile.add_item(item))
 
         self._stats["items_added"] += 1
         self._stats["tiles_modified"] += 1
@@ -325,8 +435,7 @@ class MapAPI:
                 new_items.append(item)
 
         if removed > 0:
-            new_tile = replace(tile, items=new_items, modified=True)
-            self._map.set_tile(new_tile)
+            self._write((tile.x, tile.y, tile.z), replace(tile, items=new_items, modified=True))
             self._stats["tiles_modified"] += 1
 
         self._stats["items_removed"] += removed
@@ -367,8 +476,7 @@ class MapAPI:
             removed += 1
 
         if removed > 0:
-            new_tile = replace(tile, items=[], ground=new_ground, modified=True)
-            self._map.set_tile(new_tile)
+            self._write((tile.x, tile.y, tile.z), replace(tile, items=[], ground=new_ground, modified=True))
             self._stats["tiles_modified"] += 1
 
         self._stats["items_removed"] += removed
@@ -396,12 +504,7 @@ class MapAPI:
         """
         min_x, max_x = min(x1, x2), max(x1, x2)
         min_y, max_y = min(y1, y2), max(y1, y2)
-
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                tile = self._map.get_tile(x, y, z)
-                if tile is not None:
-                    yield TileProxy(tile, x, y, z)
+        yield from self._iter_keys(self._tile_positions().clipped(min_x, min_y, max_x, max_y, z))
 
     def iter_floor(self, z: int) -> Iterator[TileProxy]:
         """Iterate over all tiles on a floor.
@@ -412,11 +515,15 @@ class MapAPI:
         Yields:
             TileProxy for each existing tile.
         """
-        for y in range(self._map.header.height):
-            for x in range(self._map.header.width):
-                tile = self._map.get_tile(x, y, z)
-                if tile is not None:
-                    yield TileProxy(tile, x, y, z)
+        yield from self._iter_keys(self._tile_positions().clipped(0, 0, self.width - 1, self.height - 1, z))
+
+    def _iter_keys(self, keys: ChunkedSelection) -> Iterator[TileProxy]:
+        # Row-major like a width x height sweep, but only over existing tiles.
+        # Tiles are looked up lazily so edits made while iterating are seen.
+        for x, y, z in sorted(keys, key=_row_major):
+            tile = self._map.get_tile(x, y, z)
+            if tile is not None:
+                yield TileProxy(tile, x, y, z)
 
     def find_items(self, item_id: int, floor: int | None = None) -> list[Position]:
         """Find all positions with a specific item.
@@ -426,30 +533,13 @@ class MapAPI:
             floor: Optional floor to limit search.
 
         Returns:
-            List of positions containing the item.
+            List of positions containing the item (as ground or stacked),
+            ordered by floor, then row, then column.
         """
-        positions: list[Position] = []
-        floors = [floor] if floor is not None else range(16)
-
-        for z in floors:
-            for y in range(self._map.header.height):
-                for x in range(self._map.header.width):
-                    tile = self._map.get_tile(x, y, z)
-                    if tile is None:
-                        continue
-
-                    # Check ground
-                    if tile.ground and tile.ground.id == item_id:
-                        positions.append((x, y, z))
-                        continue
-
-                    # Check items
-                    for item in tile.items:
-                        if item.id == item_id:
-                            positions.append((x, y, z))
-                            break
-
-        return positions
+        positions: Iterable[Position] = self._item_positions().get(int(item_id), ())
+        if floor is not None:
+            positions = [pos for pos in positions if pos[2] == floor]
+        return sorted(positions, key=_floor_row_major)
 
     def replace_item(
         self,
@@ -470,13 +560,153 @@ class MapAPI:
         positions = self.find_items(old_id, floor)
         count = 0
 
-        for x, y, z in positions:
-            self.remove_item(x, y, z, old_id, all_instances=True)
-            self.add_item(x, y, z, new_id)
-            count += 1
+        with self.batch("Replace Item"):
+            for x, y, z in positions:
+                self.remove_item(x, y, z, old_id, all_instances=True)
+                self.add_item(x, y, z, new_id)
+                count += 1
 
         return count
 
+    def replace_in_region(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        z: int,
+        old_id: int,
+        new_id: int,
+    ) -> int:
+        """Replace every ``old_id`` item (ground included) inside a rectangle.
+
+        Only tiles holding ``old_id`` are visited, and every replacement
+        shares one new item, so the cost follows the number of matches.
+
+        Args:
+            x1: Start X.
+            y1: Start Y.
+            x2: End X.
+            y2: End Y.
+            z: Floor level.
+            old_id: Item ID to replace.
+            new_id: New item ID.
+
+        Returns:
+            Number of items replaced.
+        """
+        min_x, max_x = min(x1, x2), max(x1, x2)
+        min_y, max_y = min(y1, y2), max(y1, y2)
+        old_id = int(old_id)
+        keys = [
+            key
+            for key in self._item_positions().get(old_id, ())
+            if key[2] == z and min_x <= key[0] <= max_x and min_y <= key[1] <= max_y
+        ]
+        if not keys:
+            return 0
+
+        new_item = self._make_item(new_id)
+        replaced = 0
+        tiles_changed = 0
+        with self.batch("Replace In Region"):
+            for key in keys:
+                tile = self._map.get_tile(*key)
+                if tile is None:
+                    continue
+                ground = tile.ground
+                hits = 0
+                if ground is not None and ground.id == old_id:
+                    ground = new_item
+                    hits += 1
+                items = []
+                for item in tile.items:
+                    if item.id == old_id:
+                        item = new_item
+                        hits += 1
+                    items.append(item)
+                if not hits:
+                    continue
+                if not self._config.dry_run:
+                    self._write(key, replace(tile, ground=ground, items=items, modified=True))
+                replaced += hits
+                tiles_changed += 1
+
+        if self._config.dry_run:
+            self._pending_changes.append(
+                {
+                    "type": "replace_in_region",
+                    "region": (min_x, min_y, max_x, max_y, z),
+                    "old_id": old_id,
+                    "new_id": new_id,
+                }
+            )
+        self._stats["tiles_modified"] += tiles_changed
+        self._stats["items_added"] += replaced
+        self._stats["items_removed"] += replaced
+        return replaced
+
+    def fill_region(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        z: int,
+        ground_id: int,
+        *,
+        only_existing: bool = False,
+    ) -> int:
+        """Set the ground of every position inside a rectangle.
+
+        Missing tiles are created unless ``only_existing`` is set. All tiles
+        share one ground item and tiles that already have it are skipped.
+
+        Args:
+            x1: Start X.
+            y1: Start Y.
+            x2: End X.
+            y2: End Y.
+            z: Floor level.
+            ground_id: Ground item ID.
+            only_existing: Leave empty positions alone.
+
+        Returns:
+            Number of tiles changed.
+        """
+        min_x, max_x = min(x1, x2), max(x1, x2)
+        min_y, max_y = min(y1, y2), max(y1, y2)
+        ground_id = int(ground_id)
+        if only_existing:
+            keys: Iterator[Position] = iter(self._tile_positions().clipped(min_x, min_y, max_x, max_y, z))
+        else:
+            keys = ((x, y, z) for y in range(min_y, max_y + 1) for x in range(min_x, max_x + 1))
+
+        ground = self._make_item(ground_id)
+        changed = 0
+        with self.batch("Fill Region"):
+            for x, y, tz in keys:
+                tile = self._map.get_tile(x, y, tz)
+                if tile is not None and tile.ground is not None and tile.ground.id == ground_id:
+                    continue
+                if not self._config.dry_run:
+                    if tile is None:
+                        tile = Tile(x=x, y=y, z=tz)
+                    self._write((x, y, tz), tile.with_ground(ground))
+                changed += 1
+
+        if self._config.dry_run:
+            self._pending_changes.append(
+                {
+                    "type": "fill_region",
+                    "region": (min_x, min_y, max_x, max_y, z),
+                    "item_id": ground_id,
+                    "only_existing": only_existing,
+                }
+            )
+        self._stats["tiles_modified"] += changed
+        return changed
+
     def log(self, message: str) -> None:
         """Log a message (appears in script output)."""
         print(message)
@@ -631,6 +861,7 @@ class ScriptEngine:
         self._map = game_map
         self._config = ScriptConfig()
         self._on_progress: Callable[[str, float], None] | None = None
+        self._on_commit: Callable[[LabeledPaintAction], None] | None = None
 
     def set_map(self, game_map: GameMap) -> None:
         """Set the map for script operations."""
@@ -644,6 +875,14 @@ class ScriptEngine:
         """Set callback for progress updates."""
         self._on_progress = callback
 
+    def set_commit_callback(self, callback: Callable[[LabeledPaintAction], None] | None) -> None:
+        """Set callback receiving the single undoable action of each run.
+
+        The action has already been applied to the map; the callback only
+        needs to record it (e.g. push it onto the editor history).
+        """
+        self._on_commit = callback
+
     def validate_script(self, script: str) -> tuple[bool, str]:
         """Validate a script without executing it.
 
@@ -692,7 +931,7 @@ class ScriptEngine:
 
         # Setup execution environment
         output = StringIO()
-        map_api = MapAPI(self._map, self._config)
+        map_api = MapAPI(self._map, self._config, on_commit=self._on_commit)
 
         def safe_import(
             name: str,
@@ -759,7 +998,8 @@ class ScriptEngine:
 
         try:
             # Executing user script in restricted environment (B102 suppressed: sandbox design)
-            exec(compile(script, "<script>", "exec"), script_globals)  # nosec B102
+            with map_api.batch("Run Script"):
+                exec(compile(script, "<script>", "exec"), script_globals)  # nosec B102
 
             result.status = ScriptStatus.SUCCESS
             result.return_value = script_globals.get("result")
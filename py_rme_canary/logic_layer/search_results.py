@@ -0,0 +1,284 @@
+"""Columnar storage for map search results.
+
+A search for a common item can return hundreds of thousands of hits, far too
+many to keep as one widget (or even one Python object) per row. The
+:class:`SearchResultStore` keeps every field in its own compact column and
+interns the repeated strings (match types, item names, details), so a hit
+costs a few dozen bytes. Sorting and filtering work on the columns and return
+row-index arrays; a view only formats the handful of rows it paints.
+
+Layer: logic_layer (no PyQt6 dependencies)
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, overload
+
+if TYPE_CHECKING:
+    from py_rme_canary.core.data.tile import Tile
+    from py_rme_canary.core.data.tile_table import TileTableView
+
+Position = tuple[int, int, int]
+
+_NUMERIC_CHARS = frozenset("0123456789, ")
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """Single search result entry.
+
+    Attributes:
+        x: Tile X coordinate.
+        y: Tile Y coordinate.
+        z: Floor level.
+        item_id: Item ID that matched (if applicable).
+        item_name: Display name of the item.
+        match_type: Type of match (item, creature, spawn, etc).
+        details: Additional match details.
+        timestamp: When this result was found.
+    """
+
+    x: int
+    y: int
+    z: int
+    item_id: int = 0
+    item_name: str = ""
+    match_type: str = "item"
+    details: str = ""
+    timestamp: float = 0.0
+
+
+class SearchColumn(IntEnum):
+    """Columns shown for a search result, in display order."""
+
+    POSITION = 0
+    FLOOR = 1
+    TYPE = 2
+    NAME = 3
+    DETAILS = 4
+
+
+class SearchResultStore(Sequence[SearchResult]):
+    """Append-only, column-oriented list of :class:`SearchResult`.
+
+    Indexing materializes a :class:`SearchResult` on demand; bulk consumers
+    should prefer :meth:`display`, :meth:`positions`, :meth:`filter_rows` and
+    :meth:`sort_rows`, which never build per-row objects.
+    """
+
+    __slots__ = (
+        "_codes",
+        "_details",
+        "_item_ids",
+        "_names",
+        "_strings",
+        "_timestamps",
+        "_types",
+        "_xs",
+        "_ys",
+        "_zs",
+    )
+
+    def __init__(self, results: Iterable[SearchResult] = ()) -> None:
+        self._xs = array("i")
+        self._ys = array("i")
+        self._zs = array("b")
+        self._item_ids = array("i")
+        self._types = array("I")
+        self._names = array("I")
+        self._details = array("I")
+        self._timestamps = array("d")
+        self._strings: list[str] = []
+        self._codes: dict[str, int] = {}
+        self.extend(results)
+
+    # --- building ----------------------------------------------------------
+
+    def _intern(self, text: str) -> int:
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(text)
+            self._codes[text] = code
+        return code
+
+    def append(self, result: SearchResult) -> None:
+        self._xs.append(int(result.x))
+        self._ys.append(int(result.y))
+        self._zs.append(int(result.z))
+        self._item_ids.append(int(result.item_id))
+        self._types.append(self._intern(str(result.match_type)))
+        self._names.append(self._intern(str(result.item_name)))
+        self._details.append(self._intern(str(result.details)))
+        self._timestamps.append(float(result.timestamp))
+
+    def extend(self, results: Iterable[SearchResult]) -> range:
+        """Append results and return the range of rows they now occupy."""
+        start = len(self._xs)
+        for result in results:
+            self.append(result)
+        return range(start, len(self._xs))
+
+    # --- sequence protocol -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    @overload
+    def __getitem__(self, index: int) -> SearchResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SearchResult]: ...
+
+    def __getitem__(self, index: int | slice) -> SearchResult | list[SearchResult]:
+        if isinstance(index, slice):
+            return [self._result(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("search result index out of range")
+        return self._result(index)
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        return map(self._result, range(len(self)))
+
+    def _result(self, row: int) -> SearchResult:
+        strings = self._strings
+        return SearchResult(
+            x=self._xs[row],
+            y=self._ys[row],
+            z=self._zs[row],
+            item_id=self._item_ids[row],
+            item_name=strings[self._names[row]],
+            match_type=strings[self._types[row]],
+            details=strings[self._details[row]],
+            timestamp=self._timestamps[row],
+        )
+
+    # --- column access -----------------------------------------------------
+
+    def position(self, row: int) -> Position:
+        return (self._xs[row], self._ys[row], self._zs[row])
+
+    def positions(self, rows: Iterable[int] | None = None) -> list[Position]:
+        """Positions of ``rows`` (all rows when omitted), in row order."""
+        if rows is None:
+            return list(zip(self._xs, self._ys, self._zs, strict=True))
+        xs, ys, zs = self._xs, self._ys, self._zs
+        return [(xs[row], ys[row], zs[row]) for row in rows]
+
+    def display(self, row: int, column: SearchColumn | int) -> str:
+        """Text shown for ``row`` in ``column``."""
+        if column == SearchColumn.POSITION:
+            return f"{self._xs[row]}, {self._ys[row]}"
+        if column == SearchColumn.FLOOR:
+            return str(self._zs[row])
+        if column == SearchColumn.TYPE:
+            return self._strings[self._types[row]].capitalize()
+        if column == SearchColumn.NAME:
+            item_id = self._item_ids[row]
+            if not item_id:
+                return "-"
+            return self._strings[self._names[row]] or str(item_id)
+        if column == SearchColumn.DETAILS:
+            return self._strings[self._details[row]]
+        return ""
+
+    # --- queries -----------------------------------------------------------
+
+    def filter_rows(self, text: str, rows: Iterable[int] | None = None) -> array[int]:
+        """Rows (of ``rows``, default all) where any column's text contains ``text``.
+
+        Matching is case-insensitive, like the old per-cell scan, but every
+        interned string is tested once instead of once per row, and the
+        position/floor columns are only formatted when ``text`` could match a
+        number.
+        """
+        source: Iterable[int] = range(len(self)) if rows is None else rows
+        needle = text.lower()
+        if not needle:
+            return array("I", source)
+
+        hits = [needle in value.lower() for value in self._strings]
+        numeric = set(needle) <= _NUMERIC_CHARS
+        dash_hit = needle in "-"
+        id_hits: dict[int, bool] = {}
+        xs, ys, zs = self._xs, self._ys, self._zs
+        types, names, details, item_ids = self._types, self._names, self._details, self._item_ids
+        strings = self._strings
+
+        out = array("I")
+        for row in source:
+            if hits[types[row]] or hits[details[row]]:
+                out.append(row)
+                continue
+            item_id = item_ids[row]
+            if item_id:
+                name_code = names[row]
+                if strings[name_code]:
+                    matched = hits[name_code]
+                else:
+                    cached = id_hits.get(item_id)
+                    if cached is None:
+                        cached = id_hits[item_id] = needle in str(item_id)
+                    matched = cached
+            else:
+                matched = dash_hit
+            if not matched and numeric:
+                matched = needle in f"{xs[row]}, {ys[row]}" or needle in str(zs[row])
+            if matched:
+                out.append(row)
+        return out
+
+    def sort_rows(self, rows: Iterable[int], column: SearchColumn | int, *, descending: bool = False) -> array[int]:
+        """Return ``rows`` ordered by ``column`` (stable)."""
+        return array("I", sorted(rows, key=self._sort_key(column), reverse=descending))
+
+    def _sort_key(self, column: SearchColumn | int) -> Callable[[int], int | str]:
+        xs, ys, zs = self._xs, self._ys, self._zs
+        if column == SearchColumn.POSITION:
+            return lambda row: xs[row] * 1_000_000 + ys[row]
+        if column == SearchColumn.FLOOR:
+            return zs.__getitem__
+        if column == SearchColumn.TYPE:
+            ranks = _ranks([value.capitalize() for value in self._strings])
+            types = self._types
+            return lambda row: ranks[types[row]]
+        if column == SearchColumn.DETAILS:
+            ranks = _ranks(self._strings)
+            details = self._details
+            return lambda row: ranks[details[row]]
+        return lambda row: self.display(row, column)
+
+
+def _ranks(values: Sequence[str]) -> list[int]:
+    """Rank of each value in sorted order (equal values share a rank)."""
+    ordered = {value: rank for rank, value in enumerate(sorted(set(values)))}
+    return [ordered[value] for value in values]
+
+
+def iter_item_results(
+    tiles: Mapping[Position, Tile] | TileTableView,
+    item_id: int,
+    *,
+    item_name: str = "",
+) -> Iterator[SearchResult]:
+    """Yield one result per tile holding ``item_id`` as ground or stacked item.
+
+    Meant to run on a worker thread; pass the tiles of a
+    :meth:`GameMap.snapshot` so edits made meanwhile are not observed.
+    """
+    target = int(item_id)
+    for (x, y, z), tile in tiles.items():
+        ground = tile.ground
+        if ground is not None and ground.id == target:
+            yield SearchResult(x=x, y=y, z=z, item_id=target, item_name=item_name, details="Ground")
+            continue
+        for item in tile.items:
+            if item.id == target:
+                yield SearchResult(x=x, y=y, z=z, item_id=target, item_name=item_name, details="On tile")
+                break
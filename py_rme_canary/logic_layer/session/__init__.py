@@ -2,6 +2,7 @@
 
 This package contains modular components for the editor session:
 - selection: Tile selection management (box selection, toggle, etc.)
+- selection_bitmap: Chunked bitset storage backing the selection
 - clipboard: Copy/cut/paste operations
 - gestures: Mouse input gesture handling
 - move: Selection movement operations
@@ -13,8 +14,10 @@ from .editor import EditorSession
 from .gestures import GestureHandler
 from .move import MoveHandler
 from .selection import SelectionManager, TileKey
+from .selection_bitmap import ChunkedSelection
 
 __all__ = [
+    "ChunkedSelection",
     "ClipboardManager",
     "EditorSession",
     "GestureHandler",
@@ -45,6 +45,7 @@ class ActionType(str, Enum):
     DELETE_TOWN = "delete_town"
     SET_TOWN_TEMPLE = "set_town_temple"
     SWITCH_DOOR = "switch_door"
+    RUN_SCRIPT = "run_script"
 
 
 @dataclass(frozen=True, slots=True)
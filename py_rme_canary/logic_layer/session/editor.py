@@ -10,10 +10,11 @@ import logging
 import os
 import random
 import time
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
 from contextlib import suppress
 from dataclasses import dataclass, field, replace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from py_rme_canary.core.data.door import DoorType
 from py_rme_canary.core.data.gamemap import GameMap
@@ -28,6 +29,7 @@ from py_rme_canary.core.database.door_pairs import load_door_pairs
 from py_rme_canary.core.database.items_xml import ItemsXML
 from py_rme_canary.core.memory_guard import MemoryGuard, MemoryGuardError, default_memory_guard
 from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_inbox import DEFAULT_APPLY_BUDGET_MS, LiveTileInbox
 from py_rme_canary.core.protocols.live_packets import (
     ConnectionState,
     PacketType,
@@ -36,13 +38,10 @@ from py_rme_canary.core.protocols.live_packets import (
     decode_cursor,
 )
 from py_rme_canary.core.protocols.live_server import LiveServer
-from py_rme_canary.core.protocols.tile_serializer import (
-    decode_map_chunk,
-    decode_tile_update,
-    encode_tile_update,
-)
+from py_rme_canary.core.protocols.tile_serializer import encode_tile_update
 from py_rme_canary.logic_layer.clipboard import ClipboardManager as SystemClipboardManager
-from py_rme_canary.logic_layer.clipboard import tiles_from_entry
+from py_rme_canary.logic_layer.clipboard import tiles_from_entry, tiles_from_entry_async
+from py_rme_canary.logic_layer.clipboard_binary import collect_item_ids, prefetch_lookup
 
 from ..brush_definitions import (
     VIRTUAL_DOOR_TOOL_HATCH,
@@ -67,6 +66,7 @@ from ..brush_definitions import (
     waypoint_virtual_id,
 )
 from ..door_brush import DoorBrush
+from ..map_audit import MapAudit, MapAuditEngine
 from ..map_metadata_actions import (
     HouseAction,
     HouseEntryAction,
@@ -85,6 +85,7 @@ from ..remove_items import (
     remove_unreachable_tiles_in_map,
 )
 from ..replace_items import replace_items_in_map
+from ..teleport_manager import TeleportManager
 from ..transactional_brush import (
     EditorAction,
     HistoryManager,
@@ -96,8 +97,12 @@ from .clipboard import ClipboardManager
 from .gestures import GestureHandler
 from .move import MoveHandler
 from .selection import SelectionApplyMode, SelectionManager, TileKey, tile_is_nonempty
+from .selection_bitmap import ChunkedSelection, Segment, Span
 from .selection_modes import SelectionDepthMode, apply_compensation_offset
 
+if TYPE_CHECKING:
+    from ..script_engine import ScriptConfig, ScriptResult
+
 TilesChangedCallback = Callable[[set[TileKey]], None]
 
 logger = logging.getLogger(__name__)
@@ -259,6 +264,10 @@ class EditorSession:
     borderize_paste_enabled: bool = True
     borderize_paste_threshold: int = 10000
 
+    # Live editing: UI-thread time spent applying received tiles per
+    # process_live_events call; the rest waits for the next poll.
+    live_apply_budget_ms: float = DEFAULT_APPLY_BUDGET_MS
+
     history: HistoryManager = field(default_factory=HistoryManager)
 
     # Local-only queue of typed actions (legacy-inspired).
@@ -279,6 +288,12 @@ class EditorSession:
     # Lazy-loaded items.xml for best-effort item kind classification.
     _items_xml: ItemsXML | None = field(default=None, init=False, repr=False)
 
+    # Lazy teleport link index, kept current by _emit_tiles_changed once built.
+    _teleports: TeleportManager | None = field(default=None, init=False, repr=False)
+
+    # Lazy statistics/UID/validation audit, re-scanned per dirty chunk.
+    _audit: MapAuditEngine | None = field(default=None, init=False, repr=False)
+
     _memory_guard: MemoryGuard = field(default_factory=default_memory_guard, init=False, repr=False)
     _tile_item_counts: dict[TileKey, int] | None = field(default=None, init=False, repr=False)
     _map_item_count: int = field(default=0, init=False, repr=False)
@@ -298,14 +313,21 @@ class EditorSession:
     # button is down and applies a single undoable action on mouse_up.
     _pending_batched_positions: BatchedPositionsGesture | None = field(default=None, init=False, repr=False)
 
+    # Background clipboard work: (job id, "copy" | "paste", future) while encoding/decoding.
+    _clipboard_job: tuple[int, str, Future[Any]] | None = field(default=None, init=False, repr=False)
+    _clipboard_job_seq: int = field(default=0, init=False, repr=False)
+    # Results of jobs finished early by a newer copy/paste, kept for their pollers.
+    _clipboard_results: dict[int, bool] = field(default_factory=dict, init=False, repr=False)
+
     # Live Editing Client (optional)
     _live_client: LiveClient | None = field(default=None, init=False, repr=False)
     _live_server: LiveServer | None = field(default=None, init=False, repr=False)
     _live_action_queue: NetworkedActionQueue = field(init=False, repr=False)
     _live_clients: dict[int, dict[str, object]] = field(default_factory=dict, init=False, repr=False)
     _live_cursors: dict[int, tuple[int, int, int]] = field(default_factory=dict, init=False, repr=False)
-    _live_sync_started: bool = field(default=False, init=False, repr=False)
     _live_cursor_last_sent: float = field(default=0.0, init=False, repr=False)
+    # Local edits made while the client is offline or resyncing; resent once the sync is applied.
+    _live_offline_tiles: dict[TileKey, Tile] = field(default_factory=dict, init=False, repr=False)
     _on_live_chat: Callable[[int, str, str], None] | None = field(default=None, init=False, repr=False)
     _on_live_client_list: Callable[[list[dict[str, object]]], None] | None = field(default=None, init=False, repr=False)
     _on_live_cursor: Callable[[int, int, int, int], None] | None = field(default=None, init=False, repr=False)
@@ -631,7 +653,7 @@ class EditorSession:
                     new_items = list(before.items)
                     if door_id is None:
                         continue
-                    new_item = Item(id=int(door_id))
+                    new_item = Item.plain(int(door_id))
                     if repl_idx is None:
                         new_items.append(new_item)
                     else:
@@ -722,7 +744,7 @@ class EditorSession:
                     break
 
         new_items = list(before.items)
-        new_item = Item(id=int(door_id))
+        new_item = Item.plain(int(door_id))
         if idx is None:
             new_items.append(new_item)
         else:
@@ -883,6 +905,52 @@ class EditorSession:
             self._emit_tiles_changed(changed)
         return len(changed)
 
+    def teleport_links(self) -> TeleportManager:
+        """Return the session's teleport link index, scanning the map on first use.
+
+        After the initial scan the index follows every tile change emitted by
+        the session (brushes, undo/redo, live edits) instead of rescanning.
+        """
+
+        manager = self._teleports
+        if manager is None or manager.game_map is not self.game_map:
+            manager = TeleportManager(self.game_map, on_tiles_changed=self._emit_tiles_changed)
+            manager.scan_map()
+            self._teleports = manager
+        return manager
+
+    def run_script(self, script: str, *, config: ScriptConfig | None = None) -> ScriptResult:
+        """Run an automation script against the map as one undoable step.
+
+        Every edit the script makes is collected into a single history entry
+        and announced with a single tile-change notification.
+        """
+
+        from ..script_engine import ScriptEngine
+
+        engine = ScriptEngine(self.game_map)
+        if config is not None:
+            engine.set_config(config)
+        engine.set_commit_callback(self._commit_script_action)
+        return engine.execute(script)
+
+    def _commit_script_action(self, action: LabeledPaintAction) -> None:
+        self.history.commit_action(action)
+        self.action_queue.push(SessionAction(type=ActionType.RUN_SCRIPT, action=action, label=action.describe()))
+        self._emit_tiles_changed(set(action.tiles_after))
+
+    def map_audit(self) -> MapAudit:
+        """Return up-to-date map statistics, UID conflicts and validation issues.
+
+        The first call walks the whole map; later calls only rescan the chunks
+        touched by tile changes since the previous call.
+        """
+
+        engine = self._audit
+        if engine is None or engine.game_map is not self.game_map:
+            engine = self._audit = MapAuditEngine(self.game_map)
+        return engine.refresh()
+
     # === Waypoints (map-level) ===
 
     def set_waypoint(self, *, name: str, x: int, y: int, z: int) -> EditorAction | None:
@@ -1680,42 +1748,12 @@ class EditorSession:
     def _find_monster_spawn_area_for(self, *, x: int, y: int, z: int) -> tuple[int, MonsterSpawnArea, int, int] | None:
         """Return (index, area, dx, dy) for the nearest area covering (x,y,z)."""
 
-        tx, ty, tz = int(x), int(y), int(z)
-        best: tuple[int, int, MonsterSpawnArea, int, int] | None = None  # (score, idx, area, dx, dy)
-        for idx, area in enumerate(self.game_map.monster_spawns):
-            if int(area.center.z) != tz:
-                continue
-            dx = int(tx - int(area.center.x))
-            dy = int(ty - int(area.center.y))
-            if max(abs(dx), abs(dy)) > int(area.radius):
-                continue
-            score = abs(dx) + abs(dy)
-            if best is None or score < best[0]:
-                best = (score, idx, area, dx, dy)
-        if best is None:
-            return None
-        _, idx, area, dx, dy = best
-        return int(idx), area, int(dx), int(dy)
+        return self.game_map.monster_spawn_index().nearest_covering(int(x), int(y), int(z))
 
     def _find_npc_spawn_area_for(self, *, x: int, y: int, z: int) -> tuple[int, NpcSpawnArea, int, int] | None:
         """Return (index, area, dx, dy) for the nearest area covering (x,y,z)."""
 
-        tx, ty, tz = int(x), int(y), int(z)
-        best: tuple[int, int, NpcSpawnArea, int, int] | None = None  # (score, idx, area, dx, dy)
-        for idx, area in enumerate(self.game_map.npc_spawns):
-            if int(area.center.z) != tz:
-                continue
-            dx = int(tx - int(area.center.x))
-            dy = int(ty - int(area.center.y))
-            if max(abs(dx), abs(dy)) > int(area.radius):
-                continue
-            score = abs(dx) + abs(dy)
-            if best is None or score < best[0]:
-                best = (score, idx, area, dx, dy)
-        if best is None:
-            return None
-        _, idx, area, dx, dy = best
-        return int(idx), area, int(dx), int(dy)
+        return self.game_map.npc_spawn_index().nearest_covering(int(x), int(y), int(z))
 
     def add_monster_spawn_entry(
         self,
@@ -2433,6 +2471,32 @@ class EditorSession:
     def get_selection_tiles(self) -> set[TileKey]:
         return self._selection.get_selection_tiles()
 
+    def get_selection(self) -> ChunkedSelection:
+        """Return a copy of the selection as a chunked bitmap (cheap set algebra)."""
+        return self._selection.get_selection()
+
+    def get_selection_count(self) -> int:
+        return self._selection.selection_count()
+
+    def get_selection_bounds(self) -> tuple[TileKey, TileKey] | None:
+        return self._selection.selection_bounds()
+
+    def is_tile_selected(self, *, x: int, y: int, z: int) -> bool:
+        return self._selection.is_selected((int(x), int(y), int(z)))
+
+    def iter_selection_in_rect(self, *, x0: int, y0: int, x1: int, y1: int, z: int) -> Iterator[TileKey]:
+        """Iterate selected tiles of floor ``z`` inside an inclusive rectangle."""
+        return self._selection.iter_selection_in_rect(int(x0), int(y0), int(x1), int(y1), int(z))
+
+    def selection_outline_in_rect(self, *, x0: int, y0: int, x1: int, y1: int, z: int) -> list[Segment]:
+        """Return the selection outline of floor ``z`` around an inclusive rectangle.
+
+        Segments are ``(x0, y0, x1, y1)`` in tile-edge coordinates (tile
+        ``(x, y)`` spans ``x..x+1`` and ``y..y+1``) and cover whole chunks
+        overlapping the rectangle; the caller's clip takes care of the rest.
+        """
+        return self._selection.selection_outline_in_rect(int(x0), int(y0), int(x1), int(y1), int(z))
+
     def clear_selection(self) -> None:
         self._selection.clear_selection()
 
@@ -2505,15 +2569,28 @@ class EditorSession:
     def apply_lasso_selection(
         self,
         *,
-        tiles: list[TileKey],
+        tiles: list[TileKey] | None = None,
+        spans: Iterable[Span] | None = None,
+        z: int | None = None,
         mode: SelectionApplyMode | None = None,
         visible_floors: list[int] | None = None,
     ) -> None:
-        """Apply a lasso selection to the current selection set."""
-        if not tiles:
+        """Apply a lasso selection to the current selection set.
+
+        The lasso is given either as ``tiles`` or, straight from the
+        rasterizer, as row ``spans`` ``(y, x0, x1)`` on floor ``z``.
+        """
+        if tiles:
+            base_z = int(tiles[0][2])
+            footprint = ChunkedSelection((int(x), int(y), base_z) for x, y, _z in tiles)
+        elif spans is not None and z is not None:
+            base_z = int(z)
+            footprint = ChunkedSelection.from_spans(spans, base_z)
+        else:
+            return
+        if not footprint:
             return
 
-        base_z = int(tiles[0][2])
         depth_mode = self.get_selection_depth_mode()
 
         floors: list[int] = [base_z]
@@ -2526,36 +2603,23 @@ class EditorSession:
         elif depth_mode in (SelectionDepthMode.LOWER, SelectionDepthMode.COMPENSATE):
             floors = list(range(base_z, max(visible_sorted) + 1))
 
-        selection_tiles: set[TileKey] = set()
-        for x, y, _z in tiles:
-            for z in floors:
-                tx, ty = int(x), int(y)
-                if depth_mode is SelectionDepthMode.COMPENSATE:
-                    tx, ty = apply_compensation_offset(x=tx, y=ty, z=int(z), base_z=base_z)
-                if not (0 <= tx < int(self.game_map.header.width) and 0 <= ty < int(self.game_map.header.height)):
-                    continue
-                t = self.game_map.get_tile(int(tx), int(ty), int(z))
-                if not tile_is_nonempty(t):
-                    continue
-                selection_tiles.add((int(tx), int(ty), int(z)))
+        # Rasterize the lasso once on the base floor, then derive the other
+        # floors by shifting whole bitmap rows and masking with occupancy.
+        width = int(self.game_map.header.width)
+        height = int(self.game_map.header.height)
+        occupied = self._selection.occupancy().nonempty()
+        selection_tiles = ChunkedSelection()
+        for z in floors:
+            dx, dy = 0, 0
+            if depth_mode is SelectionDepthMode.COMPENSATE:
+                dx, dy = apply_compensation_offset(x=0, y=0, z=int(z), base_z=base_z)
+            layer = footprint.translated(dx, dy, int(z) - base_z).clipped(0, 0, width - 1, height - 1)
+            selection_tiles |= layer & occupied
 
         if not isinstance(mode, SelectionApplyMode):
             mode = SelectionApplyMode.ADD if mode is None else SelectionApplyMode(str(mode))
 
-        current = self._selection.get_selection_tiles()
-        if mode is SelectionApplyMode.REPLACE:
-            new_sel = set(selection_tiles)
-        elif mode is SelectionApplyMode.SUBTRACT:
-            new_sel = set(current)
-            new_sel.difference_update(selection_tiles)
-        elif mode is SelectionApplyMode.TOGGLE:
-            new_sel = set(current)
-            new_sel.symmetric_difference_update(selection_tiles)
-        else:
-            new_sel = set(current)
-            new_sel.update(selection_tiles)
-
-        self._selection.set_selection(new_sel)
+        self._selection.apply_selection(selection_tiles, mode)
 
     # === Clipboard API ===
 
@@ -2567,8 +2631,15 @@ class EditorSession:
         client_version: str | None = None,
         *,
         sprite_hash_lookup: Callable[[int], int | None] | None = None,
+        background: bool = False,
     ) -> bool:
-        """Copy selected tiles into the internal buffer and system clipboard."""
+        """Copy selected tiles into the internal buffer and system clipboard.
+
+        The internal buffer is filled immediately. With ``background=True`` the
+        binary system-clipboard payload is encoded on the clipboard worker and
+        published by ``poll_clipboard_job``; item names and sprite hashes are
+        resolved here first, so the worker never calls back into editor state.
+        """
 
         # Prepare name lookup
         def name_lookup(server_id: int) -> str | None:
@@ -2583,13 +2654,8 @@ class EditorSession:
         if not self._clipboard.copy_tiles(selection_tiles):
             return False
 
-        tiles: list[Tile] = []
-        for key in sorted(selection_tiles):
-            t = self.game_map.get_tile(*key)
-            if t is None or not tile_is_nonempty(t):
-                continue
-            tiles.append(t)
-
+        # The buffer already holds the non-empty selected tiles in key order.
+        tiles: list[Tile] = list(self._clipboard.get_buffer_tiles().values())
         if not tiles:
             return False
 
@@ -2599,9 +2665,25 @@ class EditorSession:
         origin_z = min(int(t.z) for t in tiles)
 
         system_clipboard = SystemClipboardManager.instance()
-        system_clipboard.copy_tiles(
+        self._settle_clipboard_job()
+        if background:
+            ids = collect_item_ids(tiles)
+            names = prefetch_lookup(ids, name_lookup)
+            hashes = prefetch_lookup(ids, sprite_hash_lookup) if sprite_hash_lookup is not None else None
+            future = system_clipboard.copy_tiles_binary_async(
+                tiles,
+                (origin_x, origin_y, origin_z),
+                client_version=client_version,
+                name_lookup=names.get,
+                sprite_hash_lookup=hashes.get if hashes is not None else None,
+            )
+            self._start_clipboard_job("copy", future)
+            return True
+
+        system_clipboard.copy_tiles_binary(
             tiles,
             (origin_x, origin_y, origin_z),
+            client_version=client_version,
             name_lookup=name_lookup,
             sprite_hash_lookup=sprite_hash_lookup,
         )
@@ -2619,8 +2701,13 @@ class EditorSession:
         name_resolver: Callable[[str], int | None] | None = None,
         hash_resolver: Callable[[int, int | None, str | None], int | None] | None = None,
         enable_sprite_match: bool = True,
+        background: bool = False,
     ) -> bool:
-        """Try to import content from the system clipboard."""
+        """Try to import content from the system clipboard.
+
+        With ``background=True`` a binary payload is decoded on the clipboard
+        worker; ``poll_clipboard_job`` loads the tiles into the paste buffer.
+        """
 
         if name_resolver is None:
 
@@ -2630,6 +2717,8 @@ class EditorSession:
                     return xml.get_server_id_by_name(name)
                 return None
 
+        self._settle_clipboard_job()
+
         system_clipboard = SystemClipboardManager.instance()
         if not system_clipboard.from_system_clipboard(
             target_version=target_version,
@@ -2642,6 +2731,10 @@ class EditorSession:
         if entry is None:
             return False
 
+        if background and entry.binary is not None:
+            self._start_clipboard_job("paste", tiles_from_entry_async(entry))
+            return True
+
         result = tiles_from_entry(entry)
         if result is None:
             return False
@@ -2649,6 +2742,72 @@ class EditorSession:
         tiles, origin = result
         return self._clipboard.load_tiles(tiles, origin)
 
+    def has_clipboard_job(self) -> bool:
+        return self._clipboard_job is not None
+
+    def clipboard_job(self) -> int | None:
+        """Id of the running background copy/paste, to pass to ``poll_clipboard_job``."""
+        job = self._clipboard_job
+        return None if job is None else job[0]
+
+    def poll_clipboard_job(self, job: int | None = None, *, wait: bool = False) -> bool | None:
+        """Finish a background copy/paste once its worker is done.
+
+        Must be called from the GUI thread (it touches the system clipboard).
+
+        Args:
+            job: Id from ``clipboard_job()``; polls whichever job is running
+                when omitted. A job that a later copy/paste already finished
+                reports its own result.
+            wait: Block until the worker is done.
+
+        Returns:
+            None while the job is still running, otherwise whether it succeeded.
+        """
+        current = self._clipboard_job
+        if job is not None and (current is None or current[0] != job):
+            return self._clipboard_results.pop(job, False)
+        if current is None:
+            return False
+        _job_id, kind, future = current
+        if not wait and not future.done():
+            return None
+        self._clipboard_job = None
+        return self._finish_clipboard_job(kind, future)
+
+    def _start_clipboard_job(self, kind: str, future: Future[Any]) -> None:
+        self._clipboard_job_seq += 1
+        self._clipboard_job = (self._clipboard_job_seq, kind, future)
+
+    def _settle_clipboard_job(self) -> None:
+        """Finish the running job before starting new clipboard work, keeping its result for its poller."""
+        current = self._clipboard_job
+        if current is None:
+            return
+        job_id, kind, future = current
+        self._clipboard_job = None
+        self._clipboard_results[job_id] = self._finish_clipboard_job(kind, future)
+
+    def _finish_clipboard_job(self, kind: str, future: Future[Any]) -> bool:
+        try:
+            result = future.result()
+        except Exception:
+            logger.exception("Background clipboard %s failed", kind)
+            return False
+
+        if kind == "copy":
+            system_clipboard = SystemClipboardManager.instance()
+            system_clipboard.set_current(result)
+            version = result.header.client_version if result.header is not None else None
+            if version:
+                return bool(system_clipboard.to_system_clipboard(version))
+            return bool(system_clipboard.to_system_clipboard())
+
+        if result is None:
+            return False
+        tiles, origin = result
+        return self._clipboard.load_tiles(tiles, origin)
+
     def cut_selection(
         self,
         client_version: str | None = None,
@@ -3004,8 +3163,7 @@ class EditorSession:
 
     def borderize_selection(self) -> PaintAction | None:
         """Re-run auto-border in the selected area (legacy Ctrl+B)."""
-        selection = self._selection.get_selection_tiles()
-        if not selection:
+        if not self._selection.has_selection():
             return None
 
         if self._gestures.is_active:
@@ -3013,7 +3171,7 @@ class EditorSession:
 
         from ..auto_border import AutoBorderProcessor
 
-        expanded = self._move.calculate_expanded_area(selection)
+        expanded = self._selection.get_selection().dilated(1).to_set()
         action = PaintAction(brush_id=0)
         proc = AutoBorderProcessor(self.game_map, self.brush_manager, change_recorder=action)
 
@@ -3324,6 +3482,11 @@ class EditorSession:
             cb(set(changed))
 
         self._update_memory_guard(set(changed))
+        self._selection.notify_tiles_changed(changed)
+        if self._teleports is not None and changed:
+            self._teleports.notify_tiles_changed(changed)
+        if self._audit is not None:
+            self._audit.mark_dirty(changed)
 
         # Live Editing Broadcast
         if broadcast and (self._live_client or self._live_server):
@@ -3352,11 +3515,31 @@ class EditorSession:
             if tile is None:
                 tile = Tile(x=int(x), y=int(y), z=int(z))
             tiles.append(tile)
+        client = self._live_client
+        if client is not None and (client.state < ConnectionState.AUTHENTICATED or client.sync_pending):
+            # The sync answer would overwrite these (a full one clears the map), so hold them back.
+            self._live_offline_tiles.update(((t.x, t.y, t.z), t) for t in tiles)
+            return
         payload = encode_tile_update(tiles)
-        if self._live_client is not None:
-            self._live_client.send_packet(PacketType.TILE_UPDATE, payload)
+        if client is not None:
+            client.send_packet(PacketType.TILE_UPDATE, payload)
         if self._live_server is not None:
-            self._live_server.broadcast(PacketType.TILE_UPDATE, payload)
+            self._live_server.broadcast_tiles(payload)
+
+    def _resend_live_offline_tiles(self, client: LiveClient) -> set[TileKey]:
+        """Reapply and send the edits held back while offline; they win over the synced tiles."""
+        tiles = list(self._live_offline_tiles.values())
+        self._live_offline_tiles.clear()
+        changed: set[TileKey] = set()
+        for tile in tiles:
+            if _tile_is_truly_empty(tile):
+                self.game_map.delete_tile(tile.x, tile.y, tile.z)
+            else:
+                self.game_map.set_tile(tile)
+            changed.add((tile.x, tile.y, tile.z))
+        logger.info("Resending %d tile(s) edited while offline", len(tiles))
+        client.send_packet(PacketType.TILE_UPDATE, encode_tile_update(tiles))
+        return changed
 
     def _live_map_provider(self, x_min: int, y_min: int, x_max: int, y_max: int, z: int) -> list[Tile]:
         tiles: list[Tile] = []
@@ -3393,16 +3576,20 @@ class EditorSession:
         if password:
             self._live_client.set_password(str(password))
         self._live_action_queue.set_live_client(self._live_client)
-        self._live_sync_started = False
         return self._live_client.connect()
 
     def disconnect_live(self) -> None:
-        """Disconnect from Live Editing server."""
+        """Disconnect from Live Editing server.
+
+        Edits still held back from an interrupted connection stay local only.
+        """
         if self._live_client:
             self._live_client.disconnect()
             self._live_client = None
+        if self._live_offline_tiles:
+            logger.info("Discarding %d unsent offline tile edit(s)", len(self._live_offline_tiles))
+            self._live_offline_tiles.clear()
         self._live_action_queue.set_live_client(None)
-        self._live_sync_started = False
 
     def start_live_server(
         self, *, host: str = "127.0.0.1", port: int = 7171, name: str = "", password: str = ""
@@ -3566,42 +3753,42 @@ class EditorSession:
         return positions
 
     def process_live_events(self) -> int:
-        """Poll incoming packets from Live Client and apply them.
+        """Poll incoming packets from Live Client/Server and apply them.
+
+        Received tiles arrive already decoded and coalesced per position in
+        the client/server inbox; they are applied within
+        ``live_apply_budget_ms`` and whatever is left waits for the next
+        call. All changes of one call produce a single tiles-changed
+        notification.
 
         Returns:
-            Number of packets processed.
+            Number of packets and tiles processed.
         """
         if not self._live_client and not self._live_server:
             return 0
 
         count = 0
-        if self._live_client is not None:
+        changed: set[TileKey] = set()
+        client = self._live_client
+        if client is not None:
             while True:
-                pkt = self._live_client.pop_packet()
+                pkt = client.pop_packet()
                 if not pkt:
                     break
 
+                count += 1
                 pkt_type, payload = pkt
                 if int(pkt_type) == int(PacketType.LOGIN_SUCCESS):
                     if len(payload) >= 4:
-                        self._live_client.client_id = int.from_bytes(payload[0:4], "little", signed=False)
-                    self._live_client.state = ConnectionState.AUTHENTICATED
-                    if not self._live_sync_started:
-                        self._live_sync_started = True
-                        self.game_map.tiles.clear()
-                        width = max(1, int(self.game_map.header.width))
-                        height = max(1, int(self.game_map.header.height))
-                        for z in range(0, 16):
-                            self._live_client.request_map(
-                                x_min=0,
-                                y_min=0,
-                                x_max=width - 1,
-                                y_max=height - 1,
-                                z=int(z),
-                            )
+                        client.client_id = int.from_bytes(payload[0:4], "little", signed=False)
+                    client.state = ConnectionState.AUTHENTICATED
+                    # First login and every auto-reconnect: the server sends
+                    # only what changed since our last sequence when it can.
+                    client.request_sync()
                 elif int(pkt_type) == int(PacketType.LOGIN_ERROR) or int(pkt_type) == int(PacketType.KICK):
-                    self._live_client.set_last_error(payload.decode("utf-8", errors="ignore"))
+                    client.set_last_error(payload.decode("utf-8", errors="ignore"))
                     self.disconnect_live()
+                    break
                 elif int(pkt_type) == int(PacketType.CLIENT_LIST):
                     clients = decode_client_list(payload)
                     self._live_clients = {int(c["client_id"]): dict(c) for c in clients}
@@ -3617,28 +3804,20 @@ class EditorSession:
                     if self._on_live_cursor:
                         self._on_live_cursor(int(client_id), int(x), int(y), int(z))
                 elif int(pkt_type) == int(PacketType.TILE_UPDATE):
-                    tiles, ok = decode_tile_update(payload)
-                    if ok and tiles:
-                        changed = self._apply_live_tiles(tiles)
-                        if changed:
-                            self._emit_tiles_changed(changed, broadcast=False)
-                    else:
-                        positions = self._decode_live_positions(payload)
-                        if positions:
-                            self._emit_tiles_changed(set(positions), broadcast=False)
-                elif int(pkt_type) == int(PacketType.MAP_CHUNK):
-                    chunk = decode_map_chunk(payload)
-                    tiles = chunk.get("tiles", [])
-                    changed = self._apply_live_tiles(list(tiles))
-                    if changed:
-                        self._emit_tiles_changed(changed, broadcast=False)
-                count += 1
+                    # Tile data went to the inbox; these only name positions.
+                    changed.update(self._decode_live_positions(payload))
+            if self._live_client is client:
+                changed |= self._drain_live_inbox(client.inbox)
+                synced = client.state == ConnectionState.AUTHENTICATED and not client.sync_pending
+                if self._live_offline_tiles and synced and not len(client.inbox):
+                    changed |= self._resend_live_offline_tiles(client)
 
         if self._live_server is not None:
             while True:
                 pkt = self._live_server.pop_packet()
                 if not pkt:
                     break
+                count += 1
                 pkt_type, payload = pkt
                 if int(pkt_type) == int(PacketType.MESSAGE):
                     client_id, name, message = decode_chat(payload)
@@ -3655,18 +3834,29 @@ class EditorSession:
                     if self._on_live_cursor:
                         self._on_live_cursor(int(client_id), int(x), int(y), int(z))
                 elif int(pkt_type) == int(PacketType.TILE_UPDATE):
-                    tiles, ok = decode_tile_update(payload)
-                    if ok and tiles:
-                        changed = self._apply_live_tiles(tiles)
-                        if changed:
-                            self._emit_tiles_changed(changed, broadcast=False)
-                    else:
-                        positions = self._decode_live_positions(payload)
-                        if positions:
-                            self._emit_tiles_changed(set(positions), broadcast=False)
-                count += 1
+                    changed.update(self._decode_live_positions(payload))
+                elif int(pkt_type) == int(PacketType.SYNC_REQUEST):
+                    self._live_server.serve_sync(payload, self.game_map.snapshot())
+            changed |= self._drain_live_inbox(self._live_server.inbox)
+
+        if changed:
+            self._emit_tiles_changed(changed, broadcast=False)
+        return count + len(changed)
 
-        return count
+    def _drain_live_inbox(self, inbox: LiveTileInbox) -> set[TileKey]:
+        return inbox.drain(self._apply_live_tiles, on_reset=self._clear_live_map, budget_ms=self.live_apply_budget_ms)
+
+    def _clear_live_map(self) -> set[TileKey]:
+        cleared = set(self.game_map.tiles.keys())
+        self.game_map.tiles.clear()
+        return cleared
+
+    def get_live_inbox_stats(self) -> dict[str, Any] | None:
+        """Queue depth and apply latency of received live tiles, or None when offline."""
+        endpoint = self._live_client or self._live_server
+        if endpoint is None:
+            return None
+        return endpoint.inbox.stats.to_dict()
 
     @staticmethod
     def _changed_keys_for_action(action: EditorAction) -> set[TileKey]:
@@ -5,14 +5,24 @@ Handles tile selection state including:
 - Box/rectangle selection
 - Toggle selection
 - Selection queries
+
+The selection itself is a ``ChunkedSelection`` (per-chunk bitsets, see
+``selection_bitmap``), so million-tile box selects stay bulk operations.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 
 from py_rme_canary.core.data.gamemap import GameMap
+from py_rme_canary.logic_layer.session.selection_bitmap import (
+    ChunkedSelection,
+    Segment,
+    SelectionOutlineCache,
+    TileOccupancyIndex,
+)
 from py_rme_canary.logic_layer.session.selection_modes import (
     SelectionDepthMode,
     apply_compensation_offset,
@@ -58,7 +68,9 @@ class SelectionManager:
     game_map: GameMap
 
     # Selection state
-    _selection_tiles: set[TileKey] = field(default_factory=set)
+    _selection_tiles: ChunkedSelection = field(default_factory=ChunkedSelection)
+    _occupancy: TileOccupancyIndex | None = None
+    _outline: SelectionOutlineCache = field(default_factory=SelectionOutlineCache)
     _selection_box_active: bool = False
     _selection_box_start: TileKey | None = None
     _selection_box_end: TileKey | None = None
@@ -74,7 +86,44 @@ class SelectionManager:
 
     def get_selection_tiles(self) -> set[TileKey]:
         """Return a copy of the current selection tiles."""
-        return set(self._selection_tiles)
+        return self._selection_tiles.to_set()
+
+    def get_selection(self) -> ChunkedSelection:
+        """Return a copy of the current selection as a chunked bitmap."""
+        return self._selection_tiles.copy()
+
+    def iter_selection_tiles(self) -> Iterator[TileKey]:
+        """Iterate selected tiles without materializing a set."""
+        return iter(self._selection_tiles)
+
+    def selection_count(self) -> int:
+        return len(self._selection_tiles)
+
+    def selection_bounds(self) -> tuple[TileKey, TileKey] | None:
+        """Return ``(min_corner, max_corner)`` of the selection, or None."""
+        return self._selection_tiles.bounding_box()
+
+    def is_selected(self, key: TileKey) -> bool:
+        return key in self._selection_tiles
+
+    def iter_selection_in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> Iterator[TileKey]:
+        """Iterate selected tiles of floor ``z`` inside an inclusive rectangle."""
+        return self._selection_tiles.iter_in_rect(x0, y0, x1, y1, z)
+
+    def selection_outline_in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> list[Segment]:
+        """Return merged outline segments of the selection on floor ``z`` around an inclusive rectangle."""
+        return self._outline.outline_in_rect(self._selection_tiles, x0, y0, x1, y1, z)
+
+    def occupancy(self) -> TileOccupancyIndex:
+        """Return the lazily built index of non-empty map tiles."""
+        if self._occupancy is None:
+            self._occupancy = TileOccupancyIndex(self.game_map, is_nonempty=tile_is_nonempty)
+        return self._occupancy
+
+    def notify_tiles_changed(self, keys: Iterable[TileKey]) -> None:
+        """Keep the occupancy index in sync after map edits."""
+        if self._occupancy is not None:
+            self._occupancy.update_keys(keys)
 
     def clear_selection(self) -> None:
         """Clear all selected tiles."""
@@ -107,9 +156,28 @@ class SelectionManager:
         """Remove a tile from the selection."""
         self._selection_tiles.discard(key)
 
-    def set_selection(self, tiles: set[TileKey]) -> None:
+    def set_selection(self, tiles: Iterable[TileKey]) -> None:
         """Replace the entire selection."""
-        self._selection_tiles = set(tiles)
+        if isinstance(tiles, ChunkedSelection):
+            self._selection_tiles = tiles.copy()
+        else:
+            self._selection_tiles = ChunkedSelection(tiles)
+
+    def apply_selection(self, tiles: ChunkedSelection, mode: SelectionApplyMode | str) -> None:
+        """Combine ``tiles`` with the current selection according to ``mode``."""
+        # `mode` is usually already a SelectionApplyMode (default arg). Avoid
+        # converting it via `str(mode)` because Enum(str, Enum) renders like
+        # 'SelectionApplyMode.ADD', which is not a valid value.
+        if not isinstance(mode, SelectionApplyMode):
+            mode = SelectionApplyMode(str(mode))
+        if mode is SelectionApplyMode.REPLACE:
+            self._selection_tiles = tiles.copy()
+        elif mode is SelectionApplyMode.SUBTRACT:
+            self._selection_tiles -= tiles
+        elif mode is SelectionApplyMode.TOGGLE:
+            self._selection_tiles ^= tiles
+        elif mode is SelectionApplyMode.ADD:
+            self._selection_tiles |= tiles
 
     # === Box Selection API ===
 
@@ -176,7 +244,8 @@ class SelectionManager:
             visible_floors=visible_floors,
         )
 
-        box_tiles: set[TileKey] = set()
+        occupancy = self.occupancy()
+        box_tiles = ChunkedSelection()
         for z in floors_to_select:
             # Apply compensation offset if using COMPENSATE mode
             if self.selection_mode == SelectionDepthMode.COMPENSATE:
@@ -186,26 +255,9 @@ class SelectionManager:
                 comp_x0, comp_y0 = x0, y0
                 comp_x1, comp_y1 = x1, y1
 
-            for xx in range(int(comp_x0), int(comp_x1) + 1):
-                for yy in range(int(comp_y0), int(comp_y1) + 1):
-                    t = self.game_map.get_tile(int(xx), int(yy), int(z))
-                    if not tile_is_nonempty(t):
-                        continue
-                    box_tiles.add((int(xx), int(yy), int(z)))
+            box_tiles |= occupancy.select_rect(int(comp_x0), int(comp_y0), int(comp_x1), int(comp_y1), int(z))
 
-        # `mode` is usually already a SelectionApplyMode (default arg). Avoid
-        # converting it via `str(mode)` because Enum(str, Enum) renders like
-        # 'SelectionApplyMode.ADD', which is not a valid value.
-        if not isinstance(mode, SelectionApplyMode):
-            mode = SelectionApplyMode(str(mode))
-        if mode is SelectionApplyMode.REPLACE:
-            self._selection_tiles = set(box_tiles)
-        elif mode is SelectionApplyMode.SUBTRACT:
-            self._selection_tiles.difference_update(box_tiles)
-        elif mode is SelectionApplyMode.TOGGLE:
-            self._selection_tiles.symmetric_difference_update(box_tiles)
-        elif mode is SelectionApplyMode.ADD:
-            self._selection_tiles.update(box_tiles)
+        self.apply_selection(box_tiles, mode)
 
         self.cancel_box_selection()
 
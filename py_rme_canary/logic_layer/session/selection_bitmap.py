@@ -0,0 +1,561 @@
+"""Chunked bitmap storage for tile selections.
+
+A selection is stored as one integer bitset per 32x32 chunk of a floor,
+keyed by ``(z, chunk_x, chunk_y)``. Bit ``(ly * 32 + lx)`` of a chunk mask
+marks tile ``(chunk_x * 32 + lx, chunk_y * 32 + ly, z)``.
+
+Rectangles become a handful of big-integer operations per chunk, so box and
+lasso selects, set algebra, counting and bounding boxes scale with the number
+of touched chunks instead of the number of tiles. ``TileOccupancyIndex``
+mirrors ``GameMap.tiles`` in the same layout so a box select only has to AND
+the rectangle with the chunks that actually hold non-empty tiles.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from py_rme_canary.core.data.gamemap import GameMap
+
+TileKey = tuple[int, int, int]
+ChunkKey = tuple[int, int, int]
+Span = tuple[int, int, int]  # (y, x0, x1), inclusive row run
+Segment = tuple[int, int, int, int]  # (x0, y0, x1, y1) in tile-edge coordinates
+
+CHUNK_SHIFT = 5
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+_LOCAL_MASK = CHUNK_SIZE - 1
+_ROW_BITS = (1 << CHUNK_SIZE) - 1
+
+# _ROW_REPEAT[n] has bit 0 of the first ``n`` rows set; multiplying a row mask
+# by it stamps that row ``n`` times without carries (row masks are < 2**32).
+_ROW_REPEAT: tuple[int, ...] = tuple(sum(1 << (CHUNK_SIZE * r) for r in range(n)) for n in range(CHUNK_SIZE + 1))
+_FULL = (1 << (CHUNK_SIZE * CHUNK_SIZE)) - 1
+_COL0 = _ROW_REPEAT[CHUNK_SIZE]
+_COL_LAST = _COL0 << _LOCAL_MASK
+_LAST_ROW_SHIFT = _LOCAL_MASK * CHUNK_SIZE
+
+
+def chunk_key(x: int, y: int, z: int) -> ChunkKey:
+    return (int(z), int(x) >> CHUNK_SHIFT, int(y) >> CHUNK_SHIFT)
+
+
+def _bit(x: int, y: int) -> int:
+    return 1 << (((int(y) & _LOCAL_MASK) << CHUNK_SHIFT) | (int(x) & _LOCAL_MASK))
+
+
+def _rect_mask(lx0: int, ly0: int, lx1: int, ly1: int) -> int:
+    """Mask of the inclusive local rectangle ``[lx0..lx1] x [ly0..ly1]``."""
+    row = ((1 << (lx1 - lx0 + 1)) - 1) << lx0
+    return (row * _ROW_REPEAT[ly1 - ly0 + 1]) << (ly0 * CHUNK_SIZE)
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _runs(row: int) -> Iterator[tuple[int, int]]:
+    """Yield the inclusive ``(start, end)`` bit runs of ``row``."""
+    while row:
+        start = (row & -row).bit_length() - 1
+        shifted = row >> start
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        yield start, start + length - 1
+        row &= ~(((1 << length) - 1) << start)
+
+
+def _column_span(mask: int) -> tuple[int, int]:
+    """Return the (min, max) local column that has any bit set in ``mask``."""
+    cols = 0
+    while mask:
+        cols |= mask & _ROW_BITS
+        mask >>= CHUNK_SIZE
+    return (cols & -cols).bit_length() - 1, cols.bit_length() - 1
+
+
+class ChunkedSelection:
+    """Set of tile keys backed by per-chunk bitsets.
+
+    Behaves like a ``set[TileKey]`` for membership, iteration and ``len`` and
+    supports the usual set operators (``|``, ``&``, ``-``, ``^``) chunk-wise.
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, keys: Iterable[TileKey] | None = None) -> None:
+        self._chunks: dict[ChunkKey, int] = {}
+        if keys is not None:
+            self.update(keys)
+
+    @classmethod
+    def _from_chunks(cls, chunks: dict[ChunkKey, int]) -> ChunkedSelection:
+        sel = cls()
+        sel._chunks = {key: mask for key, mask in chunks.items() if mask}
+        return sel
+
+    @classmethod
+    def from_rect(cls, x0: int, y0: int, x1: int, y1: int, z: int) -> ChunkedSelection:
+        """Build the selection of every tile in an inclusive rectangle."""
+        sel = cls()
+        sel._or_rect(int(x0), int(y0), int(x1), int(y1), int(z))
+        return sel
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[Span], z: int) -> ChunkedSelection:
+        """Build the selection covered by inclusive row spans ``(y, x0, x1)`` on floor ``z``."""
+        sel = cls()
+        z = int(z)
+        for y, x0, x1 in spans:
+            sel._or_rect(int(x0), int(y), int(x1), int(y), z)
+        return sel
+
+    # === Set protocol ===
+
+    def __len__(self) -> int:
+        return sum(mask.bit_count() for mask in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __contains__(self, key: object) -> bool:
+        x: int
+        y: int
+        z: int
+        try:
+            x, y, z = key  # type: ignore[misc]
+            mask = self._chunks.get(chunk_key(x, y, z), 0)
+            return bool(mask & _bit(x, y))
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[TileKey]:
+        for (z, cx, cy), mask in self._chunks.items():
+            bx = cx << CHUNK_SHIFT
+            by = cy << CHUNK_SHIFT
+            for bit in _iter_bits(mask):
+                yield (bx + (bit & _LOCAL_MASK), by + (bit >> CHUNK_SHIFT), z)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChunkedSelection):
+            return self._chunks == other._chunks
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(key in self for key in other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ChunkedSelection(tiles={len(self)}, chunks={len(self._chunks)})"
+
+    def copy(self) -> ChunkedSelection:
+        return ChunkedSelection._from_chunks(self._chunks)
+
+    def to_set(self) -> set[TileKey]:
+        return set(self)
+
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def floors(self) -> set[int]:
+        return {z for z, _cx, _cy in self._chunks}
+
+    # === Mutation ===
+
+    def add(self, key: TileKey) -> None:
+        x, y, z = key
+        ck = chunk_key(x, y, z)
+        self._chunks[ck] = self._chunks.get(ck, 0) | _bit(x, y)
+
+    def discard(self, key: TileKey) -> None:
+        x, y, z = key
+        ck = chunk_key(x, y, z)
+        mask = self._chunks.get(ck, 0) & ~_bit(x, y)
+        if mask:
+            self._chunks[ck] = mask
+        else:
+            self._chunks.pop(ck, None)
+
+    def remove(self, key: TileKey) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.discard(key)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+
+    def update(self, keys: Iterable[TileKey]) -> None:
+        if isinstance(keys, ChunkedSelection):
+            self._merge(keys, lambda a, b: a | b)
+            return
+        chunks = self._chunks
+        for x, y, z in keys:
+            ck = (int(z), int(x) >> CHUNK_SHIFT, int(y) >> CHUNK_SHIFT)
+            chunks[ck] = chunks.get(ck, 0) | _bit(x, y)
+
+    def _or_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> None:
+        if x1 < x0 or y1 < y0:
+            return
+        chunks = self._chunks
+        for cy in range(y0 >> CHUNK_SHIFT, (y1 >> CHUNK_SHIFT) + 1):
+            base_y = cy << CHUNK_SHIFT
+            ly0 = max(y0 - base_y, 0)
+            ly1 = min(y1 - base_y, _LOCAL_MASK)
+            for cx in range(x0 >> CHUNK_SHIFT, (x1 >> CHUNK_SHIFT) + 1):
+                base_x = cx << CHUNK_SHIFT
+                lx0 = max(x0 - base_x, 0)
+                lx1 = min(x1 - base_x, _LOCAL_MASK)
+                ck = (z, cx, cy)
+                chunks[ck] = chunks.get(ck, 0) | _rect_mask(lx0, ly0, lx1, ly1)
+
+    # === Set algebra ===
+
+    def _merge(self, other: ChunkedSelection, op: Callable[[int, int], int]) -> None:
+        chunks = self._chunks
+        for ck, mask in other._chunks.items():
+            merged = op(chunks.get(ck, 0), mask)
+            if merged:
+                chunks[ck] = merged
+            else:
+                chunks.pop(ck, None)
+
+    def __or__(self, other: ChunkedSelection) -> ChunkedSelection:
+        out = self.copy()
+        out |= other
+        return out
+
+    def __and__(self, other: ChunkedSelection) -> ChunkedSelection:
+        small, large = (self, other) if len(self._chunks) <= len(other._chunks) else (other, self)
+        return ChunkedSelection._from_chunks(
+            {ck: mask & large._chunks.get(ck, 0) for ck, mask in small._chunks.items()}
+        )
+
+    def __sub__(self, other: ChunkedSelection) -> ChunkedSelection:
+        out = self.copy()
+        out -= other
+        return out
+
+    def __xor__(self, other: ChunkedSelection) -> ChunkedSelection:
+        out = self.copy()
+        out ^= other
+        return out
+
+    def __ior__(self, other: ChunkedSelection) -> ChunkedSelection:
+        self._merge(other, lambda a, b: a | b)
+        return self
+
+    def __iand__(self, other: ChunkedSelection) -> ChunkedSelection:
+        self._chunks = (self & other)._chunks
+        return self
+
+    def __isub__(self, other: ChunkedSelection) -> ChunkedSelection:
+        self._merge(other, lambda a, b: a & ~b)
+        return self
+
+    def __ixor__(self, other: ChunkedSelection) -> ChunkedSelection:
+        self._merge(other, lambda a, b: a ^ b)
+        return self
+
+    # === Queries ===
+
+    def bounding_box(self) -> tuple[TileKey, TileKey] | None:
+        """Return ``((min_x, min_y, min_z), (max_x, max_y, max_z))`` or None."""
+        if not self._chunks:
+            return None
+        min_x = min_y = min_z = None
+        max_x = max_y = max_z = None
+        for (z, cx, cy), mask in self._chunks.items():
+            lo_col, hi_col = _column_span(mask)
+            x_lo = (cx << CHUNK_SHIFT) + lo_col
+            x_hi = (cx << CHUNK_SHIFT) + hi_col
+            y_lo = (cy << CHUNK_SHIFT) + (((mask & -mask).bit_length() - 1) >> CHUNK_SHIFT)
+            y_hi = (cy << CHUNK_SHIFT) + ((mask.bit_length() - 1) >> CHUNK_SHIFT)
+            min_x = x_lo if min_x is None else min(min_x, x_lo)
+            max_x = x_hi if max_x is None else max(max_x, x_hi)
+            min_y = y_lo if min_y is None else min(min_y, y_lo)
+            max_y = y_hi if max_y is None else max(max_y, y_hi)
+            min_z = z if min_z is None else min(min_z, z)
+            max_z = z if max_z is None else max(max_z, z)
+        return (int(min_x), int(min_y), int(min_z)), (int(max_x), int(max_y), int(max_z))  # type: ignore[arg-type]
+
+    def clipped(self, x0: int, y0: int, x1: int, y1: int, z: int | None = None) -> ChunkedSelection:
+        """Return the part inside an inclusive rectangle (optionally one floor only).
+
+        Only the chunks already present are visited, so clipping to the whole
+        map is as cheap as clipping to a viewport.
+        """
+        x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
+        out: dict[ChunkKey, int] = {}
+        for ck, mask in self._chunks.items():
+            cz, cx, cy = ck
+            if z is not None and cz != int(z):
+                continue
+            bx = cx << CHUNK_SHIFT
+            by = cy << CHUNK_SHIFT
+            lx0 = max(x0 - bx, 0)
+            ly0 = max(y0 - by, 0)
+            lx1 = min(x1 - bx, _LOCAL_MASK)
+            ly1 = min(y1 - by, _LOCAL_MASK)
+            if lx1 < lx0 or ly1 < ly0:
+                continue
+            if lx0 == 0 and ly0 == 0 and lx1 == _LOCAL_MASK and ly1 == _LOCAL_MASK:
+                out[ck] = mask
+            else:
+                out[ck] = mask & _rect_mask(lx0, ly0, lx1, ly1)
+        return ChunkedSelection._from_chunks(out)
+
+    def iter_in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> Iterator[TileKey]:
+        """Yield selected tiles of floor ``z`` inside the inclusive rectangle."""
+        yield from self.clipped(x0, y0, x1, y1, z)
+
+    def translated(self, dx: int, dy: int, dz: int = 0) -> ChunkedSelection:
+        """Return a copy shifted by ``(dx, dy, dz)``, moving whole rows at a time."""
+        dx = int(dx)
+        dy = int(dy)
+        dz = int(dz)
+        if dx == 0 and dy == 0:
+            return ChunkedSelection._from_chunks({(z + dz, cx, cy): m for (z, cx, cy), m in self._chunks.items()})
+
+        out: dict[ChunkKey, int] = {}
+        for (z, cx, cy), mask in self._chunks.items():
+            nz = z + dz
+            gx = (cx << CHUNK_SHIFT) + dx
+            tcx = gx >> CHUNK_SHIFT
+            shift = gx & _LOCAL_MASK
+            base_y = (cy << CHUNK_SHIFT) + dy
+            row_index = 0
+            while mask:
+                row = mask & _ROW_BITS
+                if row:
+                    gy = base_y + row_index
+                    tcy = gy >> CHUNK_SHIFT
+                    offset = (gy & _LOCAL_MASK) << CHUNK_SHIFT
+                    shifted = row << shift
+                    lo = shifted & _ROW_BITS
+                    hi = shifted >> CHUNK_SIZE
+                    if lo:
+                        ck = (nz, tcx, tcy)
+                        out[ck] = out.get(ck, 0) | (lo << offset)
+                    if hi:
+                        ck = (nz, tcx + 1, tcy)
+                        out[ck] = out.get(ck, 0) | (hi << offset)
+                mask >>= CHUNK_SIZE
+                row_index += 1
+        return ChunkedSelection._from_chunks(out)
+
+    def chunk_outline(self, ck: ChunkKey) -> list[Segment]:
+        """Return the boundary of the selection inside chunk ``ck`` as merged segments.
+
+        An edge is emitted where a selected tile borders an unselected one
+        (neighbour chunks included), and collinear edges are merged, so a
+        selected rectangle costs at most four segments per chunk.
+        """
+        chunks = self._chunks
+        mask = chunks.get(ck, 0)
+        if not mask:
+            return []
+        z, cx, cy = ck
+        north = chunks.get((z, cx, cy - 1), 0)
+        south = chunks.get((z, cx, cy + 1), 0)
+        west = chunks.get((z, cx - 1, cy), 0)
+        east = chunks.get((z, cx + 1, cy), 0)
+
+        above = ((mask << CHUNK_SIZE) & _FULL) | (north >> _LAST_ROW_SHIFT)
+        below = (mask >> CHUNK_SIZE) | ((south & _ROW_BITS) << _LAST_ROW_SHIFT)
+        left = ((mask << 1) & ~_COL0 & _FULL) | ((west & _COL_LAST) >> _LOCAL_MASK)
+        right = ((mask >> 1) & ~_COL_LAST) | ((east & _COL0) << _LOCAL_MASK)
+        top_edges = mask & ~above
+        bottom_edges = mask & ~below
+        left_edges = mask & ~left
+        right_edges = mask & ~right
+
+        bx = cx << CHUNK_SHIFT
+        by = cy << CHUNK_SHIFT
+        segments: list[Segment] = []
+        for edges, dy in ((top_edges, 0), (bottom_edges, 1)):
+            row_index = 0
+            while edges:
+                row = edges & _ROW_BITS
+                gy = by + row_index + dy
+                for start, end in _runs(row):
+                    segments.append((bx + start, gy, bx + end + 1, gy))
+                edges >>= CHUNK_SIZE
+                row_index += 1
+
+        # Vertical edges: follow each column down the rows, closing a run
+        # where the column stops having an edge.
+        for edges, dx in ((left_edges, 0), (right_edges, 1)):
+            open_rows: dict[int, int] = {}
+            previous = 0
+            for row_index in range(CHUNK_SIZE + 1):
+                row = (edges >> (row_index * CHUNK_SIZE)) & _ROW_BITS if row_index < CHUNK_SIZE else 0
+                for col in _iter_bits(previous & ~row):
+                    gx = bx + col + dx
+                    segments.append((gx, by + open_rows.pop(col), gx, by + row_index))
+                for col in _iter_bits(row & ~previous):
+                    open_rows[col] = row_index
+                previous = row
+        return segments
+
+    def outline_in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> list[Segment]:
+        """Return the outline segments of every chunk of floor ``z`` overlapping the inclusive rectangle."""
+        segments: list[Segment] = []
+        for ck in self.chunks_in_rect(x0, y0, x1, y1, z):
+            segments.extend(self.chunk_outline(ck))
+        return segments
+
+    def chunks_in_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> list[ChunkKey]:
+        """Return the keys of the present chunks of floor ``z`` overlapping the inclusive rectangle."""
+        z = int(z)
+        cx0, cy0 = int(x0) >> CHUNK_SHIFT, int(y0) >> CHUNK_SHIFT
+        cx1, cy1 = int(x1) >> CHUNK_SHIFT, int(y1) >> CHUNK_SHIFT
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) < len(self._chunks):
+            chunks = self._chunks
+            return [(z, cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1) if (z, cx, cy) in chunks]
+        return [ck for ck in self._chunks if ck[0] == z and cx0 <= ck[1] <= cx1 and cy0 <= ck[2] <= cy1]
+
+    def dilated(self, radius: int = 1) -> ChunkedSelection:
+        """Return the selection grown by ``radius`` tiles (square neighbourhood, same floor)."""
+        out = self.copy()
+        for _ in range(max(0, int(radius))):
+            horizontal = out | out.translated(1, 0) | out.translated(-1, 0)
+            out = horizontal | horizontal.translated(0, 1) | horizontal.translated(0, -1)
+        return out
+
+
+class SelectionOutlineCache:
+    """Outline segments of a selection, cached per chunk.
+
+    A chunk's outline depends on its own mask and the masks of its four
+    neighbours, so the cache stores those five integers next to the
+    segments and recomputes only the chunks whose neighbourhood changed.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[ChunkKey, tuple[tuple[int, int, int, int, int], list[Segment]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def outline_in_rect(self, selection: ChunkedSelection, x0: int, y0: int, x1: int, y1: int, z: int) -> list[Segment]:
+        """Like :meth:`ChunkedSelection.outline_in_rect`, reusing unchanged chunks."""
+        chunks = selection._chunks
+        entries = self._entries
+        segments: list[Segment] = []
+        visible = selection.chunks_in_rect(x0, y0, x1, y1, z)
+        for ck in visible:
+            cz, cx, cy = ck
+            stamp = (
+                chunks[ck],
+                chunks.get((cz, cx, cy - 1), 0),
+                chunks.get((cz, cx, cy + 1), 0),
+                chunks.get((cz, cx - 1, cy), 0),
+                chunks.get((cz, cx + 1, cy), 0),
+            )
+            entry = entries.get(ck)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, selection.chunk_outline(ck))
+                entries[ck] = entry
+            segments.extend(entry[1])
+        if len(entries) > 4 * len(visible) + 64:
+            # Keep memory bounded by the chunks on screen after a pan or a big deselect.
+            self._entries = {ck: entries[ck] for ck in visible}
+        return segments
+
+
+class TileOccupancyIndex:
+    """Chunked bitmap of the non-empty tiles of a ``GameMap``.
+
+    Built lazily from ``game_map.tiles`` and kept current through
+    ``update_keys`` (the editor session feeds it every changed tile). A
+    separate presence bitmap counts the dict keys it has seen; if that count
+    drifts from ``len(game_map.tiles)`` the map was edited behind the index's
+    back and it is rebuilt on the next query.
+    """
+
+    __slots__ = ("_built", "_game_map", "_is_nonempty", "_nonempty", "_present", "_present_count", "_tiles_ref")
+
+    def __init__(self, game_map: GameMap, *, is_nonempty: Callable[[object], bool]) -> None:
+        self._game_map = game_map
+        self._is_nonempty = is_nonempty
+        self._present: dict[ChunkKey, int] = {}
+        self._nonempty = ChunkedSelection()
+        self._present_count = 0
+        self._tiles_ref: object = None
+        self._built = False
+
+    def invalidate(self) -> None:
+        self._built = False
+
+    def _stale(self) -> bool:
+        tiles = self._game_map.tiles
+        return (not self._built) or tiles is not self._tiles_ref or self._present_count != len(tiles)
+
+    def rebuild(self) -> None:
+        tiles = self._game_map.tiles
+        present: dict[ChunkKey, int] = {}
+        nonempty: dict[ChunkKey, int] = {}
+        is_nonempty = self._is_nonempty
+        for (x, y, z), tile in tiles.items():
+            ck = (int(z), int(x) >> CHUNK_SHIFT, int(y) >> CHUNK_SHIFT)
+            bit = _bit(x, y)
+            present[ck] = present.get(ck, 0) | bit
+            if is_nonempty(tile):
+                nonempty[ck] = nonempty.get(ck, 0) | bit
+        self._present = present
+        self._nonempty = ChunkedSelection._from_chunks(nonempty)
+        self._present_count = len(tiles)
+        self._tiles_ref = tiles
+        self._built = True
+
+    def update_keys(self, keys: Iterable[TileKey]) -> None:
+        """Refresh the bits of ``keys`` from the map (no-op until first built)."""
+        if not self._built:
+            return
+        tiles = self._game_map.tiles
+        if tiles is not self._tiles_ref:
+            self._built = False
+            return
+        present = self._present
+        for key in keys:
+            x, y, z = key
+            ck = chunk_key(x, y, z)
+            bit = _bit(x, y)
+            tile = tiles.get((int(x), int(y), int(z)))
+            had = bool(present.get(ck, 0) & bit)
+            if tile is None:
+                if had:
+                    present[ck] &= ~bit
+                    self._present_count -= 1
+                self._nonempty.discard((int(x), int(y), int(z)))
+                continue
+            if not had:
+                present[ck] = present.get(ck, 0) | bit
+                self._present_count += 1
+            if self._is_nonempty(tile):
+                self._nonempty.add((int(x), int(y), int(z)))
+            else:
+                self._nonempty.discard((int(x), int(y), int(z)))
+
+    def nonempty(self) -> ChunkedSelection:
+        """Return the (shared, do not mutate) bitmap of non-empty tiles."""
+        if self._stale():
+            self.rebuild()
+        return self._nonempty
+
+    def select_rect(self, x0: int, y0: int, x1: int, y1: int, z: int) -> ChunkedSelection:
+        """Return the non-empty tiles inside an inclusive rectangle of floor ``z``."""
+        return ChunkedSelection.from_rect(x0, y0, x1, y1, z) & self.nonempty()
+
+    def select_spans(self, spans: Iterable[Span], z: int) -> ChunkedSelection:
+        """Return the non-empty tiles covered by row spans ``(y, x0, x1)`` of floor ``z``."""
+        return ChunkedSelection.from_spans(spans, z) & self.nonempty()
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from .models import FriendEntry, FriendRequest, FriendsSnapshot, PresenceStatus, PrivacyMode, UserProfile
+from .models import (
+    FriendEntry,
+    FriendRequest,
+    FriendsSnapshot,
+    PresenceStatus,
+    PresenceUpdate,
+    PrivacyMode,
+    UserProfile,
+)
 from .repository import FriendsRepository
 from .service import FriendsService
 
@@ -11,6 +19,7 @@ __all__ = [
     "FriendsService",
     "FriendsSnapshot",
     "PresenceStatus",
+    "PresenceUpdate",
     "PrivacyMode",
     "UserProfile",
 ]
@@ -43,6 +43,16 @@ class FriendEntry:
     last_seen: str = ""
 
 
+@dataclass(frozen=True, slots=True)
+class PresenceUpdate:
+    """Pending presence write, coalesced per user before it is persisted."""
+
+    user_id: int
+    status: PresenceStatus
+    current_map: str | None = None
+    privacy_mode: PrivacyMode = "friends_only"
+
+
 @dataclass(slots=True)
 class FriendsSnapshot:
     """UI-friendly grouped state for the friends panel."""
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import contextlib
 import sqlite3
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 
-from .models import FriendEntry, FriendRequest, PresenceStatus, PrivacyMode, UserProfile
+from .models import FriendEntry, FriendRequest, PresenceStatus, PresenceUpdate, PrivacyMode, UserProfile
 
 _ALLOWED_PRESENCE: set[str] = {"online", "idle", "dnd", "offline"}
 _ALLOWED_PRIVACY: set[str] = {"public", "friends_only", "private"}
@@ -42,11 +45,30 @@ CREATE TABLE IF NOT EXISTS user_presence (
     FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_friendships_user1_status ON friendships(user1_id, status);
-CREATE INDEX IF NOT EXISTS idx_friendships_user2_status ON friendships(user2_id, status);
+-- Covering indexes: friend/pending lookups are answered from the index alone.
+DROP INDEX IF EXISTS idx_friendships_user1_status;
+DROP INDEX IF EXISTS idx_friendships_user2_status;
+CREATE INDEX IF NOT EXISTS idx_friendships_user1_cover ON friendships(user1_id, status, user2_id, requested_by);
+CREATE INDEX IF NOT EXISTS idx_friendships_user2_cover ON friendships(user2_id, status, user1_id, requested_by);
 CREATE INDEX IF NOT EXISTS idx_friendships_requested_by ON friendships(requested_by, status);
+CREATE INDEX IF NOT EXISTS idx_users_search_cover ON users(username, id, email, avatar_url, created_at);
 """
 
+# Per-connection prepared statement cache (sqlite3 keys it by SQL text).
+_STATEMENT_CACHE_SIZE = 256
+
+_UPSERT_PRESENCE_SQL = """
+    INSERT INTO user_presence (user_id, status, current_map, privacy_mode, last_seen)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(user_id) DO UPDATE SET
+        status = excluded.status,
+        current_map = excluded.current_map,
+        privacy_mode = excluded.privacy_mode,
+        last_seen = CURRENT_TIMESTAMP
+"""
+
+_TOUCH_PRESENCE_SQL = "UPDATE user_presence SET last_seen = CURRENT_TIMESTAMP WHERE user_id = ?"
+
 
 def _canonical_pair(first_id: int, second_id: int) -> tuple[int, int]:
     a = int(first_id)
@@ -54,12 +76,39 @@ def _canonical_pair(first_id: int, second_id: int) -> tuple[int, int]:
     return (a, b) if a < b else (b, a)
 
 
+def _normalize_presence(
+    status: object,
+    current_map: str | None,
+    privacy_mode: object,
+) -> tuple[str, str | None, str]:
+    normalized_status = str(status).lower()
+    normalized_privacy = str(privacy_mode).lower()
+    if normalized_status not in _ALLOWED_PRESENCE:
+        normalized_status = "offline"
+    if normalized_privacy not in _ALLOWED_PRIVACY:
+        normalized_privacy = "friends_only"
+
+    map_value = str(current_map).strip() if current_map else None
+    if normalized_privacy == "private":
+        map_value = None
+    return normalized_status, map_value, normalized_privacy
+
+
 class FriendsRepository:
-    """SQLite-backed repository for friend graph + presence."""
+    """SQLite-backed repository for friend graph + presence.
+
+    Connections are pooled per thread: each thread opens one connection on
+    first use (pragmas applied once) and reuses it, so the sqlite3 statement
+    cache stays warm across calls. ``close()`` releases every pooled
+    connection.
+    """
 
     def __init__(self, db_path: Path | str) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pool: list[sqlite3.Connection] = []
         self.init_schema()
 
     @property
@@ -67,12 +116,36 @@ class FriendsRepository:
         return self._db_path
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path), timeout=30.0)
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        # Each connection is only used by the thread that opened it; the flag
+        # just allows close() to run from whichever thread shuts down.
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=30.0,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._local.conn = conn
+        with self._pool_lock:
+            self._pool.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close all pooled connections (they are reopened lazily on next use)."""
+        with self._pool_lock:
+            pool = list(self._pool)
+            self._pool.clear()
+        for conn in pool:
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
+        self._local = threading.local()
+
     def init_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(_SCHEMA_SQL)
@@ -395,28 +468,33 @@ class FriendsRepository:
         current_map: str | None = None,
         privacy_mode: PrivacyMode = "friends_only",
     ) -> None:
-        uid = int(user_id)
-        normalized_status = str(status).lower()
-        normalized_privacy = str(privacy_mode).lower()
-        if normalized_status not in _ALLOWED_PRESENCE:
-            normalized_status = "offline"
-        if normalized_privacy not in _ALLOWED_PRIVACY:
-            normalized_privacy = "friends_only"
+        self.update_presence_many(
+            [PresenceUpdate(user_id=int(user_id), status=status, current_map=current_map, privacy_mode=privacy_mode)]
+        )
+
+    def update_presence_many(self, updates: Iterable[PresenceUpdate]) -> int:
+        """Persist presence updates in a single transaction.
 
-        map_value = str(current_map).strip() if current_map else None
-        if normalized_privacy == "private":
-            map_value = None
+        Updates are coalesced per user (the last one wins). Returns the number
+        of rows written.
+        """
+        latest: dict[int, tuple[int, str, str | None, str]] = {}
+        for update in updates:
+            uid = int(update.user_id)
+            status, map_value, privacy = _normalize_presence(update.status, update.current_map, update.privacy_mode)
+            latest[uid] = (uid, status, map_value, privacy)
+        if not latest:
+            return 0
 
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO user_presence (user_id, status, current_map, privacy_mode, last_seen)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(user_id) DO UPDATE SET
-                    status = excluded.status,
-                    current_map = excluded.current_map,
-                    privacy_mode = excluded.privacy_mode,
-                    last_seen = CURRENT_TIMESTAMP
-                """,
-                (uid, normalized_status, map_value, normalized_privacy),
-            )
+            conn.executemany(_UPSERT_PRESENCE_SQL, latest.values())
+        return len(latest)
+
+    def touch_presence(self, user_ids: Iterable[int]) -> int:
+        """Heartbeat: refresh ``last_seen`` for many users in one transaction."""
+        unique = {int(uid) for uid in user_ids}
+        if not unique:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(_TOUCH_PRESENCE_SQL, ((uid,) for uid in unique))
+        return len(unique)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from .models import FriendEntry, FriendsSnapshot, PresenceStatus, PrivacyMode, UserProfile
+from .models import FriendEntry, FriendsSnapshot, PresenceStatus, PresenceUpdate, PrivacyMode, UserProfile
 from .repository import FriendsRepository
 
 
@@ -12,6 +12,7 @@ class FriendsService:
 
     def __init__(self, repository: FriendsRepository) -> None:
         self.repo = repository
+        self._pending_presence: dict[int, PresenceUpdate] = {}
 
     @classmethod
     def from_path(cls, db_path: Path | str) -> FriendsService:
@@ -24,6 +25,11 @@ class FriendsService:
             return cls.from_path(Path(override))
         return cls.from_path(Path.home() / ".py_rme_canary" / "friends.db")
 
+    def close(self) -> None:
+        """Flush queued presence and release pooled database connections."""
+        self.flush_presence()
+        self.repo.close()
+
     def ensure_user(self, *, username: str, email: str = "", avatar_url: str = "") -> UserProfile:
         return self.repo.upsert_user(username=username, email=email, avatar_url=avatar_url)
 
@@ -52,6 +58,8 @@ class FriendsService:
         current_map: str | None = None,
         privacy_mode: PrivacyMode = "friends_only",
     ) -> None:
+        # A direct write supersedes anything still queued for this user.
+        self._pending_presence.pop(int(user_id), None)
         self.repo.update_presence(
             user_id=int(user_id),
             status=status,
@@ -59,6 +67,39 @@ class FriendsService:
             privacy_mode=privacy_mode,
         )
 
+    def queue_presence(
+        self,
+        *,
+        user_id: int,
+        status: PresenceStatus,
+        current_map: str | None = None,
+        privacy_mode: PrivacyMode = "friends_only",
+    ) -> None:
+        """Record a presence change to be written by the next ``flush_presence``.
+
+        Repeated updates for the same user are coalesced; only the latest is kept.
+        """
+        uid = int(user_id)
+        self._pending_presence[uid] = PresenceUpdate(
+            user_id=uid,
+            status=status,
+            current_map=current_map,
+            privacy_mode=privacy_mode,
+        )
+
+    def flush_presence(self) -> int:
+        """Write all queued presence updates in one transaction."""
+        if not self._pending_presence:
+            return 0
+        pending = list(self._pending_presence.values())
+        self._pending_presence.clear()
+        return self.repo.update_presence_many(pending)
+
+    def heartbeat(self, user_ids: set[int] | list[int] | tuple[int, ...]) -> int:
+        """Refresh ``last_seen`` for the given users in one batched write."""
+        self.flush_presence()
+        return self.repo.touch_presence(user_ids)
+
     def update_presence_by_username(
         self,
         *,
@@ -78,6 +119,7 @@ class FriendsService:
         )
 
     def snapshot(self, *, user_id: int) -> FriendsSnapshot:
+        self.flush_presence()
         pending = self.repo.list_pending_requests(user_id=int(user_id))
         friends = self.repo.list_friends(user_id=int(user_id))
 
@@ -103,17 +145,18 @@ class FriendsService:
     ) -> FriendsSnapshot:
         normalized_connected = {str(name).strip().casefold() for name in connected_usernames if str(name).strip()}
 
+        self.flush_presence()
         for entry in self.repo.list_friends(user_id=int(user_id)):
             expected_online = entry.username.casefold() in normalized_connected
             if expected_online and entry.status == "offline":
-                self.repo.update_presence(
+                self.queue_presence(
                     user_id=int(entry.id),
                     status="online",
                     current_map=entry.current_map,
                     privacy_mode=entry.privacy_mode,
                 )
             elif not expected_online and entry.status != "offline":
-                self.repo.update_presence(
+                self.queue_presence(
                     user_id=int(entry.id),
                     status="offline",
                     current_map=None,
@@ -65,11 +65,7 @@ class SpawnMonsterBrush:
             return False
 
         # Check if spawn already exists at this exact position
-        for spawn in game_map.monster_spawns:
-            if spawn.center.x == pos.x and spawn.center.y == pos.y and spawn.center.z == pos.z:
-                return False
-
-        return True
+        return game_map.monster_spawn_index().centered_at(pos.x, pos.y, pos.z) is None
 
     def draw(
         self,
@@ -143,11 +139,7 @@ class SpawnMonsterBrush:
             return []
 
         # Find and remove spawn area from map
-        spawn_to_remove = None
-        for spawn in game_map.monster_spawns:
-            if spawn.center.x == pos.x and spawn.center.y == pos.y and spawn.center.z == pos.z:
-                spawn_to_remove = spawn
-                break
+        spawn_to_remove = game_map.monster_spawn_index().centered_at(pos.x, pos.y, pos.z)
 
         if spawn_to_remove is not None:
             game_map.monster_spawns.remove(spawn_to_remove)
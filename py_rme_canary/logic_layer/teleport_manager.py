@@ -21,8 +21,8 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Iterator
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -207,6 +207,12 @@ LEVEL_MOVER_IDS = {
 class TeleportManager:
     """Manager for tracking and validating teleport links in a map.
 
+    The link table is built from the tiles that exist in the map and can be
+    kept current with :meth:`notify_tiles_changed` (the editor session feeds
+    it every changed tile, including undo/redo). :meth:`validate_all` only
+    re-evaluates links whose source or destination changed since the last
+    validation.
+
     Example:
         manager = TeleportManager(game_map)
 
@@ -229,28 +235,43 @@ class TeleportManager:
         )
     """
 
-    def __init__(self, game_map: GameMap | None = None) -> None:
+    def __init__(
+        self,
+        game_map: GameMap | None = None,
+        *,
+        on_tiles_changed: Callable[[set[Position]], None] | None = None,
+    ) -> None:
         """Initialize the teleport manager.
 
         Args:
             game_map: Optional map to scan for teleports.
+            on_tiles_changed: Called with the positions of tiles the manager
+                rewrites on the map (e.g. after ``set_destination``).
         """
         self._map = game_map
+        self._on_tiles_changed = on_tiles_changed
         self._links: dict[Position, TeleportLink] = {}
         self._destination_index: dict[Position, list[Position]] = {}
+        # Sources whose status must be re-evaluated; None forces a full pass.
+        self._stale: set[Position] | None = None
 
     @property
     def link_count(self) -> int:
         return len(self._links)
 
+    @property
+    def game_map(self) -> GameMap | None:
+        return self._map
+
     def set_map(self, game_map: GameMap) -> None:
         """Set the map and rescan."""
         self._map = game_map
         self._links.clear()
         self._destination_index.clear()
+        self._stale = None
 
     def scan_map(self) -> int:
-        """Scan the entire map for teleport items.
+        """Scan the map's existing tiles for teleport items.
 
         Returns:
             Number of teleports found.
@@ -261,27 +282,52 @@ class TeleportManager:
 
         self._links.clear()
         self._destination_index.clear()
+        self._stale = None
         count = 0
 
-        # Iterate through all tiles
-        for z in range(16):  # Standard Z range
-            for y in range(self._map.header.height):
-                for x in range(self._map.header.width):
-                    tile = self._map.get_tile(x, y, z)
-                    if tile is None:
-                        continue
-
-                    # Check items for teleports
-                    for item in tile.items:
-                        if self._is_teleport_item(item):
-                            link = self._extract_link(item, (x, y, z))
-                            if link:
-                                self._add_link(link)
-                                count += 1
+        # Only tiles that exist can hold teleports; never walk the header grid.
+        for pos, tile in self._map.tiles.items():
+            count += self._scan_tile(pos, tile)
 
         logger.info("Scanned map: found %d teleport links", count)
         return count
 
+    def _scan_tile(self, pos: Position, tile: object) -> int:
+        """Add links for the teleport items on ``tile``; return how many were found."""
+        count = 0
+        for item in getattr(tile, "items", ()):
+            if self._is_teleport_item(item):
+                link = self._extract_link(item, pos)
+                if link:
+                    self._add_link(link)
+                    count += 1
+        return count
+
+    def notify_tiles_changed(self, changed: Iterable[Position]) -> None:
+        """Re-read the links of ``changed`` tiles from the map.
+
+        Links sourced on those tiles are dropped and rescanned; they and the
+        links that point at those tiles are queued for re-validation.
+        """
+        if self._map is None:
+            return
+        tiles = self._map.tiles
+        for key in changed:
+            pos = (int(key[0]), int(key[1]), int(key[2]))
+            self._remove_link(pos)
+            tile = tiles.get(pos)
+            if tile is not None:
+                self._scan_tile(pos, tile)
+            self._mark_stale(pos)
+
+    def _mark_stale(self, pos: Position) -> None:
+        """Queue the link at ``pos`` and every link targeting ``pos`` for validation."""
+        stale = self._stale
+        if stale is None:
+            return
+        stale.add(pos)
+        stale.update(self._destination_index.get(pos, ()))
+
     def _is_teleport_item(self, item: Item) -> bool:
         """Check if an item is a teleport."""
         # Check by ID
@@ -375,12 +421,30 @@ class TeleportManager:
 
     def _add_link(self, link: TeleportLink) -> None:
         """Add a link to the manager."""
+        # One link per source: a later teleport on the same tile replaces it.
+        self._remove_link(link.source)
         self._links[link.source] = link
 
         # Index by destination for reverse lookups
         if link.destination not in self._destination_index:
             self._destination_index[link.destination] = []
         self._destination_index[link.destination].append(link.source)
+        self._mark_stale(link.source)
+
+    def _remove_link(self, source: Position) -> TeleportLink | None:
+        link = self._links.pop(source, None)
+        if link is None:
+            return None
+
+        # Remove from destination index
+        sources = self._destination_index.get(link.destination)
+        if sources is not None:
+            if source in sources:
+                sources.remove(source)
+            if not sources:
+                del self._destination_index[link.destination]
+        self._mark_stale(source)
+        return link
 
     def get_link_at(self, pos: Position) -> TeleportLink | None:
         """Get teleport link at a position."""
@@ -404,19 +468,7 @@ class TeleportManager:
         Returns:
             True if removed, False if not found.
         """
-        if source not in self._links:
-            return False
-
-        link = self._links[source]
-
-        # Remove from destination index
-        if link.destination in self._destination_index:
-            sources = self._destination_index[link.destination]
-            if source in sources:
-                sources.remove(source)
-
-        del self._links[source]
-        return True
+        return self._remove_link(source) is not None
 
     def set_destination(self, source: Position, destination: Position) -> bool:
         """Set/update destination for a teleport.
@@ -431,21 +483,12 @@ class TeleportManager:
         if source not in self._links:
             return False
 
-        link = self._links[source]
-        old_dest = link.destination
-
-        # Update destination index
-        if old_dest in self._destination_index:
-            sources = self._destination_index[old_dest]
-            if source in sources:
-                sources.remove(source)
+        link = self._remove_link(source)
+        assert link is not None
 
         # Update link
         link.destination = destination
-
-        if destination not in self._destination_index:
-            self._destination_index[destination] = []
-        self._destination_index[destination].append(source)
+        self._add_link(link)
 
         # Update actual item on map if possible
         self._update_item_destination(source, destination)
@@ -466,20 +509,21 @@ class TeleportManager:
         if link is None:
             return
 
-        for item in tile.items:
+        items = list(tile.items)
+        for index, item in enumerate(items):
             if item.id == link.item_id:
-                # Convert tuple to Item's expected Position type if needed
-                # For now, we assume Item can accept tuple or we need to import Position
                 from py_rme_canary.core.data.item import Position as ItemPosition
 
                 pos_obj = ItemPosition(x=destination[0], y=destination[1], z=destination[2])
-
-                if hasattr(item, "destination"):
-                    item.destination = pos_obj
-                elif hasattr(item, "teleport_dest"):
-                    # Legacy fallback might expect tuple
-                    item.teleport_dest = destination
+                items[index] = replace(item, destination=pos_obj)
                 break
+        else:
+            return
+
+        # Tiles are shared with snapshots and render caches: write a new one.
+        self._map.set_tile(replace(tile, items=items, modified=True))
+        if self._on_tiles_changed is not None:
+            self._on_tiles_changed({(int(x), int(y), int(z))})
 
     def create_bidirectional(
         self,
@@ -518,50 +562,54 @@ class TeleportManager:
     def validate_all(self) -> LinkValidationResult:
         """Validate all teleport links.
 
+        The first call (and any call after :meth:`scan_map`) checks every
+        link; later calls only re-check links queued by edits since then and
+        reuse the stored status of the rest.
+
         Returns:
             LinkValidationResult with validation details.
         """
-        result = LinkValidationResult(total_links=len(self._links))
-
-        # Track sources to detect duplicates
-        source_counts: dict[Position, int] = {}
+        if self._stale is None:
+            to_check: Iterable[Position] = self._links.keys()
+        else:
+            to_check = self._stale
+        for source in to_check:
+            link = self._links.get(source)
+            if link is not None:
+                link.status = self._link_status(link)
+        self._stale = set()
 
-        for source, link in self._links.items():
-            # Check for circular (self-referencing)
-            if link.source == link.destination:
-                link.status = LinkStatus.CIRCULAR
+        result = LinkValidationResult(total_links=len(self._links))
+        for link in self._links.values():
+            status = link.status
+            if status is LinkStatus.VALID:
+                result.valid_links += 1
+            elif status is LinkStatus.CIRCULAR:
                 result.circular_links.append(link)
-                continue
-
-            # Check if destination exists (has a tile)
-            if self._map is not None:
-                dx, dy, dz = link.destination
-                dest_tile = self._map.get_tile(dx, dy, dz)
-                if dest_tile is None:
-                    link.status = LinkStatus.BROKEN
-                    result.broken_links.append(link)
-                    continue
-
-            # Check for return teleport
-            if link.destination not in self._links:
-                link.status = LinkStatus.NO_RETURN
+            elif status is LinkStatus.BROKEN:
+                result.broken_links.append(link)
+            elif status is LinkStatus.NO_RETURN:
                 result.no_return_links.append(link)
-            else:
-                return_link = self._links[link.destination]
-                if return_link.destination != link.source:
-                    link.status = LinkStatus.NO_RETURN
-                    result.no_return_links.append(link)
-                else:
-                    link.status = LinkStatus.VALID
-                    result.valid_links += 1
-
-        # Find duplicate sources (actually managed by dict, but check anyway)
-        for src, count in source_counts.items():
-            if count > 1:
-                result.duplicate_sources.append(src)
 
+        # Duplicate sources cannot occur: links are keyed by source position.
         return result
 
+    def _link_status(self, link: TeleportLink) -> LinkStatus:
+        """Evaluate one link against the map and the link table."""
+        # Check for circular (self-referencing)
+        if link.source == link.destination:
+            return LinkStatus.CIRCULAR
+
+        # Check if destination exists (has a tile)
+        if self._map is not None and link.destination not in self._map.tiles:
+            return LinkStatus.BROKEN
+
+        # Check for return teleport
+        return_link = self._links.get(link.destination)
+        if return_link is None or return_link.destination != link.source:
+            return LinkStatus.NO_RETURN
+        return LinkStatus.VALID
+
     def get_all_links(self) -> list[TeleportLink]:
         """Get all teleport links."""
         return list(self._links.values())
@@ -623,6 +671,7 @@ class TeleportManager:
         """Clear all tracked links."""
         self._links.clear()
         self._destination_index.clear()
+        self._stale = None
 
 
 def create_teleport_manager(game_map: GameMap | None = None) -> TeleportManager:
@@ -48,6 +48,8 @@ from .brush_definitions import (
 
 TileKey = tuple[int, int, int]
 
+_RING8 = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+
 
 class TileChangeRecorder(Protocol):
     """Records tile-level changes produced by painting or processors."""
@@ -197,6 +199,23 @@ class TransactionalBrushStroke:
 
     _stroke_origin: TileKey | None = None
 
+    # Per-stroke scratch state, reused instead of rebuilt for every tile:
+    # the brush resolved for the selected id and the neighbour-expanded
+    # dirty set handed to the finalize passes.
+    _stroke_brush: tuple[int, BrushDefinition | None, str, str] | None = None
+    _expanded: set[TileKey] = field(default_factory=set)
+
+    def _resolve_brush(self, selected_server_id: int) -> tuple[BrushDefinition | None, str, str]:
+        """Return ``(definition, brush_type, normalized_type)`` for the stroke's brush."""
+        cached = self._stroke_brush
+        if cached is not None and cached[0] == selected_server_id:
+            return cached[1], cached[2], cached[3]
+        brush_def = self.brush_manager.get_brush(selected_server_id)
+        brush_type = brush_def.brush_type if brush_def is not None else "wall"
+        brush_type_norm = str(brush_type).strip().lower()
+        self._stroke_brush = (selected_server_id, brush_def, brush_type, brush_type_norm)
+        return brush_def, brush_type, brush_type_norm
+
     def _doodad_pick_alternative(self, spec: DoodadBrushSpec) -> DoodadAlternative:
         alts = tuple(spec.alternatives or ())
         if not alts:
@@ -303,7 +322,7 @@ class TransactionalBrushStroke:
                 return
 
         new_items = list(tile.items)
-        new_items.append(Item(id=int(item_id)))
+        new_items.append(Item.plain(int(item_id)))
         after = replace(tile, items=new_items)
         after = replace(after, modified=True)
         if before == after:
@@ -524,6 +543,7 @@ class TransactionalBrushStroke:
     ) -> None:
         self.action = PaintAction(brush_id=int(selected_server_id))
         self.dirty.clear()
+        self._stroke_brush = None
         self.autoborder_runs = 0
         self._replace_context_enabled = bool(replace_enabled)
         self._replace_source_ground_id = None if replace_source_ground_id is None else int(replace_source_ground_id)
@@ -542,10 +562,8 @@ class TransactionalBrushStroke:
         x, y, z = int(x), int(y), int(z)
         selected_server_id = int(selected_server_id)
 
-        brush_def = self.brush_manager.get_brush(selected_server_id)
+        brush_def, brush_type, brush_type_norm = self._resolve_brush(selected_server_id)
         before = self.game_map.get_tile(x, y, z)
-        brush_type = brush_def.brush_type if brush_def is not None else "wall"
-        brush_type_norm = str(brush_type).strip().lower()
 
         effective_server_id = self._resolve_effective_id(
             x, y, z, selected_server_id, brush_def, brush_type_norm
@@ -581,15 +599,16 @@ class TransactionalBrushStroke:
         else:
             after = replace_top_item(tile, new_server_id=int(effective_server_id), brush_type=brush_type)
 
-        if after is not None:
+        if after is not None and not after.modified:
             after = replace(after, modified=True)
 
         if before == after:
             return
 
-        self.action.record_tile_change((x, y, z), before, after)
+        key = (x, y, z)
+        self.action.record_tile_change(key, before, after)
         self.game_map.set_tile(after)
-        self.dirty.add((x, y, z))
+        self.dirty.add(key)
 
     def _resolve_effective_id(
         self,
@@ -711,7 +730,7 @@ class TransactionalBrushStroke:
         if bool(alt):
             return replace(tile, items=kept)
         else:
-            kept.insert(0, Item(id=int(gravel_id)))
+            kept.insert(0, Item.plain(int(gravel_id)))
             return replace(tile, items=kept)
 
     def _paint_doodad(
@@ -830,13 +849,13 @@ class TransactionalBrushStroke:
     def _paint_carpet(self, tile: Tile, effective_server_id: int, brush_def: BrushDefinition) -> Tile:
         fam = {int(v) for v in brush_def.family_ids}
         kept = [it for it in tile.items if int(it.id) not in fam]
-        kept.insert(0, Item(id=int(effective_server_id)))
+        kept.insert(0, Item.plain(int(effective_server_id)))
         return replace(tile, items=kept)
 
     def _paint_table(self, tile: Tile, effective_server_id: int, brush_def: BrushDefinition) -> Tile:
         fam = {int(v) for v in brush_def.family_ids}
         kept = [it for it in tile.items if int(it.id) not in fam]
-        kept.append(Item(id=int(effective_server_id)))
+        kept.append(Item.plain(int(effective_server_id)))
         return replace(tile, items=kept)
 
     def _apply_table_alignment(self, *, brush_def: BrushDefinition) -> None:
@@ -1032,6 +1051,8 @@ class TransactionalBrushStroke:
         action = self.action
         self.action = None
         self.dirty.clear()
+        self._expanded.clear()
+        self._stroke_brush = None
         self._replace_context_enabled = False
         self._replace_source_ground_id = None
         self._stroke_origin = None
@@ -1044,17 +1065,24 @@ class TransactionalBrushStroke:
 
         self.action = None
         self.dirty.clear()
+        self._expanded.clear()
+        self._stroke_brush = None
         self.autoborder_runs = 0
         self._replace_context_enabled = False
         self._replace_source_ground_id = None
         self._stroke_origin = None
 
     def _expanded_dirty_with_neighbors(self) -> set[TileKey]:
-        expanded: set[TileKey] = set(self.dirty)
-        for x, y, z in list(self.dirty):
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    expanded.add((int(x + dx), int(y + dy), int(z)))
+        """Return the dirty tiles plus their 8 neighbours.
+
+        The set is the stroke's scratch buffer: it is refilled on every call
+        and emptied when the stroke ends.
+        """
+        expanded = self._expanded
+        expanded.clear()
+        expanded.update(self.dirty)
+        add = expanded.add
+        for x, y, z in self.dirty:
+            for dx, dy in _RING8:
+                add((x + dx, y + dy, z))
         return expanded
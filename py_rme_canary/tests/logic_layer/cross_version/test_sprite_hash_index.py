@@ -0,0 +1,167 @@
+"""Tests for the bulk-built, disk-cached sprite hash index."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+
+import pytest
+
+from py_rme_canary.core.assets.legacy_dat_spr import LegacySpriteArchive
+from py_rme_canary.core.assets.sprite_appearances import SpriteAppearances
+from py_rme_canary.logic_layer.cross_version import sprite_hash_index
+from py_rme_canary.logic_layer.cross_version.sprite_hash import SpriteHashMatcher
+from py_rme_canary.logic_layer.cross_version.sprite_hash_index import (
+    asset_files,
+    build_sprite_hash_index,
+    load_or_build_sprite_hash_index,
+    load_sprite_hash_index,
+    save_sprite_hash_index,
+)
+
+# Colors of the four 32x32 sprites on each 64x64 sheet; sheet 3 repeats sheet 1.
+_SHEETS = (
+    ((255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 0, 0), (0, 0, 0, 0)),
+    ((10, 20, 30, 255), (40, 50, 60, 255), (70, 80, 90, 255), (0, 0, 0, 0)),
+    ((255, 0, 0, 255), (0, 255, 0, 255), (1, 2, 3, 4), (0, 0, 0, 0)),
+)
+
+
+def _write_assets(root: Path) -> SpriteAppearances:
+    try:
+        from PIL import Image  # type: ignore[import-untyped]  # optional dependency
+    except Exception:
+        pytest.skip("Pillow not installed")
+
+    catalog = []
+    for index, colors in enumerate(_SHEETS):
+        img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+        for slot, color in enumerate(colors):
+            img.paste(color, (32 * (slot % 2), 32 * (slot // 2), 32 * (slot % 2) + 32, 32 * (slot // 2) + 32))
+        img.save(root / f"sheet-{index}.png")
+        first = 1 + index * 4
+        catalog.append(
+            {
+                "type": "sprite",
+                "firstspriteid": first,
+                "lastspriteid": first + 3,
+                "spritetype": 0,
+                "file": f"sheet-{index}.png",
+            }
+        )
+    (root / "catalog-content.json").write_text(json.dumps(catalog), encoding="utf-8")
+    sprites = SpriteAppearances(assets_dir=root)
+    sprites.load_catalog_content()
+    return sprites
+
+
+def _one_by_one(sprites: SpriteAppearances, ids: range) -> SpriteHashMatcher:
+    matcher = SpriteHashMatcher()
+    for sprite_id in ids:
+        width, height, pixels = sprites.get_sprite_rgba(sprite_id)
+        matcher.add_sprite(sprite_id, pixels, width, height)
+    return matcher
+
+
+def _tables(matcher: SpriteHashMatcher) -> tuple[dict[int, int], dict[int, list[int]]]:
+    by_id = dict(matcher.items())
+    return by_id, {h: matcher.find_by_hash(h) for h in by_id.values()}
+
+
+def test_bulk_build_matches_adding_sprites_one_by_one(tmp_path) -> None:
+    sprites = _write_assets(tmp_path)
+    matcher, fingerprints = build_sprite_hash_index(sprites, max_workers=1)
+
+    assert len(matcher) == 12
+    assert _tables(matcher) == _tables(_one_by_one(sprites, range(1, 13)))
+    assert matcher.find_by_hash(matcher.get_hash(1)) == [1, 9]
+    assert [Path(fp.path) for fp in fingerprints] == asset_files(sprites)
+
+
+def test_process_pool_build_matches_inline_build(tmp_path) -> None:
+    sprites = _write_assets(tmp_path)
+    inline, inline_fps = build_sprite_hash_index(sprites, max_workers=1)
+    pooled, pooled_fps = build_sprite_hash_index(sprites, max_workers=2)
+    assert list(pooled.items()) == list(inline.items())
+    assert pooled_fps == inline_fps
+
+
+def test_cache_is_reused_until_an_asset_changes(tmp_path, monkeypatch) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    sprites = _write_assets(assets)
+    cache = tmp_path / "cache" / "index.bin"
+
+    built = load_or_build_sprite_hash_index(sprites, cache_path=cache, max_workers=1)
+    assert cache.exists()
+
+    calls: list[object] = []
+    real_build = sprite_hash_index.build_sprite_hash_index
+
+    def counting_build(*args, **kwargs):
+        calls.append(args)
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(sprite_hash_index, "build_sprite_hash_index", counting_build)
+
+    assert list(load_or_build_sprite_hash_index(sprites, cache_path=cache).items()) == list(built.items())
+    assert calls == []
+
+    # Touched but identical: accepted via the digest, and the cache is refreshed.
+    os.utime(assets / "sheet-1.png", ns=(1, 1))
+    load_or_build_sprite_hash_index(sprites, cache_path=cache)
+    assert calls == []
+    before = cache.stat().st_mtime_ns
+    load_or_build_sprite_hash_index(sprites, cache_path=cache)
+    assert cache.stat().st_mtime_ns == before
+
+    # Different pixels: the index is rebuilt.
+    (assets / "sheet-1.png").write_bytes((assets / "sheet-2.png").read_bytes())
+    rebuilt = load_or_build_sprite_hash_index(sprites, cache_path=cache, max_workers=1)
+    assert len(calls) == 1
+    assert rebuilt.get_hash(5) == built.get_hash(9)
+
+
+def test_load_rejects_foreign_or_damaged_caches(tmp_path) -> None:
+    sprites = _write_assets(tmp_path)
+    matcher, fingerprints = build_sprite_hash_index(sprites, max_workers=1)
+    cache = tmp_path / "index.bin"
+    save_sprite_hash_index(cache, matcher, fingerprints)
+
+    loaded = load_sprite_hash_index(cache, asset_files(sprites))
+    assert loaded is not None
+    assert list(loaded.items()) == list(matcher.items())
+
+    assert load_sprite_hash_index(cache, asset_files(sprites)[:2]) is None
+    assert load_sprite_hash_index(tmp_path / "missing.bin", asset_files(sprites)) is None
+
+    data = cache.read_bytes()
+    cache.write_bytes(data[:-3])
+    assert load_sprite_hash_index(cache, asset_files(sprites)) is None
+    cache.write_bytes(data[:8] + struct.pack("<I", sprite_hash_index.INDEX_VERSION + 1) + data[12:])
+    assert load_sprite_hash_index(cache, asset_files(sprites)) is None
+
+
+def test_legacy_archives_are_hashed_in_id_runs(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(sprite_hash_index, "_LEGACY_CHUNK", 2)
+    sprite = struct.pack("<HH", 0, 1) + bytes([255, 0, 0]) + struct.pack("<HH", 1023, 0)
+    body = bytes([0, 0, 0]) + struct.pack("<H", len(sprite)) + sprite
+    header = 4 + 2 + 3 * 4
+    offsets = struct.pack("<III", header, 0, header)
+    (tmp_path / "Tibia.spr").write_bytes(struct.pack("<IH", 0x01020304, 3) + offsets + body)
+    (tmp_path / "Tibia.dat").write_bytes(b"\x00" * 12)
+    archive = LegacySpriteArchive(dat_path=tmp_path / "Tibia.dat", spr_path=tmp_path / "Tibia.spr")
+
+    matcher, fingerprints = build_sprite_hash_index(archive, max_workers=1)
+
+    assert [Path(fp.path) for fp in fingerprints] == [tmp_path / "Tibia.spr", tmp_path / "Tibia.dat"]
+    assert matcher.find_by_hash(matcher.get_hash(1)) == [1, 3]
+    assert matcher.get_hash(2) != matcher.get_hash(1)
+
+    cache = tmp_path / "index.bin"
+    save_sprite_hash_index(cache, matcher, fingerprints)
+    assert load_sprite_hash_index(cache, asset_files(archive)) is not None
+    (tmp_path / "Tibia.dat").write_bytes(b"\x01" * 16)
+    assert load_sprite_hash_index(cache, asset_files(archive)) is None
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.fill_tool import FillConfig, FillMode, FloodFillEngine
+
+_SIZE = 384  # 147,456 tiles of one ground
+
+
+def _ocean_map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=_SIZE, height=_SIZE))
+    water = Item.plain(4608)
+    for x in range(_SIZE):
+        for y in range(_SIZE):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=water))
+    return game_map
+
+
+@pytest.mark.benchmark
+def test_scanline_fill_vs_bfs(benchmark) -> None:
+    game_map = _ocean_map()
+    limit = _SIZE * _SIZE
+
+    started = time.perf_counter()
+    bfs = FloodFillEngine(game_map)
+    bfs_count = sum(1 for _ in bfs.preview_fill((1, 1, 7), None, FillConfig(max_tiles=limit)))
+    bfs_ms = (time.perf_counter() - started) * 1000.0
+
+    engine = FloodFillEngine(game_map)
+    config = FillConfig(mode=FillMode.SCANLINE, max_tiles=limit)
+    assert sum(1 for _ in engine.preview_fill((1, 1, 7), None, config)) == bfs_count == limit
+
+    benchmark.extra_info["tiles"] = limit
+    benchmark.extra_info["bfs_ms"] = round(bfs_ms, 1)
+    benchmark.pedantic(lambda: engine._collect((1, 1, 7)), rounds=3, iterations=1)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import ctypes
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader  # noqa: E402
+from py_rme_canary.core.memory import AllocationProbe, AllocationReport  # noqa: E402
+from py_rme_canary.logic_layer.brush_definitions import BrushManager  # noqa: E402
+from py_rme_canary.logic_layer.session.editor import EditorSession  # noqa: E402
+from py_rme_canary.vis_layer.renderer.core import ModernSpriteBatcher  # noqa: E402
+from py_rme_canary.vis_layer.renderer.core.modern_batcher import SpriteInstance  # noqa: E402
+
+_FRAMES = 30
+_SPRITES = 40 * 30 * 3  # 40x30 visible tiles, ground + two items
+
+
+class _NullGL:
+    """Accepts every GL call; constants resolve to 0."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("GL_"):
+            return 0
+        return lambda *args: None
+
+
+def _fresh_frames() -> None:
+    """The previous batcher: new sprite records and a new upload array every frame."""
+    for _ in range(_FRAMES):
+        sprites = [
+            SpriteInstance(x=float(i % 40) * 32.0, y=float(i // 40 % 30) * 32.0, width=32.0, height=32.0, layer=i)
+            for i in range(_SPRITES)
+        ]
+        vertices: list[float] = []
+        for s in sprites:
+            vertices.extend([s.x, s.y, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, float(s.layer)] * 6)
+        (ctypes.c_float * len(vertices))(*vertices)
+
+
+def _pooled_frames(batcher: ModernSpriteBatcher) -> None:
+    for _ in range(_FRAMES):
+        batcher.begin()
+        for i in range(_SPRITES):
+            batcher.add_sprite(float(i % 40) * 32.0, float(i // 40 % 30) * 32.0, 32.0, 32.0, i)
+        batcher.end(1280, 960)
+
+
+def _probe(fn) -> AllocationReport:
+    with AllocationProbe() as probe:
+        fn()
+    return probe.report
+
+
+@pytest.mark.benchmark
+def test_sprite_frames_reuse_records_instead_of_collecting_them(benchmark) -> None:
+    batcher = ModernSpriteBatcher(_NullGL())
+    batcher._initialized = True
+    _pooled_frames(batcher)  # warm the arena and the upload buffer
+
+    before = _probe(_fresh_frames)
+    after = benchmark.pedantic(lambda: _probe(lambda: _pooled_frames(batcher)), rounds=3, iterations=1)
+
+    benchmark.extra_info["before"] = before.to_dict()
+    benchmark.extra_info["after"] = after.to_dict()
+    benchmark.extra_info["arena"] = batcher._sprites.stats.to_dict()
+    assert batcher.stats.sprites_drawn == _SPRITES
+    assert batcher._sprites.stats.created == _SPRITES
+    assert after.collections[0] * 10 < before.collections[0]
+    assert after.tracked_allocations * 10 < before.tracked_allocations
+
+
+@pytest.mark.benchmark
+def test_brush_stroke_allocations(benchmark) -> None:
+    """Report GC activity of a long stroke (one change-set entry per painted tile)."""
+
+    def stroke() -> tuple[AllocationReport, int]:
+        session = EditorSession(
+            game_map=GameMap(header=MapHeader(otbm_version=2, width=256, height=256)), brush_manager=BrushManager()
+        )
+        session.set_selected_brush(4526)
+        with AllocationProbe() as probe:
+            session.mouse_down(x=0, y=0, z=7)
+            for y in range(0, 64):
+                for x in range(0, 64):
+                    session.mouse_move(x=x, y=y, z=7)
+            session.mouse_up()
+        return probe.report, len(session.game_map.tiles)
+
+    report, tiles = benchmark.pedantic(stroke, rounds=3, iterations=1)
+
+    benchmark.extra_info["stroke"] = report.to_dict()
+    benchmark.extra_info["tracked_per_tile"] = round(report.tracked_allocations / tiles, 2)
+    assert tiles == 64 * 64
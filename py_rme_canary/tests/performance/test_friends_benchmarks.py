@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from py_rme_canary.logic_layer.social import FriendsService
+
+_USERS = 300
+
+
+def _seed_service(db_path: Path) -> tuple[FriendsService, list[int]]:
+    service = FriendsService.from_path(db_path)
+    host = service.ensure_user(username="host")
+    user_ids = [host.id]
+    for index in range(_USERS):
+        profile = service.ensure_user(username=f"mapper_{index:04d}")
+        request_id = service.send_friend_request(requester_id=host.id, target_username=profile.username)
+        service.accept_request(user_id=profile.id, request_id=request_id)
+        user_ids.append(profile.id)
+    return service, user_ids
+
+
+@pytest.mark.benchmark
+def test_presence_tick_benchmark(tmp_path: Path, benchmark) -> None:
+    """One presence poll tick: every user reports in, then the host refreshes its panel."""
+    service, user_ids = _seed_service(tmp_path / "friends.db")
+    statuses = ("online", "idle", "dnd")
+    tick = {"n": 0}
+
+    def presence_tick() -> None:
+        tick["n"] += 1
+        for offset, uid in enumerate(user_ids):
+            service.queue_presence(
+                user_id=uid,
+                status=statuses[(tick["n"] + offset) % len(statuses)],  # type: ignore[arg-type]
+                current_map=f"map_{offset % 7}.otbm",
+            )
+        service.heartbeat(user_ids)
+        service.snapshot(user_id=user_ids[0])
+
+    benchmark(presence_tick)
+    # 300 users in a single batched transaction plus one snapshot per tick.
+    assert benchmark.stats["mean"] < 0.250
+    service.close()
+
+
+@pytest.mark.benchmark
+def test_friend_search_benchmark(tmp_path: Path, benchmark) -> None:
+    service, _user_ids = _seed_service(tmp_path / "friends.db")
+
+    def search() -> None:
+        service.repo.search_users("mapper_01", limit=20)
+        service.repo.search_users("", limit=50)
+
+    benchmark(search)
+    assert benchmark.stats["mean"] < 0.050
+    service.close()
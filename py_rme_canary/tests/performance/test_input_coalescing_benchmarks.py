@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import time
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.geometry import get_brush_border_offsets, get_brush_offsets
+from py_rme_canary.logic_layer.input_coalescer import PointerCoalescer, stroke_footprint
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+_SIDE = 512
+_TILE_PX = 32
+_EVENTS_PER_FRAME = 16  # 1000 Hz mouse, 60 Hz frames
+_BRUSH = 5
+_OFFSETS = get_brush_offsets(_BRUSH, "circle")
+_BORDER = get_brush_border_offsets(_BRUSH, "circle")
+
+
+def _drag(step_px: int, tiles: int) -> list[tuple[int, int]]:
+    """Pointer samples of a diagonal-ish drag, ``step_px`` pixels apart."""
+    events = []
+    for i in range(0, tiles * _TILE_PX, step_px):
+        events.append((40 * _TILE_PX + i, 40 * _TILE_PX + i // 3))
+    return events
+
+
+def _line_tiles(x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int]]:
+    steps = max(abs(x1 - x0), abs(y1 - y0))
+    return [(x0 + round((x1 - x0) * i / steps), y0 + round((y1 - y0) * i / steps)) for i in range(steps + 1)]
+
+
+def _session() -> EditorSession:
+    session = EditorSession(
+        game_map=GameMap(header=MapHeader(otbm_version=2, width=_SIDE, height=_SIDE)), brush_manager=BrushManager()
+    )
+    session.set_selected_brush(4526)
+    return session
+
+
+def _paint(session: EditorSession, path: list[tuple[int, int]]) -> None:
+    for x, y in stroke_footprint(path, _BORDER, width=_SIDE, height=_SIDE):
+        session.mark_autoborder_position(x=x, y=y, z=7)
+    for x, y in stroke_footprint(path, _OFFSETS, width=_SIDE, height=_SIDE):
+        session.mouse_move(x=x, y=y, z=7)
+
+
+def _per_event(events: list[tuple[int, int]]) -> tuple[float, set]:
+    """The old canvas behaviour: a full footprint for every move event."""
+    session = _session()
+    session.mouse_down(x=events[0][0] // _TILE_PX, y=events[0][1] // _TILE_PX, z=7)
+    gc.disable()  # like timeit: a full collection of the suite's heap is not part of either path
+    try:
+        started = time.perf_counter()
+        for px, py in events:
+            _paint(session, [(px // _TILE_PX, py // _TILE_PX)])
+        elapsed = time.perf_counter() - started
+    finally:
+        gc.enable()
+    return elapsed, set(session.game_map.tiles)
+
+
+def _coalesced(events: list[tuple[int, int]]) -> tuple[float, set, PointerCoalescer]:
+    session = _session()
+    coalescer = PointerCoalescer()
+    first = (events[0][0] // _TILE_PX, events[0][1] // _TILE_PX)
+    session.mouse_down(x=first[0], y=first[1], z=7)
+    _paint(session, [first])
+    coalescer.begin_stroke(*first)
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for i, (px, py) in enumerate(events, start=1):
+            coalescer.extend_stroke(px // _TILE_PX, py // _TILE_PX)
+            coalescer.move(px, py)
+            if i % _EVENTS_PER_FRAME == 0 or i == len(events):
+                coalescer.mark_frame()
+                path, _alt = coalescer.take_stroke()
+                coalescer.take_pointer()
+                _paint(session, path)
+        elapsed = time.perf_counter() - started
+    finally:
+        gc.enable()
+    return elapsed, set(session.game_map.tiles), coalescer
+
+
+@pytest.mark.benchmark
+def test_slow_drag_costs_less_per_event_when_coalesced(benchmark) -> None:
+    events = _drag(step_px=4, tiles=120)  # eight events per tile
+    raw_s, raw_tiles = _per_event(events)
+
+    coalesced_s, tiles, coalescer = benchmark.pedantic(lambda: _coalesced(events), rounds=3, iterations=1)
+
+    benchmark.extra_info["events"] = len(events)
+    benchmark.extra_info["frames"] = coalescer.stats.frames
+    benchmark.extra_info["per_event_us_raw"] = round(raw_s / len(events) * 1e6, 1)
+    benchmark.extra_info["per_event_us_coalesced"] = round(coalesced_s / len(events) * 1e6, 1)
+    assert tiles == raw_tiles
+    assert coalesced_s * 4 < raw_s
+
+
+@pytest.mark.benchmark
+def test_fast_drag_leaves_no_gaps(benchmark) -> None:
+    events = _drag(step_px=12 * _TILE_PX, tiles=240)  # twelve tiles between events: wider than a size-5 brush
+    _raw_s, raw_tiles = _per_event(events)
+
+    _coalesced_s, tiles, coalescer = benchmark.pedantic(lambda: _coalesced(events), rounds=3, iterations=1)
+
+    x0, y0 = events[0][0] // _TILE_PX, events[0][1] // _TILE_PX
+    x1, y1 = events[-1][0] // _TILE_PX, events[-1][1] // _TILE_PX
+    centre_line = {(x, y, 7) for x, y in _line_tiles(x0, y0, x1, y1)}
+    benchmark.extra_info["events"] = len(events)
+    benchmark.extra_info["tiles_raw"] = len(raw_tiles)
+    benchmark.extra_info["tiles_coalesced"] = len(tiles)
+    benchmark.extra_info["stroke_tiles"] = coalescer.stats.stroke_tiles
+    assert raw_tiles < tiles
+    assert centre_line - raw_tiles  # the old path left holes along the drag
+    assert centre_line <= tiles
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.io.otbm.loader import OTBMLoader
+from py_rme_canary.core.io.otbm_saver import save_game_map_bundle_atomic
+
+_SIZE = 160  # 25,600 tiles
+
+
+def _synthetic_map_path(tmp_path: Path) -> Path:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=_SIZE, height=_SIZE))
+    for x in range(_SIZE):
+        for y in range(_SIZE):
+            items = [Item(id=4500 + (x + y) % 8)]
+            if (x * 7 + y) % 5 == 0:
+                items.append(Item(id=2148, count=1 + (x % 3)))
+            if (x * 13 + y * 3) % 97 == 0:
+                items.append(Item(id=1387, action_id=1000 + x))
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=4526 + (x * y) % 4), items=items))
+    path = tmp_path / "synthetic.otbm"
+    save_game_map_bundle_atomic(str(path), game_map, id_mapper=None)
+    return path
+
+
+def _traced_load(path: Path) -> tuple[int, GameMap]:
+    tracemalloc.start()
+    try:
+        game_map = OTBMLoader().load(str(path))
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return allocated, game_map
+
+
+@pytest.mark.benchmark
+def test_item_interning_bytes_per_tile(tmp_path: Path, benchmark, monkeypatch) -> None:
+    """Report bytes per loaded tile with one Item per slot (before) and shared plain items (after)."""
+    path = _synthetic_map_path(tmp_path)
+
+    after_bytes, shared = _traced_load(path)
+    tiles = shared.tiles
+    assert len(tiles) == _SIZE * _SIZE
+    assert tiles[(0, 0, 7)].items[0] is tiles[(8, 0, 7)].items[0]
+    del shared, tiles
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Item, "plain", classmethod(lambda cls, item_id, **fields: cls(id=item_id, **fields)))
+        before_bytes, unshared = _traced_load(path)
+    assert unshared.tiles[(0, 0, 7)].items[0] is not unshared.tiles[(8, 0, 7)].items[0]
+    del unshared
+
+    tile_count = _SIZE * _SIZE
+    per_tile_before = before_bytes / tile_count
+    per_tile_after = after_bytes / tile_count
+    benchmark.extra_info["bytes_per_tile_before"] = round(per_tile_before, 1)
+    benchmark.extra_info["bytes_per_tile_after"] = round(per_tile_after, 1)
+    assert per_tile_after < per_tile_before
+
+    benchmark.pedantic(lambda: OTBMLoader().load(str(path)), rounds=3, iterations=1)
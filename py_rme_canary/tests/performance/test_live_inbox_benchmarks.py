@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_packets import PacketType
+from py_rme_canary.core.protocols.tile_serializer import encode_tile_update
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+_SIDE = 150  # a peer repeatedly filling the same 150x150 area
+_PASSES = 8
+
+
+def _burst() -> list[bytes]:
+    payloads = []
+    for grounds in range(_PASSES):
+        for y in range(_SIDE):
+            row = [Tile(x=x, y=y, z=7, ground=Item(id=100 + grounds)) for x in range(_SIDE)]
+            payloads.append(encode_tile_update(row))
+    return payloads
+
+
+def _session() -> tuple[EditorSession, LiveClient, list[int]]:
+    header = MapHeader(otbm_version=2, width=_SIDE, height=_SIDE)
+    session = EditorSession(game_map=GameMap(header=header), brush_manager=BrushManager())
+    client = LiveClient()
+    session._live_client = client
+    notifications: list[int] = []
+    session.on_tiles_changed = lambda changed: notifications.append(len(changed))
+    return session, client, notifications
+
+
+@pytest.mark.benchmark
+def test_burst_is_applied_within_the_frame_budget(benchmark) -> None:
+    payloads = _burst()
+
+    def receive_and_apply() -> tuple[int, float, int]:
+        session, client, notifications = _session()
+        for payload in payloads:
+            client._handle_packet(int(PacketType.TILE_UPDATE), payload)
+        polls = 0
+        worst_ms = 0.0
+        while len(client.inbox):
+            started = time.perf_counter()
+            session.process_live_events()
+            worst_ms = max(worst_ms, (time.perf_counter() - started) * 1000.0)
+            polls += 1
+        assert sum(notifications) == _SIDE * _SIDE
+        assert len(notifications) == polls
+        return polls, worst_ms, len(session.game_map.tiles)
+
+    polls, worst_ms, tiles = benchmark.pedantic(receive_and_apply, rounds=3, iterations=1)
+
+    benchmark.extra_info["packets"] = len(payloads)
+    benchmark.extra_info["tiles_received"] = len(payloads) * _SIDE
+    benchmark.extra_info["tiles_applied"] = tiles
+    benchmark.extra_info["polls"] = polls
+    benchmark.extra_info["worst_poll_ms"] = round(worst_ms, 1)
+    assert tiles == _SIDE * _SIDE
+    assert polls > 1
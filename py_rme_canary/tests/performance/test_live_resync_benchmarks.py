@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import socket
+import time
+from collections.abc import Callable
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols.live_client import ReconnectConfig
+from py_rme_canary.core.protocols.live_packets import ConnectionState, PacketType
+from py_rme_canary.core.protocols.live_sync import iter_sync_chunks
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+_SIDE = 300  # 90k tiles on the host map
+_EDITS = 500  # tiles changed on the host while the client is offline
+
+
+def _host_map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=_SIDE, height=_SIDE))
+    for x in range(_SIDE):
+        for y in range(_SIDE):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=100 + (x + y) % 8), items=[Item(id=2000, subtype=1)]))
+    return game_map
+
+
+def _wire_view(game_map: GameMap) -> dict[tuple[int, int, int], tuple[int, list[int]]]:
+    # What the live tile encoding carries: ground and item ids.
+    return {
+        key: (tile.ground.id if tile.ground else 0, [item.id for item in tile.items])
+        for key, tile in game_map.tiles.items()
+    }
+
+
+class _Loopback:
+    """A hosting session and a connected client session on 127.0.0.1."""
+
+    def __init__(self) -> None:
+        self.host = EditorSession(game_map=_host_map(), brush_manager=BrushManager())
+        assert self.host.start_live_server(port=0)
+        port = self.host._live_server.socket.getsockname()[1]
+
+        self.client = EditorSession(
+            game_map=GameMap(header=MapHeader(otbm_version=2, width=_SIDE, height=_SIDE)),
+            brush_manager=BrushManager(),
+        )
+        assert self.client.connect_live("127.0.0.1", port, name="mapper")
+        self.live = self.client._live_client
+        self.live.reconnect_config = ReconnectConfig(base_delay=0.2, jitter=0.0)
+
+        # Tally resync traffic on the client's receive thread.
+        self.sync_bytes = 0
+        handle = self.live._handle_packet
+
+        def counting_handle(packet_type: int, payload: bytes) -> None:
+            if packet_type == PacketType.SYNC_CHUNK:
+                self.sync_bytes += len(payload) + 8
+            handle(packet_type, payload)
+
+        self.live._handle_packet = counting_handle
+
+    def pump_until(self, done: Callable[[], bool], timeout: float = 60.0) -> None:
+        deadline = time.perf_counter() + timeout
+        while not done():
+            assert time.perf_counter() < deadline, "loopback timed out"
+            self.host.process_live_events()
+            self.client.process_live_events()
+            time.sleep(0.001)
+
+    @staticmethod
+    def wait_until(done: Callable[[], bool], timeout: float = 10.0) -> None:
+        deadline = time.perf_counter() + timeout
+        while not done():
+            assert time.perf_counter() < deadline, "loopback timed out"
+            time.sleep(0.001)
+
+    def synced(self) -> bool:
+        return bool(self.live.sync_epoch) and not self.live.sync_pending and not len(self.live.inbox)
+
+    def resync(self, until: Callable[[], bool]) -> tuple[int, float]:
+        self.sync_bytes = 0
+        started = time.perf_counter()
+        self.pump_until(until)
+        return self.sync_bytes, (time.perf_counter() - started) * 1000.0
+
+    def close(self) -> None:
+        self.client.disconnect_live()
+        self.host.stop_live_server()
+
+
+@pytest.mark.benchmark
+def test_reconnect_resyncs_only_missed_changes(benchmark) -> None:
+    loop = _Loopback()
+    try:
+        full_bytes, full_ms = loop.resync(loop.synced)
+        assert _wire_view(loop.client.game_map) == _wire_view(loop.host.game_map)
+
+        # Wi-Fi blip: drop the connection and edit while the client is away.
+        loop.live.socket.shutdown(socket.SHUT_RDWR)
+        loop.pump_until(lambda: loop.live.state == ConnectionState.DISCONNECTED)
+        changed = set()
+        for i in range(_EDITS):
+            tile = Tile(x=i % _SIDE, y=i // _SIDE, z=7, ground=Item(id=900))
+            loop.host.game_map.set_tile(tile)
+            changed.add((tile.x, tile.y, tile.z))
+        loop.host._emit_tiles_changed(changed)
+        epoch, seq = loop.live.sync_epoch, loop.live.sync_seq
+
+        # Time the resync from the moment the auto-reconnect is through.
+        loop.wait_until(lambda: loop.live.state >= ConnectionState.CONNECTED)
+        delta_bytes, delta_ms = loop.resync(lambda: loop.synced() and loop.live.sync_seq > seq)
+        assert loop.live.sync_epoch == epoch
+        assert _wire_view(loop.client.game_map) == _wire_view(loop.host.game_map)
+
+        journal = loop.host._live_server.journal
+
+        def answer_delta() -> int:
+            _seq, tiles = journal.changes_since(epoch, seq)
+            return sum(len(chunk) for chunk in iter_sync_chunks(epoch, journal.seq, tiles))
+
+        answer_bytes = benchmark.pedantic(answer_delta, rounds=5, iterations=1)
+    finally:
+        loop.close()
+
+    benchmark.extra_info["tiles"] = _SIDE * _SIDE
+    benchmark.extra_info["full_resync_kb"] = round(full_bytes / 1024, 1)
+    benchmark.extra_info["full_resync_ms"] = round(full_ms, 1)
+    benchmark.extra_info["delta_resync_kb"] = round(delta_bytes / 1024, 1)
+    benchmark.extra_info["delta_resync_ms"] = round(delta_ms, 1)
+    assert delta_bytes * 50 < full_bytes
+    assert answer_bytes < delta_bytes
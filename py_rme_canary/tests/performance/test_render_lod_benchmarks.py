@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import gc
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QRect  # noqa: E402
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader  # noqa: E402
+from py_rme_canary.core.data.item import Item  # noqa: E402
+from py_rme_canary.core.data.tile import Tile  # noqa: E402
+from py_rme_canary.logic_layer.chunk_colors import tiles_version  # noqa: E402
+from py_rme_canary.logic_layer.drawing_options import DrawingOptions  # noqa: E402
+from py_rme_canary.logic_layer.render_optimizer import FrameMode, LevelOfDetail, LODManager  # noqa: E402
+from py_rme_canary.vis_layer.renderer.map_drawer import MapDrawer  # noqa: E402
+from py_rme_canary.vis_layer.renderer.map_layer import RetainedMapLayer, map_layer_key  # noqa: E402
+from py_rme_canary.vis_layer.renderer.qpainter_backend import QPainterRenderBackend  # noqa: E402
+
+_SIDE = 512
+_RECT = QRect(0, 0, 1280, 800)
+_SPRITE_IDS = 64
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture(scope="module")
+def dense_map(app) -> GameMap:
+    """Every tile of floor 7 has a ground and two items."""
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=_SIDE, height=_SIDE))
+    for x in range(_SIDE):
+        for y in range(_SIDE):
+            game_map.set_tile(
+                Tile(
+                    x=x,
+                    y=y,
+                    z=7,
+                    ground=Item(id=100 + (x ^ y) % 8),
+                    items=[Item(id=1000 + (x * 31 + y) % _SPRITE_IDS), Item(id=2000 + (x + y * 17) % _SPRITE_IDS)],
+                )
+            )
+    return game_map
+
+
+def _sprite_lookup():
+    cache: dict[tuple[int, int], QPixmap] = {}
+
+    def lookup(sprite_id: int, size: int) -> QPixmap:
+        key = (int(sprite_id), int(size))
+        pm = cache.get(key)
+        if pm is None:
+            pm = cache[key] = QPixmap(int(size), int(size))
+            pm.fill(QColor(int(sprite_id) % 255, 90, 140, 200))
+        return pm
+
+    return lookup
+
+
+def _drawer(game_map: GameMap, tile_px: int, *, lod: bool) -> MapDrawer:
+    opts = DrawingOptions()
+    opts.show_shade = False
+    drawer = MapDrawer(options=opts, game_map=game_map)
+    if not lod:
+        drawer.lod_manager = LODManager([LevelOfDetail(0.0, True, True, True, True)])
+    drawer.viewport.origin_x = 100
+    drawer.viewport.origin_y = 100
+    drawer.viewport.tile_px = tile_px
+    drawer.viewport.width_px = _RECT.width()
+    drawer.viewport.height_px = _RECT.height()
+    return drawer
+
+
+def _full_frames(drawer: MapDrawer, frames: int) -> float:
+    """Seconds per frame when the whole map layer is redrawn."""
+    image = QImage(_RECT.width(), _RECT.height(), QImage.Format.Format_ARGB32_Premultiplied)
+    lookup = _sprite_lookup()
+    gc.disable()  # like timeit: a full collection of the suite's heap is not part of a frame
+    try:
+        started = time.perf_counter()
+        for i in range(frames):
+            drawer.viewport.origin_x = 100 + i % 2  # a pan: nothing can be reused
+            painter = QPainter(image)
+            backend = QPainterRenderBackend(painter, target_rect=_RECT, sprite_lookup=lookup)
+            drawer.draw(backend)
+            backend.flush()
+            painter.end()
+        return (time.perf_counter() - started) / frames
+    finally:
+        gc.enable()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("tile_px", [32, 16, 12, 8, 6])
+def test_frame_time_per_zoom_level(benchmark, dense_map, tile_px: int) -> None:
+    frames = 3 if tile_px >= 12 else 2
+    full_detail_s = _full_frames(_drawer(dense_map, tile_px, lod=False), frames)
+    drawer = _drawer(dense_map, tile_px, lod=True)
+    _full_frames(drawer, 1)  # build chunk textures once, as the first zoomed-out frame does
+
+    lod_s = benchmark.pedantic(lambda: _full_frames(drawer, frames), rounds=3, iterations=1)
+
+    lod = drawer.get_lod()
+    benchmark.extra_info["tile_px"] = tile_px
+    benchmark.extra_info["visible_tiles"] = drawer.viewport.tiles_wide * drawer.viewport.tiles_high
+    benchmark.extra_info["lod"] = "chunks" if lod.chunk_textures else "colors" if not lod.show_sprites else "sprites"
+    benchmark.extra_info["full_detail_ms"] = round(full_detail_s * 1000, 2)
+    benchmark.extra_info["lod_ms"] = round(lod_s * 1000, 2)
+    if lod.chunk_textures:
+        assert lod_s * 20 < full_detail_s
+    elif not lod.show_sprites:
+        assert lod_s * 1.5 < full_detail_s
+
+
+@pytest.mark.benchmark
+def test_retained_layer_skips_and_patches_frames(benchmark, dense_map) -> None:
+    drawer = _drawer(dense_map, 32, lod=True)
+    layer = RetainedMapLayer()
+    lookup = _sprite_lookup()
+    image = QImage(_RECT.width(), _RECT.height(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def frame() -> FrameMode:
+        painter = QPainter(image)
+        plan = layer.paint(
+            painter,
+            drawer,
+            key=map_layer_key(None, drawer, 1.0),
+            version=tiles_version(dense_map),
+            target_rect=_RECT,
+            device_pixel_ratio=1.0,
+            make_backend=lambda target: QPainterRenderBackend(target, target_rect=_RECT, sprite_lookup=lookup),
+        )
+        painter.end()
+        return plan.mode
+
+    def edit_and_frame() -> FrameMode:
+        changed = [(x, y, 7) for x in range(110, 113) for y in range(110, 113)]
+        for x, y, z in changed:
+            tile = dense_map.get_tile(x, y, z)
+            dense_map.set_tile(Tile(x=x, y=y, z=z, ground=tile.ground, items=list(reversed(tile.items))))
+        layer.mark_tiles(changed, version=tiles_version(dense_map))
+        return frame()
+
+    started = time.perf_counter()
+    assert frame() is FrameMode.FULL
+    full_s = time.perf_counter() - started
+    started = time.perf_counter()
+    assert frame() is FrameMode.SKIP
+    skip_s = time.perf_counter() - started
+
+    assert benchmark.pedantic(edit_and_frame, rounds=3, iterations=1) is FrameMode.PARTIAL
+
+    partial_s = benchmark.stats.stats.mean
+    benchmark.extra_info["full_ms"] = round(full_s * 1000, 2)
+    benchmark.extra_info["skip_ms"] = round(skip_s * 1000, 2)
+    benchmark.extra_info["partial_ms"] = round(partial_s * 1000, 2)
+    benchmark.extra_info["planner"] = layer.planner.stats.to_dict()
+    assert skip_s * 10 < full_s
+    assert partial_s < full_s
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.script_engine import MapAPI, ScriptConfig
+
+_SIZE = 512  # 262,144 tiles on one floor of a 4096x4096 map
+
+
+def _grass_map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=4096, height=4096))
+    grass = Item.plain(4526)
+    bush = Item.plain(2767)
+    for x in range(_SIZE):
+        for y in range(_SIZE):
+            items = [bush] if (x * 31 + y) % 16 == 0 else []
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=grass, items=items))
+    return game_map
+
+
+@pytest.mark.benchmark
+def test_script_bulk_edit_as_one_action(benchmark) -> None:
+    game_map = _grass_map()
+    api = MapAPI(game_map, ScriptConfig())
+
+    started = time.perf_counter()
+    found = api.find_items(2767, floor=7)
+    index_ms = (time.perf_counter() - started) * 1000.0
+    assert len(found) == _SIZE * _SIZE // 16
+
+    def run() -> None:
+        committed = []
+        edit = MapAPI(game_map, ScriptConfig(), on_commit=committed.append)
+        with edit.batch():
+            edit.fill_region(0, 0, _SIZE - 1, _SIZE - 1, 7, 919)
+            edit.replace_in_region(0, 0, _SIZE - 1, _SIZE - 1, 7, 2767, 2768)
+        assert len(committed) == 1 and len(committed[0].tiles_after) == _SIZE * _SIZE
+        committed[0].undo(game_map)
+
+    benchmark.extra_info["tiles"] = _SIZE * _SIZE
+    benchmark.extra_info["find_items_ms"] = round(index_ms, 1)
+    benchmark.pedantic(run, rounds=3, iterations=1)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from py_rme_canary.logic_layer.search_results import SearchColumn, SearchResult, SearchResultStore
+
+_HITS = 300_000  # a common ground ID on a large map
+
+
+def _store() -> SearchResultStore:
+    return SearchResultStore(
+        SearchResult(x=x % 2048, y=x // 2048, z=7, item_id=4526, item_name="grass", details="Ground")
+        for x in range(_HITS)
+    )
+
+
+@pytest.mark.benchmark
+def test_filter_and_sort_large_result_set(benchmark) -> None:
+    started = time.perf_counter()
+    store = _store()
+    build_ms = (time.perf_counter() - started) * 1000.0
+
+    def query() -> int:
+        rows = store.filter_rows("5, ")
+        return len(store.sort_rows(rows, SearchColumn.POSITION, descending=True))
+
+    assert query() > 0
+    benchmark.extra_info["hits"] = _HITS
+    benchmark.extra_info["build_ms"] = round(build_ms, 1)
+    benchmark.pedantic(query, rounds=3, iterations=1)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+from py_rme_canary.core.data.item import Position
+from py_rme_canary.core.data.spawns import MonsterSpawnArea, MonsterSpawnEntry
+from py_rme_canary.core.io.spawn_xml import load_monster_spawns, save_monster_spawns
+from py_rme_canary.core.io.xml.safe import safe_etree
+
+_AREAS = 40_000  # ~120k monster entries, roughly 10 MB of XML
+
+
+def _areas() -> list[MonsterSpawnArea]:
+    names = ("Rat", "Cave Rat", "Rotworm", "Dragon Lord")
+    return [
+        MonsterSpawnArea(
+            center=Position(1000 + i % 1000, 1000 + i // 1000, 7),
+            radius=3,
+            monsters=tuple(
+                MonsterSpawnEntry(name=names[(i + j) % len(names)], dx=j - 1, dy=1 - j, spawntime=60) for j in range(3)
+            ),
+        )
+        for i in range(_AREAS)
+    ]
+
+
+def _peak_bytes(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+def test_monster_spawn_load_and_save(benchmark, tmp_path) -> None:
+    path = tmp_path / "map-monster.xml"
+    areas = _areas()
+
+    started = time.perf_counter()
+    assert save_monster_spawns(path, areas) is True
+    save_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    assert save_monster_spawns(path, areas) is False
+    unchanged_save_ms = (time.perf_counter() - started) * 1000.0
+
+    streamed = _peak_bytes(lambda: load_monster_spawns(path))
+    dom = _peak_bytes(lambda: safe_etree.parse(str(path)))
+
+    benchmark.extra_info["file_mb"] = round(path.stat().st_size / 1e6, 1)
+    benchmark.extra_info["save_ms"] = round(save_ms, 1)
+    benchmark.extra_info["unchanged_save_ms"] = round(unchanged_save_ms, 1)
+    benchmark.extra_info["load_peak_mb"] = round(streamed / 1e6, 1)
+    benchmark.extra_info["dom_parse_peak_mb"] = round(dom / 1e6, 1)
+    assert streamed < dom
+
+    loaded = benchmark.pedantic(load_monster_spawns, args=(path,), rounds=3, iterations=1)
+    assert len(loaded) == _AREAS
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.teleport_manager import TeleportManager
+
+_TELEPORTS = 100_000
+_WIDTH = 1000
+
+
+def _teleport_map() -> GameMap:
+    """Sparse 1000x1000 map whose only tiles are 100k paired teleports."""
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=_WIDTH, height=_WIDTH))
+    ground = Item.plain(4526)
+    for index in range(_TELEPORTS):
+        x, y = (index * 10) % _WIDTH, (index * 10) // _WIDTH
+        pair = index ^ 1
+        destination = Position(x=(pair * 10) % _WIDTH, y=(pair * 10) // _WIDTH, z=7)
+        game_map.set_tile(Tile(x=x, y=y, z=7, ground=ground, items=[Item(id=1387, destination=destination)]))
+    return game_map
+
+
+@pytest.mark.benchmark
+def test_teleport_scan_and_incremental_validation(benchmark) -> None:
+    game_map = _teleport_map()
+    manager = TeleportManager(game_map)
+    assert manager.scan_map() == _TELEPORTS
+    assert manager.validate_all().valid_links == _TELEPORTS
+
+    game_map.delete_tile(0, 0, 7)
+    manager.notify_tiles_changed({(0, 0, 7)})
+    result = manager.validate_all()
+    assert [link.source for link in result.broken_links] == [(10, 0, 7)]
+
+    benchmark.extra_info["teleports"] = _TELEPORTS
+    benchmark.pedantic(manager.scan_map, rounds=3, iterations=1)
@@ -44,3 +44,24 @@ def test_serialize_and_load_clientid_map(tmp_path: Path) -> None:
     assert loaded_tile.ground is not None
     assert loaded_tile.ground.id == 100
     assert loaded_tile.ground.client_id == 200
+
+
+def test_item_parser_shares_plain_items_only() -> None:
+    parser = ItemParser(items_db=None, id_mapper=None, otbm_version=2)
+
+    def parse(raw: bytes) -> Item:
+        return parser.parse_item_payload(EscapedPayloadReader(BytesIO(raw + bytes([NODE_END]))))
+
+    first = parse((100).to_bytes(2, "little"))
+    second = parse((100).to_bytes(2, "little"))
+    assert first is second
+    assert first is Item.plain(100)
+    assert first == Item(id=100)
+
+    # OTBM_ATTR_ACTION_ID (4): items with attributes get their own object.
+    with_action = parse((100).to_bytes(2, "little") + bytes([4]) + (1000).to_bytes(2, "little"))
+    assert with_action is not first
+    assert with_action.action_id == 1000
+    assert not with_action.is_plain
+    assert with_action.interned() is with_action
+    assert Item(id=100).interned() is first
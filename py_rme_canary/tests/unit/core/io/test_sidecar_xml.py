@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from py_rme_canary.core.data.houses import House
+from py_rme_canary.core.data.item import Position
+from py_rme_canary.core.data.spawns import MonsterSpawnArea, MonsterSpawnEntry, NpcSpawnArea, NpcSpawnEntry
+from py_rme_canary.core.data.zones import Zone
+from py_rme_canary.core.exceptions.io import HousesXmlError, SpawnXmlError, ZonesXmlError
+from py_rme_canary.core.io.houses_xml import build_houses_xml, load_houses, parse_houses_xml, save_houses
+from py_rme_canary.core.io.spawn_xml import (
+    build_monster_spawns_xml,
+    load_monster_spawns,
+    load_npc_spawns,
+    parse_monster_spawns_xml,
+    save_monster_spawns,
+    save_npc_spawns,
+)
+from py_rme_canary.core.io.zones_xml import build_zones_xml, load_zones, parse_zones_xml, save_zones
+
+
+def _areas() -> list[MonsterSpawnArea]:
+    return [
+        MonsterSpawnArea(
+            center=Position(100, 200, 7),
+            radius=3,
+            monsters=(
+                MonsterSpawnEntry(name="Rat", dx=-1, dy=2, spawntime=60, direction=2),
+                MonsterSpawnEntry(name='Giant "Spider" & <Co>', dx=0, dy=0, spawntime=90, weight=5),
+            ),
+        ),
+        MonsterSpawnArea(center=Position(300, 400, 8), radius=1),
+    ]
+
+
+def test_monster_spawns_are_written_one_line_per_element() -> None:
+    text = build_monster_spawns_xml(_areas())
+    assert text == (
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        "<monsters>\n"
+        '\t<monster centerx="100" centery="200" centerz="7" radius="3">\n'
+        '\t\t<monster name="Rat" x="-1" y="2" z="7" spawntime="60" direction="2" />\n'
+        '\t\t<monster name="Giant &quot;Spider&quot; &amp; &lt;Co&gt;" x="0" y="0" z="7" spawntime="90" weight="5" />\n'
+        "\t</monster>\n"
+        '\t<monster centerx="300" centery="400" centerz="8" radius="1" />\n'
+        "</monsters>\n"
+    )
+    assert build_monster_spawns_xml([]) == "<?xml version='1.0' encoding='utf-8'?>\n<monsters />"
+
+
+def test_sidecars_round_trip_through_files(tmp_path) -> None:
+    areas = tuple(_areas())
+    npcs = (NpcSpawnArea(center=Position(50, 60, 7), radius=2, npcs=(NpcSpawnEntry(name="Ünï\tcode", dx=1, dy=-1),)),)
+    houses = [
+        House(id=2, name="Guild\nHall", entry=Position(10, 11, 7), rent=500, guildhall=True, townid=1),
+        House(id=1, name="Flat", entry=None, rent=100, townid=1, size=12, beds=2),
+    ]
+    zones = [Zone(id=3, name="Arena"), Zone(id=0, name="Dropped")]
+
+    save_monster_spawns(tmp_path / "monsters.xml", areas)
+    save_npc_spawns(tmp_path / "npcs.xml", npcs)
+    save_houses(tmp_path / "houses.xml", houses)
+    save_zones(tmp_path / "zones.xml", zones)
+
+    assert load_monster_spawns(tmp_path / "monsters.xml") == areas
+    assert load_npc_spawns(tmp_path / "npcs.xml") == npcs
+    assert load_houses(tmp_path / "houses.xml") == {house.id: house for house in houses}
+    assert load_zones(tmp_path / "zones.xml") == {3: Zone(id=3, name="Arena")}
+    assert parse_houses_xml(build_houses_xml(houses)) == load_houses(tmp_path / "houses.xml")
+    assert parse_zones_xml(build_zones_xml(zones)) == load_zones(tmp_path / "zones.xml")
+
+
+def test_readers_reject_wrong_roots_and_entity_expansion(tmp_path) -> None:
+    with pytest.raises(SpawnXmlError):
+        parse_monster_spawns_xml("<npcs><npc/></npcs>")
+    with pytest.raises(HousesXmlError):
+        parse_houses_xml("<zones/>")
+    with pytest.raises(ZonesXmlError):
+        parse_zones_xml("<houses/>")
+
+    bomb = tmp_path / "zones.xml"
+    bomb.write_text('<!DOCTYPE zones [<!ENTITY a "aaaa">]><zones><zone name="&a;" zoneid="1"/></zones>')
+    with pytest.raises(ValueError):
+        load_zones(bomb)
+
+
+def test_save_skips_unchanged_sidecars(tmp_path) -> None:
+    path = tmp_path / "monsters.xml"
+    assert save_monster_spawns(path, _areas()) is True
+    os.utime(path, ns=(1, 1))
+
+    assert save_monster_spawns(path, _areas()) is False
+    assert path.stat().st_mtime_ns == 1
+
+    assert save_monster_spawns(path, _areas()[:1]) is True
+    assert load_monster_spawns(path) == tuple(_areas()[:1])
+
+    # Same size, different bytes: an edit made outside the editor is overwritten.
+    original = path.read_bytes()
+    path.write_bytes(original.replace(b"Rat", b"Bat"))
+    assert save_monster_spawns(path, _areas()[:1]) is True
+    assert path.read_bytes() == original
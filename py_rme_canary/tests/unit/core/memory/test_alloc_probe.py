@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from py_rme_canary.core.memory import AllocationProbe
+
+
+def _churn(count: int) -> list[list[int]]:
+    return [[i] for i in range(count)]
+
+
+def test_probe_counts_collections_and_retained_allocations() -> None:
+    with AllocationProbe() as probe:
+        kept = _churn(5000)
+        gc.collect(0)
+    report = probe.report
+
+    assert report.collections[0] >= 1
+    assert report.tracked_allocations > 4000
+    assert report.gc_pause_ms >= report.max_gc_pause_ms > 0.0
+    assert report.allocated_blocks > 0
+    assert report.wall_ms > 0.0
+    assert len(kept) == 5000
+    assert probe._on_gc not in gc.callbacks
+
+
+def test_freed_temporaries_are_not_counted_as_retained() -> None:
+    with AllocationProbe() as probe:
+        for i in range(5000):
+            _ = [i]
+    assert probe.report.tracked_allocations < 100
+
+
+def test_trace_memory_reports_peak_and_restores_tracing_state() -> None:
+    assert not tracemalloc.is_tracing()
+    with AllocationProbe(trace_memory=True) as probe:
+        data = bytearray(256 * 1024)
+    assert probe.report.peak_traced_kib >= 256
+    assert not tracemalloc.is_tracing()
+    assert probe.report.to_dict()["peak_traced_kib"] >= 256
+    del data
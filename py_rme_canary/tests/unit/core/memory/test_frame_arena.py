@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from py_rme_canary.core.memory import FrameArena
+
+
+@dataclass(slots=True)
+class _Record:
+    value: int = 0
+
+
+def test_reset_hands_out_the_same_objects_again() -> None:
+    arena: FrameArena[_Record] = FrameArena(_Record, name="records")
+    first = [arena.take() for _ in range(3)]
+    for i, record in enumerate(first):
+        record.value = i
+    assert list(arena) == first
+    assert arena.last() is first[-1]
+
+    arena.reset()
+    assert len(arena) == 0
+    assert arena.last() is None
+    again = [arena.take() for _ in range(2)]
+    assert again == first[:2] and again[0] is first[0]
+    assert list(arena) == again
+
+    stats = arena.stats
+    assert (stats.capacity, stats.in_use, stats.peak_in_use, stats.frames, stats.created) == (3, 2, 3, 1, 3)
+
+
+def test_preallocated_capacity_is_used_before_growing() -> None:
+    created = []
+
+    def factory() -> _Record:
+        created.append(1)
+        return _Record()
+
+    arena = FrameArena(factory, capacity=4)
+    assert len(created) == 4
+    for _ in range(4):
+        arena.take()
+    assert len(created) == 4
+    arena.take()
+    assert len(created) == 5 and arena.capacity == 5
+
+
+def test_shrink_keeps_objects_in_use() -> None:
+    arena = FrameArena(_Record, capacity=8)
+    taken = [arena.take() for _ in range(3)]
+    assert arena.shrink(0) == 5
+    assert list(arena) == taken and arena.capacity == 3
+    assert arena.stats.to_dict()["capacity"] == 3
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols import live_inbox
+from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_inbox import LiveTileInbox
+from py_rme_canary.core.protocols.live_packets import PacketType
+from py_rme_canary.core.protocols.live_sync import SYNC_DONE, SYNC_RESET, encode_sync_chunk, encode_sync_mark
+from py_rme_canary.core.protocols.tile_serializer import encode_tile, encode_tile_update
+
+
+def _tile(x: int, ground: int = 100) -> dict:
+    return {"x": x, "y": 0, "z": 7, "ground_id": ground, "items": []}
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.batches: list[list[dict]] = []
+        self.resets = 0
+
+    def apply(self, tiles: list[dict]) -> set[tuple[int, int, int]]:
+        self.batches.append(tiles)
+        return {(t["x"], t["y"], t["z"]) for t in tiles}
+
+    def on_reset(self) -> set[tuple[int, int, int]]:
+        self.resets += 1
+        return {(-1, -1, 7)}
+
+
+def test_pending_tiles_are_coalesced_to_the_latest_state() -> None:
+    inbox = LiveTileInbox()
+    inbox.put([_tile(1), _tile(2)])
+    inbox.put([_tile(1, ground=200), _tile(3)])
+    assert len(inbox) == 3
+
+    recorder = _Recorder()
+    changed = inbox.drain(recorder.apply, on_reset=recorder.on_reset, budget_ms=None)
+
+    assert changed == {(1, 0, 7), (2, 0, 7), (3, 0, 7)}
+    assert [(t["x"], t["ground_id"]) for t in recorder.batches[0]] == [(1, 200), (2, 100), (3, 100)]
+    stats = inbox.stats
+    assert (stats.queue_depth, stats.peak_queue_depth) == (0, 3)
+    assert (stats.tiles_received, stats.tiles_coalesced, stats.tiles_applied, stats.drains) == (4, 1, 3, 1)
+    assert stats.max_latency_ms >= stats.mean_latency_ms >= 0.0
+    assert inbox.drain(recorder.apply, on_reset=recorder.on_reset) == set()
+    assert inbox.stats.drains == 1
+
+
+def test_drain_stops_once_the_budget_is_spent(monkeypatch) -> None:
+    monkeypatch.setattr(live_inbox, "_DRAIN_BATCH", 4)
+    inbox = LiveTileInbox()
+    inbox.put([_tile(x) for x in range(10)])
+    recorder = _Recorder()
+
+    # An exhausted budget still applies one batch, so every drain makes progress.
+    assert len(inbox.drain(recorder.apply, on_reset=recorder.on_reset, budget_ms=0)) == 4
+    assert len(inbox) == 6
+    assert len(inbox.drain(recorder.apply, on_reset=recorder.on_reset, budget_ms=1000)) == 6
+    assert [len(batch) for batch in recorder.batches] == [4, 4, 2]
+
+
+def test_reset_drops_pending_tiles_and_clears_before_applying() -> None:
+    inbox = LiveTileInbox()
+    inbox.put([_tile(1), _tile(2)])
+    inbox.reset()
+    inbox.put([_tile(3)])
+    recorder = _Recorder()
+
+    changed = inbox.drain(recorder.apply, on_reset=recorder.on_reset)
+
+    assert recorder.resets == 1
+    assert changed == {(-1, -1, 7), (3, 0, 7)}
+    assert inbox.stats.tiles_coalesced == 2
+
+    # A reset arriving mid-drain stops it; the next drain resets first.
+    inbox.put([_tile(4)])
+
+    def apply_then_reset(tiles: list[dict]) -> set[tuple[int, int, int]]:
+        inbox.reset()
+        inbox.put([_tile(5)])
+        return recorder.apply(tiles)
+
+    inbox.put([_tile(x) for x in range(6, 600)])
+    inbox.drain(apply_then_reset, on_reset=recorder.on_reset, budget_ms=None)
+    assert len(recorder.batches) == 2
+    assert inbox.drain(recorder.apply, on_reset=recorder.on_reset) == {(-1, -1, 7), (5, 0, 7)}
+    assert recorder.resets == 2
+
+
+def test_client_decodes_tile_packets_on_the_receive_thread() -> None:
+    client = LiveClient()
+    tiles = [Tile(x=x, y=0, z=7, ground=Item(id=100)) for x in range(3)]
+
+    client._handle_packet(int(PacketType.TILE_UPDATE), encode_tile_update(tiles))
+    client._handle_packet(int(PacketType.TILE_UPDATE), b"\x01\x00\x00\x00")  # positions only
+    client._handle_packet(int(PacketType.MESSAGE), b"hi")
+    assert len(client.inbox) == 3
+    assert [packet_type for packet_type, _ in client._incoming_queue] == [PacketType.TILE_UPDATE, PacketType.MESSAGE]
+
+    client.sync_pending = True
+    chunk = encode_sync_chunk(9, 4, SYNC_RESET | SYNC_DONE, [encode_tile(tiles[0])])
+    client._handle_packet(int(PacketType.SYNC_CHUNK), chunk)
+    assert len(client.inbox) == 1
+    assert (client.sync_epoch, client.sync_seq, client.sync_pending) == (9, 4, False)
+
+    client._handle_packet(int(PacketType.SYNC_MARK), encode_sync_mark(9, 6))
+    assert client.sync_seq == 6
+    assert len(client._incoming_queue) == 2
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_packets import PacketType
+from py_rme_canary.core.protocols.live_server import LiveServer
+from py_rme_canary.core.protocols.live_sync import (
+    SYNC_DONE,
+    SYNC_RESET,
+    LiveChangeJournal,
+    decode_sync_chunk,
+    decode_sync_mark,
+    encode_sync_request,
+    iter_sync_chunks,
+)
+from py_rme_canary.core.protocols.tile_serializer import encode_tile, encode_tile_update
+
+
+def _update(*xs: int, item: int = 100) -> bytes:
+    return encode_tile_update([Tile(x=x, y=1, z=7, ground=Item(id=item)) for x in xs])
+
+
+def _decoded(tiles: list[bytes]) -> list[dict]:
+    (chunk,) = iter_sync_chunks(1, 1, tiles)
+    return decode_sync_chunk(chunk)["tiles"]
+
+
+def _xs(tiles: list[bytes]) -> list[int]:
+    return [tile["x"] for tile in _decoded(tiles)]
+
+
+def test_journal_serves_changes_since_a_sequence() -> None:
+    journal = LiveChangeJournal(epoch=42)
+    assert journal.record(_update(1, 2)) == 1
+    assert journal.record(_update(3)) == 2
+    assert journal.record(_update(1, item=200)) == 3
+    assert journal.record(b"\x01\x00\x02\x00\x07") == 3  # legacy position list: nothing to journal
+
+    seq, tiles = journal.changes_since(42, 1)
+    assert seq == 3
+    assert _xs(tiles) == [3, 1]
+    assert _decoded(tiles)[1]["ground_id"] == 200
+    assert journal.changes_since(42, 3) == (3, [])
+
+    # Other server run, never synced, or from the future: full sync.
+    assert journal.changes_since(7, 1) is None
+    assert journal.changes_since(0, 0) is None
+    assert journal.changes_since(42, 4) is None
+
+
+def test_truncated_journal_falls_back_to_full_sync() -> None:
+    journal = LiveChangeJournal(max_entries=2, epoch=42)
+    for x in range(1, 5):
+        journal.record(_update(x))
+
+    assert len(journal) == 2
+    assert journal.floor == 2
+    assert journal.changes_since(42, 1) is None
+    assert _xs(journal.changes_since(42, 2)[1]) == [3, 4]
+    assert _xs(journal.entries()[1]) == [3, 4]
+
+
+def test_sync_chunks_respect_the_byte_budget() -> None:
+    tiles = [encode_tile(Tile(x=x, y=0, z=7, ground=Item(id=1))) for x in range(10)]
+    chunks = list(iter_sync_chunks(5, 9, tiles, reset=True, budget=3 * len(tiles[0])))
+
+    decoded = [decode_sync_chunk(chunk) for chunk in chunks]
+    assert [len(chunk["tiles"]) for chunk in decoded] == [3, 3, 3, 1]
+    assert [chunk["flags"] for chunk in decoded] == [SYNC_RESET, 0, 0, SYNC_DONE]
+    assert [tile["x"] for chunk in decoded for tile in chunk["tiles"]] == list(range(10))
+    assert {(chunk["epoch"], chunk["seq"]) for chunk in decoded} == {(5, 9)}
+
+    (empty,) = iter_sync_chunks(5, 9, [], reset=True)
+    assert decode_sync_chunk(empty)["flags"] == SYNC_RESET | SYNC_DONE
+
+
+def _server_with_peer() -> tuple[LiveServer, Mock, list[tuple[int, bytes]]]:
+    server = LiveServer()
+    sent: list[tuple[int, bytes]] = []
+    peer = Mock()
+    peer.name = "Mapper"
+    peer.client_id = 1
+    peer.socket = object()
+    peer.send_packet.side_effect = lambda packet_type, payload: sent.append((int(packet_type), payload)) or True
+    server.clients[peer.socket] = peer
+    return server, peer, sent
+
+
+def _sync(server: LiveServer, peer: Mock, epoch: int, since: int, game_map: GameMap | None = None) -> None:
+    snapshot = game_map.snapshot() if game_map is not None else None
+    server._send_sync(peer, epoch, since, snapshot)
+    if snapshot is not None:
+        assert snapshot.tiles.closed
+
+
+def test_server_relays_marks_and_answers_delta_and_full_syncs() -> None:
+    server, peer, sent = _server_with_peer()
+    epoch = server.journal.epoch
+
+    server.broadcast_tiles(_update(1))
+    server.broadcast_tiles(_update(2))
+    assert [packet_type for packet_type, _ in sent] == [PacketType.TILE_UPDATE, PacketType.SYNC_MARK] * 2
+    assert decode_sync_mark(sent[-1][1]) == (epoch, 2)
+
+    sent.clear()
+    _sync(server, peer, epoch, 1, GameMap(header=MapHeader(otbm_version=2, width=8, height=8)))
+    delta, tail = [decode_sync_chunk(payload) for _, payload in sent]
+    assert (delta["flags"], tail["flags"]) == (0, SYNC_DONE)
+    assert (tail["epoch"], tail["seq"]) == (epoch, 2)
+    assert [tile["x"] for tile in delta["tiles"]] == [2]
+    assert tail["tiles"] == []
+
+    # Unknown epoch: snapshot first (with reset), then the journal on top.
+    sent.clear()
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=8, height=8))
+    game_map.set_tile(Tile(x=5, y=5, z=7, ground=Item(id=9)))
+    _sync(server, peer, 0, 0, game_map)
+    chunks = [decode_sync_chunk(payload) for _, payload in sent]
+    assert [chunk["flags"] for chunk in chunks] == [SYNC_RESET, 0, SYNC_DONE]
+    assert [tile["x"] for chunk in chunks for tile in chunk["tiles"]] == [5, 1, 2]
+    assert chunks[-1]["seq"] == 2
+
+
+def test_sync_answer_does_not_block_relaying_and_ends_with_the_journal_tail() -> None:
+    server, peer, sent = _server_with_peer()
+    epoch = server.journal.epoch
+    server.broadcast_tiles(_update(1))
+    sent.clear()
+
+    relays: list[threading.Thread] = []
+
+    def send(packet_type: int, payload: bytes) -> bool:
+        sent.append((int(packet_type), payload))
+        if packet_type == PacketType.SYNC_CHUNK and decode_sync_chunk(payload)["flags"] == 0 and not relays:
+            # Another client's edit is relayed while the journal copy is on the wire.
+            relay = threading.Thread(target=server.broadcast_tiles, args=(_update(3, item=300),))
+            relays.append(relay)
+            relay.start()
+            relay.join(timeout=5)
+            assert not relay.is_alive()
+        return True
+
+    peer.send_packet.side_effect = send
+    _sync(server, peer, 0, 0, GameMap(header=MapHeader(otbm_version=2, width=8, height=8)))
+
+    chunks = [decode_sync_chunk(payload) for packet_type, payload in sent if packet_type == PacketType.SYNC_CHUNK]
+    assert [chunk["flags"] for chunk in chunks] == [SYNC_RESET, 0, SYNC_DONE]
+    assert [tile["x"] for tile in chunks[-1]["tiles"]] == [3]
+    assert (chunks[-1]["epoch"], chunks[-1]["seq"]) == (epoch, 2)
+
+
+def test_sync_requests_are_queued_for_the_host_with_the_client_id() -> None:
+    server, peer, sent = _server_with_peer()
+    peer.is_authenticated = True
+
+    server._process_packet(peer.socket, int(PacketType.SYNC_REQUEST), encode_sync_request(3, 4))
+    packet_type, request = server.pop_packet()
+    assert packet_type == PacketType.SYNC_REQUEST
+    assert request == (1).to_bytes(4, "little") + encode_sync_request(3, 4)
+
+    snapshot = Mock()
+    assert server.serve_sync((2).to_bytes(4, "little") + request[4:], snapshot) is False
+    snapshot.close.assert_called_once()
+
+
+def test_client_position_only_advances_once_a_sync_is_applied() -> None:
+    client = LiveClient()
+    client.send_packet = Mock(return_value=True)
+
+    client.request_sync()
+    client.send_packet.assert_called_once_with(PacketType.SYNC_REQUEST, encode_sync_request(0, 0))
+    client.advance_sync(42, 5)
+    assert (client.sync_epoch, client.sync_seq) == (0, 0)
+
+    client.finish_sync(42, 3)
+    client.advance_sync(42, 5)
+    client.advance_sync(7, 9)
+    assert (client.sync_epoch, client.sync_seq, client.sync_pending) == (42, 5, False)
+
+    client.request_sync()
+    client.advance_sync(42, 8)
+    client.begin_sync_reset()
+    assert (client.sync_epoch, client.sync_seq) == (0, 0)
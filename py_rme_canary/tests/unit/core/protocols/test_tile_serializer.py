@@ -52,3 +52,15 @@ def test_tile_update_decode_invalid_payload() -> None:
     tiles, ok = decode_tile_update(b"\x00\x01\x02\x03")
     assert ok is False
     assert tiles == []
+
+
+def test_tile_update_roundtrip_several_tiles_without_house_ids() -> None:
+    tiles = [Tile(x=x, y=2, z=7, ground=Item(id=100 + x)) for x in range(3)]
+    decoded, ok = decode_tile_update(encode_tile_update(tiles))
+
+    assert ok is True
+    assert [(tile["x"], tile["ground_id"], tile["house_id"]) for tile in decoded] == [
+        (0, 100, None),
+        (1, 101, None),
+        (2, 102, None),
+    ]
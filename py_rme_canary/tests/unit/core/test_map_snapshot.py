@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import gc
+import threading
+from pathlib import Path
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.data.tile_table import TileTable
+from py_rme_canary.logic_layer.autosave_manager import AutoSaveConfig, AutoSaveManager
+
+
+def _tile(x: int, y: int, ground: int = 4526) -> Tile:
+    return Tile(x=x, y=y, z=7, ground=Item(id=ground))
+
+
+def _map(size: int = 8) -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64), tiles={})
+    for x in range(size):
+        for y in range(size):
+            game_map.set_tile(_tile(x, y))
+    game_map.waypoints["temple"] = Position(x=1, y=1, z=7)
+    return game_map
+
+
+def test_snapshot_ignores_every_kind_of_later_write() -> None:
+    game_map = _map()
+    assert isinstance(game_map.tiles, TileTable)
+    expected = dict(game_map.tiles)
+
+    with game_map.snapshot() as snapshot:
+        game_map.set_tile(_tile(0, 0, 919))
+        game_map.set_tile(_tile(0, 0, 920))
+        game_map.delete_tile(1, 1, 7)
+        game_map.tiles.pop((2, 2, 7))
+        game_map.tiles.update({(3, 3, 7): _tile(3, 3, 919), (40, 40, 7): _tile(40, 40)})
+        game_map.tiles.setdefault((41, 41, 7), _tile(41, 41))
+        game_map.waypoints["depot"] = Position(x=2, y=2, z=7)
+
+        assert snapshot.tiles.get((0, 0, 7)) == expected[(0, 0, 7)]
+        assert (40, 40, 7) not in snapshot.tiles
+        assert snapshot.tiles.journal_size == 6
+
+        detached = snapshot.to_game_map()
+        assert detached.tiles == expected
+        assert list(detached.waypoints) == ["temple"]
+
+        game_map.tiles.clear()
+        assert snapshot.to_game_map().tiles == expected
+
+    assert game_map.tiles.open_views == 0
+
+
+def test_snapshot_closes_when_dropped() -> None:
+    game_map = _map()
+    snapshot = game_map.snapshot()
+    assert game_map.tiles.open_views == 1
+    del snapshot
+    gc.collect()
+    assert game_map.tiles.open_views == 0
+
+
+def test_snapshot_stays_consistent_while_another_thread_edits() -> None:
+    game_map = _map(32)
+    expected = dict(game_map.tiles)
+    snapshot = game_map.snapshot()
+    stop = threading.Event()
+
+    def edit() -> None:
+        ground = 919
+        while not stop.is_set():
+            for key in list(expected)[::7]:
+                game_map.set_tile(_tile(key[0], key[1], ground))
+            for key in list(expected)[::11]:
+                game_map.delete_tile(*key)
+            ground += 1
+
+    editor = threading.Thread(target=edit)
+    editor.start()
+    try:
+        for _ in range(20):
+            assert snapshot.to_game_map().tiles == expected
+    finally:
+        stop.set()
+        editor.join()
+        snapshot.close()
+
+
+def test_change_tracker_reports_written_keys_once() -> None:
+    game_map = _map(4)
+    tiles = game_map.tiles
+    assert isinstance(tiles, TileTable)
+    tracker = tiles.track_changes()
+
+    game_map.set_tile(_tile(0, 0, 919))
+    game_map.delete_tile(1, 1, 7)
+    tiles.pop((2, 2, 7))
+    tiles.update({(40, 40, 7): _tile(40, 40)})
+    assert tracker.drain() == {(0, 0, 7), (1, 1, 7), (2, 2, 7), (40, 40, 7)}
+    assert tracker.drain() == set()
+
+    tiles.clear()
+    assert len(tracker.drain()) == 4 * 4 - 2 + 1
+
+    del tracker
+    gc.collect()
+    game_map.set_tile(_tile(0, 0))
+    assert tiles._trackers == ()
+
+
+def test_autosave_writes_the_snapshot_and_releases_it(tmp_path: Path) -> None:
+    game_map = _map()
+    expected = dict(game_map.tiles)
+    written: list[GameMap] = []
+
+    def write(snapshot, path: Path) -> bool:  # type: ignore[no-untyped-def]
+        game_map.set_tile(_tile(0, 0, 919))  # edit while the "save" is running
+        written.append(snapshot.to_game_map())
+        return True
+
+    manager = AutoSaveManager(AutoSaveConfig(backup_dir=tmp_path))
+    manager.set_snapshot_save(game_map.snapshot, write)
+    assert manager.force_save()
+    assert written[0].tiles == expected
+    assert game_map.tiles.open_views == 0
+    assert manager.state.total_autosaves == 1
@@ -6,6 +6,7 @@ from py_rme_canary.core.data.gamemap import GameMap, MapHeader
 from py_rme_canary.core.data.houses import House
 from py_rme_canary.core.data.item import Item, Position
 from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.io.otbm.loader import OTBMLoader
 from py_rme_canary.core.io.otbm_saver import save_game_map_bundle_atomic
 from py_rme_canary.logic_layer.operations.map_import import import_map_with_offset
 
@@ -44,3 +45,30 @@ def test_import_map_with_offset(tmp_path: Path) -> None:
     assert target_map.houses[1].entry == Position(3, 4, 7)
     assert report.tiles_imported == 1
     assert report.houses_imported == 1
+
+
+def test_import_streams_tile_areas_with_progress_and_cancel(tmp_path: Path) -> None:
+    source_map = GameMap(header=MapHeader(otbm_version=2, width=1024, height=1024))
+    for base in (0, 256, 512):
+        source_map.set_tile(Tile(x=base + 1, y=base + 1, z=7, ground=Item(id=300)))
+    source_path = tmp_path / "areas.otbm"
+    save_game_map_bundle_atomic(str(source_path), source_map, id_mapper=None)
+
+    loader = OTBMLoader()
+    areas: list[list[Tile]] = []
+    streamed = loader.stream(str(source_path), on_tile_area=areas.append)
+    assert [len(area) for area in areas] == [1, 1, 1]
+    assert not streamed.tiles
+
+    target_map = GameMap(header=MapHeader(otbm_version=2, width=1024, height=1024))
+    fractions: list[float] = []
+    report = import_map_with_offset(
+        target_map=target_map,
+        source_path=source_path,
+        offset=(0, 0, 0),
+        progress_callback=lambda fraction, _msg: fractions.append(fraction),
+        cancel_check=lambda: len(fractions) >= 1,
+    )
+    assert report.cancelled
+    assert report.tiles_imported == 2
+    assert fractions and 0.0 < fractions[0] <= 1.0
@@ -78,3 +78,34 @@ def test_carpet_brush_northeast_alignment() -> None:
     stroke.end()
 
     assert _tile_item_id(game_map, 2, 2, 7) == 202
+
+
+class _CountingBrushManager(BrushManager):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list[int] = []
+
+    def get_brush(self, server_id: int) -> BrushDefinition | None:
+        self.lookups.append(int(server_id))
+        return super().get_brush(server_id)
+
+
+def test_stroke_resolves_brush_once_and_reuses_scratch_set() -> None:
+    game_map = _make_map()
+    brush_def = _make_carpet_brush(600)
+    mgr = _CountingBrushManager()
+    mgr._brushes[600] = brush_def
+    for fid in brush_def.family_ids:
+        mgr._family_index.setdefault(int(fid), 600)
+
+    stroke = TransactionalBrushStroke(game_map=game_map, brush_manager=mgr, history=HistoryManager())
+    scratch = stroke._expanded
+    for y in range(2):
+        stroke.begin(x=1, y=y, z=7, selected_server_id=600)
+        for x in range(2, 5):
+            stroke.paint(x=x, y=y, z=7, selected_server_id=600)
+        stroke.end()
+
+    assert mgr.lookups == [600, 600, 600, 600]  # one paint lookup and one finalize lookup per stroke
+    assert stroke._expanded is scratch and not scratch
+    assert len(stroke.history.undo_stack) == 2
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.chunk_colors import EMPTY_COLOR, ChunkColorCache, id_color, tiles_version
+
+
+def _map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    game_map.set_tile(Tile(x=1, y=0, z=7, ground=Item(id=100), items=[Item(id=2000)]))
+    game_map.set_tile(Tile(x=33, y=1, z=7, ground=Item(id=101), modified=True))
+    return game_map
+
+
+def _pixel(rgba: bytes, x: int, y: int) -> tuple[int, ...]:
+    offset = (y * 32 + x) * 4
+    return tuple(rgba[offset : offset + 4])
+
+
+def test_chunk_texture_holds_top_item_colors() -> None:
+    game_map = _map()
+    cache = ChunkColorCache()
+    cache.sync(game_map)
+
+    rgba = cache.chunk_rgba(game_map, (7, 0, 0))
+
+    assert len(rgba) == 32 * 32 * 4
+    assert _pixel(rgba, 1, 0) == id_color(2000)
+    assert _pixel(rgba, 0, 0) == EMPTY_COLOR
+    assert cache.chunk_rgba(game_map, (7, 0, 0)) is rgba
+    assert cache.builds == 1
+
+
+def test_reported_edit_rebuilds_only_its_chunk() -> None:
+    game_map = _map()
+    cache = ChunkColorCache()
+    cache.sync(game_map)
+    cache.chunk_rgba(game_map, (7, 0, 0))
+    right = cache.chunk_rgba(game_map, (7, 1, 0))
+
+    game_map.set_tile(Tile(x=2, y=0, z=7, ground=Item(id=102)))
+    cache.invalidate([(2, 0, 7)], version=tiles_version(game_map))
+    cache.sync(game_map)
+
+    assert _pixel(cache.chunk_rgba(game_map, (7, 0, 0)), 2, 0) == id_color(102)
+    assert cache.chunk_rgba(game_map, (7, 1, 0)) is right
+    assert cache.builds == 3
+
+
+def test_unreported_edit_or_filter_change_drops_everything() -> None:
+    game_map = _map()
+    cache = ChunkColorCache()
+    cache.sync(game_map)
+    cache.chunk_rgba(game_map, (7, 0, 0))
+
+    game_map.set_tile(Tile(x=3, y=0, z=7, ground=Item(id=103)))
+    cache.sync(game_map)
+    assert len(cache) == 0
+
+    cache.sync(game_map, only_modified=True)
+    assert _pixel(cache.chunk_rgba(game_map, (7, 0, 0)), 1, 0) == EMPTY_COLOR
+    assert _pixel(cache.chunk_rgba(game_map, (7, 1, 0)), 1, 1) == id_color(101)
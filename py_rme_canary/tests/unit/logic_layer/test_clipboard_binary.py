@@ -0,0 +1,155 @@
+"""Unit tests for the binary clipboard format."""
+
+from __future__ import annotations
+
+import threading
+
+from py_rme_canary.core.data.creature import Monster, Outfit
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.spawns import MonsterSpawnArea, MonsterSpawnEntry
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.clipboard import ClipboardManager, tiles_from_entry
+from py_rme_canary.logic_layer.clipboard_binary import (
+    build_id_remap,
+    collect_item_ids,
+    decode_tiles,
+    encode_tiles,
+    read_header,
+)
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _sample_tiles() -> list[Tile]:
+    spawn = MonsterSpawnArea(
+        center=Position(x=101, y=200, z=7),
+        radius=2,
+        monsters=(MonsterSpawnEntry(name="orc", dx=0, dy=0, spawntime=60),),
+    )
+    return [
+        Tile(x=100, y=200, z=7, ground=Item(id=4526), items=[Item(id=2148, count=50)], house_id=12, map_flags=4),
+        Tile(
+            x=101,
+            y=200,
+            z=7,
+            ground=Item(id=4526, action_id=1000),
+            items=[
+                Item(id=1987, items=(Item(id=2160, count=3), Item(id=2400, text="sword"))),
+                Item(id=1387, destination=Position(x=50, y=60, z=8)),
+            ],
+            monsters=[Monster(name="orc", direction=1, outfit=Outfit(looktype=5))],
+            spawn_monster=spawn,
+            zones=frozenset({3}),
+        ),
+        Tile(x=140, y=230, z=6, ground=Item(id=4527)),
+    ]
+
+
+def test_binary_roundtrip_preserves_tiles() -> None:
+    tiles = _sample_tiles()
+    payload = encode_tiles(tiles, (100, 200, 6), client_version="13.10")
+
+    restored = decode_tiles(payload, origin=(10, 20, 6))
+    assert len(restored) == 3
+    first, second, third = restored
+    assert (first.x, first.y, first.z) == (10, 20, 7)
+    assert first.ground == Item(id=4526)
+    assert first.items[0].count == 50
+    assert first.house_id == 12 and first.map_flags == 4
+
+    # Non-compact ground (has attributes) is restored as ground, not stacked.
+    assert second.ground is not None and second.ground.action_id == 1000
+    container = second.items[0]
+    assert [child.id for child in container.items] == [2160, 2400]
+    assert container.items[1].text == "sword"
+    assert second.items[1].destination == Position(x=50, y=60, z=8)
+    assert second.zones == frozenset({3})
+    assert second.monsters[0].name == "orc"
+    assert second.spawn_monster is not None and second.spawn_monster.center == Position(x=11, y=20, z=7)
+    assert (third.x, third.y, third.z) == (50, 50, 6)
+
+
+def test_header_and_preview_do_not_need_tile_records() -> None:
+    tiles = _sample_tiles()
+    payload = encode_tiles(tiles, (100, 200, 6), client_version="13.10", name_lookup=lambda sid: f"item{sid}")
+    header = read_header(payload)
+    assert header.tile_count == 3
+    assert header.bbox == ((0, 0, 0), (40, 30, 1))
+    assert (header.width, header.height) == (41, 31)
+    assert header.id_table[2160] == ("item2160", None)
+
+    manager = ClipboardManager()
+    # A truncated body proves the preview only reads the header + footprint.
+    assert manager.load_binary(payload[: header.body_offset + 4])
+    assert sorted(manager.get_paste_preview((0, 0, 0))) == [(0, 0, 1), (1, 0, 1), (40, 30, 0)]
+
+
+def test_version_mismatch_remaps_ids_once_per_distinct_id() -> None:
+    tiles = _sample_tiles()
+    payload = encode_tiles(tiles, (100, 200, 6), client_version="8.60", sprite_hash_lookup=lambda sid: sid * 10)
+    header = read_header(payload)
+    calls: list[int] = []
+
+    def hash_resolver(sprite_hash: int, _sid: int | None, _name: str | None) -> int | None:
+        calls.append(sprite_hash)
+        return sprite_hash // 10 + 1 if sprite_hash == 21600 else None
+
+    assert build_id_remap(header, hash_resolver=hash_resolver) == {2160: 2161}
+    assert len(calls) == len(header.id_table)
+
+    manager = ClipboardManager()
+    assert manager.load_binary(payload, target_version="13.10", hash_resolver=hash_resolver)
+    entry = manager.get_current()
+    assert entry is not None and entry.tile_count() == 3
+    result = tiles_from_entry(entry)
+    assert result is not None
+    restored, origin = result
+    assert origin == (100, 200, 6)
+    assert [child.id for child in restored[1].items[0].items] == [2161, 2400]
+
+
+def test_background_copy_resolves_sprite_hashes_on_the_calling_thread() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=256, height=256))
+    for tile in _sample_tiles():
+        game_map.set_tile(tile)
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    session.apply_lasso_selection(tiles=list(game_map.tiles))
+    threads: set[int] = set()
+
+    def sprite_hash_lookup(sid: int) -> int:
+        threads.add(threading.get_ident())
+        return sid * 10
+
+    assert session.copy_selection("13.10", sprite_hash_lookup=sprite_hash_lookup, background=True)
+    job = session._clipboard_job
+    assert job is not None
+    entry = job[2].result(timeout=5.0)
+    session._clipboard_job = None
+
+    assert threads == {threading.get_ident()}
+    assert entry.header is not None
+    assert {sid: sprite for sid, (_name, sprite) in entry.header.id_table.items()} == {
+        sid: sid * 10 for sid in collect_item_ids(session._clipboard.get_buffer_tiles().values())
+    }
+
+
+def test_background_copy_keeps_its_result_when_a_later_copy_finishes_it(qapp) -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=256, height=256))
+    for tile in _sample_tiles():
+        game_map.set_tile(tile)
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    session.apply_lasso_selection(tiles=list(game_map.tiles))
+
+    assert session.copy_selection("13.10", background=True)
+    first = session.clipboard_job()
+    assert session.copy_selection("13.10", background=True)
+    second = session.clipboard_job()
+    assert first is not None and second is not None and first != second
+
+    # A synchronous cut finishes the pending background copy on its way.
+    assert session.cut_selection("13.10") is not None
+    assert not session.has_clipboard_job()
+    assert session.poll_clipboard_job(first) is True
+    assert session.poll_clipboard_job(second) is True
+    assert session.poll_clipboard_job(second) is False
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 pytest.importorskip("PyQt6.QtWidgets", exc_type=ImportError)
@@ -437,6 +439,43 @@ def test_rotate_item_is_transactional(app) -> None:
     assert reverted.items and int(reverted.items[0].id) == 2050
 
 
+def test_rotate_item_without_history_writes_a_new_tile(app) -> None:
+    session, tile = _make_session_with_single_item(item_id=2050)
+    editor = _DummyEditor()
+    editor.session = session  # type: ignore[attr-defined]
+    handlers = ContextMenuActionHandlers(canvas=_DummyCanvas(editor))
+    changed: list[set[tuple[int, int, int]]] = []
+    session.on_tiles_changed = changed.append
+
+    handlers.rotate_item(tile.items[0], tile, (10, 10, 7))
+
+    updated = session.game_map.get_tile(10, 10, 7)
+    assert updated is not None and updated is not tile
+    assert int(updated.items[0].id) == 2051
+    assert int(tile.items[0].id) == 2050
+    assert changed == [{(10, 10, 7)}]
+
+
+def test_goto_teleport_uses_the_session_link_index(app) -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    teleport = Item(id=1387, destination=ItemPosition(x=20, y=20, z=7))
+    game_map.set_tile(Tile(x=10, y=10, z=7, items=[teleport]))
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    editor = _DummyEditor()
+    jumps: list[tuple[int, int, int]] = []
+    editor.center_view_on = lambda x, y, z, push_history=False: jumps.append((x, y, z))  # type: ignore[attr-defined]
+    handlers = ContextMenuActionHandlers(editor_session=session, canvas=_DummyCanvas(editor))
+
+    handlers.goto_teleport_destination(teleport, (10, 10, 7))
+    assert jumps == [(20, 20, 7)]
+    assert editor.status.messages[-1] == "[Go To Teleport] Jumped to 20, 20, 7 (destination has no tile)"
+
+    game_map.set_tile(Tile(x=20, y=20, z=7, ground=Item(id=4526)))
+    session._emit_tiles_changed({(20, 20, 7)})
+    handlers.goto_teleport_destination(teleport, (10, 10, 7))
+    assert editor.status.messages[-1] == "[Go To Teleport] Jumped to 20, 20, 7 (one-way)"
+
+
 def test_delete_item_is_transactional(app) -> None:
     session, tile = _make_session_with_single_item(item_id=321)
     handlers = ContextMenuActionHandlers(editor_session=session)
@@ -489,10 +528,7 @@ def test_open_item_properties_is_transactional(app, monkeypatch) -> None:
     handlers = ContextMenuActionHandlers(editor_session=session)
 
     def _fake_edit(_parent, draft_item):
-        draft_item.action_id = 111
-        draft_item.unique_id = 222
-        draft_item.text = "new text"
-        return True
+        return replace(draft_item, action_id=111, unique_id=222, text="new text")
 
     monkeypatch.setattr(
         "py_rme_canary.vis_layer.ui.main_window.browse_tile_dialog._edit_item_basic_properties",
@@ -530,7 +566,7 @@ def test_open_item_properties_cancel_keeps_item_unchanged(app, monkeypatch) -> N
     handlers = ContextMenuActionHandlers(editor_session=session)
     monkeypatch.setattr(
         "py_rme_canary.vis_layer.ui.main_window.browse_tile_dialog._edit_item_basic_properties",
-        lambda *_args, **_kwargs: False,
+        lambda *_args, **_kwargs: None,
     )
 
     handlers.open_item_properties(tile.items[0], tile, (10, 10, 7))
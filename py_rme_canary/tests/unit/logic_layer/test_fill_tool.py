@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.fill_tool import FillConfig, FillDirection, FillMode, FloodFillEngine
+
+
+class _GroundBrush:
+    def __init__(self, ground_id: int) -> None:
+        self.ground_id = ground_id
+
+    def apply(self, tile: Tile, game_map: GameMap) -> None:
+        game_map.set_tile(Tile(x=tile.x, y=tile.y, z=tile.z, ground=Item(id=self.ground_id), items=list(tile.items)))
+
+
+def _cave_map(seed: int, size: int = 48) -> GameMap:
+    rng = random.Random(seed)
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=size, height=size))
+    for x in range(size):
+        for y in range(size):
+            ground = 4526 if rng.random() < 0.62 else 919
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=ground)))
+    return game_map
+
+
+def _collect(
+    game_map: GameMap, mode: FillMode, direction: FillDirection, **kwargs: object
+) -> set[tuple[int, int, int]]:
+    config = FillConfig(mode=mode, direction=direction, **kwargs)  # type: ignore[arg-type]
+    return set(FloodFillEngine(game_map).preview_fill((10, 10, 7), None, config))
+
+
+def test_scanline_fill_matches_bfs_region() -> None:
+    for seed in range(4):
+        game_map = _cave_map(seed)
+        for direction in (FillDirection.FOUR_WAY, FillDirection.EIGHT_WAY):
+            expected = _collect(game_map, FillMode.CONTIGUOUS, direction)
+            assert _collect(game_map, FillMode.SCANLINE, direction) == expected
+
+    game_map = _cave_map(1)
+    game_map.set_tile(Tile(x=10, y=10, z=7, ground=Item(id=4526), items=[Item(id=2148)]))
+    expected = _collect(game_map, FillMode.CONTIGUOUS, FillDirection.FOUR_WAY, match_items=True)
+    assert _collect(game_map, FillMode.SCANLINE, FillDirection.FOUR_WAY, match_items=True) == expected
+
+
+def test_scanline_fill_respects_limit_and_records_one_action() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=32, height=32))
+    for x in range(32):
+        for y in range(32):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=4526)))
+    engine = FloodFillEngine(game_map)
+
+    limited = engine.fill((5, 5, 7), None, FillConfig(mode=FillMode.SCANLINE, max_tiles=40))
+    assert limited.tiles_filled == 40 and limited.stopped_by_limit
+
+    result = engine.fill((5, 5, 7), _GroundBrush(919), FillConfig(mode=FillMode.SCANLINE))
+    assert result.tiles_filled == 32 * 32 and not result.stopped_by_limit
+    assert result.bounds == (0, 0, 31, 31)
+    assert result.action is not None and len(result.action.tiles_after) == 32 * 32
+    assert all(tile.ground.id == 919 for tile in game_map.iter_tiles())
+
+    result.action.undo(game_map)
+    assert all(tile.ground.id == 4526 for tile in game_map.iter_tiles())
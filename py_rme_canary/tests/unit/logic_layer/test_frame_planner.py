@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from py_rme_canary.logic_layer.render_optimizer import FrameMode, FramePlanner, LODManager
+
+_BOUNDS = (10, 10, 40, 30)
+
+
+def _primed(key: object = "view", version: int = 1) -> FramePlanner:
+    planner = FramePlanner()
+    assert planner.plan(key, version, bounds=_BOUNDS).mode is FrameMode.FULL
+    return planner
+
+
+def test_unchanged_frame_is_skipped() -> None:
+    planner = _primed()
+
+    assert planner.plan("view", 1, bounds=_BOUNDS).mode is FrameMode.SKIP
+    assert planner.stats.skipped == 1
+
+
+def test_key_change_redraws_everything() -> None:
+    planner = _primed()
+
+    assert planner.plan("panned", 1, bounds=_BOUNDS).mode is FrameMode.FULL
+
+
+def test_reported_edits_redraw_merged_rects() -> None:
+    planner = _primed()
+    planner.mark_tiles([(12, 12, 7), (13, 12, 7), (30, 20, 7)], version=4)
+
+    plan = planner.plan("view", 4, bounds=_BOUNDS)
+
+    assert plan.mode is FrameMode.PARTIAL
+    assert sorted((r.x1, r.y1, r.x2, r.y2) for r in plan.rects) == [(12, 12, 14, 13), (30, 20, 31, 21)]
+    assert planner.plan("view", 4, bounds=_BOUNDS).mode is FrameMode.SKIP
+
+
+def test_unreported_edit_forces_full_redraw() -> None:
+    planner = _primed()
+    planner.mark_tiles([(12, 12, 7)], version=2)
+
+    assert planner.plan("view", 3, bounds=_BOUNDS).mode is FrameMode.FULL
+
+
+def test_offscreen_edits_are_culled() -> None:
+    planner = _primed()
+    planner.mark_tiles([(200, 200, 7)], version=2)
+
+    assert planner.plan("view", 2, bounds=_BOUNDS).mode is FrameMode.SKIP
+
+
+def test_large_or_unpatchable_damage_falls_back_to_full() -> None:
+    planner = _primed()
+    planner.mark_tiles([(x, y, 7) for x in range(10, 40) for y in range(10, 30)], version=2)
+    assert planner.plan("view", 2, bounds=_BOUNDS).mode is FrameMode.FULL
+
+    planner.mark_tiles([(12, 12, 7)], version=3)
+    assert planner.plan("view", 3, bounds=_BOUNDS, partial_ok=False).mode is FrameMode.FULL
+
+
+def test_canvas_lod_levels_by_tile_size() -> None:
+    lod = LODManager(list(LODManager.CANVAS_LEVELS))
+
+    full, mid, colors, chunks = (lod.get_lod(px / 32.0) for px in (32, 12, 8, 6))
+
+    assert full.show_sprites and full.show_grid and full.show_creatures
+    assert mid.show_items and not (mid.show_creatures or mid.show_grid)
+    assert not colors.show_sprites and not colors.chunk_textures
+    assert chunks.chunk_textures
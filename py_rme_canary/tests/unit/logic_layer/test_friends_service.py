@@ -81,3 +81,52 @@ def test_sync_live_usernames_updates_friend_presence(tmp_path) -> None:
 
     snapshot_offline = service.sync_live_usernames(user_id=alice.id, connected_usernames=set())
     assert [friend.username for friend in snapshot_offline.offline] == ["bob"]
+
+
+def test_repository_reuses_one_connection_per_thread(tmp_path) -> None:
+    service = _service(tmp_path)
+    repo = service.repo
+    assert repo._connect() is repo._connect()
+
+    service.close()
+    reopened = service.ensure_user(username="carol")
+    assert reopened.username == "carol"
+
+
+def test_queued_presence_is_coalesced_and_flushed_on_snapshot(tmp_path) -> None:
+    service = _service(tmp_path)
+    alice = service.ensure_user(username="alice")
+    bob = service.ensure_user(username="bob")
+    request_id = service.send_friend_request(requester_id=alice.id, target_username="bob")
+    service.accept_request(user_id=bob.id, request_id=request_id)
+
+    service.queue_presence(user_id=bob.id, status="online", current_map="Thais")
+    service.queue_presence(user_id=bob.id, status="idle", current_map="Venore")
+
+    snapshot = service.snapshot(user_id=alice.id)
+    assert snapshot.online[0].status == "idle"
+    assert snapshot.online[0].current_map == "Venore"
+    assert service.flush_presence() == 0
+
+
+def test_update_presence_many_writes_latest_state_per_user(tmp_path) -> None:
+    from py_rme_canary.logic_layer.social import PresenceUpdate
+
+    service = _service(tmp_path)
+    alice = service.ensure_user(username="alice")
+    bob = service.ensure_user(username="bob")
+    request_id = service.send_friend_request(requester_id=alice.id, target_username="bob")
+    service.accept_request(user_id=bob.id, request_id=request_id)
+
+    written = service.repo.update_presence_many(
+        [
+            PresenceUpdate(user_id=bob.id, status="online"),
+            PresenceUpdate(user_id=alice.id, status="online"),
+            PresenceUpdate(user_id=bob.id, status="dnd", current_map="Edron"),
+        ]
+    )
+    assert written == 2
+    assert service.heartbeat([alice.id, bob.id, bob.id]) == 2
+
+    friends = service.repo.list_friends(user_id=alice.id)
+    assert [(f.username, f.status, f.current_map) for f in friends] == [("bob", "dnd", "Edron")]
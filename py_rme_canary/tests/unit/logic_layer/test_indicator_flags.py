@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.indicator_flags import (
+    AVOIDABLE,
+    HOOK,
+    MODIFIED,
+    MOVEABLE,
+    PICKUPABLE,
+    IndicatorFlagCache,
+)
+
+
+@dataclass
+class _Props:
+    pickupable: bool = False
+    moveable: bool = False
+    avoidable: bool = False
+    hook: bool = False
+
+
+_PROPS = {
+    100: _Props(),
+    200: _Props(pickupable=True, moveable=True),
+    300: _Props(hook=True),
+    400: _Props(avoidable=True),
+}
+
+
+def _map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=128, height=128))
+    game_map.set_tile(Tile(x=1, y=1, z=7, ground=Item(id=100)))
+    game_map.set_tile(Tile(x=2, y=1, z=7, ground=Item(id=100), items=[Item(id=200), Item(id=300)]))
+    game_map.set_tile(Tile(x=40, y=1, z=7, ground=Item(id=400), modified=True))
+    return game_map
+
+
+def test_chunk_flags_fold_item_props_into_masks() -> None:
+    game_map = _map()
+    cache = IndicatorFlagCache()
+
+    assert cache.chunk_flags(game_map, (7, 0, 0), _PROPS) == ((2, 1, HOOK | PICKUPABLE | MOVEABLE),)
+    assert cache.chunk_flags(game_map, (7, 1, 0), _PROPS) == ((40, 1, AVOIDABLE | MODIFIED),)
+    assert cache.chunk_flags(game_map, (6, 0, 0), _PROPS) == ()
+    assert len(cache) == 3
+
+
+def test_invalidate_rebuilds_only_the_touched_chunk() -> None:
+    game_map = _map()
+    cache = IndicatorFlagCache()
+    first = cache.chunk_flags(game_map, (7, 0, 0), _PROPS)
+    other = cache.chunk_flags(game_map, (7, 1, 0), _PROPS)
+    version = cache.version((7, 0, 0))
+
+    game_map.set_tile(Tile(x=1, y=1, z=7, ground=Item(id=400)))
+    assert cache.chunk_flags(game_map, (7, 0, 0), _PROPS) is first  # not told yet
+
+    cache.invalidate([(1, 1, 7)])
+    assert cache.version((7, 0, 0)) == version + 1
+    assert cache.version((7, 1, 0)) == 0
+    assert cache.chunk_flags(game_map, (7, 1, 0), _PROPS) is other
+    assert cache.chunk_flags(game_map, (7, 0, 0), _PROPS) == ((1, 1, AVOIDABLE), (2, 1, HOOK | PICKUPABLE | MOVEABLE))
+
+    # A different map (or props table) starts over.
+    assert cache.chunk_flags(GameMap(header=MapHeader(otbm_version=2, width=8, height=8)), (7, 0, 0), _PROPS) == ()
+    assert cache.version((7, 0, 0)) == version + 2
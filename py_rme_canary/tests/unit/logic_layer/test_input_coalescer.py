@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from py_rme_canary.logic_layer.input_coalescer import PointerCoalescer, bresenham_line, stroke_footprint
+
+
+def test_bresenham_line_is_eight_connected_and_includes_both_ends() -> None:
+    assert list(bresenham_line(0, 0, 3, 0)) == [(0, 0), (1, 0), (2, 0), (3, 0)]
+    assert list(bresenham_line(2, 2, 2, 2)) == [(2, 2)]
+
+    line = list(bresenham_line(5, -3, -4, 7))
+    assert (line[0], line[-1]) == ((5, -3), (-4, 7))
+    assert len(line) == 11
+    assert all(max(abs(ax - bx), abs(ay - by)) == 1 for (ax, ay), (bx, by) in zip(line, line[1:], strict=False))
+
+
+def test_stroke_footprint_merges_offsets_in_bounds() -> None:
+    offsets = ((0, 0), (1, 0), (0, 1))
+    assert stroke_footprint([(0, 0), (1, 0), (9, 9)], offsets, width=10, height=10) == [
+        (0, 0),
+        (1, 0),
+        (0, 1),
+        (2, 0),
+        (1, 1),
+        (9, 9),
+    ]
+
+
+def test_coalescer_fills_gaps_and_hands_out_each_tile_once_per_frame() -> None:
+    coalescer = PointerCoalescer()
+    coalescer.extend_stroke(3, 3)  # no stroke yet
+    assert not coalescer.pending
+
+    coalescer.begin_stroke(0, 0)
+    for x, y in ((0, 0), (4, 0), (4, 0), (2, 0), (4, 2)):
+        coalescer.extend_stroke(x, y, alt=True)
+        coalescer.move(x * 32, y * 32)
+    assert coalescer.pending
+
+    path, alt = coalescer.take_stroke()
+    assert path == [(1, 0), (2, 0), (3, 0), (4, 0), (3, 1), (4, 2)]
+    assert alt is True
+    assert coalescer.take_pointer() == (128, 64)
+    assert not coalescer.pending
+
+    coalescer.extend_stroke(6, 2)
+    assert coalescer.take_stroke()[0] == [(5, 2), (6, 2)]
+    coalescer.end_stroke()
+    coalescer.extend_stroke(9, 9)
+    assert coalescer.take_stroke()[0] == []
+    assert (coalescer.stats.events, coalescer.stats.stroke_tiles) == (5, 8)
@@ -4,6 +4,8 @@ Tests item categorization, door toggle detection, rotation sequences,
 and other smart context menu logic.
 """
 
+from dataclasses import replace
+
 import pytest
 
 from py_rme_canary.core.data.item import Item, Position
@@ -180,7 +182,7 @@ class TestItemTypeDetectorIntegration:
         assert open_id == 1210
 
         # Toggle to open
-        door.id = open_id
+        door = replace(door, id=open_id)
 
         # Get closed state
         closed_id = ItemTypeDetector.get_door_toggle_id(door)
@@ -196,7 +198,7 @@ class TestItemTypeDetectorIntegration:
         for _ in range(4):
             next_id = ItemTypeDetector.get_next_rotation_id(torch)
             assert next_id is not None
-            torch.id = next_id
+            torch = replace(torch, id=next_id)
 
         # Should be back to original (if sequence is 4 items)
         if 2050 in ROTATABLE_SEQUENCES and len(ROTATABLE_SEQUENCES[2050]) == 4:
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.lasso_selection import LassoSelection, WindingRule, polygon_spans
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _brute_force(lasso: LassoSelection) -> set[tuple[int, int]]:
+    min_x, min_y, max_x, max_y = lasso.get_bounding_box()  # type: ignore[misc]
+    return {(x, y) for y in range(min_y, max_y + 1) for x in range(min_x, max_x + 1) if lasso.point_in_polygon(x, y)}
+
+
+def test_even_odd_spans_match_ray_cast_on_self_intersecting_outlines() -> None:
+    rng = random.Random(3)
+    for _ in range(40):
+        lasso = LassoSelection(points=[(rng.randint(0, 40), rng.randint(0, 40)) for _ in range(rng.randint(3, 12))])
+        spans = list(lasso.iter_spans())
+        covered = {(x, y) for y, x0, x1 in spans for x in range(x0, x1 + 1)}
+        assert covered == _brute_force(lasso)
+        assert sum(x1 - x0 + 1 for _y, x0, x1 in spans) == len(covered)
+
+
+def test_non_zero_rule_fills_the_centre_of_a_star() -> None:
+    star = [(20, 0), (32, 38), (0, 14), (40, 14), (8, 38)]
+    even_odd = {(x, y) for y, x0, x1 in polygon_spans(star) for x in range(x0, x1 + 1)}
+    non_zero = {(x, y) for y, x0, x1 in polygon_spans(star, WindingRule.NON_ZERO) for x in range(x0, x1 + 1)}
+    assert (20, 20) not in even_odd
+    assert (20, 20) in non_zero
+    assert even_odd < non_zero
+
+
+def test_session_applies_spans_against_existing_tiles_only() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    for x in range(0, 10, 2):
+        for y in range(10):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=4526)))
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    lasso = LassoSelection(points=[(0, 0), (9, 0), (9, 9), (0, 9)], z_level=7)
+
+    expected = {(x, y, 7) for x in range(2, 10, 2) for y in range(1, 10)}
+    assert set(lasso.get_selected_tiles(occupancy=session._selection.occupancy())) == expected
+
+    session.apply_lasso_selection(spans=lasso.iter_spans(), z=7)
+    assert session.get_selection().to_set() == expected
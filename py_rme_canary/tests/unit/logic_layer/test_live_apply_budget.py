@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_packets import PacketType
+from py_rme_canary.core.protocols.tile_serializer import encode_tile_update
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _session() -> tuple[EditorSession, LiveClient, list[set]]:
+    session = EditorSession(
+        game_map=GameMap(header=MapHeader(otbm_version=2, width=64, height=64)), brush_manager=BrushManager()
+    )
+    client = LiveClient()
+    session._live_client = client
+    notifications: list[set] = []
+    session.on_tiles_changed = notifications.append
+    return session, client, notifications
+
+
+def _receive(client: LiveClient, xs: range, ground: int) -> None:
+    tiles = [Tile(x=x % 64, y=x // 64, z=7, ground=Item(id=ground)) for x in xs]
+    client._handle_packet(int(PacketType.TILE_UPDATE), encode_tile_update(tiles))
+
+
+def test_received_updates_are_coalesced_into_one_notification() -> None:
+    session, client, notifications = _session()
+    for ground in (100, 101, 102):
+        _receive(client, range(3), ground)
+
+    assert session.process_live_events() == 3
+    assert notifications == [{(0, 0, 7), (1, 0, 7), (2, 0, 7)}]
+    assert session.game_map.get_tile(1, 0, 7).ground.id == 102
+
+    stats = session.get_live_inbox_stats()
+    assert (stats["tiles_received"], stats["tiles_coalesced"], stats["tiles_applied"]) == (9, 6, 3)
+    assert session.process_live_events() == 0
+    assert len(notifications) == 1
+
+
+def test_large_bursts_are_spread_over_several_polls() -> None:
+    session, client, notifications = _session()
+    session.live_apply_budget_ms = 0
+    _receive(client, range(1000), 100)
+
+    polls = 0
+    while len(client.inbox):
+        session.process_live_events()
+        polls += 1
+
+    assert polls > 1
+    assert len(notifications) == polls
+    assert sum(len(changed) for changed in notifications) == 1000
+    assert len(session.game_map.tiles) == 1000
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.protocols.live_client import LiveClient
+from py_rme_canary.core.protocols.live_packets import ConnectionState, PacketType
+from py_rme_canary.core.protocols.live_sync import iter_sync_chunks
+from py_rme_canary.core.protocols.tile_serializer import decode_tile_update, encode_tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _session() -> tuple[EditorSession, LiveClient]:
+    session = EditorSession(
+        game_map=GameMap(header=MapHeader(otbm_version=2, width=64, height=64)), brush_manager=BrushManager()
+    )
+    client = LiveClient()
+    client.send_packet = Mock(return_value=True)  # type: ignore[method-assign]
+    session._live_client = client
+    return session, client
+
+
+def _edit(session: EditorSession, x: int, ground: int) -> None:
+    session.game_map.set_tile(Tile(x=x, y=0, z=7, ground=Item(id=ground)))
+    session._emit_tiles_changed({(x, 0, 7)})
+
+
+def _sent_tile_updates(client: LiveClient) -> list[list[dict]]:
+    return [
+        decode_tile_update(payload)[0]
+        for packet_type, payload in (call.args for call in client.send_packet.call_args_list)
+        if packet_type == PacketType.TILE_UPDATE
+    ]
+
+
+def test_offline_edits_are_resent_after_a_full_resync() -> None:
+    session, client = _session()
+    _edit(session, 1, 100)
+    assert _sent_tile_updates(client) == []
+
+    client.state = ConnectionState.AUTHENTICATED
+    client.request_sync()
+    _edit(session, 2, 200)
+    assert _sent_tile_updates(client) == []
+
+    # The server answers with a full snapshot that knows nothing of either edit.
+    (chunk,) = iter_sync_chunks(5, 3, [encode_tile(Tile(x=1, y=0, z=7, ground=Item(id=9)))], reset=True)
+    client._handle_packet(int(PacketType.SYNC_CHUNK), chunk)
+    session.process_live_events()
+
+    (resent,) = _sent_tile_updates(client)
+    assert sorted((tile["x"], tile["ground_id"]) for tile in resent) == [(1, 100), (2, 200)]
+    assert session.game_map.get_tile(1, 0, 7).ground.id == 100
+    assert session.game_map.get_tile(2, 0, 7).ground.id == 200
+
+    _edit(session, 3, 300)
+    assert [tile["x"] for tile in _sent_tile_updates(client)[-1]] == [3]
+
+
+def test_disconnecting_discards_held_back_edits() -> None:
+    session, client = _session()
+    _edit(session, 1, 100)
+
+    session.disconnect_live()
+
+    assert session._live_offline_tiles == {}
+    assert session.game_map.get_tile(1, 0, 7).ground.id == 100
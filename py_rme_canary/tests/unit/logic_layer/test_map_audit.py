@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.houses import House
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.core.io.map_validator import validate_game_map
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.map_audit import MapAuditEngine
+from py_rme_canary.logic_layer.map_statistics import compute_map_statistics
+from py_rme_canary.logic_layer.session.editor import EditorSession
+from py_rme_canary.logic_layer.uid_validator import UIDValidator
+
+
+def _random_map(seed: int) -> GameMap:
+    rng = random.Random(seed)
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=100, height=100))
+    game_map.houses[1] = House(id=1, name="Depot", entry=Position(x=3, y=3, z=7))
+    for _ in range(1500):
+        x, y, z = rng.randrange(110), rng.randrange(100), rng.choice((6, 7, 8))
+        items = [Item(id=rng.choice((1387, 2148, 1740)))]
+        if rng.random() < 0.1:
+            items.append(Item(id=1740, unique_id=rng.randrange(1000, 1040), items=(Item(id=2160, unique_id=2000),)))
+        if rng.random() < 0.05:
+            items.append(Item(id=1387, action_id=5, destination=Position(x=1, y=1, z=7)))
+        house_id = rng.choice((None, None, 1, 2))
+        game_map.set_tile(Tile(x=x, y=y, z=z, ground=Item(id=4526), items=items, house_id=house_id))
+    return game_map
+
+
+def _assert_matches_full_passes(audit, game_map: GameMap) -> None:  # type: ignore[no-untyped-def]
+    assert audit.statistics == compute_map_statistics(game_map)
+
+    uids = UIDValidator().scan(game_map)
+    assert audit.uids.total_items_scanned == uids.total_items_scanned
+    assert audit.uids.total_uids_found == uids.total_uids_found
+    assert {c.unique_id: sorted(c.positions) for c in audit.uids.conflicts} == {
+        c.unique_id: sorted(c.positions) for c in uids.conflicts
+    }
+
+    def issues(result):  # type: ignore[no-untyped-def]
+        return sorted(
+            (i.code, repr(sorted((k, v) for k, v in i.context.items() if k != "sample"))) for i in result.issues
+        )
+
+    assert issues(audit.validation) == issues(validate_game_map(game_map))
+
+
+def test_audit_matches_the_three_separate_passes() -> None:
+    for seed in range(3):
+        game_map = _random_map(seed)
+        _assert_matches_full_passes(MapAuditEngine(game_map).refresh(), game_map)
+
+
+def test_refresh_rescans_only_dirty_chunks() -> None:
+    game_map = _random_map(7)
+    engine = MapAuditEngine(game_map)
+    first = engine.refresh()
+
+    scanned: list[int] = []
+    original = engine._scan
+
+    def spy(tiles):  # type: ignore[no-untyped-def]
+        chunk = original(tiles)
+        scanned.append(chunk.tiles)
+        return chunk
+
+    engine._scan = spy  # type: ignore[method-assign]
+    idle = engine.refresh()
+    assert scanned == []
+    assert idle.statistics == first.statistics
+    assert idle.uids is first.uids
+
+    far = next(key for key in game_map.tiles if key[0] >= 64)
+    game_map.set_tile(Tile(x=5, y=5, z=7, ground=Item(id=4526), items=[Item(id=1740, unique_id=1001)]))
+    game_map.delete_tile(*far)
+    game_map.houses.pop(1)
+    engine.mark_dirty({(5, 5, 7), (5, 6, 7), far})
+    second = engine.refresh()
+
+    assert second.revision > first.revision
+    assert len(scanned) == 2
+    _assert_matches_full_passes(second, game_map)
+
+
+def test_refresh_picks_up_map_level_edits_without_dirty_chunks() -> None:
+    game_map = _random_map(5)
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    before = session.map_audit()
+
+    session.set_waypoint(name="temple", x=10, y=10, z=7)
+    game_map.houses[3] = House(id=3, name="Shop", entry=Position(x=500, y=500, z=7))
+    after = session.map_audit()
+
+    assert after.statistics.waypoint_count == before.statistics.waypoint_count + 1
+    assert after.statistics.total_houses == before.statistics.total_houses + 1
+    _assert_matches_full_passes(after, game_map)
+
+
+def test_session_feeds_edits_and_undo_into_the_audit() -> None:
+    game_map = _random_map(3)
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    before = session.map_audit()
+
+    session.set_selection_tiles(list(game_map.tiles)[:200])
+    assert session.delete_selection(borderize=False) is not None
+    after_delete = session.map_audit()
+    assert after_delete.statistics.total_tiles < before.statistics.total_tiles
+    _assert_matches_full_passes(after_delete, game_map)
+
+    session.undo()
+    _assert_matches_full_passes(session.map_audit(), game_map)
+    assert session.map_audit().statistics == before.statistics
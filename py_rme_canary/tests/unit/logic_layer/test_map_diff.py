@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import pytest
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.map_diff import ChangeType, DiffLevel, MapDiffEngine, StreamingDiffReport, TileDiff
+
+
+def _map(width: int = 256, height: int = 256) -> GameMap:
+    return GameMap(header=MapHeader(otbm_version=2, width=width, height=height))
+
+
+def _fill(game_map: GameMap, positions: list[tuple[int, int, int]], ground_id: int = 100) -> None:
+    for x, y, z in positions:
+        game_map.set_tile(Tile(x=x, y=y, z=z, ground=Item(id=ground_id), items=[Item(id=2000)]))
+
+
+def _summary(report) -> list[tuple[tuple[int, int, int], ChangeType]]:
+    return [(d.position, d.change_type) for d in report.tile_diffs]
+
+
+def test_sparse_diff_matches_dense_compare() -> None:
+    positions = [(x, y, 7) for x in range(0, 80, 3) for y in range(0, 70, 5)]
+    old_map = _map()
+    new_map = _map()
+    _fill(old_map, positions)
+    _fill(new_map, positions)
+
+    new_map.set_tile(Tile(x=3, y=5, z=7, ground=Item(id=101), items=[Item(id=2000)]))
+    new_map.delete_tile(33, 40, 7)
+    new_map.set_tile(Tile(x=200, y=200, z=6, ground=Item(id=100)))
+
+    engine = MapDiffEngine()
+    dense = engine.compare(old_map, new_map)
+    sparse = engine.compare_sparse(old_map, new_map, max_workers=4)
+
+    assert sparse.done
+    assert _summary(sparse) == _summary(dense)
+    assert sparse.statistics.tiles_modified == dense.statistics.tiles_modified == 1
+    assert sparse.statistics.tiles_removed == dense.statistics.tiles_removed == 1
+    assert sparse.statistics.tiles_added == dense.statistics.tiles_added == 1
+    assert sparse.statistics.tiles_compared == len(positions) + 1
+
+
+def test_identical_chunks_are_skipped_without_comparison() -> None:
+    positions = [(x, y, 7) for x in range(128) for y in range(64)]
+    old_map = _map()
+    new_map = _map()
+    _fill(old_map, positions)
+    _fill(new_map, positions)
+    new_map.set_tile(Tile(x=100, y=10, z=7, ground=Item(id=999)))
+
+    compared: list[tuple[int, int, int]] = []
+    engine = MapDiffEngine()
+    original = engine._diff_tile_pair
+
+    def spy(old_tile, new_tile, pos):
+        compared.append(pos)
+        return original(old_tile, new_tile, pos)
+
+    engine._diff_tile_pair = spy  # type: ignore[method-assign]
+    report = engine.compare_sparse(old_map, new_map, chunk_size=32)
+
+    assert report.chunks_total == 1
+    assert report.chunks_skipped == 7
+    assert len(compared) == 32 * 32
+    assert _summary(report) == [((100, 10, 7), ChangeType.MODIFIED)]
+
+
+def test_repeated_sparse_diff_rehashes_only_edited_chunks() -> None:
+    positions = [(x, y, 7) for x in range(128) for y in range(64)]
+    old_map = _map()
+    new_map = _map()
+    _fill(old_map, positions)
+    _fill(new_map, positions)
+    engine = MapDiffEngine()
+
+    assert not engine.compare_sparse(old_map, new_map, chunk_size=32).has_changes
+    new_index = engine._indexes[(id(new_map.tiles), 32, None, None)]
+    hashed = new_index.chunks_hashed
+
+    new_map.set_tile(Tile(x=100, y=10, z=7, ground=Item(id=999)))
+    new_map.delete_tile(5, 5, 7)
+    new_map.set_tile(Tile(x=200, y=200, z=6, ground=Item(id=100)))
+    report = engine.compare_sparse(old_map, new_map, chunk_size=32)
+
+    assert new_index.chunks_hashed - hashed == 3
+    assert sorted(_summary(report)) == [
+        ((5, 5, 7), ChangeType.REMOVED),
+        ((100, 10, 7), ChangeType.MODIFIED),
+        ((200, 200, 6), ChangeType.ADDED),
+    ]
+    fresh = engine.build_chunk_index(new_map, chunk_size=32)
+    assert new_index.chunk_hashes == fresh.chunk_hashes
+    assert new_index.floor_hashes == fresh.floor_hashes
+
+    new_map.delete_tile(200, 200, 6)
+    engine.compare_sparse(old_map, new_map, chunk_size=32)
+    assert 6 not in new_index.floor_hashes
+
+
+def test_sparse_diff_streams_in_background() -> None:
+    old_map = _map()
+    new_map = _map()
+    _fill(new_map, [(x, 0, 7) for x in range(100)])
+
+    seen: list[tuple[int, int, int]] = []
+    report = MapDiffEngine().compare_sparse(
+        old_map, new_map, background=True, on_diff=lambda d: seen.append(d.position)
+    )
+    streamed = [diff.position for diff in report.iter_diffs(timeout=5.0)]
+
+    assert report.wait(timeout=5.0)
+    assert report.error is None
+    assert sorted(streamed) == sorted(seen) == [(x, 0, 7) for x in range(100)]
+    assert report.statistics.tiles_added == 100
+
+
+@pytest.mark.parametrize("warm", [False, True])
+def test_background_diff_ignores_edits_made_while_it_runs(warm: bool) -> None:
+    positions = [(x, y, 7) for x in range(128) for y in range(64)]
+    old_map = _map()
+    new_map = _map()
+    _fill(old_map, positions)
+    _fill(new_map, positions)
+    new_map.set_tile(Tile(x=100, y=10, z=7, ground=Item(id=999)))
+    engine = MapDiffEngine()
+    if warm:
+        engine.compare_sparse(old_map, new_map, chunk_size=32)
+
+    # Holding the index lock keeps the worker waiting until every edit is made.
+    with engine._index_lock:
+        report = engine.compare_sparse(old_map, new_map, chunk_size=32, background=True)
+        for x, y, z in positions[::7]:
+            new_map.set_tile(Tile(x=x, y=y, z=z, ground=Item(id=555)))
+        new_map.delete_tile(100, 10, 7)
+        new_map.set_tile(Tile(x=200, y=200, z=6, ground=Item(id=100)))
+
+    assert report.wait(timeout=5.0)
+    assert report.error is None
+    assert _summary(report) == [((100, 10, 7), ChangeType.MODIFIED)]
+    assert new_map.tiles.open_views == old_map.tiles.open_views == 0
+
+    again = engine.compare_sparse(old_map, new_map, chunk_size=32)
+    assert _summary(again) == _summary(MapDiffEngine().compare(old_map, new_map))
+
+
+def test_finishing_does_not_reorder_a_running_stream() -> None:
+    report = StreamingDiffReport()
+    stream = report.iter_diffs(timeout=1.0)
+    report._add_chunk([TileDiff((9, 9, 7), ChangeType.ADDED), TileDiff((8, 9, 7), ChangeType.ADDED)], 2, 0, None)
+    first = next(stream).position
+
+    report._add_chunk([TileDiff((1, 1, 7), ChangeType.ADDED)], 1, 0, None)
+    report._finish()
+    rest = [diff.position for diff in stream]
+
+    assert [first, *rest] == [(9, 9, 7), (8, 9, 7), (1, 1, 7)]
+    assert [d.position for d in report.tile_diffs] == [(1, 1, 7), (8, 9, 7), (9, 9, 7)]
+
+
+def test_deep_level_fingerprint_detects_attribute_changes() -> None:
+    old_map = _map()
+    new_map = _map()
+    old_map.set_tile(Tile(x=1, y=1, z=7, items=[Item(id=1387, action_id=100)]))
+    new_map.set_tile(Tile(x=1, y=1, z=7, items=[Item(id=1387, action_id=200)]))
+
+    shallow = MapDiffEngine(DiffLevel.ITEMS_SHALLOW).compare_sparse(old_map, new_map)
+    deep = MapDiffEngine(DiffLevel.ITEMS_DEEP).compare_sparse(old_map, new_map)
+
+    assert not shallow.has_changes
+    assert _summary(deep) == [((1, 1, 7), ChangeType.MODIFIED)]
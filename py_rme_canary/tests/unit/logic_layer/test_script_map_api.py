@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.script_engine import MapAPI, ScriptConfig, ScriptEngine, ScriptStatus
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _sparse_map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=2048, height=2048))
+    for x, y in ((5, 9), (1900, 3), (40, 40), (7, 9)):
+        game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=4526), items=[Item(id=2120)]))
+    game_map.set_tile(Tile(x=3, y=3, z=6, ground=Item(id=2120)))
+    return game_map
+
+
+def test_sparse_iteration_and_item_queries_keep_sweep_order() -> None:
+    api = MapAPI(_sparse_map(), ScriptConfig())
+
+    assert [t.position for t in api.iter_floor(7)] == [(1900, 3, 7), (5, 9, 7), (7, 9, 7), (40, 40, 7)]
+    assert [t.position for t in api.iter_region(0, 0, 50, 20, 7)] == [(5, 9, 7), (7, 9, 7)]
+    assert api.find_items(2120) == [(3, 3, 6), (1900, 3, 7), (5, 9, 7), (7, 9, 7), (40, 40, 7)]
+    assert api.find_items(2120, floor=6) == [(3, 3, 6)]
+
+    # The indexes follow the API's own edits.
+    api.remove_item(5, 9, 7, 2120)
+    api.add_item(100, 100, 7, 2120)
+    assert api.find_items(2120, floor=7) == [(1900, 3, 7), (7, 9, 7), (40, 40, 7), (100, 100, 7)]
+    assert (100, 100, 7) in [t.position for t in api.iter_floor(7)]
+
+
+def test_batch_commits_one_action_that_undoes_every_edit() -> None:
+    game_map = _sparse_map()
+    committed = []
+    api = MapAPI(game_map, ScriptConfig(), on_commit=committed.append)
+
+    with api.batch("Bulk"):
+        assert api.fill_region(0, 0, 9, 9, 7, 919) == 100
+        with api.batch("Inner"):
+            assert api.replace_in_region(0, 0, 9, 9, 7, 2120, 2121) == 2
+        api.clear_tile(40, 40, 7)
+
+    assert len(committed) == 1
+    action = committed[0]
+    assert action.describe() == "Bulk" and len(action.tiles_after) == 101
+    assert game_map.get_tile(5, 9, 7).ground.id == 919
+    assert [item.id for item in game_map.get_tile(7, 9, 7).items] == [2121]
+
+    action.undo(game_map)
+    assert game_map.get_tile(0, 0, 7) is None
+    assert game_map.get_tile(5, 9, 7).ground.id == 4526
+    assert [item.id for item in game_map.get_tile(40, 40, 7).items] == [2120]
+
+
+def test_dry_run_counts_without_touching_the_map() -> None:
+    game_map = _sparse_map()
+    api = MapAPI(game_map, ScriptConfig(dry_run=True), on_commit=lambda _action: None)
+
+    assert api.replace_in_region(0, 0, 2047, 2047, 7, 2120, 2121) == 4
+    assert api.fill_region(0, 0, 9, 9, 7, 4526, only_existing=True) == 0
+    assert api.find_items(2121) == []
+    assert [change["type"] for change in api._pending_changes] == ["replace_in_region", "fill_region"]
+
+
+def test_session_run_script_is_one_undo_step() -> None:
+    game_map = _sparse_map()
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    notifications = []
+    session.on_tiles_changed = notifications.append
+
+    result = session.run_script(
+        """
+for tile in map.iter_floor(7):
+    map.set_ground(tile.x, tile.y, tile.z, 919)
+result = map.replace_item(2120, 2121, floor=7)
+"""
+    )
+
+    assert result.status == ScriptStatus.SUCCESS and result.return_value == 4
+    assert len(notifications) == 1 and len(notifications[0]) == 4
+    assert len(session.history.undo_stack) == 1
+
+    session.undo()
+    assert all(tile.ground.id == 4526 for tile in game_map.iter_tiles() if tile.z == 7)
+    assert game_map.get_tile(5, 9, 7).items[0].id == 2120
+
+
+def test_failed_script_still_records_its_partial_edits() -> None:
+    game_map = _sparse_map()
+    committed = []
+    engine = ScriptEngine(game_map)
+    engine.set_commit_callback(committed.append)
+
+    result = engine.execute("map.set_ground(5, 9, 7, 919)\nraise ValueError('boom')\n")
+
+    assert result.status == ScriptStatus.ERROR
+    assert len(committed) == 1 and list(committed[0].tiles_after) == [(5, 9, 7)]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.search_results import (
+    SearchColumn,
+    SearchResult,
+    SearchResultStore,
+    iter_item_results,
+)
+
+
+def _results(count: int, seed: int = 5) -> list[SearchResult]:
+    rng = random.Random(seed)
+    names = ["", "Grass", "Stone Wall", "Gold Coin"]
+    return [
+        SearchResult(
+            x=rng.randint(0, 2000),
+            y=rng.randint(0, 2000),
+            z=rng.randint(0, 15),
+            item_id=rng.choice([0, 4526, 1026, 2148]),
+            item_name=rng.choice(names),
+            match_type=rng.choice(["item", "creature", "spawn"]),
+            details=rng.choice(["", "On tile", "Ground", "Monster spawn"]),
+        )
+        for _ in range(count)
+    ]
+
+
+def _cells(result: SearchResult) -> list[str]:
+    # The cell text the old QTableWidget rows showed.
+    name = result.item_name or str(result.item_id) if result.item_id else "-"
+    return [f"{result.x}, {result.y}", str(result.z), result.match_type.capitalize(), name, result.details]
+
+
+def test_store_round_trips_results_and_display_text() -> None:
+    results = _results(300)
+    store = SearchResultStore(results)
+
+    assert len(store) == 300
+    assert list(store) == results
+    assert store[-1] == results[-1] and store[10:12] == results[10:12]
+    for row, result in enumerate(results):
+        assert [store.display(row, column) for column in SearchColumn] == _cells(result)
+    assert store.positions([3, 1]) == [(r.x, r.y, r.z) for r in (results[3], results[1])]
+
+
+def test_filter_matches_per_cell_scan() -> None:
+    results = _results(2000)
+    store = SearchResultStore(results)
+
+    for text in ("", "gr", "STONE", "4526", "1, ", "7", "-", "spawn", "zzz"):
+        expected = [row for row, r in enumerate(results) if any(text.lower() in cell.lower() for cell in _cells(r))]
+        assert list(store.filter_rows(text)) == expected, text
+        assert list(store.filter_rows(text, range(500, 900))) == [row for row in expected if 500 <= row < 900]
+
+
+def test_sort_rows_orders_by_column_keys() -> None:
+    results = _results(1000)
+    store = SearchResultStore(results)
+    rows = store.filter_rows("")
+
+    by_position = list(store.sort_rows(rows, SearchColumn.POSITION))
+    assert by_position == sorted(range(1000), key=lambda row: (results[row].x, results[row].y))
+    by_floor = list(store.sort_rows(rows, SearchColumn.FLOOR, descending=True))
+    assert [results[row].z for row in by_floor] == sorted((r.z for r in results), reverse=True)
+    for column in (SearchColumn.TYPE, SearchColumn.NAME, SearchColumn.DETAILS):
+        ordered = [store.display(row, column) for row in store.sort_rows(rows, column)]
+        assert ordered == sorted(ordered)
+
+
+def test_iter_item_results_reads_a_snapshot() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    game_map.set_tile(Tile(x=1, y=1, z=7, ground=Item(id=4526)))
+    game_map.set_tile(Tile(x=2, y=1, z=7, ground=Item(id=100), items=[Item(id=4526), Item(id=4526)]))
+    game_map.set_tile(Tile(x=3, y=1, z=7, ground=Item(id=100)))
+
+    with game_map.snapshot() as snapshot:
+        game_map.set_tile(Tile(x=3, y=1, z=7, ground=Item(id=4526)))
+        found = list(iter_item_results(snapshot.tiles, 4526, item_name="Grass"))
+
+    assert [(r.x, r.y, r.details) for r in found] == [(1, 1, "Ground"), (2, 1, "On tile")]
+    assert {r.item_name for r in found} == {"Grass"}
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+from py_rme_canary.logic_layer.session.selection import SelectionApplyMode, SelectionManager
+from py_rme_canary.logic_layer.session.selection_bitmap import ChunkedSelection, Segment
+from py_rme_canary.logic_layer.session.selection_modes import SelectionDepthMode
+
+
+def _random_keys(seed: int, count: int) -> set[tuple[int, int, int]]:
+    rng = random.Random(seed)
+    return {(rng.randint(-40, 120), rng.randint(-40, 120), rng.choice((6, 7))) for _ in range(count)}
+
+
+def test_chunked_selection_matches_set_semantics() -> None:
+    a_keys = _random_keys(1, 400)
+    b_keys = _random_keys(2, 400)
+    a = ChunkedSelection(a_keys)
+    b = ChunkedSelection(b_keys)
+
+    assert len(a) == len(a_keys)
+    assert a.to_set() == a_keys
+    assert (a | b).to_set() == a_keys | b_keys
+    assert (a & b).to_set() == a_keys & b_keys
+    assert (a - b).to_set() == a_keys - b_keys
+    assert (a ^ b).to_set() == a_keys ^ b_keys
+    assert all(key in a for key in a_keys)
+    assert (500, 500, 7) not in a
+
+    xs = [k[0] for k in a_keys]
+    ys = [k[1] for k in a_keys]
+    zs = [k[2] for k in a_keys]
+    assert a.bounding_box() == ((min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs)))
+
+
+def test_chunked_selection_rect_translate_clip_and_dilate() -> None:
+    rect = ChunkedSelection.from_rect(30, 5, 70, 40, 7)
+    expected = {(x, y, 7) for x in range(30, 71) for y in range(5, 41)}
+    assert rect.to_set() == expected
+
+    moved = rect.translated(-33, 17, 1)
+    assert moved.to_set() == {(x - 33, y + 17, 8) for x, y, _z in expected}
+
+    assert rect.clipped(0, 0, 31, 6).to_set() == {(x, y, 7) for x in (30, 31) for y in (5, 6)}
+    assert set(rect.iter_in_rect(69, 39, 100, 100, 7)) == {(69, 39, 7), (70, 39, 7), (69, 40, 7), (70, 40, 7)}
+
+    single = ChunkedSelection({(31, 31, 7)})
+    assert single.dilated(1).to_set() == {(31 + dx, 31 + dy, 7) for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+
+
+def test_box_selection_uses_occupancy_index_and_tracks_map_edits() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=256, height=256))
+    for x in range(0, 200, 3):
+        for y in range(0, 200, 5):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=100)))
+    # Logically empty tiles must never be selected.
+    game_map.set_tile(Tile(x=1, y=1, z=7))
+
+    selection = SelectionManager(game_map=game_map)
+    selection.selection_mode = SelectionDepthMode.CURRENT
+    selection.begin_box_selection(x=0, y=0, z=7)
+    selection.update_box_selection(x=99, y=99, z=7)
+    selection.finish_box_selection(mode=SelectionApplyMode.REPLACE)
+
+    expected = {(x, y, 7) for x in range(0, 100, 3) for y in range(0, 100, 5)}
+    assert selection.get_selection_tiles() == expected
+    assert selection.selection_count() == len(expected)
+    assert selection.selection_bounds() == ((0, 0, 7), (99, 95, 7))
+
+    # Same tile count, different layout: the index only learns about it
+    # through notify_tiles_changed.
+    game_map.delete_tile(0, 0, 7)
+    game_map.set_tile(Tile(x=2, y=2, z=7, ground=Item(id=100)))
+    selection.notify_tiles_changed([(0, 0, 7), (2, 2, 7)])
+
+    selection.begin_box_selection(x=0, y=0, z=7)
+    selection.update_box_selection(x=2, y=2, z=7)
+    selection.finish_box_selection(mode=SelectionApplyMode.REPLACE)
+    assert selection.get_selection_tiles() == {(2, 2, 7)}
+
+    selection.begin_box_selection(x=0, y=0, z=7)
+    selection.update_box_selection(x=3, y=0, z=7)
+    selection.finish_box_selection(mode=SelectionApplyMode.TOGGLE)
+    assert selection.get_selection_tiles() == {(2, 2, 7), (3, 0, 7)}
+
+
+def test_session_lasso_uses_bitmap_selection() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=16, height=16))
+    for x in range(2, 6):
+        game_map.set_tile(Tile(x=x, y=2, z=7, ground=Item(id=100)))
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    session.set_selection_depth_mode(SelectionDepthMode.CURRENT)
+
+    session.apply_lasso_selection(tiles=[(x, y, 7) for x in range(0, 4) for y in range(0, 4)])
+    assert session.get_selection_tiles() == {(2, 2, 7), (3, 2, 7)}
+    assert session.is_tile_selected(x=3, y=2, z=7)
+    assert not session.is_tile_selected(x=4, y=2, z=7)
+
+    session.apply_lasso_selection(tiles=[(3, 2, 7)], mode=SelectionApplyMode.SUBTRACT)
+    assert session.get_selection_count() == 1
+    assert list(session.iter_selection_in_rect(x0=0, y0=0, x1=15, y1=15, z=7)) == [(2, 2, 7)]
+
+
+def _unit_edges(segments: list[Segment]) -> set[tuple[str, int, int]]:
+    edges = set()
+    for x0, y0, x1, y1 in segments:
+        if y0 == y1:
+            edges.update(("h", x, y0) for x in range(x0, x1))
+        else:
+            edges.update(("v", x0, y) for y in range(y0, y1))
+    return edges
+
+
+def test_outline_merges_edges_across_chunks() -> None:
+    keys = _random_keys(3, 3000)
+    expected = set()
+    for x, y, z in keys:
+        if z != 7:
+            continue
+        if (x, y - 1, z) not in keys:
+            expected.add(("h", x, y))
+        if (x, y + 1, z) not in keys:
+            expected.add(("h", x, y + 1))
+        if (x - 1, y, z) not in keys:
+            expected.add(("v", x, y))
+        if (x + 1, y, z) not in keys:
+            expected.add(("v", x + 1, y))
+
+    segments = ChunkedSelection(keys).outline_in_rect(-64, -64, 160, 160, 7)
+    assert len(segments) == len(set(segments))
+    assert _unit_edges(segments) == expected
+
+    # A 40x10 rectangle spanning two chunks: one top and one bottom run per chunk.
+    rect = ChunkedSelection.from_rect(10, 4, 49, 13, 7)
+    assert sorted(rect.outline_in_rect(0, 0, 63, 31, 7)) == [
+        (10, 4, 10, 14),
+        (10, 4, 32, 4),
+        (10, 14, 32, 14),
+        (32, 4, 50, 4),
+        (32, 14, 50, 14),
+        (50, 4, 50, 14),
+    ]
+
+
+def test_manager_outline_cache_follows_the_selection() -> None:
+    manager = SelectionManager(game_map=GameMap(header=MapHeader(otbm_version=2, width=256, height=256)))
+    manager.set_selection({(x, 5, 7) for x in range(20)})
+    assert sorted(manager.selection_outline_in_rect(0, 0, 31, 31, 7)) == [
+        (0, 5, 0, 6),
+        (0, 5, 20, 5),
+        (0, 6, 20, 6),
+        (20, 5, 20, 6),
+    ]
+
+    manager.add_tile((31, 5, 7))
+    assert (32, 5, 32, 6) in manager.selection_outline_in_rect(0, 0, 31, 31, 7)
+
+    # Selecting in the neighbouring chunk changes this chunk's boundary too.
+    manager.add_tile((32, 5, 7))
+    outline = manager.selection_outline_in_rect(0, 0, 31, 31, 7)
+    assert (20, 5, 20, 6) in outline
+    assert (32, 5, 32, 6) not in outline
+    assert manager.selection_outline_in_rect(0, 0, 31, 31, 6) == []
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Position
+from py_rme_canary.core.data.spawns import MonsterSpawnArea
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+
+
+def _linear_covering(areas: list[MonsterSpawnArea], x: int, y: int, z: int) -> list[int]:
+    return [
+        idx
+        for idx, area in enumerate(areas)
+        if area.center.z == z and max(abs(x - area.center.x), abs(y - area.center.y)) <= area.radius
+    ]
+
+
+def _random_areas(seed: int, count: int) -> list[MonsterSpawnArea]:
+    rng = random.Random(seed)
+    return [
+        MonsterSpawnArea(
+            center=Position(x=rng.randint(0, 300), y=rng.randint(0, 300), z=rng.choice((6, 7))),
+            radius=rng.randint(0, 40),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_point_and_rect_queries_match_linear_scan() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=512, height=512))
+    game_map.monster_spawns = _random_areas(5, 300)
+    index = game_map.monster_spawn_index()
+    rng = random.Random(9)
+
+    for _ in range(200):
+        x, y, z = rng.randint(-20, 320), rng.randint(-20, 320), rng.choice((6, 7))
+        assert [idx for idx, _area in index.covering(x, y, z)] == _linear_covering(game_map.monster_spawns, x, y, z)
+
+    expected = [
+        idx
+        for idx, area in enumerate(game_map.monster_spawns)
+        if area.center.z == 7
+        and area.center.x - area.radius <= 60
+        and area.center.x + area.radius >= 40
+        and area.center.y - area.radius <= 45
+        and area.center.y + area.radius >= 10
+    ]
+    assert [idx for idx, _area in index.in_rect(60, 45, 40, 10, 7)] == expected
+
+
+def test_index_follows_in_place_edits_and_list_replacement() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    first = MonsterSpawnArea(center=Position(x=10, y=10, z=7), radius=3)
+    second = MonsterSpawnArea(center=Position(x=12, y=10, z=7), radius=3)
+    game_map.monster_spawns.append(first)
+    assert game_map.monster_spawn_index().centered_at(10, 10, 7) is first
+
+    game_map.monster_spawns.append(second)
+    assert game_map.monster_spawn_index().nearest_covering(12, 11, 7) == (1, second, 0, 1)
+
+    game_map.monster_spawns.remove(first)
+    assert game_map.monster_spawn_index().centered_at(10, 10, 7) is None
+    assert game_map.monster_spawn_index().nearest_covering(11, 10, 7) == (0, second, -1, 0)
+
+    game_map.monster_spawns = [first]
+    assert [area for _idx, area in game_map.monster_spawn_index().covering(13, 10, 7)] == [first]
+    assert len(game_map.monster_spawn_index()) == 1
+
+
+def test_session_spawn_edits_and_undo_keep_index_in_sync() -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+
+    assert session.set_monster_spawn_area(x=20, y=20, z=7, radius=2) is not None
+    assert session.add_monster_spawn_entry(x=21, y=19, z=7, name="orc") is not None
+    area = game_map.monster_spawns[0]
+    assert [(entry.name, entry.dx, entry.dy) for entry in area.monsters] == [("orc", 1, -1)]
+    assert [a for _idx, a in game_map.monster_spawn_index().covering(22, 22, 7)] == [area]
+
+    session.undo()
+    assert game_map.monster_spawn_index().covering(21, 19, 7)[0][1].monsters == ()
+    session.undo()
+    assert game_map.monster_spawn_index().covering(20, 20, 7) == []
+    session.redo()
+    assert game_map.monster_spawn_index().centered_at(20, 20, 7) is not None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+from py_rme_canary.logic_layer.teleport_manager import LinkStatus, TeleportManager
+
+
+def _teleport(x: int, y: int, z: int) -> Item:
+    return Item(id=1387, destination=Position(x=x, y=y, z=z))
+
+
+def _paired_map() -> GameMap:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    for x in range(8):
+        game_map.set_tile(Tile(x=x, y=0, z=7, ground=Item(id=4526)))
+    game_map.set_tile(Tile(x=1, y=0, z=7, ground=Item(id=4526), items=[_teleport(5, 0, 7)]))
+    game_map.set_tile(Tile(x=5, y=0, z=7, ground=Item(id=4526), items=[_teleport(1, 0, 7)]))
+    game_map.set_tile(Tile(x=2, y=0, z=7, ground=Item(id=4526), items=[_teleport(3, 0, 7)]))
+    return game_map
+
+
+def test_scan_reads_existing_tiles_outside_the_header_grid() -> None:
+    game_map = _paired_map()
+    game_map.set_tile(Tile(x=500, y=500, z=3, ground=Item(id=4526), items=[_teleport(1, 0, 7)]))
+    manager = TeleportManager(game_map)
+
+    assert manager.scan_map() == 4
+    result = manager.validate_all()
+    assert result.valid_links == 2
+    assert {link.source for link in result.no_return_links} == {(2, 0, 7), (500, 500, 3)}
+    assert [link.source for link in manager.get_links_to((1, 0, 7))] == [(5, 0, 7), (500, 500, 3)]
+
+
+def test_session_edits_and_undo_update_links_incrementally() -> None:
+    session = EditorSession(game_map=_paired_map(), brush_manager=BrushManager())
+    manager = session.teleport_links()
+    assert manager.link_count == 3
+    assert manager.validate_all().valid_links == 2
+
+    session.set_selection_tiles({(1, 0, 7), (2, 0, 7)})
+    assert session.delete_selection(borderize=False) is not None
+    assert [link.source for link in manager.iter_links()] == [(5, 0, 7)]
+    assert session.teleport_links() is manager
+
+    session.undo()
+    assert manager.link_count == 3
+    assert manager.validate_all().valid_links == 2
+    session.redo()
+    assert manager.link_count == 1
+    session.undo()
+    assert manager.get_link_at((1, 0, 7)).destination == (5, 0, 7)  # type: ignore[union-attr]
+
+    session.game_map.delete_tile(3, 0, 7)
+    session._emit_tiles_changed({(3, 0, 7)})
+    result = manager.validate_all()
+    assert [link.source for link in result.broken_links] == [(2, 0, 7)]
+    assert result.valid_links == 2
+
+
+def test_validate_all_only_rechecks_touched_links() -> None:
+    game_map = _paired_map()
+    manager = TeleportManager(game_map)
+    manager.scan_map()
+    manager.validate_all()
+
+    checked: list[tuple[int, int, int]] = []
+    original = manager._link_status
+
+    def spy(link):  # type: ignore[no-untyped-def]
+        checked.append(link.source)
+        return original(link)
+
+    manager._link_status = spy  # type: ignore[method-assign]
+    manager.validate_all()
+    assert checked == []
+
+    game_map.set_tile(Tile(x=5, y=0, z=7, ground=Item(id=4526), items=[_teleport(6, 0, 7)]))
+    manager.notify_tiles_changed({(5, 0, 7)})
+    result = manager.validate_all()
+    assert sorted(checked) == [(1, 0, 7), (5, 0, 7)]
+    assert manager.get_link_at((1, 0, 7)).status is LinkStatus.NO_RETURN  # type: ignore[union-attr]
+    assert result.valid_links == 0
+
+
+def test_set_destination_replaces_the_tile_instead_of_editing_it() -> None:
+    session = EditorSession(game_map=_paired_map(), brush_manager=BrushManager())
+    manager = session.teleport_links()
+    before = session.game_map.get_tile(2, 0, 7)
+    changed: list[set[tuple[int, int, int]]] = []
+    session.on_tiles_changed = changed.append
+
+    with session.game_map.snapshot() as snapshot:
+        assert manager.set_destination((2, 0, 7), (4, 0, 7))
+        assert snapshot.tiles.get((2, 0, 7)) is before
+
+    after = session.game_map.get_tile(2, 0, 7)
+    assert after is not None and after is not before
+    assert after.items[0].destination == Position(x=4, y=0, z=7)
+    assert before is not None and before.items[0].destination == Position(x=3, y=0, z=7)
+    assert changed == [{(2, 0, 7)}]
+    assert manager.get_link_at((2, 0, 7)).destination == (4, 0, 7)  # type: ignore[union-attr]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.chunk_colors import EMPTY_COLOR, id_color
+from py_rme_canary.logic_layer.drawing_options import DrawingOptions
+from py_rme_canary.vis_layer.renderer.map_drawer import MapDrawer, RenderBackend
+
+
+class _RecordingBackend(RenderBackend):
+    def __init__(self) -> None:
+        self.colors: list[tuple[int, int, int, tuple[int, ...]]] = []
+        self.sprites: list[tuple[int, int, int]] = []
+        self.grid_rects = 0
+
+    def clear(self, r: int, g: int, b: int, a: int = 255) -> None:
+        pass
+
+    def draw_tile_color(self, x: int, y: int, size: int, r: int, g: int, b: int, a: int = 255) -> None:
+        self.colors.append((x, y, size, (r, g, b, a)))
+
+    def draw_tile_sprite(self, x: int, y: int, size: int, sprite_id: int) -> None:
+        self.sprites.append((x, y, sprite_id))
+
+    def draw_grid_line(self, x0: int, y0: int, x1: int, y1: int, r: int, g: int, b: int, a: int = 255) -> None:
+        pass
+
+    def draw_grid_rect(self, x: int, y: int, w: int, h: int, r: int, g: int, b: int, a: int = 255) -> None:
+        self.grid_rects += 1
+
+    def draw_selection_rect(self, x: int, y: int, w: int, h: int, r: int, g: int, b: int, a: int = 255) -> None:
+        pass
+
+    def draw_indicator_icon(self, x: int, y: int, indicator_type: str, size: int) -> None:
+        pass
+
+    def draw_text(self, x: int, y: int, text: str, r: int, g: int, b: int, a: int = 255) -> None:
+        pass
+
+    def draw_shade_overlay(self, x: int, y: int, w: int, h: int, alpha: int) -> None:
+        pass
+
+
+class _TextureBackend(_RecordingBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.textures: list[tuple[int, int, int, int, int, int, int]] = []
+
+    def draw_chunk_texture(
+        self, x: int, y: int, size: int, rgba: bytes, sx: int, sy: int, cols: int, rows: int
+    ) -> None:
+        self.textures.append((x, y, size, sx, sy, cols, rows))
+
+
+def _drawer(tile_px: int) -> MapDrawer:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=40, height=40))
+    for x in range(40):
+        for y in range(40):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=100), items=[Item(id=2000)]))
+    game_map.set_tile(Tile(x=0, y=0, z=6, ground=Item(id=101)))
+    opts = DrawingOptions()
+    opts.show_shade = False
+    drawer = MapDrawer(options=opts, game_map=game_map)
+    drawer.viewport.z = 6
+    drawer.viewport.tile_px = tile_px
+    drawer.viewport.width_px = 20 * tile_px
+    drawer.viewport.height_px = 10 * tile_px
+    return drawer
+
+
+def test_full_detail_draws_sprites_on_every_floor() -> None:
+    drawer = _drawer(32)
+    backend = _RecordingBackend()
+
+    drawer.draw(backend)
+
+    assert (0, 0, 2000) in backend.sprites and (0, 0, 101) in backend.sprites
+    assert backend.grid_rects > 0
+
+
+def test_colors_level_draws_ground_colors_of_current_floor() -> None:
+    drawer = _drawer(8)
+    backend = _RecordingBackend()
+
+    drawer.draw(backend)
+
+    assert not backend.sprites and backend.grid_rects == 0
+    assert len(backend.colors) == 21 * 11
+    assert backend.colors[0] == (0, 0, 8, id_color(101))
+
+
+def test_chunk_level_draws_one_texture_per_chunk() -> None:
+    drawer = _drawer(6)
+    drawer.viewport.origin_x = 20
+    drawer.viewport.width_px = 120 * 6
+    backend = _TextureBackend()
+
+    drawer.draw(backend)
+
+    assert not backend.sprites and not backend.colors
+    assert backend.textures == [(0, 0, 6, 20, 0, 12, 11), (72, 0, 6, 0, 0, 8, 11)]
+
+
+def test_chunk_level_falls_back_to_tile_colors() -> None:
+    drawer = _drawer(6)
+    backend = _RecordingBackend()
+
+    drawer.draw(backend)
+
+    assert len(backend.colors) == 21 * 11
+    assert backend.colors[:2] == [(0, 0, 6, id_color(101)), (6, 0, 6, EMPTY_COLOR)]
+
+
+def test_region_redraw_is_limited_to_region_and_label_reach() -> None:
+    drawer = _drawer(32)
+    full = _RecordingBackend()
+    drawer.draw_map_layer(full)
+    region = _RecordingBackend()
+
+    drawer.draw_map_layer(region, (10, 5, 12, 6))
+
+    drawn = {(x // 32, y // 32) for x, y, _sid in region.sprites}
+    assert drawn == {(x, y) for x in range(5, 12) for y in range(4, 6)}
+    assert set(region.sprites) <= set(full.sprites)
+
+
+def test_minimap_mode_keeps_drawing_every_floor() -> None:
+    drawer = _drawer(32)
+    drawer.options.show_as_minimap = True
+    backend = _RecordingBackend()
+
+    drawer.draw(backend)
+
+    assert not backend.sprites
+    assert len(backend.colors) == 2 * 21 * 11
+    assert backend.colors[0] == (0, 0, 32, id_color(2000))
+    assert backend.colors[21 * 11] == (0, 0, 32, id_color(101))
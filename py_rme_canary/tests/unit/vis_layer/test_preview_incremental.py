@@ -0,0 +1,128 @@
+"""Tests for incremental In-Game Preview snapshots."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from PyQt6.QtCore import QObject
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.vis_layer.preview.preview_controller import PreviewController
+from py_rme_canary.vis_layer.preview.preview_renderer import PreviewDelta, PreviewViewport, TileSnapshot
+from py_rme_canary.vis_layer.preview.preview_thread import PreviewThread
+
+
+class _Canvas:
+    def width(self) -> int:
+        return 4 * 32
+
+    def height(self) -> int:
+        return 3 * 32
+
+
+class _Editor(QObject):
+    def __init__(self, game_map: GameMap) -> None:
+        super().__init__()
+        self.map = game_map
+        self.canvas = _Canvas()
+        self.viewport = SimpleNamespace(origin_x=0, origin_y=0, z=7, tile_px=32)
+        self.id_mapper = None
+        self.appearance_assets = None
+        self.show_grid = False
+        self.clock_ms = 0
+
+    def animation_time_ms(self) -> int:
+        return self.clock_ms
+
+
+class _RecordingThread:
+    def __init__(self) -> None:
+        self.deltas: list[PreviewDelta] = []
+
+    def submit_delta(self, delta: PreviewDelta) -> None:
+        self.deltas.append(delta)
+
+    def is_alive(self) -> bool:
+        return True
+
+
+def _controller() -> tuple[PreviewController, _Editor, _RecordingThread]:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    for x in range(10):
+        for y in range(10):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=4526)))
+    editor = _Editor(game_map)
+    controller = PreviewController(editor)  # type: ignore[arg-type]
+    thread = _RecordingThread()
+    controller._thread = thread  # type: ignore[assignment]
+    return controller, editor, thread
+
+
+def test_unchanged_frames_are_skipped_and_only_dirty_tiles_are_sent() -> None:
+    controller, editor, thread = _controller()
+
+    controller._sync()
+    first = thread.deltas[-1]
+    assert first.reset
+    assert len(first.tiles) == 5 * 4  # (width // 32 + 1) x (height // 32 + 1)
+
+    controller._sync()
+    editor.clock_ms = 40  # same animation step
+    controller._sync()
+    assert len(thread.deltas) == 1
+
+    editor.clock_ms = 100
+    controller._sync()
+    assert thread.deltas[-1].tiles == () and not thread.deltas[-1].reset
+
+    editor.map.set_tile(Tile(x=1, y=1, z=7, ground=Item(id=4527)))
+    editor.map.delete_tile(2, 2, 7)
+    controller.notify_tiles_changed({(1, 1, 7), (2, 2, 7), (40, 40, 7)})
+    controller._sync()
+    delta = thread.deltas[-1]
+    assert [(tile.x, tile.y, tile.ground.server_id) for tile in delta.tiles] == [(1, 1, 4527)]
+    assert delta.removed == ((2, 2, 7),)
+
+
+def test_viewport_scroll_sends_entering_and_leaving_tiles() -> None:
+    controller, editor, thread = _controller()
+    controller._sync()
+
+    editor.viewport.origin_x = 1
+    controller._sync()
+    delta = thread.deltas[-1]
+    assert sorted((tile.x, tile.y) for tile in delta.tiles) == [(5, y) for y in range(4)]
+    assert sorted(delta.removed) == [(0, y, 7) for y in range(4)]
+
+
+def test_identical_items_share_one_snapshot() -> None:
+    controller, editor, thread = _controller()
+    editor.map.set_tile(Tile(x=3, y=0, z=7, ground=Item(id=4526), items=[Item(id=2148, count=5)]))
+    controller._sync()
+    tiles = {(t.x, t.y): t for t in thread.deltas[-1].tiles}
+
+    assert tiles[(0, 0)].ground is tiles[(2, 1)].ground
+    assert tiles[(3, 0)].items[0].count == 5
+    assert tiles[(3, 0)].items[0] is not tiles[(3, 0)].ground
+
+
+def test_thread_mirror_merges_pending_deltas() -> None:
+    thread = PreviewThread(sprite_provider=None, appearance_index=None, legacy_items=None, items_xml=None)
+    viewport = PreviewViewport(origin_x=0, origin_y=0, z=7, tile_px=32, tiles_wide=2, tiles_high=2)
+
+    def tile(x: int, y: int, light: int) -> TileSnapshot:
+        return TileSnapshot(x=x, y=y, z=7, ground=None, items=(), light_strength=light)
+
+    thread.submit_delta(PreviewDelta(viewport=viewport, time_ms=0, tiles=(tile(1, 0, 1), tile(0, 1, 1)), reset=True))
+    thread.submit_delta(PreviewDelta(viewport=viewport, time_ms=100, tiles=(tile(0, 0, 2),), removed=((0, 1, 7),)))
+    assert thread._apply_pending()
+    snapshot = thread._current_snapshot
+    assert snapshot is not None and snapshot.time_ms == 100
+    assert [(t.x, t.y) for t in snapshot.tiles] == [(0, 0), (1, 0)]
+
+    assert not thread._apply_pending()
+    thread.submit_delta(PreviewDelta(viewport=viewport, time_ms=200))
+    assert thread._apply_pending()
+    assert thread._current_snapshot.tiles is snapshot.tiles
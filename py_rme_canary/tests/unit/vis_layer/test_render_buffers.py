@@ -0,0 +1,61 @@
+"""Reuse of per-frame render buffers in the OpenGL batchers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from py_rme_canary.vis_layer.renderer.core import FloatUploadBuffer, ModernSpriteBatcher  # noqa: E402
+from py_rme_canary.vis_layer.renderer.opengl_backend import _OpenGLBatcher  # noqa: E402
+
+
+def test_upload_buffer_grows_geometrically_and_is_refilled_in_place() -> None:
+    buffer = FloatUploadBuffer()
+    data, nbytes = buffer.fill([1.0, 2.0, 3.0])
+    assert nbytes == 12 and list(data[:3]) == [1.0, 2.0, 3.0]
+    again, nbytes = buffer.fill([4.0])
+    assert again is data and nbytes == 4 and data[0] == 4.0
+    buffer.fill([0.0] * (buffer.capacity + 1))
+    assert buffer.grows == 2
+    assert buffer.capacity >= 2 * len(data)
+
+
+def test_sprite_batcher_reuses_instances_between_frames() -> None:
+    gl = MagicMock()
+    batcher = ModernSpriteBatcher(gl)
+    batcher._initialized = True
+
+    def frame(count: int) -> None:
+        batcher.begin()
+        for i in range(count):
+            batcher.add_sprite(float(i), 0.0, 32.0, 32.0, i, tint=(255, 0, 0, 255))
+        batcher.end(800, 600)
+
+    frame(50)
+    first = list(batcher._sprites)
+    frame(40)
+    assert list(batcher._sprites) == first[:40]
+    assert batcher.stats.sprites_drawn == 40
+    assert batcher.stats.vertices_uploaded == 40 * ModernSpriteBatcher.FLOATS_PER_QUAD
+    assert batcher._sprites.stats.created == 50
+    _target, nbytes, _data, _usage = gl.glBufferData.call_args.args
+    assert nbytes == 40 * ModernSpriteBatcher.FLOATS_PER_QUAD * 4
+
+
+def test_gl_batcher_reset_keeps_sprite_runs() -> None:
+    batcher = _OpenGLBatcher()
+    batcher.add_sprite(7, 0, 0, 32, 32)
+    batcher.add_sprite(7, 32, 0, 32, 32)
+    batcher.add_sprite(9, 64, 0, 32, 32)
+    runs = list(batcher.sprite_runs)
+    assert [(run.texture_id, len(run.vertices)) for run in runs] == [(7, 96), (9, 48)]
+
+    batcher.reset()
+    batcher.add_color_rect(0, 0, 32, 32, (255, 0, 0, 255))
+    batcher.add_sprite(3, 0, 0, 32, 32)
+    assert len(batcher.sprite_runs) == 1 and batcher.sprite_runs.last() is runs[0]
+    assert runs[0].texture_id == 3 and len(runs[0].vertices) == 48
+    assert batcher.color_vertices[4:8] == [1.0, 0.0, 0.0, 1.0]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+try:  # pragma: no cover - skip when PyQt6 is not available (e.g. headless CI)
+    from PyQt6.QtCore import QRect
+    from PyQt6.QtGui import QImage, QPainter
+    from PyQt6.QtWidgets import QApplication
+except Exception:  # pragma: no cover
+    pytest.skip("PyQt6 is required for retained map layer tests", allow_module_level=True)
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.chunk_colors import tiles_version
+from py_rme_canary.logic_layer.drawing_options import DrawingOptions
+from py_rme_canary.logic_layer.render_optimizer import FrameMode
+from py_rme_canary.vis_layer.renderer.map_drawer import MapDrawer
+from py_rme_canary.vis_layer.renderer.map_layer import RetainedMapLayer, map_layer_key
+from py_rme_canary.vis_layer.renderer.qpainter_backend import QPainterRenderBackend
+
+_RECT = QRect(0, 0, 320, 200)
+
+
+@pytest.fixture
+def app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _drawer(tile_px: int) -> MapDrawer:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=64, height=64))
+    for x in range(64):
+        for y in range(64):
+            game_map.set_tile(Tile(x=x, y=y, z=7, ground=Item(id=100 + (x * 7 + y) % 5), items=[Item(id=2000 + x)]))
+    opts = DrawingOptions()
+    opts.show_client_ids = True
+    drawer = MapDrawer(options=opts, game_map=game_map)
+    drawer.viewport.origin_x = 3
+    drawer.viewport.origin_y = 2
+    drawer.viewport.tile_px = tile_px
+    drawer.viewport.width_px = _RECT.width()
+    drawer.viewport.height_px = _RECT.height()
+    return drawer
+
+
+def _frame(layer: RetainedMapLayer, drawer: MapDrawer, calls: list[int] | None = None) -> tuple[FrameMode, QImage]:
+    def make_backend(painter: QPainter) -> QPainterRenderBackend:
+        if calls is not None:
+            calls.append(1)
+        return QPainterRenderBackend(painter, target_rect=_RECT, sprite_lookup=lambda _sid, _size: None)
+
+    image = QImage(_RECT.width(), _RECT.height(), QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    plan = layer.paint(
+        painter,
+        drawer,
+        key=map_layer_key(None, drawer, 1.0),
+        version=tiles_version(drawer.game_map),
+        target_rect=_RECT,
+        device_pixel_ratio=1.0,
+        make_backend=make_backend,
+    )
+    painter.end()
+    return plan.mode, image
+
+
+@pytest.mark.parametrize("tile_px", [32, 8, 6])
+def test_partial_redraw_matches_full_redraw(app, tile_px: int) -> None:
+    drawer = _drawer(tile_px)
+    layer = RetainedMapLayer()
+    assert _frame(layer, drawer)[0] is FrameMode.FULL
+
+    changed = [(5, 5, 7), (6, 5, 7), (9, 4, 7)]
+    for x, y, z in changed:
+        drawer.game_map.set_tile(Tile(x=x, y=y, z=z, ground=Item(id=999)))
+    drawer.invalidate_tiles(changed)
+    layer.mark_tiles(changed, version=tiles_version(drawer.game_map))
+    mode, patched = _frame(layer, drawer)
+
+    assert mode is FrameMode.PARTIAL
+    assert patched == _frame(RetainedMapLayer(), drawer)[1]
+
+
+def test_unchanged_frame_reuses_layer(app) -> None:
+    drawer = _drawer(32)
+    layer = RetainedMapLayer()
+    _mode, first = _frame(layer, drawer)
+    calls: list[int] = []
+
+    drawer.set_hover_tile(4, 4, 7, [2004])
+    mode, second = _frame(layer, drawer, calls)
+
+    assert mode is FrameMode.SKIP and not calls
+    assert second == first
+
+
+def test_unreported_edit_redraws_whole_layer(app) -> None:
+    drawer = _drawer(32)
+    layer = RetainedMapLayer()
+    _frame(layer, drawer)
+
+    drawer.game_map.set_tile(Tile(x=4, y=4, z=7, ground=Item(id=999)))
+
+    assert _frame(layer, drawer)[0] is FrameMode.FULL
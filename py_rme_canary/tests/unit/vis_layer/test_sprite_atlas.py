@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+try:  # pragma: no cover - skip when PyQt6 is not available (e.g. headless CI)
+    from PyQt6.QtCore import QRect
+    from PyQt6.QtGui import QColor, QImage, QPainter
+    from PyQt6.QtWidgets import QApplication
+except Exception:  # pragma: no cover
+    pytest.skip("PyQt6 is required for sprite atlas tests", allow_module_level=True)
+
+from py_rme_canary.vis_layer.renderer.qpainter_backend import QPainterRenderBackend
+from py_rme_canary.vis_layer.renderer.sprite_atlas import SpriteAtlasCache, _ShelfPacker
+
+
+@pytest.fixture
+def app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _solid_sprite(r: int, g: int, b: int, size: int = 32) -> tuple[int, int, bytes]:
+    # BGRA byte order (Format_ARGB32 on little endian).
+    return size, size, bytes((b, g, r, 255)) * (size * size)
+
+
+def test_shelf_packer_wraps_rows_and_reports_full() -> None:
+    packer = _ShelfPacker(64)
+    assert packer.allocate(32, 32) == (0, 0)
+    assert packer.allocate(32, 32) == (32, 0)
+    assert packer.allocate(32, 32) == (0, 32)
+    assert packer.allocate(32, 32) == (32, 32)
+    assert packer.allocate(32, 32) is None
+
+
+def test_atlas_stores_each_sprite_once(app) -> None:
+    atlas = SpriteAtlasCache(page_size=64, max_pages=2)
+    calls: list[int] = []
+
+    def loader(sid: int):
+        calls.append(sid)
+        return _solid_sprite(255, 0, 0)
+
+    first = atlas.slot_for(7, loader)
+    again = atlas.slot_for(7, loader)
+    assert first is not None and first == again
+    assert calls == [7]
+    assert len(atlas) == 1
+    assert atlas.page_count == 1
+
+
+def test_atlas_remembers_misses(app) -> None:
+    atlas = SpriteAtlasCache(page_size=64)
+    calls: list[int] = []
+
+    def loader(sid: int):
+        calls.append(sid)
+        return None
+
+    assert atlas.slot_for(3, loader) is None
+    assert atlas.slot_for(3, loader) is None
+    assert calls == [3]
+
+
+def test_atlas_resets_when_all_pages_are_full(app) -> None:
+    atlas = SpriteAtlasCache(page_size=64, max_pages=1)
+    for sid in range(1, 5):
+        assert atlas.slot_for(sid, lambda _sid: _solid_sprite(0, 0, 255)) is not None
+    generation = atlas.generation
+
+    slot = atlas.slot_for(99, lambda _sid: _solid_sprite(0, 0, 255))
+    assert slot is not None
+    assert atlas.generation == generation + 1
+    assert len(atlas) == 1
+
+
+def test_backend_batches_atlas_sprites_per_page(app) -> None:
+    atlas = SpriteAtlasCache(page_size=128)
+    colors = {1: (255, 0, 0), 2: (0, 255, 0)}
+
+    img = QImage(64, 64, QImage.Format.Format_ARGB32)
+    img.fill(QColor(0, 0, 0))
+    painter = QPainter(img)
+    backend = QPainterRenderBackend(
+        painter,
+        target_rect=QRect(0, 0, 64, 64),
+        sprite_lookup=lambda _sid, _size: None,
+        sprite_atlas=atlas,
+        atlas_lookup=lambda sid: atlas.slot_for(sid, lambda s: _solid_sprite(*colors[s])),
+    )
+    # Drawn at 16px from 32px native sprites: the fragment scale does the zoom.
+    backend.draw_tile_sprite(0, 0, 16, 1)
+    backend.draw_tile_color(16, 0, 16, 43, 43, 43)
+    backend.draw_tile_sprite(32, 0, 16, 2)
+    backend.flush()
+    painter.end()
+
+    assert backend.fragment_batches == 1
+    assert backend.fragments_drawn == 2
+    red = QColor(img.pixelColor(8, 8))
+    green = QColor(img.pixelColor(40, 8))
+    assert (red.red(), red.green()) == (255, 0)
+    assert (green.red(), green.green()) == (0, 255)
+
+
+def test_atlas_len_tracks_packed_slots(app) -> None:
+    atlas = SpriteAtlasCache(page_size=64, max_pages=2)
+    atlas.slot_for(1, lambda _sid: _solid_sprite(255, 0, 0))
+    atlas.slot_for(2, lambda _sid: _solid_sprite(0, 255, 0))
+    atlas.slot_for(3, lambda _sid: None)
+    assert len(atlas) == 2
+
+    atlas.forget(3)
+    assert len(atlas) == 2
+    atlas.forget(1)
+    assert len(atlas) == 1
+    atlas.clear()
+    assert len(atlas) == 0
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QEvent
+
+from py_rme_canary.vis_layer.ui.canvas.widget import MapCanvasWidget
+
+
+def test_leave_event_drops_the_queued_pointer_and_hover(qtbot) -> None:
+    statuses: list[tuple[int, int]] = []
+    editor = SimpleNamespace(
+        show_preview=False,
+        update_status_from_mouse=lambda px, py: statuses.append((px, py)),
+    )
+    canvas = MapCanvasWidget(None, editor)
+    qtbot.addWidget(canvas)
+    canvas._hover_tile = (10, 10, 7)
+    canvas._hover_stack = [100]
+
+    canvas._input.move(5, 5)
+    canvas.leaveEvent(QEvent(QEvent.Type.Leave))
+    canvas._flush_pending_input()
+
+    assert canvas._input.pending is False
+    assert statuses == []
+    assert canvas._hover_tile is None
+    assert canvas._hover_stack == []
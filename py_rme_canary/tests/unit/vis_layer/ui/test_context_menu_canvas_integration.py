@@ -10,6 +10,7 @@ from PyQt6.QtCore import QPoint
 
 from py_rme_canary.logic_layer import context_menu_handlers as handlers_module
 from py_rme_canary.vis_layer.renderer import opengl_canvas as opengl_module
+from py_rme_canary.vis_layer.ui.canvas import pointer_input as pointer_module
 from py_rme_canary.vis_layer.ui.canvas import widget as canvas_module
 from py_rme_canary.vis_layer.ui.menus import context_menus as menus_module
 
@@ -230,6 +231,9 @@ def _make_map_paint_canvas(editor: SimpleNamespace) -> SimpleNamespace:
     canvas = SimpleNamespace(_editor=editor, _tile_at=lambda _x, _y: (20, 20))
     canvas._draw_offsets = lambda: canvas_module.MapCanvasWidget._draw_offsets(canvas)
     canvas._border_offsets = lambda: canvas_module.MapCanvasWidget._border_offsets(canvas)
+    canvas._paint_footprint = lambda path, alt=False: pointer_module.CoalescedPointerMixin._paint_footprint(
+        canvas, path, alt=alt
+    )
     return canvas
 
 
@@ -237,6 +241,9 @@ def _make_opengl_paint_canvas(editor: SimpleNamespace) -> SimpleNamespace:
     canvas = SimpleNamespace(_editor=editor, _tile_at=lambda _x, _y: (20, 20))
     canvas._draw_offsets = lambda: opengl_module.OpenGLCanvasWidget._draw_offsets(canvas)
     canvas._border_offsets = lambda: opengl_module.OpenGLCanvasWidget._border_offsets(canvas)
+    canvas._paint_footprint = lambda path, alt=False: pointer_module.CoalescedPointerMixin._paint_footprint(
+        canvas, path, alt=alt
+    )
     return canvas
 
 
@@ -244,7 +251,7 @@ def test_map_canvas_paint_footprint_without_mirror_skips_dedupe(monkeypatch: pyt
     def _boom(_positions):
         raise AssertionError("dedupe_positions should not be called when mirror is disabled")
 
-    monkeypatch.setattr(canvas_module, "dedupe_positions", _boom)
+    monkeypatch.setattr(pointer_module, "dedupe_positions", _boom)
     editor = _make_paint_editor(mirror_enabled=False)
     fake_canvas = _make_map_paint_canvas(editor)
 
@@ -259,7 +266,7 @@ def test_opengl_canvas_paint_footprint_without_mirror_skips_dedupe(monkeypatch:
     def _boom(_positions):
         raise AssertionError("dedupe_positions should not be called when mirror is disabled")
 
-    monkeypatch.setattr(opengl_module, "dedupe_positions", _boom)
+    monkeypatch.setattr(pointer_module, "dedupe_positions", _boom)
     editor = _make_paint_editor(mirror_enabled=False)
     fake_canvas = _make_opengl_paint_canvas(editor)
 
@@ -282,8 +289,8 @@ def test_map_canvas_paint_footprint_with_mirror_uses_dedupe_and_union(monkeypatc
         union_calls["count"] += 1
         return list(positions)
 
-    monkeypatch.setattr(canvas_module, "dedupe_positions", _dedupe)
-    monkeypatch.setattr(canvas_module, "union_with_mirrored", _union)
+    monkeypatch.setattr(pointer_module, "dedupe_positions", _dedupe)
+    monkeypatch.setattr(pointer_module, "union_with_mirrored", _union)
     editor = _make_paint_editor(mirror_enabled=True)
     fake_canvas = _make_map_paint_canvas(editor)
 
@@ -305,8 +312,8 @@ def test_opengl_canvas_paint_footprint_with_mirror_uses_dedupe_and_union(monkeyp
         union_calls["count"] += 1
         return list(positions)
 
-    monkeypatch.setattr(opengl_module, "dedupe_positions", _dedupe)
-    monkeypatch.setattr(opengl_module, "union_with_mirrored", _union)
+    monkeypatch.setattr(pointer_module, "dedupe_positions", _dedupe)
+    monkeypatch.setattr(pointer_module, "union_with_mirrored", _union)
     editor = _make_paint_editor(mirror_enabled=True)
     fake_canvas = _make_opengl_paint_canvas(editor)
 
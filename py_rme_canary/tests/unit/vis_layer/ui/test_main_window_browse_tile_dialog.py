@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from py_rme_canary.core.data.item import Item
@@ -28,10 +30,7 @@ def test_show_properties_applies_item_changes(app, monkeypatch):
     dialog._items_list.setCurrentRow(0)
 
     def _edit(parent, item):
-        item.action_id = 1000
-        item.unique_id = 2000
-        item.text = "hello"
-        return True
+        return replace(item, action_id=1000, unique_id=2000, text="hello")
 
     monkeypatch.setattr(module, "_edit_item_basic_properties", _edit)
     dialog._on_show_properties()
@@ -48,7 +47,7 @@ def test_show_properties_cancel_keeps_item(app, monkeypatch):
     dialog = module.BrowseTileDialog(tile=tile)
     dialog._items_list.setCurrentRow(0)
 
-    monkeypatch.setattr(module, "_edit_item_basic_properties", lambda parent, item: False)
+    monkeypatch.setattr(module, "_edit_item_basic_properties", lambda parent, item: None)
     dialog._on_show_properties()
 
     assert tile.items[0].action_id == 10
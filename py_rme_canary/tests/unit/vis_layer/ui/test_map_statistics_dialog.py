@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item, Position
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+from py_rme_canary.vis_layer.ui.main_window.dialogs import MapStatisticsDialog
+
+
+@pytest.fixture
+def app() -> QApplication:
+    instance = QApplication.instance()
+    if instance is None:
+        instance = QApplication([])
+    return instance
+
+
+def _session() -> EditorSession:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=32, height=32))
+    for x in range(4):
+        game_map.set_tile(Tile(x=x, y=0, z=7, ground=Item(id=4526)))
+    game_map.set_tile(
+        Tile(x=1, y=0, z=7, ground=Item(id=4526), items=[Item(id=1387, destination=Position(x=3, y=0, z=7))])
+    )
+    return EditorSession(game_map=game_map, brush_manager=BrushManager())
+
+
+def test_statistics_report_lists_teleport_link_validation(app: QApplication) -> None:
+    session = _session()
+    dialog = MapStatisticsDialog(None, game_map=session.game_map, session=session)
+
+    report = dialog._text.toPlainText()
+    assert "Teleport Links:" in report
+    assert "  One-way: 1" in report
+
+    session.game_map.delete_tile(3, 0, 7)
+    session._emit_tiles_changed({(3, 0, 7)})
+    dialog._refresh()
+    assert "  Broken: 1" in dialog._text.toPlainText()
+
+
+def test_statistics_report_reads_the_session_audit(app: QApplication) -> None:
+    session = _session()
+    dialog = MapStatisticsDialog(None, game_map=session.game_map, session=session)
+    assert "  Total Tiles: 4" in dialog._text.toPlainText()
+
+    session.set_waypoint(name="temple", x=2, y=0, z=7)
+    session.game_map.set_tile(Tile(x=9, y=9, z=7, ground=Item(id=4526)))
+    session._emit_tiles_changed({(9, 9, 7)})
+    dialog._refresh()
+
+    report = dialog._text.toPlainText()
+    assert "  Total Tiles: 5" in report
+    assert "  Waypoints: 1" in report
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from py_rme_canary.vis_layer.ui.docks.modern_palette import (
+    BrushCardData,
+    BrushIconCache,
+    BrushNameIndex,
+    ModernPaletteWidget,
+)
+
+
+@pytest.fixture
+def app():
+    instance = QApplication.instance()
+    if instance is None:
+        instance = QApplication([])
+    return instance
+
+
+def _cards(count: int) -> list[BrushCardData]:
+    return [
+        BrushCardData(brush_id=100 + i, name=f"Item {i}", brush_type="raw", sprite_id=100 + i) for i in range(count)
+    ]
+
+
+def test_name_index_matches_name_type_and_id_like_the_old_filter() -> None:
+    cards = [
+        BrushCardData(brush_id=4526, name="Grass", brush_type="ground"),
+        BrushCardData(brush_id=1026, name="Stone Wall", brush_type="wall"),
+        BrushCardData(brush_id=2148, name="Gold Coin", brush_type="raw"),
+    ]
+    index = BrushNameIndex(cards)
+
+    assert index.match("") == [0, 1, 2]
+    assert index.match("  WALL ") == [1]
+    assert index.match("2") == [0, 1, 2]
+    assert index.match("21") == [2]
+    assert index.match("st") == [1]  # shorter query after a longer one rescans everything
+    assert index.match("ground4526") == []
+
+
+def test_grid_requests_icons_only_for_painted_rows(app) -> None:
+    lookups: list[tuple[int, int]] = []
+
+    def lookup(sid: int, size: int) -> QPixmap:
+        lookups.append((sid, size))
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.red)
+        return pixmap
+
+    cache = BrushIconCache(lookup)
+    widget = ModernPaletteWidget(icon_cache=cache)
+    widget.resize(320, 240)
+    widget.set_brushes(_cards(20_000))
+    widget.show()
+    app.processEvents()
+    widget.list_widget.viewport().repaint()
+    cache.render_pending()
+
+    assert widget.list_widget.count() == 20_000
+    assert 0 < len(lookups) < 200
+    assert {size for _sid, size in lookups} == {36}
+
+    # Same (server_id, icon_px) is served from the cache; a new size renders lazily.
+    rendered = len(lookups)
+    widget.list_widget.viewport().repaint()
+    cache.render_pending()
+    assert len(lookups) == rendered
+    widget.set_icon_size(48)
+    assert widget.list_widget.iconSize().width() == 48
+    assert len(lookups) == rendered
+    widget.close()
+
+
+def test_filter_swaps_rows_and_keeps_legacy_item_api(app) -> None:
+    widget = ModernPaletteWidget()
+    widget.set_brushes(_cards(50))
+    selected: list[int] = []
+    widget.brush_selected.connect(selected.append)
+
+    widget.set_filter("item 4")
+    view = widget.list_widget
+    assert [view.item(row).text() for row in range(view.count())] == ["Item 4"] + [f"Item {i}" for i in range(40, 50)]
+
+    item = view.item(0)
+    assert item is not None and item.data(Qt.ItemDataRole.UserRole) == 104
+    view.itemClicked.emit(item)
+    assert selected == [104]
+
+    widget.set_brushes(_cards(10))
+    assert view.count() == 1  # the filter survives a reload
+    assert view.item(5) is None
+
+
+def test_icon_cache_is_bounded(app) -> None:
+    cache = BrushIconCache(max_icons=8, max_pending=4)
+    cards = _cards(20)
+    for card in cards:
+        assert cache.icon_for(card, 24) is None
+    assert cache.pending == 4
+    assert cache.render_pending() == 4
+    assert cache.icon_for(cards[-1], 24) is not None
+    assert cache.icon_for(cards[0], 24) is None  # dropped from the queue, requested again
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QApplication
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.indicator_flags import IndicatorFlagCache
+from py_rme_canary.vis_layer.renderer.overlay_layer import IndicatorOverlayLayer, draw_selection_outline
+from py_rme_canary.vis_layer.ui.helpers import ItemProps
+
+
+class _Indicators:
+    def __init__(self) -> None:
+        self.item_props = {100: ItemProps(avoidable=True)}
+        self.flags = IndicatorFlagCache()
+
+    def ensure_loaded(self) -> None:
+        pass
+
+    def icon(self, key: str, size: int):
+        return None
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def editor(app):
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=128, height=128))
+    for x in range(0, 64, 3):
+        game_map.set_tile(Tile(x=x, y=x, z=7, ground=Item(id=100)))
+    outlines = []
+    session = SimpleNamespace(
+        selection_outline_in_rect=lambda **rect: outlines.append(rect) or [(0, 0, 2, 0), (0, 0, 0, 1)]
+    )
+    return SimpleNamespace(
+        map=game_map,
+        indicators=_Indicators(),
+        viewport=SimpleNamespace(tile_px=32),
+        session=session,
+        outlines=outlines,
+        show_avoidables=True,
+    )
+
+
+def _paint(draw) -> None:
+    image = QImage(640, 640, QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    draw(painter)
+    painter.end()
+
+
+def test_chunks_are_recorded_once_until_invalidated_or_zoomed(editor) -> None:
+    layer = IndicatorOverlayLayer()
+
+    _paint(lambda p: layer.draw(p, editor, 0, 0, 20, 20, 7))
+    assert (layer.recorded, len(layer)) == (1, 1)
+    _paint(lambda p: layer.draw(p, editor, 5, 5, 25, 25, 7))
+    assert layer.recorded == 1
+
+    editor.indicators.flags.invalidate([(3, 3, 7)])
+    _paint(lambda p: layer.draw(p, editor, 0, 0, 40, 40, 7))
+    assert (layer.recorded, len(layer)) == (3, 2)  # chunk 0 again, plus (1, 1); (1, 0) and (0, 1) are empty
+
+    editor.viewport.tile_px = 16
+    _paint(lambda p: layer.draw(p, editor, 0, 0, 40, 40, 7))
+    assert layer.recorded == 5
+
+    editor.show_avoidables = False
+    _paint(lambda p: layer.draw(p, editor, 0, 0, 40, 40, 7))
+    assert layer.recorded == 5
+
+
+def test_selection_outline_is_requested_for_the_visible_rect(editor) -> None:
+    _paint(lambda p: draw_selection_outline(p, editor, 4, 6, 24, 26, 7))
+    assert editor.outlines == [{"x0": 4, "y0": 6, "x1": 23, "y1": 25, "z": 7}]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QObject
+
+from py_rme_canary.core.assets.legacy_dat_spr import LegacySpriteArchive
+from py_rme_canary.logic_layer.cross_version.sprite_hash import SpriteHashMatcher
+from py_rme_canary.vis_layer.ui.main_window import qt_map_editor_assets as assets_module
+from py_rme_canary.vis_layer.ui.main_window.qt_map_editor_assets import QtMapEditorAssetsMixin
+
+
+class _DummyEditor(QObject, QtMapEditorAssetsMixin):
+    def __init__(self, sprites: LegacySpriteArchive) -> None:
+        super().__init__()
+        self.sprite_assets = sprites
+        self.id_mapper = None
+        self.sprite_matcher = None
+        self._sprite_hash_source = None
+        self._sprite_hash_pending = False
+
+
+def _legacy_archive(root: Path) -> LegacySpriteArchive:
+    sprite = struct.pack("<HH", 0, 1) + bytes([255, 0, 0]) + struct.pack("<HH", 1023, 0)
+    body = bytes([0, 0, 0]) + struct.pack("<H", len(sprite)) + sprite
+    offsets = struct.pack("<I", 4 + 2 + 4)
+    (root / "Tibia.spr").write_bytes(struct.pack("<IH", 0x01020304, 1) + offsets + body)
+    (root / "Tibia.dat").write_bytes(b"\x00" * 12)
+    return LegacySpriteArchive(dat_path=root / "Tibia.dat", spr_path=root / "Tibia.spr")
+
+
+def test_sprite_hash_index_loads_on_a_worker_and_is_swapped_in(qtbot, tmp_path, monkeypatch) -> None:
+    loaded = SpriteHashMatcher.from_hashes([(1, 77)])
+    requested: list[object] = []
+
+    def fake_load(sprites):  # type: ignore[no-untyped-def]
+        requested.append(sprites)
+        return loaded
+
+    monkeypatch.setattr(assets_module, "load_or_build_sprite_hash_index", fake_load)
+    editor = _DummyEditor(_legacy_archive(tmp_path))
+
+    editor._build_sprite_hash_database()
+    assert editor._sprite_hash_pending
+    assert editor.sprite_matcher is not loaded and len(editor.sprite_matcher) == 0
+
+    qtbot.waitUntil(lambda: editor.sprite_matcher is loaded, timeout=5000)
+    assert not editor._sprite_hash_pending
+
+    # The same assets do not trigger another load.
+    editor._build_sprite_hash_database()
+    assert editor.sprite_matcher is loaded
+    assert requested == [editor.sprite_assets]
@@ -45,12 +45,12 @@ def test_table_select_all_on_map_emits_visible_positions(app, mock_theme_manager
     table = SearchResultsTableWidget()
     table.set_results(
         [
-            SearchResult(x=1, y=1, z=7),
-            SearchResult(x=2, y=2, z=7),
-            SearchResult(x=3, y=3, z=7),
+            SearchResult(x=1, y=1, z=7, details="keep"),
+            SearchResult(x=2, y=2, z=7, details="drop"),
+            SearchResult(x=3, y=3, z=7, details="keep"),
         ]
     )
-    table.setRowHidden(1, True)
+    table.filter_results("keep")
 
     emitted: list[list[tuple[int, int, int]]] = []
     table.select_positions_requested.connect(emitted.append)
@@ -100,3 +100,30 @@ def test_select_all_results_routes_to_map_selection(app, mock_theme_manager):
         dock.select_all_results()
 
     apply_mock.assert_called_once_with([(10, 20, 7), (30, 40, 7)])
+
+
+def test_table_model_filters_and_sorts_on_the_store(app, mock_theme_manager):
+    table = SearchResultsTableWidget()
+    table.set_results([SearchResult(x=x, y=1, z=7, item_id=2148, details=f"row {x}") for x in (5, 3, 9)])
+    model = table.results_model
+
+    assert model.rowCount() == 3
+    assert model.data(model.index(0, 0)) == "5, 1"
+    model.sort(0)
+    assert model.positions() == [(3, 1, 7), (5, 1, 7), (9, 1, 7)]
+
+    table.filter_results("ROW 9")
+    assert model.rowCount() == 1 and model.result_at(0).details == "row 9"
+
+
+def test_dock_streams_background_results_in_pages(app, mock_theme_manager):
+    dock = SearchResultsDock(editor=MagicMock())
+
+    worker = dock.start_search(lambda: (SearchResult(x=x, y=0, z=7) for x in range(10)), query="ground", page_size=4)
+    assert worker.wait(5000)
+    app.processEvents()
+
+    assert dock._current_set is not None and dock._current_set.count == 10
+    assert dock.table.results_model.rowCount() == 10
+    assert dock.status_label.text() == "10 result(s)"
+    assert "(10 results)" in dock.history_combo.itemText(0)
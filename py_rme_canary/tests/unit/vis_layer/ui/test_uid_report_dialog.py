@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication
+
+from py_rme_canary.core.data.gamemap import GameMap, MapHeader
+from py_rme_canary.core.data.item import Item
+from py_rme_canary.core.data.tile import Tile
+from py_rme_canary.logic_layer.brush_definitions import BrushManager
+from py_rme_canary.logic_layer.session.editor import EditorSession
+from py_rme_canary.vis_layer.ui.dialogs.uid_report_dialog import UIDReportDialog
+
+
+@pytest.fixture
+def app() -> QApplication:
+    instance = QApplication.instance()
+    if instance is None:
+        instance = QApplication([])
+    return instance
+
+
+def test_scan_reports_conflicts_from_the_session_audit(app: QApplication) -> None:
+    game_map = GameMap(header=MapHeader(otbm_version=2, width=32, height=32))
+    for x in range(2):
+        game_map.set_tile(Tile(x=x, y=0, z=7, ground=Item(id=4526), items=[Item(id=1740, unique_id=1001)]))
+    session = EditorSession(game_map=game_map, brush_manager=BrushManager())
+    dialog = UIDReportDialog(None, session=session)
+
+    dialog._on_scan()
+    assert dialog._table.rowCount() == 1
+    assert dialog._conflicts == session.map_audit().uids.conflicts
+
+    game_map.delete_tile(1, 0, 7)
+    session._emit_tiles_changed({(1, 0, 7)})
+    dialog._on_scan()
+    assert dialog._table.rowCount() == 0
@@ -11,9 +11,9 @@ from py_rme_canary.logic_layer.settings.light_settings import LightMode
 from py_rme_canary.logic_layer.sprite_system import LegacyDatError, LegacyItemSpriteInfo, load_legacy_item_sprites
 from py_rme_canary.vis_layer.preview.preview_renderer import (
     PreviewCreature,
+    PreviewDelta,
     PreviewItem,
     PreviewLighting,
-    PreviewSnapshot,
     PreviewSpawn,
     PreviewViewport,
     TileSnapshot,
@@ -21,10 +21,24 @@ from py_rme_canary.vis_layer.preview.preview_renderer import (
 from py_rme_canary.vis_layer.preview.preview_thread import PreviewThread
 
 if TYPE_CHECKING:
+    from py_rme_canary.core.data.gamemap import GameMap
+    from py_rme_canary.core.data.tile import Tile
     from py_rme_canary.vis_layer.ui.main_window.editor import QtMapEditor
 
 log = logging.getLogger(__name__)
 
+TileKey = tuple[int, int, int]
+
+# Animation time is forwarded in steps of the canvas animation tick; a new
+# step is the only reason to re-send an otherwise unchanged frame.
+ANIMATION_BUCKET_MS = 100
+# Every N syncs the visible tiles are re-checked by identity, which picks up
+# map edits that bypassed the session's tiles-changed callback.
+_REVALIDATE_EVERY = 10
+# Item snapshots are immutable and shared between tiles; past this many
+# distinct (server id, client id, count) entries the table starts over.
+_MAX_ITEM_SNAPSHOTS = 65536
+
 
 class PreviewController(QObject):
     def __init__(self, editor: QtMapEditor) -> None:
@@ -38,6 +52,14 @@ class PreviewController(QObject):
         self._items_xml = None
         self._light_drawer = None
         self._health_check_counter: int = 0
+        self._tile_cache: dict[TileKey, tuple[Tile, TileSnapshot]] = {}
+        self._item_snapshots: dict[tuple[int, int | None, int | None], PreviewItem] = {}
+        self._dirty: set[TileKey] = set()
+        self._tiles_version = 0
+        self._frame_key: tuple[object, ...] | None = None
+        self._synced_map: GameMap | None = None
+        self._synced_viewport: PreviewViewport | None = None
+        self._with_light = False
 
     def start(self) -> None:
         if self._thread is not None:
@@ -57,6 +79,7 @@ class PreviewController(QObject):
             items_xml=self._items_xml,
             initial_size=initial_size,
         )
+        self._reset_sync_state()
         self._thread.start()
         self._timer.start()
         self._sync()
@@ -110,10 +133,36 @@ class PreviewController(QObject):
             )
             return
 
-        snapshot = self._build_snapshot()
-        self._thread.submit_snapshot(snapshot)
+        delta = self._build_delta(revalidate=self._health_check_counter % _REVALIDATE_EVERY == 0)
+        if delta is not None:
+            self._thread.submit_delta(delta)
 
-    def _build_snapshot(self) -> PreviewSnapshot:
+    def notify_tiles_changed(self, changed: set[TileKey]) -> None:
+        """Mark ``changed`` tiles for the next sync (wired to the session's tiles-changed callback)."""
+        if not changed or self._thread is None:
+            return
+        self._dirty.update(changed)
+        self._tiles_version += 1
+
+    def _reset_sync_state(self) -> None:
+        self._tile_cache.clear()
+        self._item_snapshots.clear()
+        self._dirty.clear()
+        self._frame_key = None
+        self._synced_map = None
+        self._synced_viewport = None
+
+    def _build_delta(self, *, revalidate: bool = False) -> PreviewDelta | None:
+        """Return the changes since the last delta, or None when nothing the preview shows has changed.
+
+        ``_tile_cache`` mirrors what the preview thread holds: one
+        ``(tile, TileSnapshot)`` pair per visible position. Tiles are
+        immutable, so an entry stays valid while the map still returns the
+        same tile object and the position was not reported dirty. A full
+        viewport walk only happens when the viewport moves, the map or light
+        mode changes, or ``revalidate`` asks for an identity sweep that
+        catches edits made without a tiles-changed notification.
+        """
         editor = self._editor
         tiles_wide, tiles_high = self._tiles_from_editor()
         viewport = PreviewViewport(
@@ -124,46 +173,95 @@ class PreviewController(QObject):
             tiles_wide=int(tiles_wide),
             tiles_high=int(tiles_high),
         )
-
-        tiles: list[TileSnapshot] = []
         lighting = self._build_lighting()
-        show_light_strength = bool(getattr(lighting, "show_strength", False))
-        show_lights = bool(getattr(lighting, "enabled", False))
-        for y in range(viewport.origin_y, viewport.origin_y + viewport.tiles_high):
-            for x in range(viewport.origin_x, viewport.origin_x + viewport.tiles_wide):
-                tile = editor.map.get_tile(x, y, viewport.z)
+        time_ms = int(editor.animation_time_ms() if hasattr(editor, "animation_time_ms") else 0)
+        show_grid = bool(getattr(editor, "show_grid", False))
+        game_map = editor.map
+
+        frame_key = (
+            viewport,
+            time_ms // ANIMATION_BUCKET_MS,
+            lighting,
+            show_grid,
+            self._tiles_version,
+            id(game_map),
+        )
+        if frame_key == self._frame_key and not revalidate:
+            return None
+        first_frame = self._frame_key is None
+        self._frame_key = frame_key
+
+        with_light = bool(lighting.enabled or lighting.show_strength)
+        reset = first_frame or game_map is not self._synced_map or with_light != self._with_light
+        cache = self._tile_cache
+        if reset:
+            cache.clear()
+            self._item_snapshots.clear()
+            self._synced_map = game_map
+            self._with_light = with_light
+        dirty = self._dirty
+        self._dirty = set()
+
+        upserts: list[TileSnapshot] = []
+        removed: list[TileKey] = []
+        x0, y0, z = viewport.origin_x, viewport.origin_y, viewport.z
+        x1, y1 = x0 + viewport.tiles_wide, y0 + viewport.tiles_high
+
+        if reset or revalidate or viewport != self._synced_viewport:
+            self._synced_viewport = viewport
+            visible: set[TileKey] = set()
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    tile = game_map.get_tile(x, y, z)
+                    if tile is None:
+                        continue
+                    key = (x, y, z)
+                    visible.add(key)
+                    cached = cache.get(key)
+                    if cached is None or cached[0] is not tile or key in dirty:
+                        snapshot = self._snapshot_tile(tile, x, y, z, with_light=with_light)
+                        cache[key] = (tile, snapshot)
+                        upserts.append(snapshot)
+            for key in [key for key in cache if key not in visible]:
+                del cache[key]
+                removed.append(key)
+        else:
+            for key in dirty:
+                x, y, tz = key
+                if tz != z or not (x0 <= x < x1 and y0 <= y < y1):
+                    continue
+                tile = game_map.get_tile(x, y, z)
                 if tile is None:
+                    if cache.pop(key, None) is not None:
+                        removed.append(key)
                     continue
-                ground = self._snapshot_item(tile.ground)
-                items = tuple(self._snapshot_item(it) for it in tile.items if it is not None)
-                light_strength = 0
-                if show_lights or show_light_strength:
-                    light_strength = self._light_strength_for_tile(tile)
-
-                creatures = self._snapshot_creatures(tile)
-                spawns = self._snapshot_spawns(tile)
-
-                tiles.append(
-                    TileSnapshot(
-                        x=int(x),
-                        y=int(y),
-                        z=int(viewport.z),
-                        ground=ground,
-                        items=items,
-                        light_strength=int(light_strength),
-                        creatures=creatures,
-                        spawns=spawns,
-                    )
-                )
+                snapshot = self._snapshot_tile(tile, x, y, z, with_light=with_light)
+                cache[key] = (tile, snapshot)
+                upserts.append(snapshot)
 
-        time_ms = int(editor.animation_time_ms() if hasattr(editor, "animation_time_ms") else 0)
-        show_grid = bool(getattr(editor, "show_grid", False))
-        return PreviewSnapshot(
+        return PreviewDelta(
             viewport=viewport,
-            tiles=tuple(tiles),
             time_ms=time_ms,
-            show_grid=bool(show_grid),
+            show_grid=show_grid,
             lighting=lighting,
+            tiles=tuple(upserts),
+            removed=tuple(removed),
+            reset=reset,
+        )
+
+    def _snapshot_tile(self, tile, x: int, y: int, z: int, *, with_light: bool) -> TileSnapshot:
+        ground = self._snapshot_item(tile.ground)
+        items = tuple(self._snapshot_item(it) for it in tile.items if it is not None)
+        light_strength = self._light_strength_for_tile(tile) if with_light else 0
+        return TileSnapshot(
+            x=int(x),
+            y=int(y),
+            z=int(z),
+            ground=ground,
+            items=items,
+            light_strength=int(light_strength),
+            creatures=self._snapshot_creatures(tile),
+            spawns=self._snapshot_spawns(tile),
         )
 
     def _snapshot_item(self, item) -> PreviewItem | None:
@@ -171,11 +269,21 @@ class PreviewController(QObject):
             return None
         server_id = int(item.id)
         client_id = item.client_id
+        count = item.count if item.count is not None else item.subtype
+        key = (server_id, client_id, count)
+        snapshot = self._item_snapshots.get(key)
+        if snapshot is None:
+            if len(self._item_snapshots) >= _MAX_ITEM_SNAPSHOTS:
+                self._item_snapshots.clear()
+            snapshot = self._build_item_snapshot(server_id, client_id, count)
+            self._item_snapshots[key] = snapshot
+        return snapshot
+
+    def _build_item_snapshot(self, server_id: int, client_id: int | None, count: int | None) -> PreviewItem:
         if client_id is None and self._editor.id_mapper is not None:
             client_id = self._editor.id_mapper.get_client_id(server_id)
         if client_id is None:
             client_id = server_id
-        count = item.count if item.count is not None else item.subtype
 
         stackable = False
         if self._items_xml is not None:
@@ -203,8 +311,11 @@ class PreviewController(QObject):
     @staticmethod
     def _snapshot_creatures(tile: object) -> tuple[PreviewCreature, ...]:
         """Extract creature snapshots from a tile."""
-        result: list[PreviewCreature] = []
         monsters = getattr(tile, "monsters", None)
+        npc = getattr(tile, "npc", None)
+        if not monsters and npc is None:
+            return ()
+        result: list[PreviewCreature] = []
         if monsters:
             for m in monsters:
                 name = str(getattr(m, "name", ""))
@@ -215,7 +326,6 @@ class PreviewController(QObject):
                     kind="monster",
                     lookitem=lookitem if lookitem > 0 else None,
                 ))
-        npc = getattr(tile, "npc", None)
         if npc is not None:
             name = str(getattr(npc, "name", ""))
             outfit = getattr(npc, "outfit", None)
@@ -230,14 +340,16 @@ class PreviewController(QObject):
     @staticmethod
     def _snapshot_spawns(tile: object) -> tuple[PreviewSpawn, ...]:
         """Extract spawn marker snapshots from a tile."""
-        result: list[PreviewSpawn] = []
         sm = getattr(tile, "spawn_monster", None)
+        sn = getattr(tile, "spawn_npc", None)
+        if sm is None and sn is None:
+            return ()
+        result: list[PreviewSpawn] = []
         if sm is not None:
             result.append(PreviewSpawn(
                 kind="monster",
                 radius=int(getattr(sm, "radius", 0)),
             ))
-        sn = getattr(tile, "spawn_npc", None)
         if sn is not None:
             result.append(PreviewSpawn(
                 kind="npc",
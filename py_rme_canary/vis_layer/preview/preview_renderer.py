@@ -80,6 +80,23 @@ class PreviewSnapshot:
     lighting: PreviewLighting = field(default_factory=PreviewLighting)
 
 
+@dataclass(frozen=True, slots=True)
+class PreviewDelta:
+    """Frame parameters plus the tiles that changed since the previous delta.
+
+    The preview thread applies deltas to its own tile mirror; ``reset``
+    replaces the mirror with ``tiles`` instead of patching it.
+    """
+
+    viewport: PreviewViewport
+    time_ms: int
+    show_grid: bool = False
+    lighting: PreviewLighting = field(default_factory=PreviewLighting)
+    tiles: tuple[TileSnapshot, ...] = ()
+    removed: tuple[tuple[int, int, int], ...] = ()
+    reset: bool = False
+
+
 class SpriteSurfaceCache:
     def __init__(self, sprite_provider, *, memory_guard: MemoryGuard | None = None) -> None:
         self._sprite_provider = sprite_provider
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import contextlib
 import logging
-import queue
 import threading
 import time
 
@@ -10,10 +8,21 @@ from py_rme_canary.core.assets.appearances_dat import AppearanceIndex
 from py_rme_canary.core.database.items_xml import ItemsXML
 from py_rme_canary.core.memory_guard import MemoryGuard, default_memory_guard
 from py_rme_canary.logic_layer.sprite_system.legacy_dat import LegacyItemSpriteInfo
-from py_rme_canary.vis_layer.preview.preview_renderer import IngameRenderer, PreviewSnapshot
+from py_rme_canary.vis_layer.preview.preview_renderer import (
+    IngameRenderer,
+    PreviewDelta,
+    PreviewSnapshot,
+    TileSnapshot,
+)
 
 log = logging.getLogger(__name__)
 
+TileKey = tuple[int, int, int]
+
+
+def _draw_order(tile: TileSnapshot) -> tuple[int, int]:
+    return (tile.y, tile.x)
+
 
 class PreviewMetrics:
     """Lightweight frame-time tracker for the preview window."""
@@ -52,6 +61,11 @@ class PreviewThread(threading.Thread):
     - Esc closes the preview window
     - Graceful error recovery for pygame init failures
     - Performance metrics tracking
+
+    The editor side submits :class:`PreviewDelta` objects. Deltas that arrive
+    faster than frames are drawn are merged rather than dropped, and the
+    thread keeps its own mirror of the visible tiles so that only changed
+    tiles cross the thread boundary.
     """
 
     def __init__(
@@ -65,7 +79,12 @@ class PreviewThread(threading.Thread):
         initial_size: tuple[int, int] = (640, 480),
     ) -> None:
         super().__init__(daemon=True)
-        self._queue: queue.Queue[PreviewSnapshot] = queue.Queue(maxsize=2)
+        self._pending_lock = threading.Lock()
+        self._pending_frame: PreviewDelta | None = None
+        self._pending_tiles: dict[TileKey, TileSnapshot | None] = {}
+        self._pending_reset = False
+        self._tiles: dict[TileKey, TileSnapshot] = {}
+        self._ordered_tiles: tuple[TileSnapshot, ...] = ()
         self._stop_event = threading.Event()
         self._renderer = IngameRenderer(
             sprite_provider=sprite_provider,
@@ -81,19 +100,64 @@ class PreviewThread(threading.Thread):
         self._error: str | None = None
 
     def submit_snapshot(self, snapshot: PreviewSnapshot) -> None:
+        """Replace the whole tile mirror with ``snapshot``."""
+        self.submit_delta(
+            PreviewDelta(
+                viewport=snapshot.viewport,
+                time_ms=snapshot.time_ms,
+                show_grid=snapshot.show_grid,
+                lighting=snapshot.lighting,
+                tiles=snapshot.tiles,
+                reset=True,
+            )
+        )
+
+    def submit_delta(self, delta: PreviewDelta) -> None:
+        """Queue ``delta``, folding it into any delta not yet picked up by the render loop."""
         if self._stop_event.is_set():
             return
-        try:
-            self._queue.put_nowait(snapshot)
-        except queue.Full:
-            try:
-                _ = self._queue.get_nowait()
-            except queue.Empty:
-                return
-            try:
-                self._queue.put_nowait(snapshot)
-            except queue.Full:
-                return
+        with self._pending_lock:
+            pending = self._pending_tiles
+            if delta.reset:
+                pending.clear()
+                self._pending_reset = True
+            for key in delta.removed:
+                pending[key] = None
+            for tile in delta.tiles:
+                pending[(tile.x, tile.y, tile.z)] = tile
+            self._pending_frame = delta
+
+    def _apply_pending(self) -> bool:
+        """Apply queued changes to the tile mirror; return True if a new frame is available."""
+        with self._pending_lock:
+            frame = self._pending_frame
+            if frame is None:
+                return False
+            changes = self._pending_tiles
+            reset = self._pending_reset
+            self._pending_frame = None
+            self._pending_tiles = {}
+            self._pending_reset = False
+
+        mirror = self._tiles
+        if reset:
+            mirror.clear()
+        for key, tile in changes.items():
+            if tile is None:
+                mirror.pop(key, None)
+            else:
+                mirror[key] = tile
+        if reset or changes:
+            self._ordered_tiles = tuple(sorted(mirror.values(), key=_draw_order))
+
+        self._current_snapshot = PreviewSnapshot(
+            viewport=frame.viewport,
+            tiles=self._ordered_tiles,
+            time_ms=frame.time_ms,
+            show_grid=frame.show_grid,
+            lighting=frame.lighting,
+        )
+        return True
 
     def stop(self) -> None:
         self._stop_event.set()
@@ -145,8 +209,7 @@ class PreviewThread(threading.Thread):
             if self._stop_event.is_set():
                 break
 
-            with contextlib.suppress(queue.Empty):
-                self._current_snapshot = self._queue.get_nowait()
+            self._apply_pending()
 
             if self._current_snapshot is not None:
                 self._renderer.render(screen, self._current_snapshot)
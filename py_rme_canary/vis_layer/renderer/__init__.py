@@ -79,8 +79,11 @@ except Exception:  # pragma: no cover - fallback for headless envs without PyQt6
                             int(sid), tile_px=int(size)
                         ),
                         indicator_lookup=self._editor.indicators.icon,
+                        sprite_atlas=getattr(self._editor, "_sprite_atlas", None),
+                        atlas_lookup=lambda sid: self._editor._sprite_atlas_slot_for_server_id(int(sid)),
                     )
                     drawer.draw(backend)
+                    backend.flush()
 
                 painter.end()
 
@@ -6,6 +6,7 @@ the remeres-map-editor-redux architecture.
 Components:
     - TextureArray: GL_TEXTURE_2D_ARRAY for sprite batching
     - ModernSpriteBatcher: High-performance sprite batching
+    - FloatUploadBuffer: Reusable staging buffer for vertex uploads
     - AtlasManager: Manages sprite atlas allocation (future)
 """
 
@@ -13,5 +14,6 @@ from __future__ import annotations
 
 from .modern_batcher import ModernSpriteBatcher
 from .texture_array import TextureArray
+from .upload_buffer import FloatUploadBuffer
 
-__all__ = ["TextureArray", "ModernSpriteBatcher"]
+__all__ = ["FloatUploadBuffer", "TextureArray", "ModernSpriteBatcher"]
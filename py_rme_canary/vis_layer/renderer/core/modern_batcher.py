@@ -20,7 +20,10 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from py_rme_canary.core.memory.frame_arena import FrameArena
+
 from .texture_array import TextureArray
+from .upload_buffer import FloatUploadBuffer
 
 if TYPE_CHECKING:
     pass
@@ -49,6 +52,10 @@ class SpriteInstance:
     tint: tuple[int, int, int, int] = (255, 255, 255, 255)
 
 
+def _blank_sprite() -> SpriteInstance:
+    return SpriteInstance(0.0, 0.0, 0.0, 0.0, 0)
+
+
 @dataclass
 class BatcherStats:
     """Statistics for the current frame."""
@@ -101,9 +108,11 @@ class ModernSpriteBatcher:
         self._u_texture_array: int = -1
         self._u_use_texture: int = -1
 
-        # Batch data
-        self._sprites: list[SpriteInstance] = []
+        # Batch data. Sprite records and the upload buffer are reused from
+        # frame to frame so a steady scene does not allocate per sprite.
+        self._sprites: FrameArena[SpriteInstance] = FrameArena(_blank_sprite, name="SpriteInstance")
         self._vertices: list[float] = []
+        self._upload = FloatUploadBuffer()
         self._initialized: bool = False
 
         # Stats
@@ -210,7 +219,7 @@ class ModernSpriteBatcher:
 
     def begin(self) -> None:
         """Begin a new frame/batch."""
-        self._sprites.clear()
+        self._sprites.reset()
         self._vertices.clear()
         self._stats = BatcherStats()
 
@@ -237,16 +246,13 @@ class ModernSpriteBatcher:
             logger.warning("ModernSpriteBatcher: Max sprites reached, sprite dropped")
             return
 
-        self._sprites.append(
-            SpriteInstance(
-                x=float(x),
-                y=float(y),
-                width=float(width),
-                height=float(height),
-                layer=int(layer),
-                tint=tint,
-            )
-        )
+        sprite = self._sprites.take()
+        sprite.x = float(x)
+        sprite.y = float(y)
+        sprite.width = float(width)
+        sprite.height = float(height)
+        sprite.layer = int(layer)
+        sprite.tint = tint
 
     def _build_vertices(self) -> None:
         """Convert sprites to vertex data."""
@@ -269,71 +275,18 @@ class ModernSpriteBatcher:
             u0, v0 = 0.0, 1.0
             u1, v1 = 1.0, 0.0
 
-            # Two triangles (6 vertices per quad)
-            # Triangle 1: top-left, top-right, bottom-right
-            self._vertices.extend(
-                [
-                    x0,
-                    y0,
-                    u0,
-                    v0,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                    x1,
-                    y0,
-                    u1,
-                    v0,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                    x1,
-                    y1,
-                    u1,
-                    v1,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                ]
-            )
-            # Triangle 2: top-left, bottom-right, bottom-left
+            # Two triangles (6 vertices per quad):
+            # top-left, top-right, bottom-right / top-left, bottom-right, bottom-left
             self._vertices.extend(
-                [
-                    x0,
-                    y0,
-                    u0,
-                    v0,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                    x1,
-                    y1,
-                    u1,
-                    v1,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                    x0,
-                    y1,
-                    u0,
-                    v1,
-                    r,
-                    g,
-                    b,
-                    a,
-                    layer,
-                ]
-            )
+                (
+                    x0, y0, u0, v0, r, g, b, a, layer,
+                    x1, y0, u1, v0, r, g, b, a, layer,
+                    x1, y1, u1, v1, r, g, b, a, layer,
+                    x0, y0, u0, v0, r, g, b, a, layer,
+                    x1, y1, u1, v1, r, g, b, a, layer,
+                    x0, y1, u0, v1, r, g, b, a, layer,
+                )
+            )  # fmt: skip
 
     def end(self, viewport_width: int, viewport_height: int) -> None:
         """End the batch and render all sprites.
@@ -366,8 +319,8 @@ class ModernSpriteBatcher:
         gl.glBindVertexArray(self._vao)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
 
-        data = (ctypes.c_float * len(self._vertices))(*self._vertices)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, ctypes.sizeof(data), data, gl.GL_DYNAMIC_DRAW)
+        data, nbytes = self._upload.fill(self._vertices)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, data, gl.GL_DYNAMIC_DRAW)
 
         # Draw
         vertex_count = len(self._sprites) * self.VERTICES_PER_QUAD
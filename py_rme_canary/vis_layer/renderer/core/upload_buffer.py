@@ -0,0 +1,49 @@
+"""Reusable client-side staging buffer for vertex uploads.
+
+``glBufferData`` needs a contiguous C array. Building a fresh
+``(ctypes.c_float * n)(*vertices)`` for every batch of every frame allocates
+(and later frees) a buffer the size of the whole vertex stream; the staging
+buffer here is allocated once, grows geometrically, and is refilled in place.
+"""
+
+from __future__ import annotations
+
+import ctypes
+
+_MIN_CAPACITY = 1024
+
+
+class FloatUploadBuffer:
+    """Growable ``c_float`` array reused across uploads.
+
+    Usage:
+        data, nbytes = buffer.fill(vertices)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, data, gl.GL_DYNAMIC_DRAW)
+    """
+
+    __slots__ = ("_data", "grows")
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._data: ctypes.Array[ctypes.c_float] = (ctypes.c_float * max(0, int(capacity)))()
+        self.grows = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def fill(self, values: list[float]) -> tuple[ctypes.Array[ctypes.c_float], int]:
+        """Copy ``values`` to the front of the buffer.
+
+        Returns:
+            The buffer and the byte size of the copied data. The buffer may be
+            longer than the data; pass the byte size to the upload call.
+        """
+        n = len(values)
+        if n > len(self._data):
+            self._data = (ctypes.c_float * max(n, 2 * len(self._data), _MIN_CAPACITY))()
+            self.grows += 1
+        self._data[:n] = values
+        return self._data, n * ctypes.sizeof(ctypes.c_float)
+
+
+__all__ = ["FloatUploadBuffer"]
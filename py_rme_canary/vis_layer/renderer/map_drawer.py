@@ -9,16 +9,24 @@ Architecture Notes:
 - MapDrawer provides methods matching C++ API: Draw(), DrawMap(), DrawGrid(), etc.
 - Actual pixel output is delegated to a backend (QPainter, OpenGL, etc.)
 - The canvas widget creates a MapDrawer and calls draw() on paint events
+- draw() is draw_map_layer() (tiles, lights, shade, grid) followed by
+  draw_overlays() (highlight, cursors, tooltips), so canvases that retain the
+  map layer can redraw it only when (or where) the map changed
+- Detail follows the zoom through LODManager.CANVAS_LEVELS: zoomed far out,
+  tiles are drawn as flat ground colours, then as cached minimap chunk textures
 """
 
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol
 
+from py_rme_canary.logic_layer.chunk_colors import ChunkColorCache, tile_ground_color, tile_minimap_color, tiles_version
 from py_rme_canary.logic_layer.drawing_options import DrawingOptions
+from py_rme_canary.logic_layer.render_optimizer import LevelOfDetail, LODManager
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SHIFT
 
 if TYPE_CHECKING:
     from py_rme_canary.core.data.gamemap import GameMap
@@ -29,6 +37,14 @@ from py_rme_canary.vis_layer.renderer.drawers.grid_drawer import GridDrawer
 from py_rme_canary.vis_layer.renderer.drawers.item_drawer import ItemDrawer
 from py_rme_canary.vis_layer.renderer.drawers.light_drawer import LightDrawer
 
+# Labels (creature names, client ids) start inside their tile but may run this
+# far to the right; region redraws include the tiles they can come from.
+_LABEL_OVERFLOW_PX = 160
+
+
+def _canvas_lod_manager() -> LODManager:
+    return LODManager(list(LODManager.CANVAS_LEVELS))
+
 
 class RenderBackend(Protocol):
     """Protocol for render backends (QPainter, OpenGL, etc.)."""
@@ -132,6 +148,7 @@ class MapDrawer:
     _highlight_until: float = 0.0
     _live_cursors: list[dict[str, object]] = field(default_factory=list)
     _client_id_cache: dict[int, int | None] = field(default_factory=dict)
+    _lod: LevelOfDetail = field(default_factory=lambda: LODManager.CANVAS_LEVELS[0])
 
     # Drawers (Composition Pattern)
     grid_drawer: GridDrawer = field(default_factory=GridDrawer)
@@ -140,6 +157,10 @@ class MapDrawer:
     creature_drawer: CreatureDrawer = field(default_factory=CreatureDrawer)
     light_drawer: LightDrawer = field(default_factory=LightDrawer)
 
+    # Level of detail and zoomed-out chunk textures
+    lod_manager: LODManager = field(default_factory=_canvas_lod_manager)
+    chunk_colors: ChunkColorCache = field(default_factory=ChunkColorCache)
+
     def set_hover_tile(self, x: int, y: int, z: int, stack: list[int]) -> None:
         """Set hover tile and visible stack for tooltip rendering."""
         self._hover_tile = (int(x), int(y), int(z))
@@ -154,12 +175,17 @@ class MapDrawer:
         """Set live cursor overlay list."""
         self._live_cursors = list(cursors)
 
+    def invalidate_tiles(self, keys: Iterable[tuple[int, int, int]]) -> None:
+        """Drop cached chunk textures of edited tiles (``(x, y, z)`` keys)."""
+        self.chunk_colors.invalidate(keys, version=tiles_version(self.game_map))
+
     def setup_vars(self) -> None:
         """Set up rendering variables from viewport state.
 
         Mirrors C++ MapDrawer::SetupVars().
         """
         self._zoom = 32.0 / self.viewport.tile_px if self.viewport.tile_px > 0 else 1.0
+        self._lod = self.lod_manager.get_lod(1.0 / self._zoom)
         self._floor = self.viewport.z
 
         # View bounds
@@ -201,19 +227,19 @@ class MapDrawer:
     def should_draw_grid(self) -> bool:
         """Check if grid should be drawn.
 
-        Mirrors C++ logic: show_grid && zoom <= 10.
+        Mirrors C++ logic: show_grid && zoom <= 10, limited by the level of detail.
         """
-        return bool(self.options.show_grid) and self._zoom <= 10.0
+        return bool(self.options.show_grid) and self._zoom <= 10.0 and self._lod.show_grid
 
     def should_draw_items(self) -> bool:
         """Check if items should be drawn (not zoomed out too far)."""
-        if not self.options.show_items:
+        if not self.options.show_items or not self._lod.show_items:
             return False
         return not (self.options.hide_items_when_zoomed and self._zoom > 10.0)
 
     def should_draw_creatures(self) -> bool:
         """Check if creatures (monsters/NPCs) should be drawn."""
-        return self.options.show_monsters or self.options.show_npcs
+        return (self.options.show_monsters or self.options.show_npcs) and self._lod.show_creatures
 
     def should_draw_spawns(self) -> bool:
         """Check if spawn indicators should be drawn."""
@@ -243,6 +269,10 @@ class MapDrawer:
         """Check if we're in minimap/colors-only mode."""
         return self.options.is_only_colors()
 
+    def get_lod(self) -> LevelOfDetail:
+        """Return the level of detail picked by the last setup_vars()."""
+        return self._lod
+
     def get_tile_bounds(self) -> tuple[int, int, int, int]:
         """Return (start_x, start_y, end_x, end_y) tile bounds for iteration."""
         return self._start_x, self._start_y, self._end_x, self._end_y
@@ -261,14 +291,34 @@ class MapDrawer:
         backend : RenderBackend
             The rendering backend to use for output.
         """
+        self.draw_map_layer(backend)
+        self.draw_overlays(backend)
+
+    def draw_map_layer(self, backend: RenderBackend, region: tuple[int, int, int, int] | None = None) -> None:
+        """Render what only changes with the map, the viewport or the options.
+
+        Parameters
+        ----------
+        backend : RenderBackend
+            The rendering backend to use for output.
+        region : tuple[int, int, int, int] | None
+            Map tile rectangle ``(x0, y0, x1, y1)``, ends exclusive, to redraw
+            instead of the whole viewport. Tiles whose labels can reach into
+            the region are drawn as well, so the caller must clip the output
+            to the region's pixels.
+        """
         self._client_id_cache.clear()
         self.setup_vars()
+        if region is not None:
+            overflow = -(-_LABEL_OVERFLOW_PX // max(1, int(self.viewport.tile_px)))
+            x0, y0, x1, y1 = region
+            region = (int(x0) - overflow, int(y0) - 1, int(x1), int(y1))
 
         # Background
         self._draw_background(backend)
 
         # Map tiles
-        self._draw_map(backend)
+        self._draw_map(backend, region)
 
         # Lights (if enabled)
         if self.should_draw_lights():
@@ -282,6 +332,10 @@ class MapDrawer:
         if self.should_draw_grid():
             self._draw_grid(backend)
 
+    def draw_overlays(self, backend: RenderBackend) -> None:
+        """Render the overlays drawn over the map layer on every frame."""
+        self.setup_vars()
+
         # Go-to highlight
         self._draw_highlight(backend)
 
@@ -303,25 +357,69 @@ class MapDrawer:
         """
         backend.clear(0, 0, 0)  # Black background
 
-    def _draw_map(self, backend: RenderBackend) -> None:
-        """Draw all visible map tiles.
+    def _draw_map(self, backend: RenderBackend, region: tuple[int, int, int, int] | None = None) -> None:
+        """Draw all visible map tiles (those inside ``region`` when given).
 
         Mirrors C++ MapDrawer::DrawMap().
         """
         if self.game_map is None:
             return
 
-        if self._start_x >= self._end_x or self._start_y >= self._end_y:
+        x0, y0, x1, y1 = self._start_x, self._start_y, self._end_x, self._end_y
+        if region is not None:
+            x0, y0 = max(x0, region[0]), max(y0, region[1])
+            x1, y1 = min(x1, region[2]), min(y1, region[3])
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        lod = self._lod
+        if lod.chunk_textures:
+            self._draw_chunk_textures(backend, x0, y0, x1, y1)
             return
 
+        # The ground-colour level fills every tile opaquely, so floors below the current one would be painted over.
+        start_z = self._start_z if lod.show_sprites else self._end_z
         tile_size = self.viewport.tile_px
-        for z in range(self._start_z, self._end_z - 1, -1):
-            for y in range(self._start_y, self._end_y):
+        for z in range(start_z, self._end_z - 1, -1):
+            for y in range(y0, y1):
                 py = (y - self._start_y) * tile_size
-                for x in range(self._start_x, self._end_x):
+                for x in range(x0, x1):
                     px = (x - self._start_x) * tile_size
                     self._draw_tile(backend, x, y, z, px, py, tile_size)
 
+    def _draw_chunk_textures(self, backend: RenderBackend, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Draw tiles ``[x0, x1) x [y0, y1)`` of the current floor from cached chunk textures.
+
+        Backends with ``draw_chunk_texture(x, y, size, rgba, sx, sy, cols, rows)``
+        get one call per chunk; others get one colour fill per tile.
+        """
+        game_map = self.game_map
+        cache = self.chunk_colors
+        cache.sync(game_map, only_modified=bool(self.options.show_only_modified))
+        draw_texture = getattr(backend, "draw_chunk_texture", None)
+        tile_size = self.viewport.tile_px
+        z = self._end_z
+        for cy in range(y0 >> CHUNK_SHIFT, ((y1 - 1) >> CHUNK_SHIFT) + 1):
+            ty0 = max(y0, cy << CHUNK_SHIFT)
+            ty1 = min(y1, (cy + 1) << CHUNK_SHIFT)
+            for cx in range(x0 >> CHUNK_SHIFT, ((x1 - 1) >> CHUNK_SHIFT) + 1):
+                tx0 = max(x0, cx << CHUNK_SHIFT)
+                tx1 = min(x1, (cx + 1) << CHUNK_SHIFT)
+                rgba = cache.chunk_rgba(game_map, (z, cx, cy))
+                sx = tx0 - (cx << CHUNK_SHIFT)
+                sy = ty0 - (cy << CHUNK_SHIFT)
+                px = (tx0 - self._start_x) * tile_size
+                py = (ty0 - self._start_y) * tile_size
+                if draw_texture is not None:
+                    draw_texture(px, py, tile_size, rgba, sx, sy, tx1 - tx0, ty1 - ty0)
+                    continue
+                for row in range(ty1 - ty0):
+                    offset = (((sy + row) << CHUNK_SHIFT) + sx) * 4
+                    for col in range(tx1 - tx0):
+                        r, g, b, a = rgba[offset : offset + 4]
+                        backend.draw_tile_color(px + col * tile_size, py + row * tile_size, tile_size, r, g, b, a)
+                        offset += 4
+
     def _draw_tile(
         self,
         backend: RenderBackend,
@@ -356,10 +454,16 @@ class MapDrawer:
             backend.draw_tile_color(screen_x, screen_y, size, *color)
             return
 
+        # Zoomed out - flat ground colors
+        if not self._lod.show_sprites:
+            backend.draw_tile_color(screen_x, screen_y, size, *tile_ground_color(tile))
+            return
+
         # Normal rendering - ground then items
         self.floor_drawer.draw(self, backend, tile, screen_x, screen_y, size)
         self.item_drawer.draw(self, backend, tile, screen_x, screen_y, size)
-        self.creature_drawer.draw(self, backend, tile, screen_x, screen_y, size)
+        if self._lod.show_creatures:
+            self.creature_drawer.draw(self, backend, tile, screen_x, screen_y, size)
         self._draw_client_id_overlay(backend, tile, map_z, screen_x, screen_y, size)
 
     def _draw_client_id_overlay(
@@ -371,7 +475,7 @@ class MapDrawer:
         screen_y: int,
         size: int,
     ) -> None:
-        if not bool(self.options.show_client_ids):
+        if not bool(self.options.show_client_ids) or not self._lod.show_names:
             return
         if self.is_minimap_mode() or int(size) < 18:
             return
@@ -420,25 +524,7 @@ class MapDrawer:
     def _get_tile_color(self, tile) -> tuple[int, int, int, int]:
         """Get the display color for a tile (for minimap mode)."""
         # Hash-based color to match qcolor_from_id (Qt-free).
-        if tile.items:
-            top_id = tile.items[-1].id
-        elif tile.ground is not None:
-            top_id = tile.ground.id
-        else:
-            return (43, 43, 43, 255)
-
-        v = int(top_id) & 0xFFFFFFFF
-        r = (v * 2654435761) & 0xFF
-        g = (v * 2246822519) & 0xFF
-        b = (v * 3266489917) & 0xFF
-
-        def clamp(c: int) -> int:
-            return 48 + (int(c) % 160)
-
-        r = clamp(int(r))
-        g = clamp(int(g))
-        b = clamp(int(b))
-        return (r, g, b, 255)
+        return tile_minimap_color(tile)
 
     def _draw_highlight(self, backend: RenderBackend) -> None:
         """Draw a temporary highlight box for a tile."""
@@ -480,7 +566,7 @@ class MapDrawer:
             except Exception:
                 r, g, b = (255, 255, 255)
             backend.draw_selection_rect(px, py, tile_size, tile_size, int(r), int(g), int(b), 200)
-            name = str(cursor.get("name", ""))
+            name = str(cursor.get("name", "")) if self._lod.show_names else ""
             if name:
                 backend.draw_text(px + 2, py + 10, name, int(r), int(g), int(b), 220)
 
@@ -0,0 +1,128 @@
+"""Retained map layer for QPainter canvases.
+
+The map layer (tiles, lights, shade and grid, see ``MapDrawer.draw_map_layer``)
+only changes with the map, the viewport, the drawing options or the assets,
+while the hover highlight, live cursors and tooltips move on almost every
+frame. ``RetainedMapLayer`` keeps the last map layer in a pixmap and asks a
+:class:`~py_rme_canary.logic_layer.render_optimizer.FramePlanner` what the
+next frame needs: nothing (the pixmap is blitted as is), the dirty tile
+rectangles of reported edits (redrawn under a clip), or a full redraw.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from PyQt6.QtCore import QRect, QSize
+from PyQt6.QtGui import QPainter, QPixmap
+
+from py_rme_canary.logic_layer.render_optimizer import FrameMode, FramePlan, FramePlanner
+
+if TYPE_CHECKING:
+    from py_rme_canary.vis_layer.renderer.map_drawer import MapDrawer
+    from py_rme_canary.vis_layer.renderer.qpainter_backend import QPainterRenderBackend
+
+
+def map_layer_key(editor: Any, drawer: MapDrawer, device_pixel_ratio: float) -> tuple[object, ...]:
+    """Return what the map layer depends on besides the tiles, as a comparable tuple."""
+    vp = drawer.viewport
+    options = drawer.options
+    atlas = getattr(editor, "_sprite_atlas", None)
+    sprite_render_enabled = getattr(editor, "_sprite_render_enabled", None)
+    animation_time_ms = getattr(editor, "animation_time_ms", None)
+    return (
+        id(drawer.game_map),
+        vp.origin_x,
+        vp.origin_y,
+        vp.z,
+        vp.tile_px,
+        vp.width_px,
+        vp.height_px,
+        float(device_pixel_ratio),
+        options.render_key(),
+        bool(sprite_render_enabled()) if sprite_render_enabled is not None else False,
+        id(getattr(editor, "sprite_assets", None)),
+        id(getattr(editor, "appearance_assets", None)),
+        id(getattr(editor, "id_mapper", None)),
+        getattr(atlas, "generation", 0),
+        int(animation_time_ms()) if options.show_preview and animation_time_ms is not None else 0,
+    )
+
+
+class RetainedMapLayer:
+    """Pixmap holding the map layer between frames.
+
+    Usage:
+        layer.mark_tiles(changed, version=tiles_version(game_map))  # on edits
+
+        layer.paint(painter, drawer, key=..., version=..., target_rect=self.rect(),
+                    device_pixel_ratio=self.devicePixelRatioF(), make_backend=...)
+        drawer.draw_overlays(make_backend(painter))
+    """
+
+    __slots__ = ("_pixmap", "planner")
+
+    def __init__(self) -> None:
+        self.planner = FramePlanner()
+        self._pixmap: QPixmap | None = None
+
+    def invalidate(self) -> None:
+        """Redraw the whole layer on the next frame."""
+        self.planner.invalidate()
+
+    def mark_tiles(self, keys: Iterable[tuple[int, int, int]], *, version: int | None) -> None:
+        """Report edited tiles; the next frame redraws their area only."""
+        self.planner.mark_tiles(keys, version=version)
+
+    def paint(
+        self,
+        painter: QPainter,
+        drawer: MapDrawer,
+        *,
+        key: tuple[object, ...],
+        version: int | None,
+        target_rect: QRect,
+        device_pixel_ratio: float,
+        make_backend: Callable[[QPainter], QPainterRenderBackend],
+    ) -> FramePlan:
+        """Bring the layer up to date and draw it at the origin of ``painter``."""
+        drawer.setup_vars()
+        dpr = max(1.0, float(device_pixel_ratio))
+        size = QSize(max(1, round(target_rect.width() * dpr)), max(1, round(target_rect.height() * dpr)))
+        pixmap = self._pixmap
+        if pixmap is None or pixmap.size() != size:
+            pixmap = self._pixmap = QPixmap(size)
+            pixmap.setDevicePixelRatio(dpr)
+            self.planner.invalidate()
+
+        plan = self.planner.plan(
+            key, version, bounds=drawer.get_tile_bounds(), partial_ok=not drawer.should_draw_lights()
+        )
+        if plan.mode is not FrameMode.SKIP:
+            layer_painter = QPainter(pixmap)
+            backend = make_backend(layer_painter)
+            if plan.mode is FrameMode.FULL:
+                drawer.draw_map_layer(backend)
+            else:
+                tile_size = int(drawer.viewport.tile_px)
+                start_x, start_y, _end_x, _end_y = drawer.get_tile_bounds()
+                for rect in plan.rects:
+                    layer_painter.setClipRect(
+                        QRect(
+                            (rect.x1 - start_x) * tile_size,
+                            (rect.y1 - start_y) * tile_size,
+                            rect.width * tile_size,
+                            rect.height * tile_size,
+                        )
+                    )
+                    drawer.draw_map_layer(backend, (rect.x1, rect.y1, rect.x2, rect.y2))
+                    backend.flush()
+            backend.flush()
+            layer_painter.end()
+
+        painter.drawPixmap(target_rect.topLeft(), pixmap)
+        return plan
+
+
+__all__ = ["RetainedMapLayer", "map_layer_key"]
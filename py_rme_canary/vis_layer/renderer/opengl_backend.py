@@ -8,7 +8,9 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from .core import ModernSpriteBatcher, TextureArray
+from py_rme_canary.core.memory.frame_arena import FrameArena
+
+from .core import FloatUploadBuffer, ModernSpriteBatcher, TextureArray
 from .map_drawer import RenderBackend
 
 logger = logging.getLogger(__name__)
@@ -219,6 +221,11 @@ class OpenGLResources:
         self.white_texture = self._create_white_texture()
         self.texture_cache = _SpriteTextureCache(gl)
 
+        # Per-frame vertex batches and their staging buffer, reused by every
+        # backend built on these resources.
+        self.batcher = _OpenGLBatcher()
+        self.upload = FloatUploadBuffer()
+
         # Optional: modern sprite batching via GL_TEXTURE_2D_ARRAY.
         self.texture_array_atlas: _TextureArrayAtlas | None = None
         self.sprite_batcher: ModernSpriteBatcher | None = None
@@ -350,16 +357,26 @@ void main() {
         return int(tex)
 
 
+def _blank_run() -> _SpriteRun:
+    return _SpriteRun(texture_id=0, vertices=[])
+
+
 class _OpenGLBatcher:
     def __init__(self) -> None:
         self.color_vertices: list[float] = []
         self.line_vertices: list[float] = []
-        self.sprite_runs: list[_SpriteRun] = []
+        self.sprite_runs: FrameArena[_SpriteRun] = FrameArena(_blank_run, name="SpriteRun")
         self._current_texture: int | None = None
 
+    def reset(self) -> None:
+        """Empty the batches for a new frame, keeping the run records."""
+        self.color_vertices.clear()
+        self.line_vertices.clear()
+        self.sprite_runs.reset()
+        self._current_texture = None
+
     def add_color_rect(self, x: int, y: int, w: int, h: int, color: tuple[int, int, int, int]) -> None:
-        r, g, b, a = color
-        self._append_quad(self.color_vertices, x, y, w, h, (r, g, b, a), uv=(0.0, 0.0, 0.0, 0.0))
+        self._append_quad(self.color_vertices, x, y, w, h, color, uv=(0.0, 0.0, 0.0, 0.0))
 
     def add_line(self, x0: int, y0: int, x1: int, y1: int, color: tuple[int, int, int, int]) -> None:
         r, g, b, a = color
@@ -368,10 +385,12 @@ class _OpenGLBatcher:
 
     def add_sprite(self, texture_id: int, x: int, y: int, w: int, h: int) -> None:
         tex = int(texture_id)
-        if not self.sprite_runs or self._current_texture != tex:
-            self.sprite_runs.append(_SpriteRun(texture_id=tex, vertices=[]))
+        run = self.sprite_runs.last()
+        if run is None or self._current_texture != tex:
+            run = self.sprite_runs.take()
+            run.texture_id = tex
+            run.vertices.clear()
             self._current_texture = tex
-        run = self.sprite_runs[-1]
         self._append_sprite_quad(run.vertices, x, y, w, h)
 
     def _append_vertex(
@@ -387,7 +406,7 @@ class _OpenGLBatcher:
         a: int,
     ) -> None:
         out.extend(
-            [
+            (
                 float(x),
                 float(y),
                 float(u),
@@ -396,7 +415,7 @@ class _OpenGLBatcher:
                 float(g) / 255.0,
                 float(b) / 255.0,
                 float(a) / 255.0,
-            ]
+            )
         )
 
     def _append_quad(
@@ -410,18 +429,26 @@ class _OpenGLBatcher:
         *,
         uv: tuple[float, float, float, float],
     ) -> None:
-        r, g, b, a = color
+        r = float(color[0]) / 255.0
+        g = float(color[1]) / 255.0
+        b = float(color[2]) / 255.0
+        a = float(color[3]) / 255.0
         u0, v0, u1, v1 = uv
         x0 = float(x)
         y0 = float(y)
         x1 = float(x + w)
         y1 = float(y + h)
-        self._append_vertex(out, x0, y0, u0, v0, r, g, b, a)
-        self._append_vertex(out, x1, y0, u1, v0, r, g, b, a)
-        self._append_vertex(out, x1, y1, u1, v1, r, g, b, a)
-        self._append_vertex(out, x0, y0, u0, v0, r, g, b, a)
-        self._append_vertex(out, x1, y1, u1, v1, r, g, b, a)
-        self._append_vertex(out, x0, y1, u0, v1, r, g, b, a)
+        # Two triangles, one extend per quad.
+        out.extend(
+            (
+                x0, y0, u0, v0, r, g, b, a,
+                x1, y0, u1, v0, r, g, b, a,
+                x1, y1, u1, v1, r, g, b, a,
+                x0, y0, u0, v0, r, g, b, a,
+                x1, y1, u1, v1, r, g, b, a,
+                x0, y1, u0, v1, r, g, b, a,
+            )
+        )  # fmt: skip
 
     def _append_sprite_quad(self, out: list[float], x: int, y: int, w: int, h: int) -> None:
         # Flip V to account for top-left origin in sprite data.
@@ -443,7 +470,8 @@ class OpenGLRenderBackend(RenderBackend):
         self._viewport_width = int(max(1, viewport_width))
         self._viewport_height = int(max(1, viewport_height))
         self._sprite_lookup = sprite_lookup
-        self._batcher = _OpenGLBatcher()
+        self._batcher = resources.batcher
+        self._batcher.reset()
         self._sprite_batcher = resources.sprite_batcher
         self._texture_array_atlas = resources.texture_array_atlas
         self._use_texture_array = bool(
@@ -564,16 +592,17 @@ class OpenGLRenderBackend(RenderBackend):
         gl.glBindVertexArray(resources.vao)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, resources.vbo)
 
+        upload = resources.upload
         if self._batcher.color_vertices:
-            data = (ctypes.c_float * len(self._batcher.color_vertices))(*self._batcher.color_vertices)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, ctypes.sizeof(data), data, gl.GL_DYNAMIC_DRAW)
+            data, nbytes = upload.fill(self._batcher.color_vertices)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, data, gl.GL_DYNAMIC_DRAW)
             gl.glUniform1i(resources.u_use_texture, 0)
             gl.glBindTexture(gl.GL_TEXTURE_2D, resources.white_texture)
             gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(self._batcher.color_vertices) // 8)
 
         if self._batcher.line_vertices:
-            data = (ctypes.c_float * len(self._batcher.line_vertices))(*self._batcher.line_vertices)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, ctypes.sizeof(data), data, gl.GL_DYNAMIC_DRAW)
+            data, nbytes = upload.fill(self._batcher.line_vertices)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, data, gl.GL_DYNAMIC_DRAW)
             gl.glUniform1i(resources.u_use_texture, 0)
             gl.glBindTexture(gl.GL_TEXTURE_2D, resources.white_texture)
             gl.glDrawArrays(gl.GL_LINES, 0, len(self._batcher.line_vertices) // 8)
@@ -583,8 +612,8 @@ class OpenGLRenderBackend(RenderBackend):
             for run in self._batcher.sprite_runs:
                 if not run.vertices:
                     continue
-                data = (ctypes.c_float * len(run.vertices))(*run.vertices)
-                gl.glBufferData(gl.GL_ARRAY_BUFFER, ctypes.sizeof(data), data, gl.GL_DYNAMIC_DRAW)
+                data, nbytes = upload.fill(run.vertices)
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, data, gl.GL_DYNAMIC_DRAW)
                 gl.glBindTexture(gl.GL_TEXTURE_2D, int(run.texture_id))
                 gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(run.vertices) // 8)
 
@@ -14,11 +14,13 @@ from PyQt6.QtCore import QElapsedTimer, QPoint, QRect, QSize, Qt, QTimer
 from PyQt6.QtGui import QColor, QPainter, QPen
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
-from py_rme_canary.logic_layer.mirroring import union_with_mirrored
-from py_rme_canary.logic_layer.rust_accel import dedupe_positions
+from py_rme_canary.logic_layer.chunk_colors import tiles_version
 from py_rme_canary.logic_layer.session.selection import SelectionApplyMode
+from py_rme_canary.vis_layer.renderer.map_layer import RetainedMapLayer, map_layer_key
 from py_rme_canary.vis_layer.renderer.opengl_backend import OpenGLRenderBackend, OpenGLResources
+from py_rme_canary.vis_layer.renderer.overlay_layer import IndicatorOverlayLayer, draw_selection_outline
 from py_rme_canary.vis_layer.renderer.qpainter_backend import QPainterRenderBackend
+from py_rme_canary.vis_layer.ui.canvas.pointer_input import CoalescedPointerMixin
 from py_rme_canary.vis_layer.ui.helpers import (
     get_brush_border_offsets,
     get_brush_offsets,
@@ -48,7 +50,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # type: ignore[misc]
+class OpenGLCanvasWidget(CoalescedPointerMixin, QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # type: ignore[misc]
     """
     OpenGL-based canvas for map rendering.
     Falls back to QPainter if OpenGL is not available.
@@ -88,11 +90,16 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
         self._refresh_watch = QElapsedTimer()
         self._refresh_watch.start()
         self._overlay_text_calls: list[tuple[int, int, str, int, int, int, int]] = []
+        self._indicator_layer = IndicatorOverlayLayer()
+        self._map_layer = RetainedMapLayer()  # QPainter fallback only; GL frames redraw the whole buffer
         self._animation_timer = QTimer(self)
         self._animation_timer.setInterval(self.ANIMATION_INTERVAL_MS)
         self._animation_timer.timeout.connect(self._on_animation_tick)
         self._sync_animation_timer()
 
+        # Pointer moves are gathered and handled at most once per frame.
+        self._init_pointer_input()
+
         self._brush_cursor_overlay = BrushCursorOverlay(self)
         self._brush_cursor_overlay.set_visible(False)
         self._brush_preview_overlay = BrushPreviewOverlay(self)
@@ -142,6 +149,9 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
         vp.tile_px = new_tile_px
         self._pending_zoom_step = 0
 
+    def _on_pointer_moved(self, px: int, py: int) -> None:
+        self._update_brush_preview(QPoint(px, py))
+
     def _tile_at(self, px: int, py: int) -> tuple[int, int]:
         vp = self._editor.viewport
         tx = vp.origin_x + (int(px) // vp.tile_px)
@@ -238,64 +248,9 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             return cached
         return get_brush_border_offsets(int(editor.brush_size), str(editor.brush_shape))
 
-    def _paint_footprint_at(self, px: int, py: int, *, alt: bool = False) -> None:
-        editor = self._editor
-        x, y = self._tile_at(px, py)
-        z = editor.viewport.z
-        if not (0 <= x < editor.map.header.width and 0 <= y < editor.map.header.height):
-            return
-
-        mirror_enabled = bool(getattr(editor, "mirror_enabled", False)) and bool(editor.has_mirror_axis())
-        if not mirror_enabled:
-            for dx, dy in self._border_offsets():
-                tx = int(x + dx)
-                ty = int(y + dy)
-                if 0 <= tx < editor.map.header.width and 0 <= ty < editor.map.header.height:
-                    editor.session.mark_autoborder_position(x=int(tx), y=int(ty), z=int(z))
-
-            for dx, dy in self._draw_offsets():
-                tx = int(x + dx)
-                ty = int(y + dy)
-                if 0 <= tx < editor.map.header.width and 0 <= ty < editor.map.header.height:
-                    editor.session.mouse_move(x=int(tx), y=int(ty), z=int(z), alt=bool(alt))
-            return
-
-        axis = str(getattr(editor, "mirror_axis", "x")).lower()
-        v = int(editor.get_mirror_axis_value())
-        width = int(editor.map.header.width)
-        height = int(editor.map.header.height)
-
-        border_positions: list[tuple[int, int, int]] = []
-        for dx, dy in self._border_offsets():
-            tx = int(x + dx)
-            ty = int(y + dy)
-            if 0 <= tx < width and 0 <= ty < height:
-                border_positions.append((tx, ty, int(z)))
-
-        for tx, ty, _tz in union_with_mirrored(
-            dedupe_positions(border_positions),
-            axis=axis,
-            axis_value=int(v),
-            width=width,
-            height=height,
-        ):
-            editor.session.mark_autoborder_position(x=int(tx), y=int(ty), z=int(z))
-
-        draw_positions: list[tuple[int, int, int]] = []
-        for dx, dy in self._draw_offsets():
-            tx = int(x + dx)
-            ty = int(y + dy)
-            if 0 <= tx < width and 0 <= ty < height:
-                draw_positions.append((tx, ty, int(z)))
-
-        for tx, ty, _tz in union_with_mirrored(
-            dedupe_positions(draw_positions),
-            axis=axis,
-            axis_value=int(v),
-            width=width,
-            height=height,
-        ):
-            editor.session.mouse_move(x=int(tx), y=int(ty), z=int(z), alt=bool(alt))
+    def invalidate_tiles(self, changed) -> None:
+        """Report edited tiles so the next QPainter frame redraws only their part of the map layer."""
+        self._map_layer.mark_tiles(changed, version=tiles_version(self._editor.map))
 
     def initializeGL(self) -> None:
         """Initialize OpenGL context (called automatically by Qt)."""
@@ -417,14 +372,30 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
         with contextlib.suppress(Exception):
             drawer.set_live_cursors(editor.session.get_live_cursor_overlays())
 
-        backend = QPainterRenderBackend(
+        def make_backend(target: QPainter) -> QPainterRenderBackend:
+            return QPainterRenderBackend(
+                target,
+                target_rect=self.rect(),
+                sprite_lookup=lambda sid, size: editor._sprite_pixmap_for_server_id(int(sid), tile_px=int(size)),
+                indicator_lookup=editor.indicators.icon,
+                sprite_atlas=getattr(editor, "_sprite_atlas", None),
+                atlas_lookup=lambda sid: editor._sprite_atlas_slot_for_server_id(int(sid)),
+            )
+
+        self._overlay_text_calls = []
+        dpr = self.devicePixelRatioF()
+        self._map_layer.paint(
             painter,
+            drawer,
+            key=map_layer_key(editor, drawer, dpr),
+            version=tiles_version(editor.map),
             target_rect=self.rect(),
-            sprite_lookup=lambda sid, size: editor._sprite_pixmap_for_server_id(int(sid), tile_px=int(size)),
-            indicator_lookup=editor.indicators.icon,
+            device_pixel_ratio=dpr,
+            make_backend=make_backend,
         )
-        self._overlay_text_calls = []
-        drawer.draw(backend)
+        backend = make_backend(painter)
+        drawer.draw_overlays(backend)
+        backend.flush()
         return True
 
     def _draw_overlays(self) -> None:
@@ -436,92 +407,14 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
 
         p = QPainter(self)
 
-        if (
-            getattr(editor, "show_wall_hooks", False)
-            or getattr(editor, "show_pickupables", False)
-            or getattr(editor, "show_moveables", False)
-            or getattr(editor, "show_avoidables", False)
-        ):
-            editor.indicators.ensure_loaded()
-            props = editor.indicators.item_props
-            for y in range(y0, y1):
-                py0 = (y - y0) * s
-                for x in range(x0, x1):
-                    px0 = (x - x0) * s
-                    t = editor.map.get_tile(int(x), int(y), int(z))
-                    if t is None or (
-                        getattr(editor, "only_show_modified", False) and not bool(getattr(t, "modified", False))
-                    ):
-                        continue
-                    stack: list[int] = []
-                    if t.ground is not None:
-                        stack.append(int(t.ground.id))
-                    if t.items:
-                        stack.extend(int(it.id) for it in t.items)
-                    if not stack:
-                        continue
-
-                    any_hook = False
-                    any_pick = False
-                    any_move = False
-                    any_avoid = False
-                    for sid in stack:
-                        it = props.get(int(sid))
-                        if it is None:
-                            continue
-                        if editor.show_wall_hooks and it.hook:
-                            any_hook = True
-                        if editor.show_pickupables and it.pickupable:
-                            any_pick = True
-                        if editor.show_moveables and it.moveable:
-                            any_move = True
-                        if editor.show_avoidables and it.avoidable:
-                            any_avoid = True
-
-                    icon_size = max(8, min(12, s // 2))
-                    cx = px0 + 2
-                    cy = py0 + 2
-                    if any_hook:
-                        pm = editor.indicators.icon("hooks", icon_size)
-                        if pm is not None:
-                            p.drawPixmap(cx, cy, pm)
-                            cx += icon_size + 1
-                    if any_pick:
-                        pm = editor.indicators.icon("pickupables", icon_size)
-                        if pm is not None:
-                            p.drawPixmap(cx, cy, pm)
-                            cx += icon_size + 1
-                    if any_move:
-                        pm = editor.indicators.icon("moveables", icon_size)
-                        if pm is not None:
-                            p.drawPixmap(cx, cy, pm)
-                            cx += icon_size + 1
-                    if any_avoid:
-                        p.setPen(QPen(QColor(255, 60, 60)))
-                        p.drawText(
-                            QRect(px0 + 2, py0 + 2, s - 4, s - 4),
-                            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
-                            "A",
-                        )
+        self._indicator_layer.draw(p, editor, x0, y0, x1, y1, z)
 
         if self._overlay_text_calls and self._use_opengl and self._opengl_initialized:
             for x, y, text, r, g, b, a in self._overlay_text_calls:
                 p.setPen(QPen(QColor(int(r), int(g), int(b), int(a))))
                 p.drawText(int(x), int(y), str(text))
 
-        sel_pen = QPen(QColor(230, 230, 230))
-        sel_pen.setWidth(2)
-        p.setPen(sel_pen)
-
-        selected = editor.session.get_selection_tiles()
-        for sx, sy, sz in selected:
-            if int(sz) != int(z):
-                continue
-            if not (x0 <= int(sx) < x1 and y0 <= int(sy) < y1):
-                continue
-            px0 = (int(sx) - x0) * s
-            py0 = (int(sy) - y0) * s
-            p.drawRect(QRect(px0, py0, s, s))
+        draw_selection_outline(p, editor, x0, y0, x1, y1, z)
 
         box = editor.session.get_selection_box()
         if box is not None:
@@ -638,8 +531,7 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             ctrl = bool(mods & Qt.KeyboardModifier.ControlModifier)
             alt = bool(mods & Qt.KeyboardModifier.AltModifier)
 
-            selected = editor.session.get_selection_tiles()
-            if (not shift) and (not ctrl) and ((int(x), int(y), int(z)) in selected):
+            if (not shift) and (not ctrl) and editor.session.is_tile_selected(x=x, y=y, z=z):
                 self._selection_dragging = True
                 self._selection_drag_start = (int(x), int(y), int(z))
                 self.update()
@@ -659,8 +551,7 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             elif ctrl:
                 editor.session.toggle_select_tile(x=x, y=y, z=z)
             elif alt:
-                selected = editor.session.get_selection_tiles()
-                if (int(x), int(y), int(z)) in selected:
+                if editor.session.is_tile_selected(x=x, y=y, z=z):
                     editor.session.toggle_select_tile(x=x, y=y, z=z)
             else:
                 editor.session.set_single_selection(x=x, y=y, z=z)
@@ -692,14 +583,15 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             alt = bool(event.modifiers() & Qt.KeyboardModifier.AltModifier)
             editor.session.mouse_down(x=x, y=y, z=z, alt=alt)
             self._paint_footprint_at(int(event.position().x()), int(event.position().y()), alt=alt)
+            self._input.begin_stroke(x, y)
         except Exception as e:
             QMessageBox.critical(self, "Paint", str(e))
             self._mouse_down = False
 
     def mouseMoveEvent(self, event):
         editor = self._editor
-
-        self._update_brush_preview(event.position().toPoint())
+        px = int(event.position().x())
+        py = int(event.position().y())
 
         if self._panning and self._pan_anchor is not None:
             anchor_pt, ox, oy = self._pan_anchor
@@ -708,7 +600,7 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             dy_px = int(cur.y() - anchor_pt.y())
             if not self._right_click_moved:
                 if abs(dx_px) < self._right_click_threshold and abs(dy_px) < self._right_click_threshold:
-                    editor.update_status_from_mouse(int(event.position().x()), int(event.position().y()))
+                    self._queue_pointer(px, py)
                     return
                 self._right_click_moved = True
             dx_tiles = -dx_px // editor.viewport.tile_px
@@ -716,27 +608,28 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
             editor.viewport.origin_x = max(0, int(ox + dx_tiles))
             editor.viewport.origin_y = max(0, int(oy + dy_tiles))
             self.request_render()
-            editor.update_status_from_mouse(int(event.position().x()), int(event.position().y()))
+            self._queue_pointer(px, py)
             return
 
         if getattr(editor, "selection_mode", False) and self._mouse_down:
             if self._selection_dragging and self._selection_drag_start is not None:
-                editor.update_status_from_mouse(int(event.position().x()), int(event.position().y()))
+                self._queue_pointer(px, py)
                 return
             box = editor.session.get_selection_box()
             if box is not None:
-                x, y = self._tile_at(int(event.position().x()), int(event.position().y()))
+                x, y = self._tile_at(px, py)
                 z = editor.viewport.z
                 editor.session.update_box_selection(x=x, y=y, z=z)
                 self.request_render()
-            editor.update_status_from_mouse(int(event.position().x()), int(event.position().y()))
+            self._queue_pointer(px, py)
             return
 
-        if self._mouse_down:
+        if self._mouse_down and self._input.stroke_active:
+            x, y = self._tile_at(px, py)
             alt = bool(event.modifiers() & Qt.KeyboardModifier.AltModifier)
-            self._paint_footprint_at(int(event.position().x()), int(event.position().y()), alt=alt)
+            self._input.extend_stroke(x, y, alt=alt)
 
-        editor.update_status_from_mouse(int(event.position().x()), int(event.position().y()))
+        self._queue_pointer(px, py)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.RightButton:
@@ -755,6 +648,9 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
         if not self._mouse_down:
             return
 
+        # Paint what the last frame has not applied yet before the stroke ends.
+        self._flush_pending_input()
+        self._input.end_stroke()
         self._mouse_down = False
 
         editor = self._editor
@@ -793,10 +689,12 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
         editor.session.mouse_up()
 
     def leaveEvent(self, event) -> None:  # type: ignore[override]
+        self._drop_pointer()
         self._hide_brush_preview()
         super().leaveEvent(event)
 
     def cancel_interaction(self) -> None:
+        self._input.clear()
         self._mouse_down = False
         self._panning = False
         self._pan_anchor = None
@@ -894,3 +792,4 @@ class OpenGLCanvasWidget(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):  # typ
 def is_opengl_available() -> bool:
     """Check if OpenGL rendering is supported on this system."""
     return OPENGL_AVAILABLE
+
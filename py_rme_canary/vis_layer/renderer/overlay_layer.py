@@ -0,0 +1,156 @@
+"""Retained indicator overlay and merged selection outline for the map canvases.
+
+Both canvases used to rebuild the item-indicator overlay tile by tile on
+every repaint and to outline the selection with one ``drawRect`` per tile.
+Here the indicators are recorded once per 32x32 chunk into a ``QPicture``
+(from the flags cached by ``IndicatorFlagCache``) and replayed while the
+chunk, the zoom level and the toggles stay the same; the selection is drawn
+from the merged outline segments of ``EditorSession.selection_outline_in_rect``
+in a single ``drawLines`` call.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from PyQt6.QtCore import QLine, QPoint, QRect, Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPicture
+
+from py_rme_canary.logic_layer.indicator_flags import (
+    AVOIDABLE,
+    HOOK,
+    MODIFIED,
+    MOVEABLE,
+    PICKUPABLE,
+    IndicatorFlagCache,
+)
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SHIFT, ChunkKey
+
+if TYPE_CHECKING:
+    from py_rme_canary.vis_layer.ui.main_window.editor import QtMapEditor
+
+_ICONS = ((HOOK, "hooks"), (PICKUPABLE, "pickupables"), (MOVEABLE, "moveables"))
+_MAX_LAYERS = 256
+
+
+def enabled_indicator_mask(editor: Any) -> int:
+    """Return the indicator bits switched on in the editor's view toggles."""
+    mask = 0
+    if getattr(editor, "show_wall_hooks", False):
+        mask |= HOOK
+    if getattr(editor, "show_pickupables", False):
+        mask |= PICKUPABLE
+    if getattr(editor, "show_moveables", False):
+        mask |= MOVEABLE
+    if getattr(editor, "show_avoidables", False):
+        mask |= AVOIDABLE
+    return mask
+
+
+class IndicatorOverlayLayer:
+    """Per-chunk ``QPicture`` recordings of the item indicators.
+
+    A recording is keyed by the chunk's flag-cache version, the tile size,
+    the enabled indicators and the "only show modified" toggle, so it is
+    re-recorded only when one of those changes.
+    """
+
+    def __init__(self) -> None:
+        self._layers: dict[ChunkKey, tuple[tuple[int, int, int, bool], QPicture]] = {}
+        self.recorded = 0
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def clear(self) -> None:
+        self._layers.clear()
+
+    def draw(self, painter: QPainter, editor: QtMapEditor, x0: int, y0: int, x1: int, y1: int, z: int) -> None:
+        """Draw the indicators of the tiles ``[x0, x1) x [y0, y1)`` with tile ``(x0, y0)`` at the origin."""
+        enabled = enabled_indicator_mask(editor)
+        if not enabled:
+            return
+        indicators = editor.indicators
+        indicators.ensure_loaded()
+        flags: IndicatorFlagCache = indicators.flags
+        props = indicators.item_props
+        game_map = editor.map
+        s = int(editor.viewport.tile_px)
+        only_modified = bool(getattr(editor, "only_show_modified", False))
+
+        layers = self._layers
+        visible: list[ChunkKey] = []
+        for cy in range(y0 >> CHUNK_SHIFT, ((y1 - 1) >> CHUNK_SHIFT) + 1):
+            for cx in range(x0 >> CHUNK_SHIFT, ((x1 - 1) >> CHUNK_SHIFT) + 1):
+                ck = (int(z), cx, cy)
+                visible.append(ck)
+                entries = flags.chunk_flags(game_map, ck, props)
+                if not entries:
+                    continue
+                key = (flags.version(ck), s, enabled, only_modified)
+                layer = layers.get(ck)
+                if layer is None or layer[0] != key:
+                    layer = (key, self._record(entries, cx, cy, s, enabled, only_modified, indicators))
+                    layers[ck] = layer
+                painter.drawPicture(QPoint(((cx << CHUNK_SHIFT) - x0) * s, ((cy << CHUNK_SHIFT) - y0) * s), layer[1])
+
+        if len(layers) > _MAX_LAYERS:
+            self._layers = {ck: layers[ck] for ck in visible if ck in layers}
+
+    def _record(
+        self,
+        entries: tuple[tuple[int, int, int], ...],
+        cx: int,
+        cy: int,
+        s: int,
+        enabled: int,
+        only_modified: bool,
+        indicators: Any,
+    ) -> QPicture:
+        picture = QPicture()
+        p = QPainter(picture)
+        bx = cx << CHUNK_SHIFT
+        by = cy << CHUNK_SHIFT
+        icon_size = max(8, min(12, s // 2))
+        icons = [(bit, indicators.icon(name, icon_size)) for bit, name in _ICONS if enabled & bit]
+        avoid_pen = QPen(QColor(255, 60, 60))
+        for x, y, mask in entries:
+            if only_modified and not mask & MODIFIED:
+                continue
+            mask &= enabled
+            if not mask:
+                continue
+            px0 = (x - bx) * s
+            py0 = (y - by) * s
+            ix = px0 + 2
+            for bit, pm in icons:
+                if mask & bit and pm is not None:
+                    p.drawPixmap(ix, py0 + 2, pm)
+                    ix += icon_size + 1
+            if mask & AVOIDABLE:
+                p.setPen(avoid_pen)
+                p.drawText(
+                    QRect(px0 + 2, py0 + 2, s - 4, s - 4),
+                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
+                    "A",
+                )
+        p.end()
+        self.recorded += 1
+        return picture
+
+
+def draw_selection_outline(painter: QPainter, editor: QtMapEditor, x0: int, y0: int, x1: int, y1: int, z: int) -> None:
+    """Outline the selected tiles of ``[x0, x1) x [y0, y1)`` with tile ``(x0, y0)`` at the origin."""
+    segments = editor.session.selection_outline_in_rect(x0=x0, y0=y0, x1=x1 - 1, y1=y1 - 1, z=z)
+    if not segments:
+        return
+    s = int(editor.viewport.tile_px)
+    sel_pen = QPen(QColor(230, 230, 230))
+    sel_pen.setWidth(2)
+    painter.setPen(sel_pen)
+    painter.drawLines(
+        [QLine((ax - x0) * s, (ay - y0) * s, (bx - x0) * s, (by - y0) * s) for ax, ay, bx, by in segments]
+    )
+
+
+__all__ = ["IndicatorOverlayLayer", "draw_selection_outline", "enabled_indicator_mask"]
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QRect
-from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt6.QtCore import QPointF, QRect, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+
+from py_rme_canary.logic_layer.session.selection_bitmap import CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from py_rme_canary.vis_layer.renderer.sprite_atlas import AtlasSlot, SpriteAtlasCache
 
 
 def _color_from_id(sprite_id: int) -> QColor:
@@ -27,7 +33,14 @@ def _border_color_from_id(sprite_id: int) -> QColor:
 
 
 class QPainterRenderBackend:
-    """RenderBackend implementation that draws using QPainter."""
+    """RenderBackend implementation that draws using QPainter.
+
+    When ``sprite_atlas`` and ``atlas_lookup`` are given, sprites are drawn from
+    shared native-size atlas pages: consecutive sprites of the same page are
+    queued as pixmap fragments and emitted with one ``drawPixmapFragments``
+    call. Primitives that may overlap queued sprites emit the queue first, so
+    painting order is preserved. Callers must call ``flush()`` after drawing.
+    """
 
     def __init__(
         self,
@@ -36,22 +49,123 @@ class QPainterRenderBackend:
         target_rect: QRect,
         sprite_lookup: Callable[[int, int], QPixmap | None],
         indicator_lookup: Callable[[str, int], QPixmap | None] | None = None,
+        sprite_atlas: SpriteAtlasCache | None = None,
+        atlas_lookup: Callable[[int], AtlasSlot | None] | None = None,
     ) -> None:
         self._painter = painter
         self._target_rect = target_rect
         self._sprite_lookup = sprite_lookup
         self._indicator_lookup = indicator_lookup
+        self._sprite_atlas = sprite_atlas
+        self._atlas_lookup = atlas_lookup if sprite_atlas is not None else None
         self._sprite_frame_cache: dict[tuple[int, int], QPixmap | None] = {}
+        self._atlas_frame_cache: dict[int, AtlasSlot | None] = {}
+        self._atlas_generation = sprite_atlas.generation if sprite_atlas is not None else 0
         self._indicator_frame_cache: dict[tuple[str, int], QPixmap | None] = {}
+        self._pending_page: QPixmap | None = None
+        self._pending_fragments: list[QPainter.PixmapFragment] = []
+        self._pending_cells: set[tuple[int, int]] = set()
+        self._pending_size = 0
+        self.fragment_batches = 0
+        self.fragments_drawn = 0
+
+    def flush(self) -> None:
+        """Emit queued atlas fragments (one draw call for the pending page)."""
+        fragments = self._pending_fragments
+        page = self._pending_page
+        if not fragments or page is None:
+            self._pending_page = None
+            self._pending_cells.clear()
+            return
+        try:
+            self._painter.drawPixmapFragments(fragments, page)
+        except TypeError:
+            # Some PyQt6 builds only accept sip arrays here; draw one by one.
+            for frag in fragments:
+                w = frag.width * frag.scaleX
+                h = frag.height * frag.scaleY
+                self._painter.drawPixmap(
+                    QRectF(frag.x - w / 2.0, frag.y - h / 2.0, w, h),
+                    page,
+                    QRectF(frag.sourceLeft, frag.sourceTop, frag.width, frag.height),
+                )
+        self.fragment_batches += 1
+        self.fragments_drawn += len(fragments)
+        fragments.clear()
+        self._pending_cells.clear()
+        self._pending_page = None
+
+    def _overlaps_pending(self, x: int, y: int, size: int) -> bool:
+        # Queued sprites are scaled to exactly their grid cell, so a grid-aligned
+        # fill of a different cell cannot overlap them and need not break the batch.
+        if not self._pending_fragments:
+            return False
+        s = int(size)
+        if s != self._pending_size or s <= 0 or int(x) % s or int(y) % s:
+            return True
+        return (int(x), int(y)) in self._pending_cells
+
+    def _atlas_slot(self, sprite_id: int) -> AtlasSlot | None:
+        atlas = self._sprite_atlas
+        assert atlas is not None and self._atlas_lookup is not None
+        if atlas.generation != self._atlas_generation:
+            self._atlas_frame_cache.clear()
+            self._atlas_generation = atlas.generation
+        sid = int(sprite_id)
+        if sid not in self._atlas_frame_cache:
+            self._atlas_frame_cache[sid] = self._atlas_lookup(sid)
+            if atlas.generation != self._atlas_generation:
+                # The lookup reset a full atlas; only the slot just returned is valid.
+                self._atlas_frame_cache = {sid: self._atlas_frame_cache[sid]}
+                self._atlas_generation = atlas.generation
+        return self._atlas_frame_cache[sid]
+
+    def _queue_atlas_sprite(self, x: int, y: int, size: int, slot: AtlasSlot) -> None:
+        assert self._sprite_atlas is not None
+        page = self._sprite_atlas.page(slot.page)
+        if self._pending_page is not None and self._pending_page is not page:
+            self.flush()
+        if self._pending_fragments and int(size) != self._pending_size:
+            self.flush()
+        self._pending_page = page
+        self._pending_size = int(size)
+        self._pending_cells.add((int(x), int(y)))
+        half = float(size) / 2.0
+        self._pending_fragments.append(
+            QPainter.PixmapFragment.create(
+                QPointF(float(x) + half, float(y) + half),
+                QRectF(float(slot.x), float(slot.y), float(slot.w), float(slot.h)),
+                float(size) / float(slot.w),
+                float(size) / float(slot.h),
+            )
+        )
 
     def clear(self, r: int, g: int, b: int, a: int = 255) -> None:
+        self.flush()
         self._painter.fillRect(self._target_rect, QColor(int(r), int(g), int(b), int(a)))
 
     def draw_tile_color(self, x: int, y: int, size: int, r: int, g: int, b: int, a: int = 255) -> None:
+        if self._overlaps_pending(x, y, size):
+            self.flush()
         rect = QRect(int(x), int(y), int(size), int(size))
         self._painter.fillRect(rect, QColor(int(r), int(g), int(b), int(a)))
 
+    def draw_chunk_texture(
+        self, x: int, y: int, size: int, rgba: bytes, sx: int, sy: int, cols: int, rows: int
+    ) -> None:
+        """Draw tiles ``(sx, sy, cols, rows)`` of a chunk colour texture, ``size`` pixels per tile."""
+        self.flush()
+        image = QImage(rgba, CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE * 4, QImage.Format.Format_RGBA8888)
+        target = QRect(int(x), int(y), int(cols) * int(size), int(rows) * int(size))
+        self._painter.drawImage(target, image, QRect(int(sx), int(sy), int(cols), int(rows)))
+
     def draw_tile_sprite(self, x: int, y: int, size: int, sprite_id: int) -> None:
+        if self._atlas_lookup is not None and int(size) > 0:
+            slot = self._atlas_slot(int(sprite_id))
+            if slot is not None:
+                self._queue_atlas_sprite(x, y, size, slot)
+                return
+        self.flush()
         key = (int(sprite_id), int(size))
         if key not in self._sprite_frame_cache:
             self._sprite_frame_cache[key] = self._sprite_lookup(int(sprite_id), int(size))
@@ -72,16 +186,19 @@ class QPainterRenderBackend:
         self._painter.drawPixmap(int(x), int(y), pm)
 
     def draw_grid_line(self, x0: int, y0: int, x1: int, y1: int, r: int, g: int, b: int, a: int = 255) -> None:
+        self.flush()
         pen = QPen(QColor(int(r), int(g), int(b), int(a)))
         self._painter.setPen(pen)
         self._painter.drawLine(int(x0), int(y0), int(x1), int(y1))
 
     def draw_grid_rect(self, x: int, y: int, w: int, h: int, r: int, g: int, b: int, a: int = 255) -> None:
+        self.flush()
         pen = QPen(QColor(int(r), int(g), int(b), int(a)))
         self._painter.setPen(pen)
         self._painter.drawRect(int(x), int(y), int(w), int(h))
 
     def draw_selection_rect(self, x: int, y: int, w: int, h: int, r: int, g: int, b: int, a: int = 255) -> None:
+        self.flush()
         pen = QPen(QColor(int(r), int(g), int(b), int(a)))
         pen.setWidth(2)
         self._painter.setPen(pen)
@@ -90,6 +207,7 @@ class QPainterRenderBackend:
     def draw_indicator_icon(self, x: int, y: int, indicator_type: str, size: int) -> None:
         if self._indicator_lookup is None:
             return
+        self.flush()
         key = (str(indicator_type), int(size))
         if key not in self._indicator_frame_cache:
             self._indicator_frame_cache[key] = self._indicator_lookup(str(indicator_type), int(size))
@@ -99,9 +217,11 @@ class QPainterRenderBackend:
         self._painter.drawPixmap(int(x), int(y), pm)
 
     def draw_text(self, x: int, y: int, text: str, r: int, g: int, b: int, a: int = 255) -> None:
+        self.flush()
         self._painter.setPen(QPen(QColor(int(r), int(g), int(b), int(a))))
         self._painter.drawText(int(x), int(y), str(text))
 
     def draw_shade_overlay(self, x: int, y: int, w: int, h: int, alpha: int) -> None:
+        self.flush()
         rect = QRect(int(x), int(y), int(w), int(h))
         self._painter.fillRect(rect, QColor(0, 0, 0, int(alpha)))
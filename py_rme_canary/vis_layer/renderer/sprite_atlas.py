@@ -0,0 +1,177 @@
+"""Zoom-independent sprite atlas for the QPainter canvas path.
+
+Each sprite is uploaded once, at its native size, into a shared atlas page
+(a large ``QPixmap``). The QPainter backend then draws every visible sprite
+of a page with a single ``QPainter.drawPixmapFragments`` call and lets the
+fragment scale factors do the zoom, so changing ``tile_px`` never creates
+new pixmaps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+
+# (width, height, BGRA bytes) as returned by the sprite asset providers.
+SpriteRGBA = tuple[int, int, bytes]
+
+
+@dataclass(frozen=True, slots=True)
+class AtlasSlot:
+    """Location of a sprite inside an atlas page."""
+
+    page: int
+    x: int
+    y: int
+    w: int
+    h: int
+
+
+class _ShelfPacker:
+    """Simple shelf (row) packer for one square atlas page."""
+
+    __slots__ = ("_shelf_h", "_size", "_x", "_y")
+
+    def __init__(self, size: int) -> None:
+        self._size = int(size)
+        self._x = 0
+        self._y = 0
+        self._shelf_h = 0
+
+    def allocate(self, w: int, h: int) -> tuple[int, int] | None:
+        w = int(w)
+        h = int(h)
+        if w <= 0 or h <= 0 or w > self._size or h > self._size:
+            return None
+        if self._x + w > self._size:
+            # Start a new shelf below the current one.
+            self._y += self._shelf_h
+            self._x = 0
+            self._shelf_h = 0
+        if self._y + h > self._size:
+            return None
+        pos = (self._x, self._y)
+        self._x += w
+        self._shelf_h = max(self._shelf_h, h)
+        return pos
+
+
+class SpriteAtlasCache:
+    """Stores each sprite once at native size, packed into shared atlas pages.
+
+    Lookups are keyed only by sprite id (never by zoom). Sprites that failed
+    to decode are remembered as misses so they are not retried every frame.
+    When all pages are full the atlas is reset; with the default sizes that
+    is several tens of thousands of distinct 32x32 sprites.
+    """
+
+    def __init__(self, *, page_size: int = 2048, max_pages: int = 8) -> None:
+        self.page_size = max(64, int(page_size))
+        self.max_pages = max(1, int(max_pages))
+        self._pages: list[QPixmap] = []
+        self._packers: list[_ShelfPacker] = []
+        self._slots: dict[int, AtlasSlot | None] = {}
+        # Number of packed (non-miss) slots, kept in step with ``_slots``.
+        self._packed = 0
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return self._packed
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    @property
+    def generation(self) -> int:
+        """Incremented every time the atlas is cleared (slots become invalid)."""
+        return int(self._generation)
+
+    def page(self, index: int) -> QPixmap:
+        return self._pages[int(index)]
+
+    def memory_bytes(self) -> int:
+        """Approximate pixel memory held by atlas pages (ARGB32)."""
+        return len(self._pages) * self.page_size * self.page_size * 4
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self._packers.clear()
+        self._slots.clear()
+        self._packed = 0
+        self._generation += 1
+
+    def forget(self, sprite_id: int) -> None:
+        """Drop a cached miss/slot so the next lookup retries the loader."""
+        if self._slots.pop(int(sprite_id), None) is not None:
+            self._packed -= 1
+
+    def get(self, sprite_id: int) -> AtlasSlot | None:
+        return self._slots.get(int(sprite_id))
+
+    def contains(self, sprite_id: int) -> bool:
+        return int(sprite_id) in self._slots
+
+    def slot_for(self, sprite_id: int, loader: Callable[[int], SpriteRGBA | None]) -> AtlasSlot | None:
+        """Return the atlas slot for ``sprite_id``, uploading it on first use."""
+        sid = int(sprite_id)
+        if sid in self._slots:
+            return self._slots[sid]
+
+        data = loader(sid)
+        if data is None:
+            self._slots[sid] = None
+            return None
+        w, h, bgra = data
+        w = int(w)
+        h = int(h)
+        if w <= 0 or h <= 0 or w > self.page_size or h > self.page_size:
+            self._slots[sid] = None
+            return None
+
+        image = QImage(bgra, w, h, w * 4, QImage.Format.Format_ARGB32)
+        if image.isNull():
+            self._slots[sid] = None
+            return None
+
+        placed = self._allocate(w, h)
+        if placed is None:
+            return None
+        page_index, x, y = placed
+
+        painter = QPainter(self._pages[page_index])
+        try:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawImage(x, y, image)
+        finally:
+            painter.end()
+
+        slot = AtlasSlot(page=page_index, x=x, y=y, w=w, h=h)
+        self._slots[sid] = slot
+        self._packed += 1
+        return slot
+
+    def _allocate(self, w: int, h: int) -> tuple[int, int, int] | None:
+        for index, packer in enumerate(self._packers):
+            pos = packer.allocate(w, h)
+            if pos is not None:
+                return index, pos[0], pos[1]
+
+        if len(self._pages) >= self.max_pages:
+            # Full: start over rather than evicting individual rectangles.
+            self.clear()
+
+        page = QPixmap(self.page_size, self.page_size)
+        if page.isNull():
+            return None
+        page.fill(Qt.GlobalColor.transparent)
+        packer = _ShelfPacker(self.page_size)
+        pos = packer.allocate(w, h)
+        if pos is None:
+            return None
+        self._pages.append(page)
+        self._packers.append(packer)
+        return len(self._pages) - 1, pos[0], pos[1]
@@ -0,0 +1,122 @@
+"""Coalesced pointer input shared by the QPainter and OpenGL map canvases."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QElapsedTimer, QTimer
+from PyQt6.QtWidgets import QMessageBox
+
+from py_rme_canary.logic_layer.input_coalescer import PointerCoalescer, stroke_footprint
+from py_rme_canary.logic_layer.mirroring import union_with_mirrored
+from py_rme_canary.logic_layer.rust_accel import dedupe_positions
+
+if TYPE_CHECKING:
+    from py_rme_canary.vis_layer.ui.main_window.editor import QtMapEditor
+
+
+class CoalescedPointerMixin:
+    """Handle pointer moves and stroke painting at most once per frame.
+
+    The host widget calls :meth:`_init_pointer_input` from its constructor
+    and provides ``HARD_REFRESH_RATE_MS``, ``_mouse_down``,
+    ``request_render()``, ``_tile_at()``, ``_draw_offsets()``,
+    ``_border_offsets()`` and ``_on_pointer_moved()`` (hover/preview update
+    for the latest pointer position).
+    """
+
+    HARD_REFRESH_RATE_MS: int
+    _editor: QtMapEditor
+    _mouse_down: bool
+
+    def _init_pointer_input(self) -> None:
+        self._input = PointerCoalescer()
+        self._input_watch = QElapsedTimer()
+        self._input_watch.start()
+        self._input_timer = QTimer(self)
+        self._input_timer.setSingleShot(True)
+        self._input_timer.timeout.connect(self._flush_pending_input)
+
+    def _queue_pointer(self, px: int, py: int) -> None:
+        """Record a pointer move; handle it now if a frame has passed, else at the next frame."""
+        self._input.move(px, py)
+        elapsed = int(self._input_watch.elapsed())
+        if elapsed >= self.HARD_REFRESH_RATE_MS:
+            self._flush_pending_input()
+        elif not self._input_timer.isActive():
+            self._input_timer.start(self.HARD_REFRESH_RATE_MS - elapsed)
+
+    def _flush_pending_input(self) -> None:
+        """Apply the coalesced stroke path and pointer updates gathered since the last frame."""
+        self._input_timer.stop()
+        self._input_watch.restart()
+        if not self._input.pending:
+            return
+        self._input.mark_frame()
+        path, alt = self._input.take_stroke()
+        if path:
+            try:
+                self._paint_footprint(path, alt=alt)
+            except Exception as e:
+                self._input.clear()
+                self._mouse_down = False
+                QMessageBox.critical(self, "Paint", str(e))
+                return
+            self.request_render()
+        pointer = self._input.take_pointer()
+        if pointer is not None:
+            px, py = pointer
+            self._editor.update_status_from_mouse(px, py)
+            self._on_pointer_moved(px, py)
+
+    def _drop_pointer(self) -> None:
+        """Forget a queued hover position, e.g. when the pointer leaves the canvas."""
+        self._input.take_pointer()
+
+    def _paint_footprint_at(self, px: int, py: int, *, alt: bool = False) -> None:
+        self._paint_footprint([self._tile_at(px, py)], alt=alt)
+
+    def _paint_footprint(self, path: list[tuple[int, int]], *, alt: bool = False) -> None:
+        """Paint the merged brush footprint of a stroke path (tile coordinates) in one pass."""
+        editor = self._editor
+        z = int(editor.viewport.z)
+        width = int(editor.map.header.width)
+        height = int(editor.map.header.height)
+        path = [(int(x), int(y)) for x, y in path if 0 <= x < width and 0 <= y < height]
+        if not path:
+            return
+
+        # Legacy `tilestoborder` ring and draw area, merged over the whole path.
+        border_offsets = self._border_offsets()
+        draw_offsets = self._draw_offsets()
+        border_tiles = stroke_footprint(path, border_offsets, width=width, height=height)
+        draw_tiles = stroke_footprint(path, draw_offsets, width=width, height=height)
+
+        mirror_enabled = bool(getattr(editor, "mirror_enabled", False)) and bool(editor.has_mirror_axis())
+        if not mirror_enabled:
+            for tx, ty in border_tiles:
+                editor.session.mark_autoborder_position(x=tx, y=ty, z=z)
+            for tx, ty in draw_tiles:
+                editor.session.mouse_move(x=tx, y=ty, z=z, alt=bool(alt))
+            return
+
+        axis = str(getattr(editor, "mirror_axis", "x")).lower()
+        v = int(editor.get_mirror_axis_value())
+
+        for tx, ty, _tz in union_with_mirrored(
+            dedupe_positions([(tx, ty, z) for tx, ty in border_tiles]),
+            axis=axis,
+            axis_value=int(v),
+            width=width,
+            height=height,
+        ):
+            editor.session.mark_autoborder_position(x=int(tx), y=int(ty), z=z)
+
+        for tx, ty, _tz in union_with_mirrored(
+            dedupe_positions([(tx, ty, z) for tx, ty in draw_tiles]),
+            axis=axis,
+            axis_value=int(v),
+            width=width,
+            height=height,
+        ):
+            editor.session.mouse_move(x=int(tx), y=int(ty), z=z, alt=bool(alt))
@@ -11,6 +11,7 @@ Reference:
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
@@ -298,8 +299,10 @@ class DepotPropertiesWindow(QDialog):
 
         # Apply to item if available
         if self._item is not None:
-            if hasattr(self._item, "depot_id"):
-                self._item.depot_id = properties["depot_id"]
+            # Items are immutable; keep an updated copy.
+            changes = {key: value for key, value in properties.items() if hasattr(self._item, key)}
+            if changes:
+                self._item = replace(self._item, **changes)
 
         self.properties_changed.emit(properties)
         self.accept()
@@ -5,6 +5,7 @@ Advanced search and replace for items on the map.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import Qt
@@ -304,28 +305,32 @@ class ItemFindReplaceDialog(QDialog):
         replaced = 0
         tiles = getattr(self._game_map, "tiles", {}) or {}
 
-        for _pos, tile in tiles.items():
+        # Tiles and items are immutable: collect updated copies, then store them.
+        for pos, tile in list(tiles.items()):
+            ground = tile.ground
+            items = tile.items
             # Check ground
-            if self.match_ground.isChecked() and tile.ground and tile.ground.id == find_id:
-                if self.delete_mode.isChecked():
-                    tile.ground = None
-                else:
-                    tile.ground.id = replace_id
+            if self.match_ground.isChecked() and ground and ground.id == find_id:
+                ground = None if replace_id is None else replace(ground, id=replace_id)
                 replaced += 1
                 self.progress.setValue(replaced)
 
             # Check items
             if self.match_items.isChecked():
-                for item in tile.items:
+                for index, item in enumerate(items):
                     if item.id == find_id:
-                        if self.delete_mode.isChecked():
-                            tile.items.remove(item)
+                        items = list(items)
+                        if replace_id is None:
+                            del items[index]
                         else:
-                            item.id = replace_id
+                            items[index] = replace(item, id=replace_id)
                         replaced += 1
                         self.progress.setValue(replaced)
                         break
 
+            if ground is not tile.ground or items is not tile.items:
+                tiles[pos] = replace(tile, ground=ground, items=items, modified=True)
+
         self.progress.hide()
         self.results_label.setText(f"Replaced {replaced} item{'s' if replaced != 1 else ''}")
         self._match_count = 0
@@ -11,6 +11,7 @@ Reference:
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
@@ -402,12 +403,10 @@ class SplashPropertiesWindow(QDialog):
 
         # Apply to item if available
         if self._item is not None:
-            if hasattr(self._item, "action_id"):
-                self._item.action_id = properties["action_id"]
-            if hasattr(self._item, "unique_id"):
-                self._item.unique_id = properties["unique_id"]
-            if hasattr(self._item, "fluid_type"):
-                self._item.fluid_type = properties["fluid_type"]
+            # Items are immutable; keep an updated copy.
+            changes = {key: value for key, value in properties.items() if hasattr(self._item, key)}
+            if changes:
+                self._item = replace(self._item, **changes)
 
         self.properties_changed.emit(properties)
         self.accept()
@@ -93,9 +93,9 @@ class UIDReportDialog(QDialog):
             QMessageBox.warning(self, "No Map", "Could not access map data.")
             return
 
-        # Run scan
-        validator = get_uid_validator()
-        result = validator.scan(game_map)
+        # Editor sessions keep an incremental audit; only rescan by hand without one.
+        map_audit = getattr(self._session, "map_audit", None)
+        result = map_audit().uids if callable(map_audit) else get_uid_validator().scan(game_map)
 
         self._conflicts = result.conflicts
 
@@ -11,6 +11,7 @@ Reference:
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
@@ -302,12 +303,10 @@ class WritablePropertiesWindow(QDialog):
 
         # Apply to item if available
         if self._item is not None:
-            if hasattr(self._item, "action_id"):
-                self._item.action_id = properties["action_id"]
-            if hasattr(self._item, "unique_id"):
-                self._item.unique_id = properties["unique_id"]
-            if hasattr(self._item, "text"):
-                self._item.text = properties["text"]
+            # Items are immutable; keep an updated copy.
+            changes = {key: value for key, value in properties.items() if hasattr(self._item, key)}
+            if changes:
+                self._item = replace(self._item, **changes)
 
         self.properties_changed.emit(properties)
         self.accept()
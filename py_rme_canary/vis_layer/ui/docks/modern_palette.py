@@ -1,13 +1,44 @@
-"""Modern palette primitives used by the palette dock."""
+"""Modern palette primitives used by the palette dock.
+
+The brush grid is a model/view pair: :class:`BrushGridModel` holds the
+brush cards and the filtered row list, and :class:`BrushIconDelegate` asks the
+shared :class:`BrushIconCache` for an icon only when a row is painted. Icons
+are rendered a few at a time from a bounded queue, newest request first, so
+opening the RAW palette (tens of thousands of brushes) or changing the icon
+size only ever renders what is on screen.
+"""
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from PyQt6.QtCore import QSize, Qt, QMimeData, pyqtSignal, QByteArray
-from PyQt6.QtGui import QColor, QDrag, QFont, QIcon, QPainter, QPixmap
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QVBoxLayout, QWidget, QAbstractItemView
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtBoundSignal,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QDrag, QFont, QIcon, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+IconKey = tuple[object, ...]
 
 
 @dataclass(slots=True)
@@ -41,8 +72,6 @@ def _make_fallback_icon(text: str, size: int) -> QPixmap:
     painter.drawRoundedRect(1, 1, size - 2, size - 2, 6.0, 6.0)
 
     # Border
-    from PyQt6.QtGui import QPen
-
     painter.setPen(QPen(border, 1.0))
     painter.setBrush(Qt.BrushStyle.NoBrush)
     painter.drawRoundedRect(1, 1, size - 2, size - 2, 6.0, 6.0)
@@ -60,37 +89,322 @@ def _make_fallback_icon(text: str, size: int) -> QPixmap:
     return px
 
 
-class DraggableListWidget(QListWidget):
-    """QListWidget with custom drag support for brushes."""
+def _icon_key(entry: BrushCardData, icon_px: int) -> IconKey:
+    sid = int(entry.sprite_id or 0)
+    if sid > 0:
+        return ("sprite", sid, int(icon_px))
+    return ("text", str(entry.name), int(icon_px))
+
+
+class BrushNameIndex:
+    """Prebuilt lowercase search text for a list of brush cards.
+
+    A card matches when the query is part of its name, type or ID, like the
+    dock's old per-card check. Typing one more character only re-checks the
+    previous matches.
+    """
+
+    __slots__ = ("_haystacks", "_last_query", "_last_rows")
+
+    def __init__(self, entries: list[BrushCardData]) -> None:
+        # "\0" cannot be typed into the filter box, so a query never spans fields.
+        self._haystacks = [f"{e.name}\0{e.brush_type}".lower() + f"\0{int(e.brush_id)}" for e in entries]
+        self._last_query = ""
+        self._last_rows: list[int] = list(range(len(entries)))
+
+    def __len__(self) -> int:
+        return len(self._haystacks)
+
+    def match(self, query: str) -> list[int]:
+        """Rows whose card matches ``query`` (case-insensitive), in order."""
+        needle = str(query or "").strip().lower()
+        if not needle:
+            rows = list(range(len(self._haystacks)))
+        else:
+            haystacks = self._haystacks
+            candidates = self._last_rows if self._last_query and needle.startswith(self._last_query) else None
+            if candidates is None:
+                rows = [row for row, text in enumerate(haystacks) if needle in text]
+            else:
+                rows = [row for row in candidates if needle in haystacks[row]]
+        self._last_query = needle
+        self._last_rows = rows
+        return list(rows)
+
+
+class BrushIconCache(QObject):
+    """Bounded LRU of brush icons keyed by ``(server_id, icon_px)``.
+
+    :meth:`icon_for` never renders: a miss queues the card and returns
+    ``None``. Queued cards are rendered in short time slices on the GUI thread
+    (sprite pixmaps are GUI-thread objects), newest request first; when the
+    queue is full the oldest requests, rows that have scrolled away, are
+    dropped and re-requested if painted again.
+    """
+
+    icons_ready = pyqtSignal()
+
+    def __init__(
+        self,
+        sprite_lookup: Callable[[int, int], QPixmap | None] | None = None,
+        *,
+        max_icons: int = 2048,
+        max_pending: int = 512,
+        slice_ms: float = 8.0,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._sprite_lookup = sprite_lookup
+        self._icons: OrderedDict[IconKey, QIcon] = OrderedDict()
+        self._pending: OrderedDict[IconKey, tuple[BrushCardData, int]] = OrderedDict()
+        self._max_icons = max(1, int(max_icons))
+        self._max_pending = max(1, int(max_pending))
+        self._slice_s = max(0.001, float(slice_ms) / 1000.0)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._render_slice)
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def set_sprite_lookup(self, sprite_lookup: Callable[[int, int], QPixmap | None] | None) -> None:
+        self._sprite_lookup = sprite_lookup
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget every icon, e.g. after sprites were (re)loaded."""
+        self._icons.clear()
+        self._pending.clear()
+
+    def icon_for(self, entry: BrushCardData, icon_px: int) -> QIcon | None:
+        key = _icon_key(entry, icon_px)
+        icon = self._icons.get(key)
+        if icon is not None:
+            self._icons.move_to_end(key)
+            return icon
+        if key in self._pending:
+            self._pending.move_to_end(key)
+        else:
+            self._pending[key] = (entry, int(icon_px))
+            if len(self._pending) > self._max_pending:
+                self._pending.popitem(last=False)
+        if not self._timer.isActive():
+            self._timer.start()
+        return None
+
+    def render_pending(self, budget_s: float | None = None) -> int:
+        """Render queued icons, newest first, for at most ``budget_s`` seconds."""
+        deadline = None if budget_s is None else time.perf_counter() + budget_s
+        rendered = 0
+        while self._pending:
+            key, (entry, icon_px) = self._pending.popitem(last=True)
+            self._icons[key] = QIcon(self._render(entry, icon_px))
+            rendered += 1
+            if len(self._icons) > self._max_icons:
+                self._icons.popitem(last=False)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if rendered:
+            self.icons_ready.emit()
+        return rendered
+
+    def _render_slice(self) -> None:
+        self.render_pending(self._slice_s)
+        if self._pending:
+            self._timer.start()
+
+    def _render(self, entry: BrushCardData, icon_px: int) -> QPixmap:
+        sid = int(entry.sprite_id or 0)
+        if sid > 0 and self._sprite_lookup is not None:
+            try:
+                pixmap = self._sprite_lookup(sid, int(icon_px))
+            except Exception:
+                pixmap = None
+            if pixmap is not None and not pixmap.isNull():
+                return pixmap
+        return _make_fallback_icon(entry.name, int(icon_px))
+
+
+class BrushGridModel(QAbstractListModel):
+    """Brush cards plus the rows currently passing the filter."""
+
+    ENTRY_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: list[BrushCardData] = []
+        self._rows: list[int] = []
+
+    @property
+    def entries(self) -> list[BrushCardData]:
+        return self._entries
+
+    def set_entries(self, entries: list[BrushCardData], rows: list[int]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self._rows = rows
+        self.endResetModel()
+
+    def set_rows(self, rows: list[int]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def entry(self, row: int) -> BrushCardData:
+        return self._entries[self._rows[row]]
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        entry = self._entries[self._rows[index.row()]]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(entry.name)
+        if role == Qt.ItemDataRole.UserRole:
+            return int(entry.brush_id)
+        if role == self.ENTRY_ROLE:
+            return entry
+        if role == Qt.ItemDataRole.ToolTipRole:
+            tooltip = f"{entry.name}\nType: {entry.brush_type}\nID: {int(entry.brush_id)}"
+            if entry.sprite_id is not None:
+                tooltip += f"\nSprite: {int(entry.sprite_id)}"
+            return tooltip
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+
+class BrushIconDelegate(QStyledItemDelegate):
+    """Paints brush cards, fetching icons from the cache only for painted rows."""
+
+    def __init__(self, icons: BrushIconCache, icon_px: int, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._icons = icons
+        self.icon_px = int(icon_px)
+
+    def initStyleOption(self, option: QStyleOptionViewItem | None, index: QModelIndex) -> None:
+        super().initStyleOption(option, index)
+        if option is None:
+            return
+        entry = index.data(BrushGridModel.ENTRY_ROLE)
+        if not isinstance(entry, BrushCardData):
+            return
+        icon = self._icons.icon_for(entry, self.icon_px)
+        if icon is not None:
+            option.icon = icon
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+            option.decorationSize = QSize(self.icon_px, self.icon_px)
+
+
+@dataclass(frozen=True, slots=True)
+class BrushGridItem:
+    """``QListWidgetItem``-like handle on one grid row, for legacy callers."""
+
+    row: int
+    entry: BrushCardData
+
+    def text(self) -> str:
+        return str(self.entry.name)
+
+    def data(self, role: int) -> object:
+        if role == Qt.ItemDataRole.UserRole:
+            return int(self.entry.brush_id)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.text()
+        return None
+
+
+class BrushGridView(QListView):
+    """Icon-mode list view over a :class:`BrushGridModel` with brush drag support.
+
+    Exposes the small part of the ``QListWidget`` API that editor code uses
+    on the palette list (``count``, ``item``, ``selectedItems``, item signals).
+    """
+
+    # QListWidget signal names, emitting BrushGridItem.
+    itemClicked = pyqtSignal(object)  # noqa: N815
+    itemActivated = pyqtSignal(object)  # noqa: N815
+    itemEntered = pyqtSignal(object)  # noqa: N815
+
+    EMPTY_TEXT = "No items found"
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setDragEnabled(True)
         self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
-
-    def startDrag(self, supportedActions: Qt.DropAction) -> None:
+        self.clicked.connect(lambda index: self._forward(self.itemClicked, index))
+        self.activated.connect(lambda index: self._forward(self.itemActivated, index))
+        self.entered.connect(lambda index: self._forward(self.itemEntered, index))
+
+    def _grid_model(self) -> BrushGridModel | None:
+        model = self.model()
+        return model if isinstance(model, BrushGridModel) else None
+
+    def _forward(self, signal: pyqtBoundSignal, index: QModelIndex) -> None:
+        item = self.item(index.row()) if index.isValid() else None
+        if item is not None:
+            signal.emit(item)
+
+    def count(self) -> int:
+        model = self.model()
+        return int(model.rowCount()) if model is not None else 0
+
+    def item(self, row: int) -> BrushGridItem | None:
+        model = self._grid_model()
+        if model is None or not 0 <= int(row) < model.rowCount():
+            return None
+        return BrushGridItem(int(row), model.entry(int(row)))
+
+    def currentItem(self) -> BrushGridItem | None:
+        index = self.currentIndex()
+        return self.item(index.row()) if index.isValid() else None
+
+    def selectedItems(self) -> list[BrushGridItem]:
+        items = (self.item(index.row()) for index in self.selectedIndexes())
+        return [item for item in items if item is not None]
+
+    def startDrag(self, supportedActions: Qt.DropAction) -> None:  # noqa: N803
         item = self.currentItem()
-        if not item:
-            return
-
-        brush_id = item.data(Qt.ItemDataRole.UserRole)
-        if brush_id is None:
+        if item is None:
             return
 
         mime_data = QMimeData()
-        mime_data.setData("application/x-rme-brush-id", QByteArray(str(brush_id).encode("utf-8")))
+        mime_data.setData("application/x-rme-brush-id", QByteArray(str(int(item.entry.brush_id)).encode("utf-8")))
 
         drag = QDrag(self)
         drag.setMimeData(mime_data)
 
         # Use icon as drag pixmap if available
-        icon = item.icon()
-        if not icon.isNull():
-            drag.setPixmap(icon.pixmap(32, 32))
-            drag.setHotSpot(QPoint(16, 16) if hasattr(QPoint, "__init__") else Qt.QPoint(16, 16))
+        delegate = self.itemDelegate()
+        if isinstance(delegate, BrushIconDelegate):
+            icon = delegate._icons.icon_for(item.entry, delegate.icon_px)
+            if icon is not None and not icon.isNull():
+                drag.setPixmap(icon.pixmap(32, 32))
+                drag.setHotSpot(QPoint(16, 16))
 
         drag.exec(Qt.DropAction.CopyAction)
 
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self.count():
+            return
+        painter = QPainter(self.viewport())
+        painter.setPen(QColor(136, 136, 160))
+        painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, self.EMPTY_TEXT)
+        painter.end()
+
 
 class ModernPaletteWidget(QWidget):
     """Brush list widget with icon cards used inside tabs — Antigravity style."""
@@ -102,12 +416,15 @@ class ModernPaletteWidget(QWidget):
         self,
         *,
         sprite_lookup: Callable[[int, int], QPixmap | None] | None = None,
+        icon_cache: BrushIconCache | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
-        self._sprite_lookup = sprite_lookup
+        self._icons = icon_cache if icon_cache is not None else BrushIconCache(sprite_lookup, parent=self)
         self._icon_px = 36
         self._entries: list[BrushCardData] = []
+        self._index = BrushNameIndex([])
+        self._filter = ""
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -115,13 +432,18 @@ class ModernPaletteWidget(QWidget):
         layout.setContentsMargins(6, 6, 6, 6)
         layout.setSpacing(4)
 
-        self.list_widget = DraggableListWidget(self)
+        self.model = BrushGridModel(self)
+        self.delegate = BrushIconDelegate(self._icons, self._icon_px, self)
+        self.list_widget = BrushGridView(self)
         self.list_widget.setObjectName("AssetGrid")
+        self.list_widget.setModel(self.model)
+        self.list_widget.setItemDelegate(self.delegate)
         self.list_widget.setMouseTracking(True)  # Enable hover tracking
-        self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
-        self.list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
+        self.list_widget.setViewMode(QListView.ViewMode.IconMode)
+        self.list_widget.setResizeMode(QListView.ResizeMode.Adjust)
         self.list_widget.setUniformItemSizes(True)
-        self.list_widget.setMovement(QListWidget.Movement.Static)
+        self.list_widget.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_widget.setMovement(QListView.Movement.Static)
         self.list_widget.setWordWrap(True)
         self.list_widget.setSpacing(6)
         self.list_widget.setIconSize(QSize(self._icon_px, self._icon_px))
@@ -129,27 +451,28 @@ class ModernPaletteWidget(QWidget):
         self.list_widget.itemClicked.connect(self._emit_selected)
         self.list_widget.itemActivated.connect(self._emit_selected)
         self.list_widget.itemEntered.connect(self._emit_hovered)
+        self._icons.icons_ready.connect(self.list_widget.viewport().update)
         # Enhanced Antigravity styling for the list items
         self.list_widget.setStyleSheet(
             """
-            QListWidget {
+            QListView {
                 background: transparent;
                 border: none;
                 outline: none;
             }
-            QListWidget::item {
+            QListView::item {
                 background: rgba(19, 19, 29, 0.4);
                 border: 1px solid rgba(255, 255, 255, 0.04);
                 border-radius: 8px;
                 padding: 4px;
                 color: rgba(229, 229, 231, 0.8);
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background: rgba(139, 92, 246, 0.12);
                 border-color: rgba(139, 92, 246, 0.25);
                 color: #ffffff;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: rgba(139, 92, 246, 0.25);
                 border-color: rgba(139, 92, 246, 0.5);
                 color: #ffffff;
@@ -158,70 +481,43 @@ class ModernPaletteWidget(QWidget):
         )
         layout.addWidget(self.list_widget)
 
-        # Empty state label
-        self._empty_label = QListWidgetItem("No items to display")
-        self._empty_label.setFlags(Qt.ItemFlag.NoItemFlags)
+    @property
+    def brushes(self) -> list[BrushCardData]:
+        """All brushes of this palette, before filtering."""
+        return self._entries
+
+    @property
+    def icon_cache(self) -> BrushIconCache:
+        return self._icons
 
     def set_icon_size(self, icon_px: int) -> None:
-        """Set list icon size and rerender current entries."""
+        """Set list icon size; icons of the new size are rendered as rows are painted."""
         new_px = max(12, min(64, int(icon_px)))
         if new_px == int(self._icon_px):
             return
         self._icon_px = int(new_px)
+        self.delegate.icon_px = int(new_px)
         self.list_widget.setIconSize(QSize(self._icon_px, self._icon_px))
         self.list_widget.setGridSize(QSize(self._icon_px + 24, self._icon_px + 28))
-        self._render_entries(self._entries)
 
     def set_brushes(self, brushes: list[BrushCardData]) -> None:
-        """Replace displayed brushes, preserving given ordering."""
+        """Replace displayed brushes, preserving given ordering and the filter."""
         self._entries = list(brushes)
-        self._render_entries(self._entries)
+        self._index = BrushNameIndex(self._entries)
+        self.model.set_entries(self._entries, self._index.match(self._filter))
 
-    def _render_entries(self, brushes: list[BrushCardData]) -> None:
-        self.list_widget.clear()
-
-        if not brushes:
-            empty = QListWidgetItem("  No items found")
-            empty.setFlags(Qt.ItemFlag.NoItemFlags)
-            empty.setForeground(QColor(136, 136, 160))
-            self.list_widget.addItem(empty)
-            return
+    def set_filter(self, query: str) -> None:
+        """Show only brushes whose name, type or ID contains ``query``."""
+        self._filter = str(query or "")
+        self.model.set_rows(self._index.match(self._filter))
 
-        for entry in brushes:
-            item = QListWidgetItem(str(entry.name))
-            item.setData(Qt.ItemDataRole.UserRole, int(entry.brush_id))
-            tooltip = f"{entry.name}\nType: {entry.brush_type}\nID: {int(entry.brush_id)}"
-            if entry.sprite_id is not None:
-                tooltip += f"\nSprite: {int(entry.sprite_id)}"
-            item.setToolTip(tooltip)
-
-            # Try sprite lookup, fall back to generated placeholder icon
-            icon_set = False
-            if self._sprite_lookup is not None:
-                sid = int(entry.sprite_id or 0)
-                if sid > 0:
-                    try:
-                        pixmap = self._sprite_lookup(sid, int(self._icon_px))
-                    except Exception:
-                        pixmap = None
-                    if pixmap is not None and not pixmap.isNull():
-                        item.setIcon(QIcon(pixmap))
-                        icon_set = True
-
-            if not icon_set:
-                # Generate a colored fallback icon
-                fallback = _make_fallback_icon(entry.name, int(self._icon_px))
-                item.setIcon(QIcon(fallback))
-
-            self.list_widget.addItem(item)
-
-    def _emit_selected(self, item: QListWidgetItem) -> None:
+    def _emit_selected(self, item: BrushGridItem) -> None:
         value = item.data(Qt.ItemDataRole.UserRole)
         if value is None:
             return
         self.brush_selected.emit(int(value))
 
-    def _emit_hovered(self, item: QListWidgetItem) -> None:
+    def _emit_hovered(self, item: BrushGridItem) -> None:
         value = item.data(Qt.ItemDataRole.UserRole)
         if value is None:
             return
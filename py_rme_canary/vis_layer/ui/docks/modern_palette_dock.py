@@ -8,9 +8,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QDockWidget, QLineEdit, QListWidget, QSplitter, QTabWidget, QVBoxLayout, QWidget
-
-from py_rme_canary.vis_layer.ui.docks.modern_palette import BrushCardData, ModernPaletteWidget
+from PyQt6.QtWidgets import QDockWidget, QLineEdit, QSplitter, QTabWidget, QVBoxLayout, QWidget
+
+from py_rme_canary.vis_layer.ui.docks.modern_palette import (
+    BrushCardData,
+    BrushGridView,
+    BrushIconCache,
+    ModernPaletteWidget,
+)
 from py_rme_canary.vis_layer.ui.docks.modern_tool_options import ModernToolOptionsWidget
 from py_rme_canary.vis_layer.ui.docks.palette import _resolve_materials_brushs_path
 from py_rme_canary.vis_layer.ui.icons import icon_search, palette_tab_icons
@@ -21,6 +26,7 @@ if TYPE_CHECKING:
 
 from PyQt6.QtCore import Qt, pyqtSignal
 
+
 class ModernPaletteDock(QDockWidget):
     """Modern replacement for the palette dock."""
 
@@ -32,6 +38,7 @@ class ModernPaletteDock(QDockWidget):
         self._icon_size: int = 36
         self._all_brushes_by_key: dict[str, list[BrushCardData]] = {}
         self._palette_widgets: dict[str, ModernPaletteWidget] = {}
+        self._shown_sources: dict[str, list[BrushCardData]] = {}
         self.key_by_index: dict[int, str] = {}
 
         self._setup_ui()
@@ -55,9 +62,9 @@ class ModernPaletteDock(QDockWidget):
         return self.filter_edit
 
     @property
-    def brush_list(self) -> QListWidget:
+    def brush_list(self) -> BrushGridView:
         widget = self._current_palette_widget()
-        return widget.list_widget if widget is not None else QListWidget(self)
+        return widget.list_widget if widget is not None else BrushGridView(self)
 
     def _setup_ui(self) -> None:
         container = QWidget()
@@ -135,16 +142,19 @@ class ModernPaletteDock(QDockWidget):
 
         tab_icons = palette_tab_icons(18)
 
-        self.key_by_index = {}
-        for index, (label, key) in enumerate(categories):
-            sprite_lookup = None
-            if hasattr(self.editor, "_sprite_pixmap_for_server_id"):
+        # One icon cache for all tabs: the same sprite shows up in several palettes.
+        sprite_lookup = None
+        if hasattr(self.editor, "_sprite_pixmap_for_server_id"):
+
+            def _lookup(sid: int, size: int):
+                return self.editor._sprite_pixmap_for_server_id(int(sid), tile_px=int(size))
 
-                def _lookup(sid: int, size: int):
-                    return self.editor._sprite_pixmap_for_server_id(int(sid), tile_px=int(size))
+            sprite_lookup = _lookup
+        self.icon_cache = BrushIconCache(sprite_lookup, parent=self)
 
-                sprite_lookup = _lookup
-            widget = ModernPaletteWidget(sprite_lookup=sprite_lookup)
+        self.key_by_index = {}
+        for index, (label, key) in enumerate(categories):
+            widget = ModernPaletteWidget(icon_cache=self.icon_cache)
             widget.set_icon_size(int(self._icon_size))
             widget.brush_selected.connect(self._on_brush_selected)
             widget.brush_hovered.connect(self.brush_hovered.emit)
@@ -165,19 +175,13 @@ class ModernPaletteDock(QDockWidget):
         return widget if isinstance(widget, ModernPaletteWidget) else None
 
     def _apply_filter_to_widget(self, key: str, widget: ModernPaletteWidget) -> None:
-        source = list(self._all_brushes_by_key.get(str(key).strip().lower(), []))
-        query = str(self.filter_edit.text() or "").strip().lower()
-        if not query:
+        key_norm = str(key).strip().lower()
+        source = self._all_brushes_by_key.get(key_norm, [])
+        # Filtering alone only swaps the row list; cards are reloaded when refreshed.
+        if self._shown_sources.get(key_norm) is not source:
+            self._shown_sources[key_norm] = source
             widget.set_brushes(source)
-            return
-        filtered = [
-            brush
-            for brush in source
-            if query in str(brush.name).lower()
-            or query in str(brush.brush_type).lower()
-            or query in str(int(brush.brush_id))
-        ]
-        widget.set_brushes(filtered)
+        widget.set_filter(str(self.filter_edit.text() or ""))
 
     def _on_tab_changed(self, index: int) -> None:
         """Handle tab change to update options and populate list if needed."""
@@ -530,10 +534,11 @@ class ModernPaletteDock(QDockWidget):
         self._apply_filter_to_widget(key_norm, widget)
 
     def refresh_primary_list(self) -> None:
-        """Compatibility API for legacy callers."""
+        """Compatibility API for legacy callers (e.g. after sprites were reloaded)."""
         widget = self._current_palette_widget()
         if widget is None:
             return
+        self.icon_cache.invalidate()
         key = str(widget.property("palette_key") or "")
         self._refresh_palette_content(key, widget)
 
@@ -572,4 +577,3 @@ class ModernPaletteDock(QDockWidget):
         self._icon_size = int(new_size)
         for widget in self._palette_widgets.values():
             widget.set_icon_size(int(new_size))
-        self.refresh_primary_list()
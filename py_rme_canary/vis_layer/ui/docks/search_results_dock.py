@@ -5,6 +5,10 @@ Provides a persistent list of search results with:
 - Column sorting
 - Filter/highlight capabilities
 - Export results to file
+- Results streamed in pages from a background search
+
+The table is a model/view over a columnar ``SearchResultStore``; sorting and
+filtering run on the store, so large result sets never create per-row widgets.
 
 Reference:
     - GAP_ANALYSIS.md: P1 - Search Results Dock
@@ -17,11 +21,13 @@ from __future__ import annotations
 import contextlib
 import csv
 import logging
+from array import array
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QThread, pyqtSignal
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -34,12 +40,12 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QMenu,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from py_rme_canary.logic_layer.search_results import SearchResult, SearchResultStore
 from py_rme_canary.vis_layer.ui.theme import get_theme_manager
 
 if TYPE_CHECKING:
@@ -48,54 +54,178 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
-class SearchResult:
-    """Single search result entry.
-
-    Attributes:
-        x: Tile X coordinate.
-        y: Tile Y coordinate.
-        z: Floor level.
-        item_id: Item ID that matched (if applicable).
-        item_name: Display name of the item.
-        match_type: Type of match (item, creature, spawn, etc).
-        details: Additional match details.
-        timestamp: When this result was found.
-    """
-
-    x: int
-    y: int
-    z: int
-    item_id: int = 0
-    item_name: str = ""
-    match_type: str = "item"
-    details: str = ""
-    timestamp: float = 0.0
-
-
 @dataclass
 class SearchResultSet:
     """Collection of search results from a single query.
 
     Attributes:
         query: Original search query.
-        results: List of SearchResult entries.
+        results: Columnar store of the results (plain lists are converted).
         search_time: When the search was performed.
         scope: Search scope (all, selection, floor).
     """
 
     query: str = ""
-    results: list[SearchResult] = field(default_factory=list)
+    results: SearchResultStore = field(default_factory=SearchResultStore)
     search_time: datetime = field(default_factory=datetime.now)
     scope: str = "all"
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.results, SearchResultStore):
+            self.results = SearchResultStore(self.results)
+
     @property
     def count(self) -> int:
         return len(self.results)
 
 
-class SearchResultsTableWidget(QTableWidget):
-    """Table widget for displaying search results."""
+class SearchResultsModel(QAbstractTableModel):
+    """Table model over a :class:`SearchResultStore`.
+
+    The model holds one array of store row numbers (the filtered, sorted
+    view) and formats cells only when the view asks for them, so the cost of
+    showing a result set does not depend on its size.
+    """
+
+    RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, headers: list[str], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._headers = headers
+        self._store = SearchResultStore()
+        self._rows: array[int] = array("I")
+        self._filter_text = ""
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    @property
+    def store(self) -> SearchResultStore:
+        return self._store
+
+    def set_store(self, store: SearchResultStore) -> None:
+        """Show ``store``, keeping the current filter and sort."""
+        self.beginResetModel()
+        self._store = store
+        self._rows = self._view_rows()
+        self.endResetModel()
+
+    def append_rows(self, rows: range) -> None:
+        """Show store rows appended while streaming (they go to the end)."""
+        added = self._store.filter_rows(self._filter_text, rows)
+        if not added:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+        self._rows.extend(added)
+        self.endInsertRows()
+
+    def set_filter(self, text: str) -> None:
+        self._filter_text = text
+        self.set_store(self._store)
+
+    def resort(self) -> None:
+        """Re-apply the active sort, e.g. once streamed rows are complete."""
+        if self._sort_column >= 0:
+            self.set_store(self._store)
+
+    def _view_rows(self) -> array[int]:
+        rows = self._store.filter_rows(self._filter_text)
+        if self._sort_column >= 0:
+            descending = self._sort_order == Qt.SortOrder.DescendingOrder
+            rows = self._store.sort_rows(rows, self._sort_column, descending=descending)
+        return rows
+
+    def store_row(self, row: int) -> int:
+        return self._rows[row]
+
+    def result_at(self, row: int) -> SearchResult:
+        return self._store[self._rows[row]]
+
+    def positions(self, rows: Iterable[int] | None = None) -> list[tuple[int, int, int]]:
+        """Positions of view ``rows`` (all shown rows when omitted)."""
+        view = self._rows if rows is None else (self._rows[row] for row in rows)
+        return self._store.positions(view)
+
+    # --- QAbstractTableModel -----------------------------------------------
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._store.display(row, index.column())
+        if role == self.RESULT_ROLE:
+            return self._store[row]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        horizontal = orientation == Qt.Orientation.Horizontal
+        if role == Qt.ItemDataRole.DisplayRole and horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self._sort_column = int(column)
+        self._sort_order = order
+        self.set_store(self._store)
+
+
+class SearchResultsWorker(QThread):
+    """Run a result producer off the UI thread and deliver results in pages.
+
+    The producer is any callable returning an iterable of
+    :class:`SearchResult`; it runs on the worker thread, so it should read
+    from a :meth:`GameMap.snapshot` rather than the live map.
+    """
+
+    page_ready = pyqtSignal(list)
+    finished_search = pyqtSignal(int)  # total count
+
+    PAGE_SIZE = 4096
+
+    def __init__(
+        self,
+        producer: Callable[[], Iterable[SearchResult]],
+        page_size: int = PAGE_SIZE,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._producer = producer
+        self._page_size = max(1, int(page_size))
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop after the current result."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        total = 0
+        page: list[SearchResult] = []
+        try:
+            for result in self._producer():
+                if self._cancelled:
+                    break
+                page.append(result)
+                if len(page) >= self._page_size:
+                    total += len(page)
+                    self.page_ready.emit(page)
+                    page = []
+        except Exception:
+            logger.exception("Search producer failed")
+        if page and not self._cancelled:
+            total += len(page)
+            self.page_ready.emit(page)
+        self.finished_search.emit(total)
+
+
+class SearchResultsTableWidget(QTableView):
+    """Virtualized table displaying search results."""
 
     # Signal: (x, y, z) when user double-clicks
     jump_to_position = pyqtSignal(int, int, int)
@@ -113,14 +243,16 @@ class SearchResultsTableWidget(QTableWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self._model = SearchResultsModel([c[0] for c in self.COLUMNS], self)
+        self.setModel(self._model)
         self._setup_table()
-        self._results: list[SearchResult] = []
+
+    @property
+    def results_model(self) -> SearchResultsModel:
+        return self._model
 
     def _setup_table(self) -> None:
         """Configure table appearance."""
-        self.setColumnCount(len(self.COLUMNS))
-        self.setHorizontalHeaderLabels([c[0] for c in self.COLUMNS])
-
         # Column widths
         header = self.horizontalHeader()
         for i, (_, width) in enumerate(self.COLUMNS):
@@ -129,11 +261,16 @@ class SearchResultsTableWidget(QTableWidget):
             )
             self.setColumnWidth(i, width)
 
-        # Appearance
-        self.verticalHeader().setVisible(False)
+        # Appearance; fixed row heights keep scrolling independent of row count
+        vertical = self.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(self.fontMetrics().height() + 8)
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        # Keep discovery order until the user picks a column to sort by.
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.setSortingEnabled(True)
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
@@ -151,20 +288,20 @@ class SearchResultsTableWidget(QTableWidget):
 
         self.setStyleSheet(
             f"""
-            QTableWidget {{
+            QTableView {{
                 background: {c["surface"]["primary"]};
                 border: 1px solid {c["border"]["default"]};
                 border-radius: {r["sm"]}px;
                 gridline-color: {c["surface"]["secondary"]};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 color: {c["text"]["primary"]};
                 padding: 4px 8px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background: {c["brand"]["primary"]};
             }}
-            QTableWidget::item:hover {{
+            QTableView::item:hover {{
                 background: {c["surface"]["secondary"]};
             }}
             QHeaderView::section {{
@@ -178,74 +315,31 @@ class SearchResultsTableWidget(QTableWidget):
         """
         )
 
-    def set_results(self, results: list[SearchResult]) -> None:
-        """Populate table with search results."""
-        self._results = results
-        self.setRowCount(0)  # Clear
-        self.setSortingEnabled(False)  # Disable during population
-
-        for result in results:
-            row = self.rowCount()
-            self.insertRow(row)
-
-            # Position (sortable by x*1000000 + y)
-            pos_item = QTableWidgetItem(f"{result.x}, {result.y}")
-            pos_item.setData(Qt.ItemDataRole.UserRole, result.x * 1000000 + result.y)
-            pos_item.setData(Qt.ItemDataRole.UserRole + 1, result)  # Store result
-            self.setItem(row, 0, pos_item)
-
-            # Floor
-            floor_item = QTableWidgetItem(str(result.z))
-            floor_item.setData(Qt.ItemDataRole.UserRole, result.z)
-            self.setItem(row, 1, floor_item)
-
-            # Type
-            type_item = QTableWidgetItem(result.match_type.capitalize())
-            self.setItem(row, 2, type_item)
-
-            # Name/ID
-            name = result.item_name or str(result.item_id) if result.item_id else "-"
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.ItemDataRole.UserRole, result.item_id)
-            self.setItem(row, 3, name_item)
-
-            # Details
-            details_item = QTableWidgetItem(result.details)
-            self.setItem(row, 4, details_item)
+    def set_results(self, results: Sequence[SearchResult]) -> None:
+        """Show search results (a store is shown as-is, without copying)."""
+        store = results if isinstance(results, SearchResultStore) else SearchResultStore(results)
+        self._model.set_store(store)
 
-        self.setSortingEnabled(True)
+    def append_rows(self, rows: range) -> None:
+        """Show rows just appended to the displayed store."""
+        self._model.append_rows(rows)
 
     def filter_results(self, text: str) -> None:
         """Show only rows matching filter text."""
-        text = text.lower()
-        for row in range(self.rowCount()):
-            match = False
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item and text in item.text().lower():
-                    match = True
-                    break
-            self.setRowHidden(row, not match)
+        self._model.set_filter(text)
 
     def get_selected_results(self) -> list[SearchResult]:
         """Get list of currently selected results."""
-        selected: list[SearchResult] = []
-        for index in self.selectedIndexes():
-            if index.column() == 0:  # Only process once per row
-                item = self.item(index.row(), 0)
-                if item:
-                    result = item.data(Qt.ItemDataRole.UserRole + 1)
-                    if isinstance(result, SearchResult):
-                        selected.append(result)
-        return selected
+        selection = self.selectionModel()
+        if selection is None:
+            return []
+        return [self._model.result_at(index.row()) for index in selection.selectedRows()]
 
     def _on_double_click(self, index) -> None:
         """Handle double-click to jump to position."""
-        item = self.item(index.row(), 0)
-        if item:
-            result = item.data(Qt.ItemDataRole.UserRole + 1)
-            if isinstance(result, SearchResult):
-                self.jump_to_position.emit(result.x, result.y, result.z)
+        if index.isValid():
+            x, y, z = self._model.positions([index.row()])[0]
+            self.jump_to_position.emit(x, y, z)
 
     def _show_context_menu(self, pos) -> None:
         """Show context menu for selected results."""
@@ -259,9 +353,7 @@ class SearchResultsTableWidget(QTableWidget):
         action = menu.exec(self.viewport().mapToGlobal(pos))
 
         if action == select_all_action:
-            visible_results = self._visible_results()
-            source = visible_results if visible_results else self._results
-            positions = [(int(r.x), int(r.y), int(r.z)) for r in source]
+            positions = self._model.positions()
             if positions:
                 self.select_positions_requested.emit(positions)
             return
@@ -277,20 +369,6 @@ class SearchResultsTableWidget(QTableWidget):
             text = "\n".join(f"{r.x}, {r.y}, {r.z}" for r in selected)
             QApplication.clipboard().setText(text)
 
-    def _visible_results(self) -> list[SearchResult]:
-        """Return current non-hidden rows as SearchResult objects."""
-        visible: list[SearchResult] = []
-        for row in range(self.rowCount()):
-            if self.isRowHidden(row):
-                continue
-            item = self.item(row, 0)
-            if item is None:
-                continue
-            result = item.data(Qt.ItemDataRole.UserRole + 1)
-            if isinstance(result, SearchResult):
-                visible.append(result)
-        return visible
-
 
 class SearchResultsDock(QDockWidget):
     """Dock widget for persistent search results.
@@ -315,6 +393,8 @@ class SearchResultsDock(QDockWidget):
 
         self._result_sets: list[SearchResultSet] = []
         self._current_set: SearchResultSet | None = None
+        self._worker: SearchResultsWorker | None = None
+        self._streaming_set: SearchResultSet | None = None
 
         self._setup_ui()
         self._apply_style()
@@ -428,7 +508,70 @@ class SearchResultsDock(QDockWidget):
             results=results,
             scope=scope,
         )
+        self._push_result_set(result_set)
+
+    def start_search(
+        self,
+        producer: Callable[[], Iterable[SearchResult]],
+        query: str = "",
+        scope: str = "all",
+        page_size: int = SearchResultsWorker.PAGE_SIZE,
+    ) -> SearchResultsWorker:
+        """Run ``producer`` in the background, showing results as pages arrive.
 
+        Any search still running is cancelled first.
+
+        Args:
+            producer: Callable returning the results; runs on a worker thread.
+            query: The search query, for the history list.
+            scope: Search scope (all, selection, floor).
+            page_size: Results delivered to the table per update.
+        """
+        self.cancel_search()
+        result_set = SearchResultSet(query=query, scope=scope)
+        self._push_result_set(result_set)
+
+        worker = SearchResultsWorker(producer, page_size, self)
+        worker.page_ready.connect(self._on_page_ready)
+        worker.finished_search.connect(self._on_search_finished)
+        self._worker = worker
+        self._streaming_set = result_set
+        worker.start()
+        return worker
+
+    def cancel_search(self) -> None:
+        """Stop the running background search, keeping the results so far."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            worker.wait()
+
+    def _on_page_ready(self, page: list[SearchResult]) -> None:
+        result_set = self._streaming_set
+        if self.sender() is not self._worker or result_set is None:
+            return  # page queued by a cancelled search
+        rows = result_set.results.extend(page)
+        if result_set is self._current_set:
+            self.table.append_rows(rows)
+            self._update_status()
+
+    def _on_search_finished(self, _total: int) -> None:
+        result_set = self._streaming_set
+        if self.sender() is not self._worker or result_set is None:
+            return
+        self._worker = None
+        self._streaming_set = None
+        # Refresh the result count in the history labels, keeping the shown entry.
+        self._update_history_combo()
+        if self._current_set in self._result_sets:
+            self.history_combo.blockSignals(True)
+            self.history_combo.setCurrentIndex(self._result_sets.index(self._current_set))
+            self.history_combo.blockSignals(False)
+        if result_set is self._current_set:
+            self.table.results_model.resort()
+            self._update_status()
+
+    def _push_result_set(self, result_set: SearchResultSet) -> None:
         self._result_sets.insert(0, result_set)
 
         # Limit history
@@ -465,7 +608,7 @@ class SearchResultsDock(QDockWidget):
         if self._current_set is None:
             self.status_label.setText("No results")
         else:
-            visible = sum(1 for row in range(self.table.rowCount()) if not self.table.isRowHidden(row))
+            visible = self.table.results_model.rowCount()
             total = self._current_set.count
 
             if visible == total:
@@ -538,7 +681,7 @@ class SearchResultsDock(QDockWidget):
         if self._current_set:
             self._result_sets.remove(self._current_set)
             self._current_set = None
-            self.table.setRowCount(0)
+            self.table.set_results(SearchResultStore())
             self._update_history_combo()
             self._update_status()
 
@@ -547,8 +690,7 @@ class SearchResultsDock(QDockWidget):
         if self._current_set is None:
             return
 
-        positions = [(int(r.x), int(r.y), int(r.z)) for r in self._current_set.results]
-        self._apply_selection_on_map(positions)
+        self._apply_selection_on_map(self._current_set.results.positions())
 
     def _on_select_positions_requested(self, positions: list[tuple[int, int, int]]) -> None:
         """Handle table request to map-select result tiles."""
@@ -5,6 +5,7 @@ import os
 from PyQt6.QtGui import QPixmap
 
 from py_rme_canary.core.io.xml.safe import safe_etree as ET
+from py_rme_canary.logic_layer.indicator_flags import IndicatorFlagCache
 
 from .helpers import ItemProps
 
@@ -15,6 +16,8 @@ class IndicatorService:
         self._item_props: dict[int, ItemProps] = {}
         self._icons: dict[str, QPixmap] = {}
         self._scaled_icons: dict[tuple[str, int], QPixmap] = {}
+        # Per-chunk indicator bitmasks; the editor invalidates it on tile changes.
+        self.flags = IndicatorFlagCache()
 
     @property
     def item_props(self) -> dict[int, ItemProps]:
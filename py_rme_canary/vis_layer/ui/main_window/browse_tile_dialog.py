@@ -6,6 +6,7 @@ Provides UI for browsing and managing items on a selected tile.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import Qt
@@ -26,6 +27,7 @@ from PyQt6.QtWidgets import (
 from py_rme_canary.vis_layer.ui.dialogs.base_modern import ModernDialog
 
 if TYPE_CHECKING:
+    from py_rme_canary.core.data.item import Item
     from py_rme_canary.core.data.tile import Tile
     from py_rme_canary.core.database.items_database import ItemsDatabase
 
@@ -171,7 +173,12 @@ class BrowseTileDialog(ModernDialog):
         data = list_item.data(Qt.ItemDataRole.UserRole)
         item = data[1]
         current_row = self._items_list.row(list_item)
-        if _edit_item_basic_properties(self, item):
+        edited = _edit_item_basic_properties(self, item)
+        if edited is not None and self._tile is not None:
+            if data[0] == "ground":
+                self._tile = replace(self._tile, ground=edited)
+            elif 0 <= data[2] < len(self._tile.items):
+                self._tile.items[data[2]] = edited
             self._update_items_list()
             if 0 <= current_row < self._items_list.count():
                 self._items_list.setCurrentRow(current_row)
@@ -185,7 +192,8 @@ class BrowseTileDialog(ModernDialog):
         return self._tile
 
 
-def _edit_item_basic_properties(parent: QDialog, item: object) -> bool:
+def _edit_item_basic_properties(parent: QDialog, item: Item) -> Item | None:
+    """Ask for action id, unique id and text; return the edited copy or None."""
     dialog = QDialog(parent)
     dialog.setWindowTitle(f"Item Properties - ID {int(getattr(item, 'id', 0))}")
     dialog.setModal(True)
@@ -218,12 +226,14 @@ def _edit_item_basic_properties(parent: QDialog, item: object) -> bool:
     root.addWidget(buttons)
 
     if dialog.exec() != QDialog.DialogCode.Accepted:
-        return False
+        return None
 
     action_id = int(action_id_spin.value())
     unique_id = int(unique_id_spin.value())
     text = str(text_edit.text() or "")
-    item.action_id = action_id if action_id > 0 else None
-    item.unique_id = unique_id if unique_id > 0 else None
-    item.text = text if text else None
-    return True
+    return replace(
+        item,
+        action_id=action_id if action_id > 0 else None,
+        unique_id=unique_id if unique_id > 0 else None,
+        text=text if text else None,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -29,6 +30,9 @@ from py_rme_canary.core.data.gamemap import GameMap
 from py_rme_canary.core.data.item import Position
 from py_rme_canary.logic_layer.map_statistics import compute_map_statistics, format_map_statistics_report
 
+if TYPE_CHECKING:
+    from py_rme_canary.logic_layer.session.editor import EditorSession
+
 
 @dataclass(slots=True)
 class FindItemResult:
@@ -377,12 +381,13 @@ class FindNamedPositionsDialog(QDialog):
 
 
 class MapStatisticsDialog(QDialog):
-    def __init__(self, parent: QWidget | None, *, game_map: GameMap) -> None:
+    def __init__(self, parent: QWidget | None, *, game_map: GameMap, session: EditorSession | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Map Statistics")
         self.setModal(True)
 
         self._game_map = game_map
+        self._session = session
 
         self._text = QPlainTextEdit(self)
         self._text.setReadOnly(True)
@@ -408,8 +413,14 @@ class MapStatisticsDialog(QDialog):
         self._refresh()
 
     def _refresh(self) -> None:
-        stats = compute_map_statistics(self._game_map)
+        if self._session is not None:
+            stats = self._session.map_audit().statistics
+        else:
+            stats = compute_map_statistics(self._game_map)
         report = format_map_statistics_report(self._game_map, stats)
+        if self._session is not None:
+            links = self._session.teleport_links().validate_all()
+            report += "\nTeleport Links:\n" + "".join(f"  {line}\n" for line in links.summary().splitlines())
         self._text.setPlainText(report)
 
     def _export(self) -> None:
@@ -26,6 +26,7 @@ from py_rme_canary.logic_layer.drawing_options import DrawingOptions
 from py_rme_canary.logic_layer.editor_session import EditorSession
 from py_rme_canary.vis_layer.renderer import OpenGLCanvasWidget
 from py_rme_canary.vis_layer.renderer.map_drawer import MapDrawer
+from py_rme_canary.vis_layer.renderer.sprite_atlas import SpriteAtlasCache
 from py_rme_canary.vis_layer.ui.docks.actions_history import ActionsHistoryDock
 from py_rme_canary.vis_layer.ui.docks.minimap import MinimapWidget
 from py_rme_canary.vis_layer.ui.docks.modern_palette_dock import ModernPaletteDock
@@ -373,6 +374,8 @@ class QtMapEditor(
         self.id_mapper = None
         # LRU cache to avoid unbounded growth
         self._sprite_cache: OrderedDict[tuple[int, int], QPixmap] = OrderedDict()
+        # Native-size sprite atlas used by the QPainter canvas (zoom independent)
+        self._sprite_atlas = SpriteAtlasCache()
         self._memory_guard = default_memory_guard()
         self._sprite_render_temporarily_disabled: bool = False
         self._sprite_render_emergency_warned: bool = False
@@ -381,6 +384,8 @@ class QtMapEditor(
 
         # Cross-version clipboard sprite matcher
         self.sprite_matcher = None
+        self._sprite_hash_source: object | None = None  # sprite assets the matcher was loaded for
+        self._sprite_hash_pending: bool = False
 
         # Selection mode (legacy-like box selection)
         self.selection_mode: bool = False
@@ -155,9 +155,25 @@ class ImportMapDialog(ModernDialog):
             QMessageBox.warning(self, "Import Map", "No target map loaded.")
             return
 
-        from PyQt6.QtWidgets import QMessageBox
+        from PyQt6.QtWidgets import QApplication, QMessageBox
 
         from py_rme_canary.logic_layer.operations.map_import import import_map_with_offset
+        from py_rme_canary.vis_layer.ui.widgets.modern_progress_dialog import ModernProgressDialog
+
+        progress = ModernProgressDialog(
+            title="IMPORT MAP",
+            label_text="READING MAP...",
+            minimum=0,
+            maximum=1000,
+            parent=self,
+        )
+        progress.show()
+        QApplication.processEvents()
+
+        def on_progress(fraction: float, message: str) -> None:
+            progress.setValue(int(fraction * 1000))
+            progress.setLabelText(message)
+            QApplication.processEvents()
 
         try:
             report = import_map_with_offset(
@@ -173,10 +189,14 @@ class ImportMapDialog(ModernDialog):
                 import_spawns=self._import_spawns_chk.isChecked(),
                 import_zones=self._import_zones_chk.isChecked(),
                 merge_mode=self._merge_mode_group.checkedId(),
+                progress_callback=on_progress,
+                cancel_check=progress.wasCanceled,
             )
         except Exception as exc:
             QMessageBox.critical(self, "Import Map", str(exc))
             return
+        finally:
+            progress.close()
 
         summary = [
             f"Tiles imported: {report.tiles_imported}",
@@ -184,6 +204,8 @@ class ImportMapDialog(ModernDialog):
             f"Spawns imported: {report.spawns_imported}",
             f"Zones imported: {report.zones_imported}",
         ]
+        if report.cancelled:
+            summary.append("Import canceled: only part of the map was merged.")
         if report.skipped_out_of_bounds:
             summary.append(f"Skipped (out of bounds): {report.skipped_out_of_bounds}")
         if report.house_id_mapping and any(k != v for k, v in report.house_id_mapping.items()):
@@ -8,16 +8,16 @@ from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QApplication, QDialog, QFileDialog, QInputDialog, QMessageBox
 
 from py_rme_canary.vis_layer.ui.widgets.modern_progress_dialog import ModernProgressDialog
 from py_rme_canary.core.assets.appearances_dat import AppearancesDatError, load_appearances_dat
 from py_rme_canary.core.assets.asset_profile import AssetProfileError, detect_asset_profile
-from py_rme_canary.core.assets.legacy_dat_spr import LegacySpriteError
+from py_rme_canary.core.assets.legacy_dat_spr import LegacySpriteArchive, LegacySpriteError
 from py_rme_canary.core.assets.loader import load_assets_from_profile
-from py_rme_canary.core.assets.sprite_appearances import SpriteAppearancesError
+from py_rme_canary.core.assets.sprite_appearances import SpriteAppearances, SpriteAppearancesError
 from py_rme_canary.core.config.client_profiles import ClientProfile, create_client_profile
 from py_rme_canary.core.config.configuration_manager import ConfigurationManager
 from py_rme_canary.core.config.project import MapMetadata, find_project_for_otbm
@@ -26,15 +26,36 @@ from py_rme_canary.core.database.id_mapper import IdMapper
 from py_rme_canary.core.database.items_otb import ItemsOTB, ItemsOTBError
 from py_rme_canary.core.database.items_xml import ItemsXML
 from py_rme_canary.core.memory_guard import MemoryGuardError
+from py_rme_canary.logic_layer.cross_version.sprite_hash import SpriteHashMatcher
+from py_rme_canary.logic_layer.cross_version.sprite_hash_index import load_or_build_sprite_hash_index
 from py_rme_canary.vis_layer.ui.dialogs.client_data_loader_dialog import ClientDataLoadConfig
 
 if TYPE_CHECKING:
+    from py_rme_canary.vis_layer.renderer.sprite_atlas import AtlasSlot
     from py_rme_canary.vis_layer.ui.main_window.editor import QtMapEditor
 
 
 logger = logging.getLogger(__name__)
 
 
+class SpriteHashIndexWorker(QThread):
+    """Load (or build and cache) the sprite hash index of one client off the UI thread."""
+
+    index_ready = pyqtSignal(object, object)  # sprites, SpriteHashMatcher | None
+
+    def __init__(self, sprites: SpriteAppearances | LegacySpriteArchive, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._sprites = sprites
+
+    def run(self) -> None:
+        try:
+            matcher = load_or_build_sprite_hash_index(self._sprites)
+        except Exception:
+            logger.exception("Failed to load the sprite hash index")
+            matcher = None
+        self.index_ready.emit(self._sprites, matcher)
+
+
 class QtMapEditorAssetsMixin:
     # ---------- assets (legacy sprite sheets) ----------
 
@@ -536,6 +557,7 @@ class QtMapEditorAssetsMixin:
         self.sprite_assets = loaded.sprite_assets
         self.appearance_assets = loaded.appearance_assets
         self._sprite_cache.clear()
+        self._sprite_atlas.clear()
         self._sprite_render_temporarily_disabled = False
         self._sprite_render_disabled_reason = None
 
@@ -568,6 +590,7 @@ class QtMapEditorAssetsMixin:
         if self.engine != prev_engine:
             # Engine switch should never explode any downstream rendering.
             self._sprite_cache.clear()
+            self._sprite_atlas.clear()
             self._sprite_render_temporarily_disabled = False
             self._sprite_render_disabled_reason = None
         self._maybe_reselect_assets_for_metadata()
@@ -714,6 +737,8 @@ class QtMapEditorAssetsMixin:
         self._sprite_render_disabled_reason = str(reason)
         with contextlib.suppress(Exception):
             self._sprite_cache.clear()
+        with contextlib.suppress(Exception):
+            self._sprite_atlas.clear()
 
         # One clear warning; after that keep it in the status bar.
         msg = (
@@ -971,6 +996,49 @@ class QtMapEditorAssetsMixin:
                 continue
         return None
 
+    def _sprite_atlas_slot_for_server_id(self: QtMapEditor, server_id: int) -> AtlasSlot | None:
+        """Return the native-size atlas slot for a server id (zoom independent)."""
+        if not self._sprite_render_enabled():
+            return None
+        if self.sprite_assets is None:
+            return None
+        atlas = self._sprite_atlas
+
+        def load(sprite_id: int) -> tuple[int, int, bytes] | None:
+            try:
+                return self.sprite_assets.get_sprite_rgba(int(sprite_id))
+            except SpriteAppearancesError:
+                return None
+            except MemoryError:
+                raise
+            except Exception:
+                return None
+
+        for sprite_id in self._candidate_sprite_ids_for_server_id(int(server_id)):
+            known = atlas.contains(int(sprite_id))
+            try:
+                slot = atlas.slot_for(int(sprite_id), load)
+            except MemoryError:
+                self._disable_sprite_render_temporarily(reason="MemoryError while packing sprite atlas")
+                return None
+            if slot is None:
+                continue
+            if not known:
+                try:
+                    msg = self._memory_guard.check_cache_entries(
+                        kind="qt_pixmap_cache",
+                        entries=len(atlas),
+                        stage="qt_sprite_atlas",
+                    )
+                    if msg is not None:
+                        self.status.showMessage(str(msg))
+                except MemoryGuardError:
+                    # Atlas pages cannot evict single sprites; start over with just this one.
+                    atlas.clear()
+                    return atlas.slot_for(int(sprite_id), load)
+            return slot
+        return None
+
     def _sprite_bgra_for_server_id(self: QtMapEditor, server_id: int) -> tuple[int, int, int, bytes] | None:
         if not self._sprite_render_enabled():
             return None
@@ -997,6 +1065,8 @@ class QtMapEditorAssetsMixin:
         matcher = getattr(self, "sprite_matcher", None)
         if matcher is None or self.id_mapper is None:
             return
+        if getattr(self, "_sprite_hash_pending", False):
+            return  # rebuilt once the index is loaded instead of hashing every sprite here
 
         server_to_client = dict(getattr(self.id_mapper, "server_to_client", {}) or {})
         indexed = 0
@@ -1112,58 +1182,38 @@ class QtMapEditorAssetsMixin:
             self.sprite_preview.setPixmap(QPixmap())
 
     def _build_sprite_hash_database(self: QtMapEditor) -> None:
-        """Build sprite hash database for cross-version clipboard matching."""
-        try:
-            from py_rme_canary.logic_layer.cross_version.sprite_hash import SpriteHashMatcher
-
-            # Initialize sprite matcher
-            if not hasattr(self, "sprite_matcher") or self.sprite_matcher is None:
-                self.sprite_matcher = SpriteHashMatcher()
-            else:
-                self.sprite_matcher.clear()
-
-            # Skip if no assets loaded
-            if self.sprite_assets is None or self.id_mapper is None:
-                logger.debug("Skipping sprite hash database build - no assets loaded")
-                self._item_hash_to_server_ids = {}
-                self._server_id_to_item_hash = {}
-                return
-
-            # Get sprite count
-            sprite_count = 0
-            with contextlib.suppress(Exception):
-                sprite_count = getattr(self.sprite_assets, "sprite_count", 0) or 0
-
-            if sprite_count <= 0:
-                logger.debug("No sprites to hash")
-                self._item_hash_to_server_ids = {}
-                self._server_id_to_item_hash = {}
-                return
-
-            # Build hash for each sprite (limit to avoid performance issues)
-            max_sprites = min(int(sprite_count), 50000)
-            hashed_count = 0
-
-            for sprite_id in range(1, max_sprites + 1):
-                try:
-                    w, h, bgra = self.sprite_assets.get_sprite_rgba(int(sprite_id))
-                    if w > 0 and h > 0 and bgra:
-                        self.sprite_matcher.add_sprite(int(sprite_id), bytes(bgra), int(w), int(h))
-                        hashed_count += 1
-                except Exception:
-                    # Sprite doesn't exist or failed to load, skip
-                    continue
+        """Load the sprite hash index for cross-version clipboard matching.
+
+        The index is loaded from its disk cache, or built, on a
+        :class:`SpriteHashIndexWorker`. Until it arrives the matcher starts
+        empty and hashes sprites on demand. Repeated calls for the same
+        sprite assets only rebuild the ServerID index.
+        """
+        sprites = self.sprite_assets
+        if sprites is not None and sprites is getattr(self, "_sprite_hash_source", None):
+            self._build_item_hash_index()
+            return
 
-            logger.info(f"Built sprite hash database: {hashed_count} sprites hashed from {max_sprites} total")
+        self._sprite_hash_source = sprites
+        self.sprite_matcher = SpriteHashMatcher()
+        self._item_hash_to_server_ids = {}
+        self._server_id_to_item_hash = {}
+        if not isinstance(sprites, (SpriteAppearances, LegacySpriteArchive)):
+            self._sprite_hash_pending = False
             self._build_item_hash_index()
+            return
 
-        except ImportError:
-            logger.warning("CrossVersionClipboard not available")
-            self.sprite_matcher = None
-            self._item_hash_to_server_ids = {}
-            self._server_id_to_item_hash = {}
-        except Exception as e:
-            logger.exception(f"Failed to build sprite hash database: {e}")
-            self.sprite_matcher = None
-            self._item_hash_to_server_ids = {}
-            self._server_id_to_item_hash = {}
+        self._sprite_hash_pending = True
+        worker = SpriteHashIndexWorker(sprites, parent=self)
+        worker.index_ready.connect(self._on_sprite_hash_index_ready)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_sprite_hash_index_ready(self: QtMapEditor, sprites: object, matcher: SpriteHashMatcher | None) -> None:
+        if sprites is not self._sprite_hash_source:
+            return  # the assets changed while the index was loading
+        self._sprite_hash_pending = False
+        if matcher is not None:
+            self.sprite_matcher = matcher
+            logger.info("Sprite hash index ready: %d sprites", len(matcher))
+        self._build_item_hash_index()
@@ -102,7 +102,7 @@ class QtMapEditorDialogsMixin:
 
     def _show_map_statistics(self) -> None:
         editor = cast("QtMapEditor", self)
-        dlg = MapStatisticsDialog(editor, game_map=editor.map)
+        dlg = MapStatisticsDialog(editor, game_map=editor.map, session=editor.session)
         dlg.exec()
 
     def _show_map_statistics_graphs(self) -> None:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from py_rme_canary.core.config.user_settings import get_user_settings
@@ -57,11 +59,27 @@ class QtMapEditorEditMixin:
         if not self.session.copy_selection(
             client_version=str(self.client_version),
             sprite_hash_lookup=self._sprite_hash_for_server_id,
+            background=True,
         ):
             self.status.showMessage("Copy: nothing selected")
             self._update_action_enabled_states()
             return
-        self.status.showMessage("Copied selection")
+        job = self.session.clipboard_job()
+        if job is None:
+            self.status.showMessage("Copied selection")
+            self._update_action_enabled_states()
+            return
+        self.status.showMessage("Copying selection...")
+        self._update_action_enabled_states()
+        self._poll_clipboard_job(job, lambda ok: self.status.showMessage("Copied selection" if ok else "Copy failed"))
+
+    def _poll_clipboard_job(self: QtMapEditor, job: int, on_done: Callable[[bool], None]) -> None:
+        """Poll one background clipboard job of the session without blocking the UI."""
+        result = self.session.poll_clipboard_job(job)
+        if result is None:
+            QTimer.singleShot(15, lambda: self._poll_clipboard_job(job, on_done))
+            return
+        on_done(bool(result))
         self._update_action_enabled_states()
 
     def _cut_selection(self: QtMapEditor) -> None:
@@ -94,8 +112,16 @@ class QtMapEditorEditMixin:
             target_version=str(self.client_version),
             hash_resolver=self._resolve_server_id_from_sprite_hash,
             enable_sprite_match=sprite_match_enabled,
+            background=True,
         )
+        job = self.session.clipboard_job()
+        if job is not None:
+            self.status.showMessage("Reading clipboard...")
+            self._poll_clipboard_job(job, lambda _ok: self._finish_arm_paste())
+            return
+        self._finish_arm_paste()
 
+    def _finish_arm_paste(self: QtMapEditor) -> None:
         if not self.session.can_paste():
             self.status.showMessage("Paste: buffer empty")
             self._update_action_enabled_states()
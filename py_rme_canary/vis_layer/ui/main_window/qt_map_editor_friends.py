@@ -208,6 +208,9 @@ class QtMapEditorFriendsMixin:
     def closeEvent(self, event) -> None:  # noqa: N802
         editor = cast("QtMapEditor", self)
         editor._friends_mark_offline()
+        service = getattr(editor, "friends_service", None)
+        if service is not None:
+            service.close()
         parent_close_event = getattr(super(), "closeEvent", None)
         if callable(parent_close_event):
             parent_close_event(event)
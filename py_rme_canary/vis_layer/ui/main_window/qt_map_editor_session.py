@@ -1034,7 +1034,7 @@ class QtMapEditorSessionMixin:
         z = int(getattr(self.viewport, "z", 7))
 
         names = self._collect_spawn_entry_names_at_cursor(
-            self.session.game_map.monster_spawns,
+            [area for _idx, area in self.session.game_map.monster_spawn_index().covering(x, y, z)],
             entries_attr="monsters",
             x=int(x),
             y=int(y),
@@ -1106,7 +1106,7 @@ class QtMapEditorSessionMixin:
         z = int(getattr(self.viewport, "z", 7))
 
         names = self._collect_spawn_entry_names_at_cursor(
-            self.session.game_map.npc_spawns,
+            [area for _idx, area in self.session.game_map.npc_spawn_index().covering(x, y, z)],
             entries_attr="npcs",
             x=int(x),
             y=int(y),
@@ -1248,8 +1248,18 @@ class QtMapEditorSessionMixin:
         _set_enabled("act_live_ban", is_server)
         _set_enabled("act_live_banlist", is_server)
 
-    def _on_tiles_changed(self, _changed) -> None:
+    def _on_tiles_changed(self, changed) -> None:
+        self.indicators.flags.invalidate(changed)
+        drawer = getattr(self, "map_drawer", None)
+        if drawer is not None:
+            drawer.invalidate_tiles(changed)
+        invalidate_canvas = getattr(self.canvas, "invalidate_tiles", None)
+        if invalidate_canvas is not None:
+            invalidate_canvas(changed)
         self.canvas.update()
+        preview = getattr(self, "ingame_preview_controller", None)
+        if preview is not None:
+            preview.notify_tiles_changed(changed)
         if self.minimap_widget is not None and self.dock_minimap is not None and self.dock_minimap.isVisible():
             self.minimap_widget.update()
         with contextlib.suppress(Exception):